@@ -1,20 +1,22 @@
 from functools import cached_property
 import glob
 import os
+import time
 import traceback
 
 # Import the correct version of PyQt
 try:
-    from PyQt6.QtCore import QObject, pyqtSlot, pyqtSignal, pyqtProperty
+    from PyQt6.QtCore import QObject, QTimer, pyqtSlot, pyqtSignal, pyqtProperty
     PYQT_VERSION = 6
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, pyqtProperty
+    from PyQt5.QtCore import QObject, QTimer, pyqtSlot, pyqtSignal, pyqtProperty
     PYQT_VERSION = 5
 
 from UM.Application import Application
 from UM.Extension import Extension
 from UM.Logger import Logger
 from UM.Message import Message
+from UM.OutputDevice import OutputDeviceError
 from UM.PluginRegistry import PluginRegistry
 
 from UM.i18n import i18nCatalog
@@ -24,10 +26,18 @@ from UM.Resources import Resources
 from cura.CuraApplication import CuraApplication
 from cura.Settings.ExtruderManager import ExtruderManager
 
+from . import DirectGcodeGenerator
 from . import MeshImporter
+from . import StlFile
+from . import TowerAssembler
+from .GlyphAtlas import GlyphAtlas
+from .GlyphAtlasJob import GlyphAtlasJob
 from .PluginSettings import PluginSettings
 from .OpenScadInterface import OpenScadInterface
 from .OpenScadJob import OpenScadJob
+from .OpenScadWarmUpJob import OpenScadWarmUpJob
+from .Postprocessing import GcodeCompaction_PostProcessing
+from .TowerHistory import TowerHistory
 
 from .Controllers.BedLevelPatternContoller import BedLevelPatternController
 from .Controllers.FanTowerController import FanTowerController
@@ -51,6 +61,10 @@ class AutoTowersGenerator(QObject, Extension):
     # Add additional controller classes to this list
     _controllerClasses = [BedLevelPatternController, FanTowerController, FlowTowerController, RetractTowerController, SpeedTowerController, TempTowerController]
 
+    # The OpenSCAD quality values ($fn) used to quickly render draft models
+    # These control the resolution of curves and text in the models
+    _draftQualityParameters = {'Preview_Quality_Value': 8, 'Render_Quality_Value': 8, 'Quality_Value': 8}
+
 
 
     def __init__(self):
@@ -58,6 +72,7 @@ class AutoTowersGenerator(QObject, Extension):
         Extension.__init__(self)
 
         self._pluginSettings = None
+        self._towerHistory = None
 
         # Keep track of the post-processing callback and the node added by the OpenSCAD import
         self._towerControllerPostProcessingCallback = None
@@ -70,6 +85,36 @@ class AutoTowersGenerator(QObject, Extension):
         # Keep track of the currently active tower controller
         self._currentTowerController = None
 
+        # Keep track of the custom tower being rendered in the background, either speculatively while a tower dialog is open
+        # or to replace a draft model in the scene
+        # This is a tuple of the scad hash, the OpenSCAD process, and the STL file being generated
+        self._backgroundRender = None
+        self._backgroundRenderPollTimer = QTimer()
+        self._backgroundRenderPollTimer.setInterval(250)
+        self._backgroundRenderPollTimer.timeout.connect(self._pollBackgroundRender)
+
+        # Keep track of the draft model waiting to be replaced by its full-quality version
+        # This is a tuple of the scad hash, the operation that added the draft to the scene, and the entry to add to the history once it's replaced
+        self._draftRender = None
+
+        # Keep track of the tower waiting for a background render to finish so it can be imported
+        # This is a tuple of the scad hash and the details needed to import the tower
+        self._awaitedRender = None
+
+        # Keep track of gcode being written directly, so the gcode it replaced in the scene can be restored afterwards
+        # This is a tuple of the output device, the build plate, the written gcode, and the gcode it replaced
+        self._directGcodeWrite = None
+
+        # Keep track of the draft being rendered in the background
+        # This is a tuple of the OpenSCAD job and the details needed to import the draft once it has been rendered
+        self._pendingDraft = None
+
+        # Keep track of the glyph atlases loaded for assembling towers, by the hash of their OpenSCAD parameters
+        self._glyphAtlases = {}
+
+        # Keep track of the glyph atlases being rendered in the background, by the hash of their OpenSCAD parameters
+        self._glyphAtlasJobs = {}
+
         # Update the view when the main window is changed so the "remove" button is always visible when enabled
         CuraApplication.getInstance().mainWindowChanged.connect(self._displayRemoveAutoTowerButton)
 
@@ -121,6 +166,14 @@ class AutoTowersGenerator(QObject, Extension):
 
 
 
+    @cached_property
+    def _cacheDir(self)->str:
+        ''' Returns the directory where generated STL files are cached between sessions '''
+
+        return os.path.join(self._pluginDir, 'cache')
+
+
+
     @cached_property
     def _pluginSettingsFilePath(self)->str:
         ''' Returns the path to the plugin settings file '''
@@ -129,6 +182,14 @@ class AutoTowersGenerator(QObject, Extension):
 
 
 
+    @cached_property
+    def _towerHistoryFilePath(self)->str:
+        ''' Returns the path to the database of previously generated towers '''
+
+        return os.path.join(self._pluginDir, 'towerHistory.db')
+
+
+
     @cached_property
     def _removeAutoTowerButton(self)->QObject:
         ''' Returns the button used to remove the Auto Tower from the scene '''
@@ -153,6 +214,14 @@ class AutoTowersGenerator(QObject, Extension):
 
 
 
+    @cached_property
+    def _recentTowersDialog(self)->QObject:
+        ''' Returns the dialog used to reopen a previously generated tower '''
+
+        return self._createDialog('RecentTowersDialog.qml')
+
+
+
     @cached_property
     def _waitDialog(self)->QObject:
         ''' Returns the dialog used to tell the user that generating a model may take a long time '''
@@ -287,6 +356,91 @@ class AutoTowersGenerator(QObject, Extension):
 
 
 
+    _draftRenderingSetting = True
+
+    _draftRenderingSettingChanged = pyqtSignal()
+
+    def setDraftRenderingSetting(self, value:bool)->None:
+        self._pluginSettings.SetValue('draft rendering', value)
+        self._draftRenderingSettingChanged.emit()
+
+    @pyqtProperty(bool, notify=_draftRenderingSettingChanged, fset=setDraftRenderingSetting)
+    def draftRenderingSetting(self)->bool:
+        return self._pluginSettings.GetValue('draft rendering', False)
+
+
+
+    _compactGcodeSetting = True
+
+    _compactGcodeSettingChanged = pyqtSignal()
+
+    def setCompactGcodeSetting(self, value:bool)->None:
+        self._pluginSettings.SetValue('compact gcode', value)
+        self._compactGcodeSettingChanged.emit()
+
+    @pyqtProperty(bool, notify=_compactGcodeSettingChanged, fset=setCompactGcodeSetting)
+    def compactGcodeSetting(self)->bool:
+        return self._pluginSettings.GetValue('compact gcode', False)
+
+
+
+    _warmUpOpenScadSetting = False
+
+    _warmUpOpenScadSettingChanged = pyqtSignal()
+
+    def setWarmUpOpenScadSetting(self, value:bool)->None:
+        self._pluginSettings.SetValue('warm up openscad', value)
+        self._warmUpOpenScadSettingChanged.emit()
+
+    @pyqtProperty(bool, notify=_warmUpOpenScadSettingChanged, fset=setWarmUpOpenScadSetting)
+    def warmUpOpenScadSetting(self)->bool:
+        return self._pluginSettings.GetValue('warm up openscad', False)
+
+
+
+    recentTowersChanged = pyqtSignal()
+
+    @pyqtProperty(list, notify=recentTowersChanged)
+    def recentTowersModel(self)->list:
+        ''' Lists the previously generated towers for the recent towers dialog '''
+
+        return [{'name': f'{entry["tower name"]} ({time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["timestamp"]))})'} for entry in self._towerHistory.RecentTowers()]
+
+
+
+    @pyqtSlot(int)
+    def reopenRecentTower(self, index:int)->None:
+        ''' Called by the recent towers dialog to reopen a previously generated tower '''
+
+        try:
+            entry = self._towerHistory.RecentTowers()[index]
+        except IndexError:
+            return
+
+        # Look up the controller that originally generated the tower
+        controllerClasses = {controllerClass.__name__: controllerClass for controllerClass in self._controllerClasses}
+        try:
+            controller = self._retrieveTowerController(controllerClasses[entry['controller']])
+        except KeyError:
+            Logger.log('e', f'Unable to reopen "{entry["tower name"]}" - the controller "{entry["controller"]}" is not recognized')
+            return
+
+        # The cached file may have been removed since the tower was generated
+        stlFilePath = entry['stl file path']
+        if not os.path.isfile(stlFilePath):
+            errorMessage = f'{catalog.i18nc("@msg", "The STL file")} "{stlFilePath}" {catalog.i18nc("@msg", "does not exist")}'
+            Logger.log('e', errorMessage)
+            Message(errorMessage, title = self._pluginName, message_type=Message.MessageType.ERROR).show()
+            return
+
+        # Restore the values that the tower was generated with, since these determine how it's post-processed
+        controller.restoreDataModelState(entry['post-processing parameters'])
+
+        # Import the tower just as if it had been generated again
+        self._importStl(controller, entry['tower name'], stlFilePath, controller.postProcess, entry['openscad parameters'], entry['scad hash'])
+
+
+
     @pyqtSlot()
     def removeButtonClicked(self)->None:
         ''' Called when the remove button is clicked to remove the generated Auto Tower from the scene'''
@@ -301,7 +455,7 @@ class AutoTowersGenerator(QObject, Extension):
         ''' Provides lazy instantiation of the tower controllers '''
     
         if not ControllerClass in self._cachedControllerTable:
-            self._cachedControllerTable[ControllerClass] = ControllerClass(guiDir=self._qmlDir, stlDir=self._stlDir, loadStlCallback=self._loadStlCallback, generateStlCallback=self._generateStlCallback, pluginName=self._pluginName)
+            self._cachedControllerTable[ControllerClass] = ControllerClass(guiDir=self._qmlDir, stlDir=self._stlDir, loadStlCallback=self._loadStlCallback, loadMeshCallback=self._loadMeshCallback, writeGcodeCallback=self._writeGcodeCallback, generateStlCallback=self._generateStlCallback, speculativeRenderCallback=self._speculativeRenderCallback, pluginName=self._pluginName)
         return self._cachedControllerTable[ControllerClass]
 
 
@@ -315,8 +469,11 @@ class AutoTowersGenerator(QObject, Extension):
             controller = self._retrieveTowerController(controllerClass)
             self.addMenuItem(controller.name, lambda controllerClass=controllerClass: self._generateAutoTower(controllerClass))
 
-        # Add a menu item for modifying plugin settings
+        # Add a menu item for reopening previously generated towers
         self.addMenuItem(' ', lambda: None)
+        self.addMenuItem(catalog.i18nc("@menu", "Recent Towers"), lambda: self._displayRecentTowersDialog())
+
+        # Add a menu item for modifying plugin settings
         self.addMenuItem(catalog.i18nc("@menu", "Settings"), lambda: self._displayPluginSettingsDialog())
 
 
@@ -326,7 +483,8 @@ class AutoTowersGenerator(QObject, Extension):
 
         # Generate the auto tower
         currentTowerController = self._retrieveTowerController(controllerClass)
-        currentTowerController.generate(customizable=self._openScadInterface.OpenScadPathValid)
+        customizable = not currentTowerController.customTowersRequireOpenScad or self._openScadInterface.OpenScadPathValid
+        currentTowerController.generate(customizable=customizable)
 
 
 
@@ -398,6 +556,18 @@ class AutoTowersGenerator(QObject, Extension):
 
 
 
+    def _displayRecentTowersDialog(self)->None:
+        ''' Prepares and displays the recent towers dialog '''
+
+        if len(self._towerHistory.RecentTowers()) == 0:
+            Message(catalog.i18nc("@msg", "No towers have been generated yet"), title=self._pluginName, lifetime=8).show()
+            return
+
+        self.recentTowersChanged.emit()
+        self._recentTowersDialog.show()
+
+
+
     def _loadStlCallback(self, controller, towerName, stlFilePath, postProcessingCallback)->None:
         ''' This callback is called by the tower model controller if a preset tower is requested '''
 
@@ -413,21 +583,147 @@ class AutoTowersGenerator(QObject, Extension):
 
 
 
-    def _generateStlCallback(self, controller, towerName, openScadFilename, openScadParameters, postProcessingCallback)->None:
-        ''' This callback is called by the tower model controller after a tower has been configured to generate an STL model from an OpenSCAD file '''
+    def _loadMeshCallback(self, controller, towerName, vertices, postProcessingCallback)->None:
+        ''' This callback is called by the tower model controller if a tower has been generated directly as a mesh, without OpenSCAD '''
+
+        # The model is cached like an OpenSCAD model, so it can be reopened from the history
+        stlData = StlFile.StlDataFromVertices(vertices)
+        stlHash = TowerHistory.StlHash(stlData)
+        stlFilePath = self._towerHistory.CachedStlFilePath(stlHash)
+        if stlFilePath is None:
+            stlFilePath = self._towerHistory.CacheStlData(stlData, stlHash)
+
+        # Import the model into the scene directly from memory
+        self._importStl(controller, towerName, stlFilePath, postProcessingCallback, None, stlHash, MeshImporter.MeshDataFromVertices(vertices))
+
+
+
+    def _writeGcodeCallback(self, controller, towerName, toolpaths, lineWidth, layerHeight)->None:
+        ''' This callback is called by the tower model controller to write a single-layer print directly as gcode, without slicing it '''
+
+        # Make sure any previous auto towers are removed
+        self._removeAutoTower()
+
+        # Generate the gcode from the current print settings
+        globalStack = Application.getInstance().getGlobalContainerStack()
+        extruderStack = ExtruderManager.getInstance().getActiveExtruderStack()
+        try:
+            gcode = DirectGcodeGenerator.GenerateGcode(toolpaths, lineWidth, layerHeight, globalStack, extruderStack, f'Generated with {self._pluginName} {self.pluginVersion}')
+        except ValueError as e:
+            errorMessage = f'{catalog.i18nc("@msg", "Failed to write")} "{towerName}" {catalog.i18nc("@msg", "as gcode")} : {e}'
+            Logger.log('e', errorMessage)
+            Message(errorMessage, title = self._pluginName, message_type=Message.MessageType.ERROR).show()
+            return
+
+        # Cura's gcode writer writes whatever gcode is in the scene for the active build plate, so the gcode is placed there
+        # and written by the active output device as if it had been sliced
+        scene = Application.getInstance().getController().getScene()
+        if not hasattr(scene, 'gcode_dict'):
+            setattr(scene, 'gcode_dict', {})
+        # The gcode only stands in for a slice while it is written, so whatever was there before is put back afterwards
+        active_build_plate_id = CuraApplication.getInstance().getMultiBuildPlateModel().activeBuildPlate
+        previousGcode = scene.gcode_dict.get(active_build_plate_id)
+        scene.gcode_dict[active_build_plate_id] = gcode
+
+        towerName = self._shortenTowerName(towerName)
+        CuraApplication.getInstance().getPrintInformation().setJobName(towerName)
+
+        outputDevice = Application.getInstance().getOutputDeviceManager().getActiveDevice()
+        self._directGcodeWrite = (outputDevice, active_build_plate_id, gcode, previousGcode)
+        outputDevice.writeFinished.connect(self._onDirectGcodeWriteFinished)
+        outputDevice.writeError.connect(self._onDirectGcodeWriteFinished)
+        try:
+            outputDevice.requestWrite([scene.getRoot()], file_name=towerName, limit_mimetypes=['text/x-gcode'])
+        except OutputDeviceError.WriteRequestFailedError as e:
+            self._onDirectGcodeWriteFinished()
+            errorMessage = f'{catalog.i18nc("@msg", "Failed to write")} "{towerName}" {catalog.i18nc("@msg", "as gcode")} : {e}'
+            Logger.log('e', errorMessage)
+            Message(errorMessage, title = self._pluginName, message_type=Message.MessageType.ERROR).show()
+
+
+
+    def _onDirectGcodeWriteFinished(self, *args)->None:
+        ''' Called when gcode written directly has been written, or has failed to be written
+            The gcode that was in the scene beforehand is restored, so a later write doesn't pick up the directly-written gcode '''
+
+        if self._directGcodeWrite is None:
+            return
+        (outputDevice, buildPlate, gcode, previousGcode) = self._directGcodeWrite
+        self._directGcodeWrite = None
+
+        outputDevice.writeFinished.disconnect(self._onDirectGcodeWriteFinished)
+        outputDevice.writeError.disconnect(self._onDirectGcodeWriteFinished)
+
+        # Nothing is restored if the scene has been sliced again in the meantime
+        scene = Application.getInstance().getController().getScene()
+        if not scene.gcode_dict.get(buildPlate) is gcode:
+            return
+
+        if previousGcode is None:
+            del scene.gcode_dict[buildPlate]
+        else:
+            scene.gcode_dict[buildPlate] = previousGcode
+
+
+
+    def _generateStlCallback(self, controller, towerName, openScadFilename, openScadParameters, postProcessingCallback, allowDraft=True)->None:
+        ''' This callback is called by the tower model controller after a tower has been configured to generate an STL model from an OpenSCAD file
+            If allowDraft is False, the tower is generated at full quality even if draft rendering is enabled '''
+
+        # Any draft still being rendered, or background render being waited for, has been superseded by this tower
+        self._pendingDraft = None
+        self._awaitedRender = None
 
         # This could take up to a couple of minutes...
         self._waitDialog.show()
         CuraApplication.getInstance().processEvents() # Allow Cura to update itself periodically through this method
         
-        # Compile the STL file name
         openScadFilePath = os.path.join(self._openScadSourcePath, openScadFilename)
-        stlFilename = 'custom_autotower.stl'
-        stlFilePath = os.path.join(self._tempDir, stlFilename)
 
-        # Generate the STL file
-        # Since it can take a while to generate the STL file, this is done in a separate thread to allow the GUI to remain responsive
-        job = OpenScadJob(self._openScadInterface, openScadFilePath, openScadParameters, stlFilePath)
+        # If this tower has been generated with the same parameters before, just use the cached model
+        scadHash = TowerHistory.ScadHash(openScadFilePath, openScadParameters)
+        cachedStlFilePath = self._towerHistory.CachedStlFilePath(scadHash)
+        if not cachedStlFilePath is None:
+            Logger.log('d', f'Using the cached model "{cachedStlFilePath}" for "{towerName}"')
+            self._importStl(controller, towerName, cachedStlFilePath, postProcessingCallback, openScadParameters, scadHash)
+            return
+
+        # Towers that can be assembled directly don't need to be rendered by OpenSCAD at all
+        # Assembled towers are cached under their own hash, so they're only reused while they can be assembled
+        if self._canAssembleTower(openScadFilename):
+            assembledHash = TowerHistory.AssembledHash(scadHash)
+            cachedStlFilePath = self._towerHistory.CachedStlFilePath(assembledHash)
+            if not cachedStlFilePath is None:
+                Logger.log('d', f'Using the cached assembled model "{cachedStlFilePath}" for "{towerName}"')
+                self._importStl(controller, towerName, cachedStlFilePath, postProcessingCallback, openScadParameters, assembledHash)
+                return
+
+            # The first time a font is used, its glyph atlas is rendered in the background while this tower is rendered by OpenSCAD
+            vertices = self._assembleTower(openScadFilename, openScadParameters)
+            if not vertices is None:
+                Logger.log('d', f'Assembled "{towerName}" without OpenSCAD')
+                stlFilePath = self._towerHistory.CacheStlData(StlFile.StlDataFromVertices(vertices), assembledHash)
+                self._importStl(controller, towerName, stlFilePath, postProcessingCallback, openScadParameters, assembledHash, MeshImporter.MeshDataFromVertices(vertices))
+                return
+
+        # In draft mode, a low-detail model is rendered in the background and imported, then replaced once the full-quality model has been rendered
+        if self.draftRenderingSetting and allowDraft:
+            self._generateDraftStl(controller, towerName, openScadFilename, openScadParameters, scadHash, postProcessingCallback)
+            return
+
+        # If this tower is already being rendered in the background, it is imported when that render finishes rather than starting over
+        if not self._backgroundRender is None and self._backgroundRender[0] == scadHash:
+            Logger.log('d', f'Waiting for the background render of "{towerName}" to finish')
+            self._awaitedRender = (scadHash, controller, towerName, openScadFilename, openScadParameters, postProcessingCallback)
+            return
+
+        # Any other background render is no longer needed and would only slow this one down
+        self._cancelBackgroundRender()
+
+        # Generate the STL model
+        # Since it can take a while to generate the STL model, this is done in a separate thread to allow the GUI to remain responsive
+        # OpenSCAD exports the model to stdout, so it is parsed in memory rather than being read back from a temporary file
+        job = OpenScadJob(self._openScadInterface, openScadFilePath, openScadParameters)
         job.run()
 
         # Wait for OpenSCAD to finish
@@ -435,21 +731,292 @@ class AutoTowersGenerator(QObject, Extension):
         while (job.isRunning()):
             pass
 
-        # Make sure the STL file was generated
-        if os.path.isfile(stlFilePath) == False:
-            errorMessage = f'{catalog.i18nc("@msg", "Failed to generate")} "{stlFilePath}" {catalog.i18nc("@msg", "from")} "{openScadFilename}"\n{catalog.i18nc("@msg", "Command output was")}\n"{self._openScadInterface.commandResult}"'
+        # Make sure the STL model was generated
+        if len(job.stlData) == 0:
+            errorMessage = f'{catalog.i18nc("@msg", "Failed to generate")} "{towerName}" {catalog.i18nc("@msg", "from")} "{openScadFilename}"\n{catalog.i18nc("@msg", "Command output was")}\n"{job.commandResult}"'
             Message(errorMessage, title = self._pluginName, message_type=Message.MessageType.ERROR).show()
             Logger.log('e', errorMessage)
             self._waitDialog.hide()
             return
 
-        # Import the STL file into the scene
-        self._importStl(controller, towerName, stlFilePath, postProcessingCallback)
+        # Keep a copy of the generated model so it can be reopened without running OpenSCAD again
+        stlFilePath = self._towerHistory.CacheStlData(job.stlData, scadHash)
+
+        # Import the STL model into the scene
+        self._importStl(controller, towerName, stlFilePath, postProcessingCallback, openScadParameters, scadHash, MeshImporter.ReadStlData(job.stlData))
+
+
+
+    def _canAssembleTower(self, openScadFilename)->bool:
+        ''' Returns True if a tower can be assembled directly with the current settings, rather than rendered with OpenSCAD '''
+
+        if not TowerAssembler.CanAssemble(openScadFilename):
+            return False
+
+        # The shapes of an assembled tower only touch, so Cura has to union them when slicing
+        # If that has been turned off, the tower is rendered by OpenSCAD as a single shape instead
+        if not ExtruderManager.getInstance().getActiveExtruderStack().getProperty('meshfix_union_all', 'value'):
+            Logger.log('d', 'Union Overlapping Volumes is disabled - the tower will be rendered by OpenSCAD')
+            return False
+
+        return True
+
+
+
+    def _assembleTower(self, openScadFilename, openScadParameters, renderGlyphAtlas=True):
+        ''' Assembles a tower directly, rather than rendering it with OpenSCAD
+            Returns the vertices of the tower, or None if it must be rendered by OpenSCAD instead '''
+
+        if not self._canAssembleTower(openScadFilename):
+            return None
+
+        glyphAtlas = self._glyphAtlas(TowerAssembler.GlyphAtlasParameters(openScadFilename, openScadParameters), renderGlyphAtlas)
+        if glyphAtlas is None:
+            return None
+
+        return TowerAssembler.AssembleTower(openScadFilename, openScadParameters, glyphAtlas)
+
+
 
+    def _glyphAtlas(self, atlasParameters, render=True)->GlyphAtlas:
+        ''' Returns the glyph atlas for a font, which is rendered by OpenSCAD the first time the font is used and cached after that
+            None is returned if the atlas hasn't been rendered yet
+            If render is True, the atlas is rendered in the background, so towers using the font can be assembled once it's ready '''
 
+        atlasFilePath = os.path.join(self._openScadSourcePath, 'glyphatlas.scad')
+        atlasHash = TowerHistory.ScadHash(atlasFilePath, atlasParameters)
+        if atlasHash in self._glyphAtlases:
+            return self._glyphAtlases[atlasHash]
 
-    def _importStl(self, controller, towerName, stlFilePath, postProcessingCallback)->None:
-        ''' Imports an STL file into the scene '''
+        # The atlas is cached alongside the STL files, but isn't pruned with them
+        cachedAtlasFilePath = self._cachedGlyphAtlasFilePath(atlasHash)
+        if os.path.isfile(cachedAtlasFilePath):
+            try:
+                self._glyphAtlases[atlasHash] = GlyphAtlas.Load(cachedAtlasFilePath)
+                return self._glyphAtlases[atlasHash]
+            except (OSError, ValueError) as e:
+                Logger.log('w', f'Unable to load the cached glyph atlas "{cachedAtlasFilePath}": {e}')
+
+        if not render or atlasHash in self._glyphAtlasJobs or not self._openScadInterface.OpenScadPathValid:
+            return None
+
+        Logger.log('d', f'Rendering the glyph atlas for the font "{atlasParameters["Font"]}" in the background')
+        job = GlyphAtlasJob(self._openScadInterface, atlasFilePath, atlasParameters, atlasHash)
+        job.finished.connect(self._onGlyphAtlasRendered)
+        self._glyphAtlasJobs[atlasHash] = job
+        job.start()
+        return None
+
+
+
+    def _onGlyphAtlasRendered(self, job)->None:
+        ''' Called when a glyph atlas has been rendered in the background '''
+
+        del self._glyphAtlasJobs[job.atlasHash]
+
+        # An empty atlas is kept for this session so OpenSCAD isn't run again, but isn't saved in case the problem is fixed
+        if job.glyphAtlas.GlyphCount > 0:
+            job.glyphAtlas.Save(self._cachedGlyphAtlasFilePath(job.atlasHash))
+            Logger.log('d', 'The glyph atlas has been rendered - towers using its font will now be assembled directly')
+        else:
+            Logger.log('w', f'The glyph atlas {job.atlasHash} is empty - towers using its font will be rendered by OpenSCAD\n{job.commandResult}')
+        self._glyphAtlases[job.atlasHash] = job.glyphAtlas
+
+
+
+    def _cachedGlyphAtlasFilePath(self, atlasHash)->str:
+        ''' Returns the path of the cached glyph atlas with the given hash '''
+
+        return os.path.join(self._cacheDir, f'{atlasHash}.json')
+
+
+
+    def _generateDraftStl(self, controller, towerName, openScadFilename, openScadParameters, scadHash, postProcessingCallback)->None:
+        ''' Starts rendering a low-detail version of a tower in the background
+            The draft is imported once it has been rendered, and the full-quality version is then rendered to replace it '''
+
+        # A background render of any other tower is no longer needed and would only slow this one down
+        if not self._backgroundRender is None and self._backgroundRender[0] != scadHash:
+            self._cancelBackgroundRender()
+
+        # Only the quality values actually used by the OpenSCAD file are overridden
+        openScadFilePath = os.path.join(self._openScadSourcePath, openScadFilename)
+        with open(openScadFilePath, 'r') as openScadFile:
+            openScadSource = openScadFile.read()
+        draftParameters = dict(openScadParameters)
+        draftParameters.update({name: value for name, value in self._draftQualityParameters.items() if name in openScadSource})
+
+        job = OpenScadJob(self._openScadInterface, openScadFilePath, draftParameters)
+        job.finished.connect(self._onDraftRendered)
+        self._pendingDraft = (job, controller, towerName, openScadFilename, openScadParameters, scadHash, postProcessingCallback)
+        job.start()
+
+
+
+    def _onDraftRendered(self, job)->None:
+        ''' Called when the draft of a tower has been rendered in the background '''
+
+        # The draft may have been superseded by another tower in the meantime
+        if self._pendingDraft is None or not self._pendingDraft[0] is job:
+            return
+        (job, controller, towerName, openScadFilename, openScadParameters, scadHash, postProcessingCallback) = self._pendingDraft
+        self._pendingDraft = None
+
+        if len(job.stlData) == 0:
+            Logger.log('w', f'Unable to generate a draft of "{towerName}" - generating it at full quality instead')
+            self._generateStlCallback(controller, towerName, openScadFilename, openScadParameters, postProcessingCallback, allowDraft=False)
+            return
+
+        # The draft isn't added to the history - the tower is only recorded once its full-quality model has been cached
+        self._importStl(controller, towerName, None, postProcessingCallback, openScadParameters, scadHash, MeshImporter.ReadStlData(job.stlData), recordHistory=False)
+        historyEntry = (type(controller).__name__, self._shortenTowerName(towerName), controller.getDataModelState(), openScadParameters)
+        self._draftRender = (scadHash, self._autoTowerOperation, historyEntry)
+
+        # Start the full-quality render, unless it's already being rendered speculatively or finished while the draft was generated
+        cachedStlFilePath = self._towerHistory.CachedStlFilePath(scadHash)
+        if not cachedStlFilePath is None:
+            self._replaceDraftStl(cachedStlFilePath)
+        elif self._backgroundRender is None:
+            self._startBackgroundRender(os.path.join(self._openScadSourcePath, openScadFilename), openScadParameters, scadHash, 'final')
+
+
+
+    def _replaceDraftStl(self, stlFilePath)->None:
+        ''' Replaces the draft model in the scene with the full-quality model and records the tower in the history
+            The node itself is kept, so its position and post-processing are unchanged '''
+
+        (scadHash, draftOperation, historyEntry) = self._draftRender
+        self._draftRender = None
+
+        # The tower can be reopened now that its full-quality model has been cached
+        (controllerName, towerName, dataModelState, openScadParameters) = historyEntry
+        self._towerHistory.AddTower(controllerName, towerName, stlFilePath, dataModelState, openScadParameters, scadHash)
+        self.recentTowersChanged.emit()
+
+        # The draft may have been removed from the scene in the meantime
+        if not draftOperation is None and draftOperation is self._autoTowerOperation:
+            Logger.log('d', f'Replacing the draft model with the full-quality model "{stlFilePath}"')
+            meshData = MeshImporter.ReadMeshData(stlFilePath)
+            scene = CuraApplication.getInstance().getController().getScene()
+            for node in scene.getRoot().getChildren():
+                if node.getName() == self._pluginName:
+                    node.setMeshData(meshData)
+                    scene.sceneChanged.emit(node)
+
+
+
+    def _speculativeRenderCallback(self, openScadFilename, openScadParameters)->None:
+        ''' This callback is called by the tower model controller when a custom tower has been configured in its dialog
+            The tower is rendered in the background so it is likely to already be cached when the tower is generated '''
+
+        openScadFilePath = os.path.join(self._openScadSourcePath, openScadFilename)
+        scadHash = TowerHistory.ScadHash(openScadFilePath, openScadParameters)
+
+        # Nothing needs to be done if this tower has already been rendered or is being rendered now
+        if not self._towerHistory.CachedStlFilePath(scadHash) is None:
+            return
+        if not self._backgroundRender is None and self._backgroundRender[0] == scadHash:
+            return
+
+        # Towers that can be assembled directly are generated almost instantly, so there's no need to render them ahead of time
+        # The glyph atlas isn't rendered here, since that would run OpenSCAD anyway
+        if not self._assembleTower(openScadFilename, openScadParameters, renderGlyphAtlas=False) is None:
+            return
+
+        # A tower that is waiting to be imported takes priority over speculation
+        if not self._awaitedRender is None:
+            return
+
+        # The full-quality version of a draft in the scene takes priority over speculation
+        if not self._backgroundRender is None and not self._draftRender is None and self._backgroundRender[0] == self._draftRender[0]:
+            return
+
+        # Stop rendering a tower that has been superseded
+        self._cancelBackgroundRender()
+
+        self._startBackgroundRender(openScadFilePath, openScadParameters, scadHash, 'speculative')
+
+
+
+    def _startBackgroundRender(self, openScadFilePath, openScadParameters, scadHash, purpose)->None:
+        ''' Starts rendering a tower into the STL cache without waiting for OpenSCAD to finish '''
+
+        stlFilePath = os.path.join(self._tempDir, f'{purpose}_{scadHash}.stl')
+        process = self._openScadInterface.StartStlGeneration(openScadFilePath, openScadParameters, stlFilePath)
+        if process is None:
+            return
+
+        self._backgroundRender = (scadHash, process, stlFilePath)
+        self._backgroundRenderPollTimer.start()
+
+
+
+    def _pollBackgroundRender(self)->None:
+        ''' Periodically checks whether the background render has finished '''
+
+        if self._backgroundRender is None:
+            self._backgroundRenderPollTimer.stop()
+            return
+
+        process = self._backgroundRender[1]
+        if not process.poll() is None:
+            self._finishBackgroundRender()
+
+
+
+    def _finishBackgroundRender(self)->None:
+        ''' Adds the model generated by a finished background render to the STL cache '''
+
+        (scadHash, process, stlFilePath) = self._backgroundRender
+        self._backgroundRender = None
+        self._backgroundRenderPollTimer.stop()
+
+        if os.path.isfile(stlFilePath):
+            if process.returncode == 0:
+                Logger.log('d', f'Caching the model rendered in the background for scad hash {scadHash}')
+                cachedStlFilePath = self._towerHistory.CacheStl(stlFilePath, scadHash)
+
+                # Swap out the draft of this tower, if there is one
+                if not self._draftRender is None and self._draftRender[0] == scadHash:
+                    self._replaceDraftStl(cachedStlFilePath)
+            os.remove(stlFilePath)
+
+        # Import the tower that was waiting for this render, if there is one
+        if not self._awaitedRender is None and self._awaitedRender[0] == scadHash:
+            (scadHash, controller, towerName, openScadFilename, openScadParameters, postProcessingCallback) = self._awaitedRender
+            self._awaitedRender = None
+
+            cachedStlFilePath = self._towerHistory.CachedStlFilePath(scadHash)
+            if cachedStlFilePath is None:
+                errorMessage = f'{catalog.i18nc("@msg", "Failed to generate")} "{towerName}" {catalog.i18nc("@msg", "from")} "{openScadFilename}"'
+                Message(errorMessage, title = self._pluginName, message_type=Message.MessageType.ERROR).show()
+                Logger.log('e', errorMessage)
+                self._waitDialog.hide()
+            else:
+                self._importStl(controller, towerName, cachedStlFilePath, postProcessingCallback, openScadParameters, scadHash)
+
+
+
+    def _cancelBackgroundRender(self)->None:
+        ''' Stops the background render, if there is one, and discards its output '''
+
+        if self._backgroundRender is None:
+            return
+
+        (scadHash, process, stlFilePath) = self._backgroundRender
+        self._backgroundRender = None
+        self._backgroundRenderPollTimer.stop()
+
+        self._openScadInterface.StopStlGeneration(process)
+        if os.path.isfile(stlFilePath):
+            os.remove(stlFilePath)
+
+
+
+    def _importStl(self, controller, towerName, stlFilePath, postProcessingCallback, openScadParameters=None, scadHash=None, meshData=None, recordHistory=True)->None:
+        ''' Imports an STL file into the scene
+            If the model has already been read into mesh data, it is imported from memory instead of the file
+            If recordHistory is False, the tower isn't added to the recent towers (such as for a draft model) '''
 
         # Make sure any previous auto towers are removed
         self._removeAutoTower()
@@ -469,30 +1036,21 @@ class AutoTowersGenerator(QObject, Extension):
         self._currentTowerController = controller
 
         # Import the STL file into the scene
-        self._autoTowerOperation = MeshImporter.ImportMesh(stlFilePath, name=self._pluginName)
+        if meshData is None:
+            self._autoTowerOperation = MeshImporter.ImportMesh(stlFilePath, name=self._pluginName)
+        else:
+            self._autoTowerOperation = MeshImporter.ImportMeshData(meshData, name=self._pluginName)
         CuraApplication.getInstance().processEvents()
 
         # The dialog is no longer needed
         self._waitDialog.hide()
 
-        # Some printers cannot handle long, descriptive file names
-        # If descriptive file names have been disabled, truncate the tower name
-        # Google suggests 20 characters to be a safe limit
-        # Ideally, truncation should happen when the tower name is first 
-        # generated by the tower controller, but that involves a lot of changes
-        # This is lazy but effective
-        if self.enableDescriptiveFileNamesSetting == False:
-            towerName = towerName.replace('Preset ', '')
-            towerName = towerName.replace('Custom', '')
-            towerName = towerName.replace('Tower', '')
-            towerName = towerName.replace('Bed Level Pattern', 'LVL')
-            towerName = towerName.replace('Distance', 'DST')
-            towerName = towerName.replace('Flow', 'FLW')
-            towerName = towerName.replace('Retraction', 'RT')
-            towerName = towerName.replace('Speed', 'SPD')
-            towerName = towerName.replace('Temp', 'TMP')
-            towerName = towerName.replace(' ', '')
-            towerName = towerName[:20]
+        towerName = self._shortenTowerName(towerName)
+
+        # Record the tower so it can be reopened later
+        if recordHistory:
+            self._towerHistory.AddTower(type(controller).__name__, towerName, stlFilePath, controller.getDataModelState(), openScadParameters, scadHash)
+            self.recentTowersChanged.emit()
 
         # Rename the print job
         CuraApplication.getInstance().getPrintInformation().setJobName(towerName)
@@ -520,6 +1078,32 @@ class AutoTowersGenerator(QObject, Extension):
 
 
 
+    def _shortenTowerName(self, towerName)->str:
+        ''' Returns the tower name to use for the print job '''
+
+        # Some printers cannot handle long, descriptive file names
+        # If descriptive file names have been disabled, truncate the tower name
+        # Google suggests 20 characters to be a safe limit
+        # Ideally, truncation should happen when the tower name is first 
+        # generated by the tower controller, but that involves a lot of changes
+        # This is lazy but effective
+        if self.enableDescriptiveFileNamesSetting == False:
+            towerName = towerName.replace('Preset ', '')
+            towerName = towerName.replace('Custom', '')
+            towerName = towerName.replace('Tower', '')
+            towerName = towerName.replace('Bed Level Pattern', 'LVL')
+            towerName = towerName.replace('Distance', 'DST')
+            towerName = towerName.replace('Flow', 'FLW')
+            towerName = towerName.replace('Retraction', 'RT')
+            towerName = towerName.replace('Speed', 'SPD')
+            towerName = towerName.replace('Temp', 'TMP')
+            towerName = towerName.replace(' ', '')
+            towerName = towerName[:20]
+
+        return towerName
+
+
+
     def _onMachineChanged(self)->None:
         ''' Listen for machine changes made after an Auto Tower is generated 
             In this case, the Auto Tower needs to be removed and regenerated '''           
@@ -554,9 +1138,15 @@ class AutoTowersGenerator(QObject, Extension):
             Iniializing here means that Cura is fully ready '''
 
         self._pluginSettings = PluginSettings(self._pluginSettingsFilePath)
+        self._towerHistory = TowerHistory(self._towerHistoryFilePath, self._cacheDir)
         
         # Init openscad path
         self._openScadInterface.SetOpenScadPath(self._pluginSettings.GetValue('openscad path'))        
+
+        # Render a single character with the tower font in the background, so OpenSCAD's font cache is ready for the first custom tower
+        if self.warmUpOpenScadSetting:
+            warmUpParameters = {**TowerAssembler.GlyphAtlasParameters('temptower.scad', {}), 'Character_Codes': [ord('0')]}
+            OpenScadWarmUpJob(self._openScadInterface, os.path.join(self._openScadSourcePath, 'glyphatlas.scad'), warmUpParameters).start()
         
         # Make sure the temp directory exists
         if not os.path.exists(self._tempDir):
@@ -582,11 +1172,10 @@ class AutoTowersGenerator(QObject, Extension):
         # Remove the tower
         self._removeAutoTower(catalog.i18nc("@msg", "Removing the autotower because Cura is closing"))
 
-        # Save the plugin settings
-        try:
-            self._pluginSettings.SaveToFile(self._pluginSettingsFilePath)
-        except AttributeError:
-            pass
+        # Don't leave OpenSCAD running in the background
+        self._cancelBackgroundRender()
+
+        # The plugin settings don't need to be saved here - they are saved in the background whenever they change
 
         # Clear the temp directory
         for file in glob.glob(os.path.join(self._tempDir, '*')):
@@ -626,8 +1215,20 @@ class AutoTowersGenerator(QObject, Extension):
                 gcode[0] += self._gcodeProcessedMarker + '\n'
 
                 # Call the tower controller post-processing callback to modify the g-code
+                # Cura's gcode writer reads the g-code list from the scene once this callback returns, so it can't 
+                # consume the g-code as it is post-processed
+                # Instead, the post-processing scripts replace the clumps (layers) of the list in place, one at a time, 
+                # so no more than a layer's worth of g-code is copied at once
                 try:
-                    gcode = self._towerControllerPostProcessingCallback(gcode, self.enableLcdMessagesSetting, self.enableAdvancedGcodeCommentsSetting)
+                    processed_gcode = self._towerControllerPostProcessingCallback(gcode, self.enableLcdMessagesSetting, self.enableAdvancedGcodeCommentsSetting)
+
+                    # Reduce the size of the post-processed g-code, if requested
+                    if self.compactGcodeSetting:
+                        processed_gcode = GcodeCompaction_PostProcessing.execute(processed_gcode)
+
+                    # Make sure the writer sees the post-processed g-code, even if it was returned as a new list
+                    if not processed_gcode is gcode:
+                        gcode[:] = processed_gcode
                 except Exception as e:
                     message = f'{catalog.i18nc("@msg", "An exception occured during post-processing")} : {e}'
                     Message(f'{message}', title=self._pluginName, message_type=Message.MessageType.ERROR).show()
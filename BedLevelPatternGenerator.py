@@ -0,0 +1,509 @@
+from collections import namedtuple
+import math
+
+import numpy
+
+# Generates bed level pattern meshes directly, without OpenSCAD
+#
+# The patterns reproduce those in bedlevelpattern.scad, which was inspired by this All3DP article:
+# https://all3dp.com/2/ender-3-pro-bed-leveling-gcode/
+#
+# Every pattern is made of flat shapes extruded to a single line height:
+#   - Convex polygons, such as the lines of a grid or the filled circles
+#   - Bands between two curves, such as the outline of a square or circle, or an arc of one
+# Where the lines of a pattern cross, they are split so the shapes only touch, which lets the
+# meshes be built in a few array operations instead of by constructive solid geometry, and
+# lets them be sliced the same way whether or not Cura unions overlapping volumes
+#
+# The returned vertices use the same coordinates as the STL files generated by OpenSCAD
+# (centered on the origin with Z up), so they are imported exactly the same way
+#
+# Each shape can also describe the paths the nozzle follows to print it, so a pattern can be
+# turned into gcode without being sliced
+
+# The number of segments used for a full circle (the equivalent of OpenSCAD's $fn)
+_circleSegmentCount = 128
+
+# The diameter of the circles in the five circles pattern
+_circleDiameter = 20
+
+# The distance of the five circles pattern outline from the corner circles
+_outlineDistance = 5
+
+# Each shape provides a function returning its triangles for a given height, and a function
+# returning the paths along the middle of its lines (arrays of points, repeating the first
+# point at the end if the path is a closed loop)
+_Shape = namedtuple('_Shape', ['triangles', 'toolpaths'])
+
+
+
+def GenerateBedLevelPattern(patternName, printAreaWidth, printAreaDepth, lineWidth, lineHeight, fillPercentage, ringCount, cellCount, padSize) -> numpy.ndarray:
+    ''' Generates a bed level pattern and returns the vertices of each of its triangles as an (n*3, 3) array
+        The pattern name is one of the pattern names from bedlevelpattern.scad (such as "spiral squares") '''
+
+    shapes = _patternShapes(patternName, printAreaWidth, printAreaDepth, lineWidth, fillPercentage, ringCount, cellCount, padSize)
+    return numpy.concatenate([shape.triangles(lineHeight) for shape in shapes]).astype(numpy.float32)
+
+
+
+def GenerateBedLevelToolpaths(patternName, printAreaWidth, printAreaDepth, lineWidth, fillPercentage, ringCount, cellCount, padSize) -> list:
+    ''' Generates the paths the nozzle follows to print a bed level pattern, centered on the origin
+        Each path is an (n, 2) array of points and the paths are ordered to keep travel moves short '''
+
+    shapes = _patternShapes(patternName, printAreaWidth, printAreaDepth, lineWidth, fillPercentage, ringCount, cellCount, padSize)
+    return _orderToolpaths([toolpath for shape in shapes for toolpath in shape.toolpaths()])
+
+
+
+def _patternShapes(patternName, printAreaWidth, printAreaDepth, lineWidth, fillPercentage, ringCount, cellCount, padSize) -> list:
+    ''' Returns the shapes making up a bed level pattern '''
+
+    patternWidth = printAreaWidth * (fillPercentage/100)
+    patternDepth = printAreaDepth * (fillPercentage/100)
+
+    if patternName == 'concentric squares':
+        shapes = _concentricSquares(patternWidth, patternDepth, lineWidth, ringCount)
+    elif patternName == 'spiral squares':
+        shapes = _spiralSquares(patternWidth, patternDepth, lineWidth, ringCount)
+    elif patternName == 'concentric circles':
+        shapes = _concentricCircles(patternWidth, patternDepth, lineWidth, ringCount)
+    elif patternName == 'x in square':
+        shapes = _xInSquare(patternWidth, patternDepth, lineWidth)
+    elif patternName == 'circle in square':
+        shapes = _circleInSquare(patternWidth, patternDepth, lineWidth)
+    elif patternName == 'grid':
+        shapes = _grid(patternWidth, patternDepth, lineWidth, cellCount)
+    elif patternName == 'padded grid':
+        shapes = _paddedGrid(patternWidth, patternDepth, lineWidth, cellCount, padSize)
+    elif patternName == 'five circles':
+        shapes = _fiveCircles(patternWidth, patternDepth, lineWidth)
+    else:
+        raise ValueError(f'Unrecognized bed level pattern "{patternName}"')
+
+    return shapes
+
+
+
+def _concentricSquares(width, depth, lineWidth, ringCount) -> list:
+    ''' Evenly spaced square outlines '''
+
+    ringScales = numpy.arange(1, ringCount + 1) / ringCount
+    return [_rectangleOutline(width * scale, depth * scale, lineWidth) for scale in ringScales]
+
+
+
+def _spiralSquares(width, depth, lineWidth, ringCount) -> list:
+    ''' Square outlines, each of which is broken and joined to the next to form a spiral '''
+
+    widthDelta = width/ringCount
+    depthDelta = depth/ringCount
+
+    rectangles = []
+    for ringNumber in range(ringCount):
+        ringWidth = widthDelta * (ringNumber + 1)
+        ringDepth = depthDelta * (ringNumber + 1)
+
+        x1 = -ringWidth/2
+        x2 = x1 + ringWidth
+        y1 = -ringDepth/2
+        y2 = y1 + ringDepth
+        y3 = y1 - depthDelta/2
+
+        # The bottom line of the ring
+        bottomLineWidth = ringWidth - widthDelta/2
+        if bottomLineWidth > 0:
+            rectangles.append((x1, y1, x1 + bottomLineWidth, y1 + lineWidth))
+
+        # The left line of the ring
+        rectangles.append((x1, y1, x1 + lineWidth, y2))
+
+        # The top line of the ring
+        rectangles.append((x1, y2 - lineWidth, x2, y2))
+
+        # The right line of the ring, which reaches down to join the next ring
+        rightLineDepth = ringDepth + depthDelta/2
+        if rightLineDepth < depth:
+            rectangles.append((x2 - lineWidth, y3, x2, y3 + rightLineDepth))
+        else:
+            rectangles.append((x2 - lineWidth, y1, x2, y1 + depth))
+
+    return [_rectangles(rectangles, lineWidth)]
+
+
+
+def _concentricCircles(width, depth, lineWidth, ringCount) -> list:
+    ''' Evenly spaced oval outlines '''
+
+    ringScales = numpy.arange(1, ringCount + 1) / ringCount
+    return [_ovalOutline(width * scale, depth * scale, lineWidth) for scale in ringScales]
+
+
+
+def _xInSquare(width, depth, lineWidth) -> list:
+    ''' A square outline with an X inside it '''
+
+    xWidth = width - lineWidth*4
+    xDepth = depth - lineWidth*4
+
+    # Each line of the X is a long rectangle along a diagonal, trimmed to the area inside the outline
+    angle = math.atan2(xDepth, xWidth)
+    length = math.hypot(xWidth, xDepth)
+    line = numpy.array([(-length/2, -lineWidth/2), (length/2, -lineWidth/2), (length/2, lineWidth/2), (-length/2, lineWidth/2)])
+    (lines, toolpaths) = ([], [])
+    for (lineAngle, ySign) in ((angle, 1), (-angle, -1)):
+        rotation = numpy.array([[math.cos(lineAngle), -math.sin(lineAngle)], [math.sin(lineAngle), math.cos(lineAngle)]])
+        lines.append(_clipToRectangle(line @ rotation.T, xWidth/2, xDepth/2))
+        toolpaths.append(numpy.array([(-xWidth/2, -xDepth/2 * ySign), (xWidth/2, xDepth/2 * ySign)]))
+
+    # The second line is split where it crosses the first, so the two halves only touch the first line
+    normal = numpy.array([-math.sin(angle), math.cos(angle)])
+    halves = [_clipToHalfPlane(lines[1], normal * sign, -lineWidth/2) for sign in (1, -1)]
+
+    return [_rectangleOutline(width, depth, lineWidth), _convexPolygon(lines[0], [toolpaths[0]]), _convexPolygon(halves[0], [toolpaths[1]]), _convexPolygon(halves[1], [])]
+
+
+
+def _circleInSquare(width, depth, lineWidth) -> list:
+    ''' A square outline with an oval outline inside it '''
+
+    return [_rectangleOutline(width, depth, lineWidth), _ovalOutline(width - lineWidth*4, depth - lineWidth*4, lineWidth)]
+
+
+
+def _grid(width, depth, lineWidth, cellCount) -> list:
+    ''' Evenly spaced horizontal and vertical lines '''
+
+    return [_rectangles(_gridLines(width, depth, lineWidth, cellCount), lineWidth)]
+
+
+
+def _paddedGrid(width, depth, lineWidth, cellCount, padSize) -> list:
+    ''' A grid with a square pad at each intersection '''
+
+    gridWidth = width - padSize + lineWidth
+    gridDepth = depth - padSize + lineWidth
+
+    # The pads are centered on the grid lines
+    padX = -(gridWidth - lineWidth)/2 + (gridWidth - lineWidth)/cellCount * numpy.arange(cellCount + 1)
+    padY = -(gridDepth - lineWidth)/2 + (gridDepth - lineWidth)/cellCount * numpy.arange(cellCount + 1)
+    (padX, padY) = [values.ravel() for values in numpy.meshgrid(padX, padY)]
+    pads = numpy.column_stack((padX - padSize/2, padY - padSize/2, padX + padSize/2, padY + padSize/2))
+
+    return [_rectangles(numpy.concatenate((_gridLines(gridWidth, gridDepth, lineWidth, cellCount), pads)), lineWidth)]
+
+
+
+def _fiveCircles(width, depth, lineWidth) -> list:
+    ''' Five filled circles, surrounded by an outline that curves in between them '''
+
+    cornerRadius = _circleDiameter/2 + _outlineDistance + lineWidth
+    cornerX = width/2 - cornerRadius
+    cornerY = depth/2 - cornerRadius
+
+    # The filled circles in the center and near each corner
+    shapes = [_circle(x, y, _circleDiameter/2, lineWidth) for (x, y) in ((0, 0), (cornerX, cornerY), (-cornerX, cornerY), (-cornerX, -cornerY), (cornerX, -cornerY))]
+
+    # The outline follows the outer half of a circle around each corner circle...
+    for (x, y, startAngle) in ((cornerX, cornerY, -45), (-cornerX, cornerY, 45), (-cornerX, -cornerY, 135), (cornerX, -cornerY, 225)):
+        shapes.append(_arcOutline(x, y, cornerRadius, lineWidth, startAngle, startAngle + 180))
+
+    # ...and joins them with large arcs curving in toward the center of each side
+    sideOffset = cornerX + cornerY
+    horizontalSideRadius = cornerY * math.sqrt(2) - cornerRadius + lineWidth
+    verticalSideRadius = cornerX * math.sqrt(2) - cornerRadius + lineWidth
+    shapes.append(_arcOutline(sideOffset, 0, horizontalSideRadius, lineWidth, 135, 225))
+    shapes.append(_arcOutline(-sideOffset, 0, horizontalSideRadius, lineWidth, -45, 45))
+    shapes.append(_arcOutline(0, sideOffset, verticalSideRadius, lineWidth, 225, 315))
+    shapes.append(_arcOutline(0, -sideOffset, verticalSideRadius, lineWidth, 45, 135))
+
+    return shapes
+
+
+
+def _gridLines(width, depth, lineWidth, cellCount) -> numpy.ndarray:
+    ''' Returns the rectangles making up the lines of a grid, with the outer lines inside the given dimensions '''
+
+    width -= lineWidth
+    depth -= lineWidth
+
+    lineX = -width/2 + width/cellCount * numpy.arange(cellCount + 1)
+    lineY = -depth/2 + depth/cellCount * numpy.arange(cellCount + 1)
+    ones = numpy.ones_like(lineX)
+
+    verticalLines = numpy.column_stack((lineX - lineWidth/2, ones * -(depth + lineWidth)/2, lineX + lineWidth/2, ones * (depth + lineWidth)/2))
+    horizontalLines = numpy.column_stack((ones * -(width + lineWidth)/2, lineY - lineWidth/2, ones * (width + lineWidth)/2, lineY + lineWidth/2))
+    return numpy.concatenate((verticalLines, horizontalLines))
+
+
+
+def _clipToRectangle(polygon:numpy.ndarray, halfWidth, halfDepth) -> numpy.ndarray:
+    ''' Clips a convex polygon to a rectangle centered on the origin '''
+
+    for (normal, limit) in (((1, 0), halfWidth), ((-1, 0), halfWidth), ((0, 1), halfDepth), ((0, -1), halfDepth)):
+        polygon = _clipToHalfPlane(polygon, numpy.array(normal), limit)
+
+    return polygon
+
+
+
+def _clipToHalfPlane(polygon:numpy.ndarray, normal:numpy.ndarray, limit) -> numpy.ndarray:
+    ''' Clips a convex polygon to the points whose projection onto the normal is no more than the limit (the Sutherland-Hodgman algorithm) '''
+
+    clipped = []
+    for (start, end) in zip(polygon, numpy.roll(polygon, -1, axis=0)):
+        (startDistance, endDistance) = (start @ normal, end @ normal)
+        startInside = startDistance <= limit
+        endInside = endDistance <= limit
+        if startInside:
+            clipped.append(start)
+        if startInside != endInside:
+            fraction = (limit - startDistance) / (endDistance - startDistance)
+            clipped.append(start + (end - start) * fraction)
+
+    return numpy.array(clipped)
+
+
+
+def _disjointRectangles(rectangles:numpy.ndarray) -> numpy.ndarray:
+    ''' Splits axis-aligned rectangles, given as (x1, y1, x2, y2), into rectangles covering the same area that don't overlap
+        The area is divided into cells at every rectangle edge, then each row's runs of covered cells are joined with
+        identical runs in the rows above them '''
+
+    # Rounding stops edges that should line up from leaving slivers between them
+    rectangles = numpy.round(rectangles, 6)
+    edgesX = numpy.unique(rectangles[:, [0, 2]])
+    edgesY = numpy.unique(rectangles[:, [1, 3]])
+
+    covered = numpy.zeros((len(edgesY) - 1, len(edgesX) - 1), dtype=bool)
+    (x1, x2) = (numpy.searchsorted(edgesX, rectangles[:, 0]), numpy.searchsorted(edgesX, rectangles[:, 2]))
+    (y1, y2) = (numpy.searchsorted(edgesY, rectangles[:, 1]), numpy.searchsorted(edgesY, rectangles[:, 3]))
+    for rectangle in zip(x1, y1, x2, y2):
+        covered[rectangle[1]:rectangle[3], rectangle[0]:rectangle[2]] = True
+
+    # Each open run is the row it started on, by its first and last cell
+    disjoint = []
+    openRuns = {}
+    for row in range(len(covered) + 1):
+        runs = set()
+        if row < len(covered):
+            changes = numpy.flatnonzero(numpy.diff(numpy.concatenate(([False], covered[row], [False]))))
+            runs = set(zip(changes[::2], changes[1::2]))
+
+        for run in [run for run in openRuns if not run in runs]:
+            disjoint.append((edgesX[run[0]], edgesY[openRuns.pop(run)], edgesX[run[1]], edgesY[row]))
+        for run in runs:
+            openRuns.setdefault(run, row)
+
+    return numpy.array(disjoint, dtype=numpy.float64).reshape(-1, 4)
+
+
+
+def _orderToolpaths(toolpaths) -> list:
+    ''' Orders toolpaths so each one starts as close as possible to where the last one ended
+        Open paths may be reversed and closed loops may be started from any of their points '''
+
+    if len(toolpaths) == 0:
+        return []
+
+    # Gather every point each path could be started from into one array, so the nearest can be found in a single operation
+    closedPaths = [len(toolpath) > 2 and numpy.array_equal(toolpath[0], toolpath[-1]) for toolpath in toolpaths]
+    startPoints = [toolpath[:-1] if closed else toolpath[[0, -1]] for (toolpath, closed) in zip(toolpaths, closedPaths)]
+    pathIndices = numpy.concatenate([numpy.full(len(points), index) for (index, points) in enumerate(startPoints)])
+    pointIndices = numpy.concatenate([numpy.arange(len(points)) for points in startPoints])
+    startPoints = numpy.concatenate(startPoints)
+    available = numpy.ones(len(startPoints), dtype=bool)
+
+    ordered = []
+    position = toolpaths[0][0]
+    for _ in range(len(toolpaths)):
+        distances = numpy.where(available, numpy.hypot(*(startPoints - position).T), math.inf)
+        nearest = int(numpy.argmin(distances))
+        (pathIndex, pointIndex) = (pathIndices[nearest], pointIndices[nearest])
+        available[pathIndices == pathIndex] = False
+
+        toolpath = toolpaths[pathIndex]
+        if closedPaths[pathIndex]:
+            toolpath = numpy.concatenate((toolpath[pointIndex:-1], toolpath[:pointIndex + 1]))
+        elif pointIndex == 1:
+            toolpath = toolpath[::-1]
+        ordered.append(toolpath)
+        position = toolpath[-1]
+
+    return ordered
+
+
+
+def _closedLoop(points:numpy.ndarray) -> numpy.ndarray:
+    ''' Returns a toolpath following a loop of points back to the start '''
+
+    return numpy.concatenate((points, points[:1]))
+
+
+
+def _rectangleToolpaths(x1, y1, x2, y2, lineWidth) -> list:
+    ''' Fills a rectangle with loops working inwards, finishing with a single line if the middle is too narrow for a loop '''
+
+    toolpaths = []
+    while True:
+        width = x2 - x1
+        depth = y2 - y1
+
+        # Stop once what's left is too narrow to print
+        if min(width, depth) < lineWidth/2:
+            break
+
+        # A single line down the middle fills whatever is too narrow for a loop
+        if min(width, depth) < lineWidth*2:
+            (centerX, centerY) = ((x1 + x2)/2, (y1 + y2)/2)
+            if width <= depth:
+                toolpaths.append(numpy.array([(centerX, y1 + lineWidth/2), (centerX, y2 - lineWidth/2)]))
+            else:
+                toolpaths.append(numpy.array([(x1 + lineWidth/2, centerY), (x2 - lineWidth/2, centerY)]))
+            break
+
+        inset = lineWidth/2
+        toolpaths.append(_closedLoop(numpy.array([(x1 + inset, y1 + inset), (x2 - inset, y1 + inset), (x2 - inset, y2 - inset), (x1 + inset, y2 - inset)])))
+        (x1, y1, x2, y2) = (x1 + lineWidth, y1 + lineWidth, x2 - lineWidth, y2 - lineWidth)
+
+    return toolpaths
+
+
+
+def _circlePoints(x, y, radiusX, radiusY, startAngle=0, endAngle=360, segmentCount=_circleSegmentCount, endpoint=False) -> numpy.ndarray:
+    ''' Returns points around an oval (or an arc of one), from the start angle counter-clockwise to the end angle (in degrees) '''
+
+    angles = numpy.radians(numpy.linspace(startAngle, endAngle, segmentCount + (1 if endpoint else 0), endpoint=endpoint))
+    return numpy.column_stack((x + radiusX * numpy.cos(angles), y + radiusY * numpy.sin(angles)))
+
+
+
+# The functions below describe the primitive shapes the patterns are made of
+# Each returns a _Shape, so the triangles can be generated once the line height is known
+
+
+
+def _rectangles(rectangles, lineWidth) -> _Shape:
+    ''' Axis-aligned rectangles, each given as (x1, y1, x2, y2)
+        Where the rectangles overlap, the mesh is split into rectangles that only touch, while each is printed with its own toolpaths '''
+
+    rectangles = numpy.asarray(rectangles, dtype=numpy.float64)
+    (x1, y1, x2, y2) = _disjointRectangles(rectangles).T
+    corners = numpy.stack((numpy.column_stack((x1, y1)), numpy.column_stack((x2, y1)), numpy.column_stack((x2, y2)), numpy.column_stack((x1, y2))), axis=1)
+    return _Shape(
+        lambda height: _extrudeConvexPolygons(corners, height),
+        lambda: [toolpath for rectangle in rectangles for toolpath in _rectangleToolpaths(*rectangle, lineWidth)])
+
+
+
+def _convexPolygon(points:numpy.ndarray, toolpaths:list) -> _Shape:
+    ''' A single convex polygon with its points in counter-clockwise order, printed with the given toolpaths '''
+
+    return _Shape(lambda height: _extrudeConvexPolygons(points[numpy.newaxis], height), lambda: toolpaths)
+
+
+
+def _circle(x, y, radius, lineWidth) -> _Shape:
+    ''' A filled circle '''
+
+    # The circle is filled with loops working inwards
+    toolpathRadii = numpy.arange(radius - lineWidth/2, lineWidth/4, -lineWidth)
+    toolpaths = [_closedLoop(_circlePoints(x, y, toolpathRadius, toolpathRadius)) for toolpathRadius in toolpathRadii]
+
+    return _convexPolygon(_circlePoints(x, y, radius, radius), toolpaths)
+
+
+
+def _rectangleOutline(width, depth, thickness) -> _Shape:
+    ''' The outline of a rectangle centered on the origin '''
+
+    # If the outline is thicker than the rectangle, the rectangle is simply filled
+    if width <= thickness*2 or depth <= thickness*2:
+        return _rectangles([(-width/2, -depth/2, width/2, depth/2)], thickness)
+
+    signs = numpy.array([(-1, -1), (1, -1), (1, 1), (-1, 1)])
+    outer = signs * (width/2, depth/2)
+    inner = signs * (width/2 - thickness, depth/2 - thickness)
+    middle = signs * (width/2 - thickness/2, depth/2 - thickness/2)
+    return _Shape(lambda height: _extrudeBand(outer, inner, height, closed=True), lambda: [_closedLoop(middle)])
+
+
+
+def _ovalOutline(width, depth, thickness) -> _Shape:
+    ''' The outline of an oval centered on the origin '''
+
+    # As in OpenSCAD, the inside of the outline is an oval with its diameters reduced by twice the thickness
+    outer = _circlePoints(0, 0, width/2, depth/2)
+    inner = _circlePoints(0, 0, max(width/2 - thickness, 0), max(depth/2 - thickness, 0))
+    middle = _circlePoints(0, 0, max(width/2 - thickness/2, 0), max(depth/2 - thickness/2, 0))
+    return _Shape(lambda height: _extrudeBand(outer, inner, height, closed=True), lambda: [_closedLoop(middle)])
+
+
+
+def _arcOutline(x, y, outerRadius, thickness, startAngle, endAngle) -> _Shape:
+    ''' An arc of a circle outline, from the start angle counter-clockwise to the end angle (in degrees) '''
+
+    segmentCount = max(1, round(_circleSegmentCount * (endAngle - startAngle) / 360))
+    innerRadius = max(outerRadius - thickness, 0)
+    middleRadius = max(outerRadius - thickness/2, 0)
+
+    outer = _circlePoints(x, y, outerRadius, outerRadius, startAngle, endAngle, segmentCount, endpoint=True)
+    inner = _circlePoints(x, y, innerRadius, innerRadius, startAngle, endAngle, segmentCount, endpoint=True)
+    middle = _circlePoints(x, y, middleRadius, middleRadius, startAngle, endAngle, segmentCount, endpoint=True)
+    return _Shape(lambda height: _extrudeBand(outer, inner, height, closed=False), lambda: [middle])
+
+
+
+def _extrudeConvexPolygons(polygons:numpy.ndarray, height) -> numpy.ndarray:
+    ''' Extrudes convex polygons, given as an (n, k, 2) array of counter-clockwise points, into closed prisms '''
+
+    (polygonCount, pointCount) = polygons.shape[:2]
+    bottom = numpy.concatenate((polygons, numpy.zeros((polygonCount, pointCount, 1))), axis=2)
+    top = numpy.concatenate((polygons, numpy.full((polygonCount, pointCount, 1), height)), axis=2)
+
+    # The top and bottom are triangle fans around the first point of each polygon
+    fan = numpy.arange(1, pointCount - 1)
+    topTriangles = numpy.stack((numpy.repeat(top[:, :1], len(fan), axis=1), top[:, fan], top[:, fan + 1]), axis=2)
+    bottomTriangles = numpy.stack((numpy.repeat(bottom[:, :1], len(fan), axis=1), bottom[:, fan + 1], bottom[:, fan]), axis=2)
+
+    # The sides join each edge of the bottom to the same edge of the top
+    following = numpy.roll(numpy.arange(pointCount), -1)
+    sideTriangles = _quads(bottom, bottom[:, following], top[:, following], top)
+
+    return numpy.concatenate((topTriangles.reshape(-1, 3), bottomTriangles.reshape(-1, 3), sideTriangles))
+
+
+
+def _extrudeBand(outer:numpy.ndarray, inner:numpy.ndarray, height, closed) -> numpy.ndarray:
+    ''' Extrudes the band between matching outer and inner curves, traced counter-clockwise, into a solid
+        A closed band is a loop (like an outline), while an open band has ends (like an arc) '''
+
+    pointCount = len(outer)
+    outerBottom = numpy.column_stack((outer, numpy.zeros(pointCount)))
+    outerTop = numpy.column_stack((outer, numpy.full(pointCount, height)))
+    innerBottom = numpy.column_stack((inner, numpy.zeros(pointCount)))
+    innerTop = numpy.column_stack((inner, numpy.full(pointCount, height)))
+
+    # Each segment of the band joins one point to the next
+    start = numpy.arange(pointCount if closed else pointCount - 1)
+    end = (start + 1) % pointCount
+
+    triangles = [
+        _quads(innerTop[start], outerTop[start], outerTop[end], innerTop[end]),
+        _quads(innerBottom[end], outerBottom[end], outerBottom[start], innerBottom[start]),
+        _quads(outerBottom[start], outerBottom[end], outerTop[end], outerTop[start]),
+        _quads(innerBottom[start], innerTop[start], innerTop[end], innerBottom[end]),
+    ]
+
+    # An open band is closed off at each end
+    if not closed:
+        triangles.append(_quads(innerBottom[:1], outerBottom[:1], outerTop[:1], innerTop[:1]))
+        triangles.append(_quads(innerBottom[-1:], innerTop[-1:], outerTop[-1:], outerBottom[-1:]))
+
+    return numpy.concatenate(triangles)
+
+
+
+def _quads(a, b, c, d) -> numpy.ndarray:
+    ''' Splits quads, given by arrays of their corners in counter-clockwise order, into triangles '''
+
+    return numpy.stack((a, b, c, a, c, d), axis=-2).reshape(-1, 3)
@@ -12,6 +12,7 @@ from UM.Resources import Resources
 
 
 from .ControllerBase import ControllerBase
+from .. import BedLevelPatternGenerator
 from ..Models.BedLevelPatternModel import BedLevelPatternModel
 
 Resources.addSearchPath(
@@ -22,9 +23,22 @@ catalog = i18nCatalog("autotowers")
 
 class BedLevelPatternController(ControllerBase):
 
-    _openScadFilename = 'bedlevelpattern.scad'
     _qmlFilename = 'BedLevelPatternDialog.qml'
 
+    # Custom patterns are generated without OpenSCAD
+    customTowersRequireOpenScad = False
+
+    # The parameters the preset patterns are generated with
+    _presetParameters = {
+        'patternName': 'spiral squares',
+        'lineWidth': 0.4,
+        'lineHeight': 0.2,
+        'fillPercentage': 90,
+        'ringCount': 7,
+        'cellCount': 4,
+        'padSize': 20,
+    }
+
 
 
     # The print settings that are considered critical for this tower
@@ -41,9 +55,9 @@ class BedLevelPatternController(ControllerBase):
 
 
 
-    def __init__(self, guiDir, stlDir, loadStlCallback, generateStlCallback, pluginName):
+    def __init__(self, guiDir, stlDir, loadStlCallback, loadMeshCallback, writeGcodeCallback, generateStlCallback, speculativeRenderCallback, pluginName):
         dataModel = BedLevelPatternModel(stlDir=stlDir)
-        super().__init__(name=catalog.i18nc("@test", "Bed Level Pattern"), guiDir=guiDir, loadStlCallback=loadStlCallback, generateStlCallback=generateStlCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
+        super().__init__(name=catalog.i18nc("@test", "Bed Level Pattern"), guiDir=guiDir, loadStlCallback=loadStlCallback, loadMeshCallback=loadMeshCallback, writeGcodeCallback=writeGcodeCallback, generateStlCallback=generateStlCallback, speculativeRenderCallback=speculativeRenderCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
 
 
 
@@ -71,14 +85,24 @@ class BedLevelPatternController(ControllerBase):
     def _loadPresetBedLevelPattern(self)->None:
         ''' Load a preset tower '''
 
-        # Determine the path of the STL file to load
-        stlFilePath = self._dataModel.presetFilePath
+        (print_area_width, print_area_depth) = self._dataModel.presetPrintArea
 
         # Determine the tower name
         towerName = f'Preset {self._dataModel.presetName}'
 
-        # Use the callback to load the preset STL file
-        self._loadStlCallback(self, towerName, stlFilePath, self.postProcess)
+        # The pattern can be written directly as gcode, using the current line width and layer height
+        if self._dataModel.directGcode:
+            parameters = {name: value for (name, value) in self._presetParameters.items() if name != 'lineHeight'}
+            parameters['lineWidth'] = self._dataModel.lineWidth
+            toolpaths = BedLevelPatternGenerator.GenerateBedLevelToolpaths(printAreaWidth=print_area_width, printAreaDepth=print_area_depth, **parameters)
+            self._writeGcodeCallback(self, towerName, toolpaths, self._dataModel.lineWidth, self._dataModel.layerHeight)
+            return
+
+        # Generate the preset pattern
+        vertices = BedLevelPatternGenerator.GenerateBedLevelPattern(printAreaWidth=print_area_width, printAreaDepth=print_area_depth, **self._presetParameters)
+
+        # Use the callback to load the generated pattern
+        self._loadMeshCallback(self, towerName, vertices, self.postProcess)
 
 
 
@@ -101,21 +125,17 @@ class BedLevelPatternController(ControllerBase):
         # Query the current line width
         line_width = self._dataModel.lineWidth
 
-        # Compile the parameters to send to OpenSCAD
-        openScadParameters = {
-            'Bed_Level_Pattern_Type': patternName,
-            'Print_Area_Width': print_area_width,
-            'Print_Area_Depth': print_area_depth,
-            'Line_Width': line_width,
-            'Line_Height': layer_height,
-            'Fill_Percentage': fill_percentage,
-            'Concentric_Ring_Count': number_of_rings,
-            'Grid_Cell_Count': cell_size,
-            'Grid_Pad_Size': pad_size,
-        }
-
         # Determine the tower name
         towerName = f'Custom Bed Level Pattern - {self._dataModel.patternName} {print_area_width}x{print_area_depth}'
 
-        # Send the filename and parameters to the STL generation callback
-        self._generateStlCallback(self, towerName, self._openScadFilename, openScadParameters, self.postProcess)
+        # The pattern can be written directly as gcode, without being sliced
+        if self._dataModel.directGcode:
+            toolpaths = BedLevelPatternGenerator.GenerateBedLevelToolpaths(patternName, print_area_width, print_area_depth, line_width, fill_percentage, number_of_rings, cell_size, pad_size)
+            self._writeGcodeCallback(self, towerName, toolpaths, line_width, layer_height)
+            return
+
+        # Generate the pattern directly - this is fast enough that OpenSCAD isn't needed
+        vertices = BedLevelPatternGenerator.GenerateBedLevelPattern(patternName, print_area_width, print_area_depth, line_width, layer_height, fill_percentage, number_of_rings, cell_size, pad_size)
+
+        # Send the generated pattern to the mesh loading callback
+        self._loadMeshCallback(self, towerName, vertices, self.postProcess)
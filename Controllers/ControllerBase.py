@@ -1,12 +1,15 @@
 # Import the correct version of PyQt
 try:
-    from PyQt6.QtCore import QObject
+    from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+    from PyQt6.QtQml import QQmlEngine
 except ImportError:
-    from PyQt5.QtCore import QObject
+    from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+    from PyQt5.QtQml import QQmlEngine
 
 from enum import IntEnum
 import math
 import os
+import time
 
 from cura.CuraApplication import CuraApplication
 from cura.Settings.ExtruderManager import ExtruderManager
@@ -24,7 +27,15 @@ class ControllerBase(QObject):
 
 
 
-    def __init__(self, name, guiDir, loadStlCallback, generateStlCallback, qmlFilename, criticalPropertiesTable, dataModel, pluginName):
+    # Whether OpenSCAD is needed to generate custom towers
+    customTowersRequireOpenScad = True
+
+    # How long to wait after the last change in the dialog before rendering the custom tower in the background (in milliseconds)
+    _speculativeRenderDelay = 1500
+
+
+
+    def __init__(self, name, guiDir, loadStlCallback, generateStlCallback, qmlFilename, criticalPropertiesTable, dataModel, pluginName, speculativeRenderCallback=None, loadMeshCallback=None, writeGcodeCallback=None):
         super().__init__()
         
         self.name = name
@@ -32,7 +43,10 @@ class ControllerBase(QObject):
         self._guiDir = guiDir
 
         self._loadStlCallback = loadStlCallback
+        self._loadMeshCallback = loadMeshCallback
+        self._writeGcodeCallback = writeGcodeCallback
         self._generateStlCallback = generateStlCallback
+        self._speculativeRenderCallback = speculativeRenderCallback
 
         self._qmlFilename = qmlFilename
         self._criticalPropertiesTable = criticalPropertiesTable
@@ -42,6 +56,18 @@ class ControllerBase(QObject):
         self._pluginName = pluginName
         
         self._backedUpSettings = {}
+
+        # Render the custom tower in the background once the user stops changing the dialog values
+        # so it is likely to already be available when the tower is generated
+        self._speculativeRenderTimer = QTimer()
+        self._speculativeRenderTimer.setSingleShot(True)
+        self._speculativeRenderTimer.setInterval(self._speculativeRenderDelay)
+        self._speculativeRenderTimer.timeout.connect(self._requestSpeculativeRender)
+
+        # Every change to the data model restarts the countdown
+        for name in dir(type(self._dataModel)):
+            if isinstance(getattr(type(self._dataModel), name), pyqtSignal):
+                getattr(self._dataModel, name).connect(self._onDataModelChanged)
     
 
 
@@ -92,12 +118,47 @@ class ControllerBase(QObject):
 
     _dialog = None
 
-    def generate(self, customizable)->None:
-        ''' Generate a tower - either a preset tower or a custom tower '''
+    def prepareDialog(self, customizable=False)->None:
+        ''' Creates the dialog for this controller, if it hasn't been created already
+            The dialog is created once and shown again each time a tower is generated, so its QML only needs to be compiled once '''
+
+        if not self._dialog is None:
+            return
 
+        startTime = time.perf_counter()
         qmlFilePath = os.path.join(self._guiDir, self._qmlFilename)
         self._dialog = CuraApplication.getInstance().createQmlComponent(qmlFilePath, {'controller': self, 'dataModel': self._dataModel, 'enableCustom': customizable})
+        Logger.log('d', f'Created the {self.name} dialog in {time.perf_counter() - startTime:.3f} seconds')
+
+
+
+    def generate(self, customizable)->None:
+        ''' Generate a tower - either a preset tower or a custom tower '''
+
+        startTime = time.perf_counter()
+        self.prepareDialog(customizable)
+        if self._dialog is None:
+            Logger.log('e', f'Unable to create the {self.name} dialog')
+            return
+
+        # OpenSCAD may have been found or lost since the dialog was created
+        QQmlEngine.contextForObject(self._dialog).setContextProperty('enableCustom', customizable)
         self._dialog.show()
+        Logger.log('d', f'Opened the {self.name} dialog in {time.perf_counter() - startTime:.3f} seconds')
+
+
+
+    def getDataModelState(self)->dict:
+        ''' Returns the values selected in the data model, which determine how the tower is post-processed '''
+
+        return self._dataModel.getState()
+
+
+
+    def restoreDataModelState(self, state:dict)->None:
+        ''' Restores data model values previously returned by getDataModelState '''
+
+        self._dataModel.restoreState(state)
 
 
 
@@ -122,6 +183,40 @@ class ControllerBase(QObject):
             
 
 
+    def _customTowerDescription(self)->tuple:
+        ''' Returns the tower name, OpenSCAD file name, and OpenSCAD parameters for the custom tower currently configured in the dialog
+            Controllers that generate custom towers with OpenSCAD override this '''
+
+        return None
+
+
+
+    def _onDataModelChanged(self)->None:
+        ''' Restarts the speculative render countdown when a value in the dialog is changed '''
+
+        if not self._dialog is None and self._dialog.property('visible'):
+            self._speculativeRenderTimer.start()
+
+
+
+    def _requestSpeculativeRender(self)->None:
+        ''' Asks for the custom tower currently configured in the dialog to be rendered in the background '''
+
+        # Nothing needs to be rendered if the dialog has been closed or a preset is selected
+        if self._speculativeRenderCallback is None or self._dialog is None or not self._dialog.property('visible'):
+            return
+        if self._dataModel.presetSelected:
+            return
+
+        towerDescription = self._customTowerDescription()
+        if towerDescription is None:
+            return
+
+        (towerName, openScadFilename, openScadParameters) = towerDescription
+        self._speculativeRenderCallback(openScadFilename, openScadParameters)
+
+
+
     def _getContainerStack(self, sourceDescription: ContainerId):
         ''' Retieves and returns a property source based on a description string '''
 
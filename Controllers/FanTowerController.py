@@ -38,9 +38,9 @@ class FanTowerController(ControllerBase):
 
 
 
-    def __init__(self, guiDir, stlDir, loadStlCallback, generateStlCallback, pluginName):
+    def __init__(self, guiDir, stlDir, loadStlCallback, loadMeshCallback, writeGcodeCallback, generateStlCallback, speculativeRenderCallback, pluginName):
         dataModel = FanTowerModel(stlDir=stlDir)
-        super().__init__(name=catalog.i18nc("@test", "Fan Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, generateStlCallback=generateStlCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
+        super().__init__(name=catalog.i18nc("@test", "Fan Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, loadMeshCallback=loadMeshCallback, writeGcodeCallback=writeGcodeCallback, generateStlCallback=generateStlCallback, speculativeRenderCallback=speculativeRenderCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
 
 
 
@@ -104,6 +104,15 @@ class FanTowerController(ControllerBase):
     def _generateCustomFanTower(self)->None:
         ''' Generate a custom tower '''
 
+        # Send the filename and parameters to the STL generation callback
+        (towerName, openScadFilename, openScadParameters) = self._customTowerDescription()
+        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+
+
+
+    def _customTowerDescription(self)->tuple:
+        ''' Returns the name, OpenSCAD file name, and OpenSCAD parameters of the custom tower configured in the dialog '''
+
         # Collect data from the data model
         openScadFilename = self._openScadFilename
         startFanPercent = self._dataModel.startFanPercent
@@ -128,5 +137,4 @@ class FanTowerController(ControllerBase):
         # Determine the tower name
         towerName = f'Custom Fan Tower - Speed {startFanPercent}-{endFanPercent}x{fanPercentChange}'
 
-        # Send the filename and parameters to the STL generation callback
-        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+        return (towerName, openScadFilename, openScadParameters)
@@ -41,9 +41,9 @@ class FlowTowerController(ControllerBase):
 
 
 
-    def __init__(self, guiDir, stlDir, loadStlCallback, generateStlCallback, pluginName):
+    def __init__(self, guiDir, stlDir, loadStlCallback, loadMeshCallback, writeGcodeCallback, generateStlCallback, speculativeRenderCallback, pluginName):
         dataModel = FlowTowerModel(stlDir=stlDir)
-        super().__init__(name=catalog.i18nc("@test", "Flow Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, generateStlCallback=generateStlCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
+        super().__init__(name=catalog.i18nc("@test", "Flow Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, loadMeshCallback=loadMeshCallback, writeGcodeCallback=writeGcodeCallback, generateStlCallback=generateStlCallback, speculativeRenderCallback=speculativeRenderCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
 
 
 
@@ -110,6 +110,15 @@ class FlowTowerController(ControllerBase):
     def _generateCustomFlowTower(self)->None:
         ''' Generate a custom tower '''
 
+        # Send the filename and parameters to the model callback
+        (towerName, openScadFilename, openScadParameters) = self._customTowerDescription()
+        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+
+
+
+    def _customTowerDescription(self)->tuple:
+        ''' Returns the name, OpenSCAD file name, and OpenSCAD parameters of the custom tower configured in the dialog '''
+
         # Collect data from the data model
         openScadFileName = self._dataModel.towerDesignFileName
         startFlowPercent = self._dataModel.startFlowPercent
@@ -134,5 +143,4 @@ class FlowTowerController(ControllerBase):
         # Determine the tower name
         towerName = f'Custom Flow Tower - {startFlowPercent}-{endFlowPercent}x{flowPercentChange}'
 
-        # Send the filename and parameters to the model callback
-        self._generateStlCallback(self, towerName, openScadFileName, openScadParameters, self.postProcess)
+        return (towerName, openScadFileName, openScadParameters)
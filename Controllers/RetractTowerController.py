@@ -37,9 +37,9 @@ class RetractTowerController(ControllerBase):
 
 
 
-    def __init__(self, guiDir, stlDir, loadStlCallback, generateStlCallback, pluginName):
+    def __init__(self, guiDir, stlDir, loadStlCallback, loadMeshCallback, writeGcodeCallback, generateStlCallback, speculativeRenderCallback, pluginName):
         dataModel = RetractTowerModel(stlDir=stlDir)
-        super().__init__(name=catalog.i18nc("@test", "Retraction Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, generateStlCallback=generateStlCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
+        super().__init__(name=catalog.i18nc("@test", "Retraction Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, loadMeshCallback=loadMeshCallback, writeGcodeCallback=writeGcodeCallback, generateStlCallback=generateStlCallback, speculativeRenderCallback=speculativeRenderCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
 
 
 
@@ -66,6 +66,7 @@ class RetractTowerController(ControllerBase):
         initialLayerHeight = self._dataModel.initialLayerHeight
         layerHeight = self._dataModel.layerHeight
         relativeExtrusion = self._dataModel.relativeExtrusion
+        firmwareRetraction = self._dataModel.firmwareRetraction
         startValue = self._dataModel.startValue
         valueChange = self._dataModel.valueChange
         towerType = self._dataModel.towerTypeName
@@ -78,6 +79,8 @@ class RetractTowerController(ControllerBase):
                 section_height=sectionHeight, 
                 initial_layer_height=initialLayerHeight, 
                 layer_height=layerHeight, 
+                relative_extrusion=relativeExtrusion,
+                firmware_retraction=firmwareRetraction,
                 start_retract_speed=startValue, 
                 retract_speed_change=valueChange, 
                 enable_lcd_messages=enable_lcd_messages,
@@ -94,6 +97,7 @@ class RetractTowerController(ControllerBase):
                 initial_layer_height=initialLayerHeight, 
                 layer_height=layerHeight, 
                 relative_extrusion=relativeExtrusion,
+                firmware_retraction=firmwareRetraction,
                 start_retract_distance=startValue, 
                 retract_distance_change=valueChange, 
                 enable_lcd_messages=enable_lcd_messages,
@@ -124,6 +128,15 @@ class RetractTowerController(ControllerBase):
 
     def generateCustomRetractTower(self)->None:
         ''' This method is called by the dialog when the "Generate" button is clicked '''
+
+        # Send the filename and parameters to the model callback
+        (towerName, openScadFilename, openScadParameters) = self._customTowerDescription()
+        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+
+
+
+    def _customTowerDescription(self)->tuple:
+        ''' Returns the name, OpenSCAD file name, and OpenSCAD parameters of the custom tower configured in the dialog '''
         
         # Collect the tower customizations
         openScadFilename = self._openScadFilename
@@ -148,5 +161,4 @@ class RetractTowerController(ControllerBase):
         # Determine the tower name
         towerName = f'Custom Retraction Tower - {self._dataModel.towerTypeName} {startValue}-{endValue}x{valueChange}'
 
-        # Send the filename and parameters to the model callback
-        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+        return (towerName, openScadFilename, openScadParameters)
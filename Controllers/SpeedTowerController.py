@@ -35,9 +35,9 @@ class SpeedTowerController(ControllerBase):
 
 
 
-    def __init__(self, guiDir, stlDir, loadStlCallback, generateStlCallback, pluginName):
+    def __init__(self, guiDir, stlDir, loadStlCallback, loadMeshCallback, writeGcodeCallback, generateStlCallback, speculativeRenderCallback, pluginName):
         dataModel = SpeedTowerModel(stlDir=stlDir)
-        super().__init__(name=catalog.i18nc("@test", "Speed Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, generateStlCallback=generateStlCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
+        super().__init__(name=catalog.i18nc("@test", "Speed Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, loadMeshCallback=loadMeshCallback, writeGcodeCallback=writeGcodeCallback, generateStlCallback=generateStlCallback, speculativeRenderCallback=speculativeRenderCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
 
 
 
@@ -120,6 +120,15 @@ class SpeedTowerController(ControllerBase):
     def _generateCustomSpeedTower(self)->None:
         ''' Generate a custom tower '''
 
+        # Send the filename and parameters to the model callback
+        (towerName, openScadFilename, openScadParameters) = self._customTowerDescription()
+        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+
+
+
+    def _customTowerDescription(self)->tuple:
+        ''' Returns the name, OpenSCAD file name, and OpenSCAD parameters of the custom tower configured in the dialog '''
+
         # Collect data from the data model
         startSpeed = self._dataModel.startSpeed
         endSpeed = self._dataModel.endSpeed
@@ -146,5 +155,4 @@ class SpeedTowerController(ControllerBase):
         # Determine the tower name
         towerName = f'Custom Speed Tower - {towerType} {startSpeed}-{endSpeed}x{speedChange}'
 
-        # Send the filename and parameters to the model callback
-        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+        return (towerName, openScadFilename, openScadParameters)
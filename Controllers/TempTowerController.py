@@ -35,9 +35,9 @@ class TempTowerController(ControllerBase):
 
 
 
-    def __init__(self, guiDir, stlDir, loadStlCallback, generateStlCallback, pluginName):
+    def __init__(self, guiDir, stlDir, loadStlCallback, loadMeshCallback, writeGcodeCallback, generateStlCallback, speculativeRenderCallback, pluginName):
         dataModel = TempTowerModel(stlDir=stlDir)
-        super().__init__(name=catalog.i18nc("@test", "Temp Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, generateStlCallback=generateStlCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
+        super().__init__(name=catalog.i18nc("@test", "Temp Tower"), guiDir=guiDir, loadStlCallback=loadStlCallback, loadMeshCallback=loadMeshCallback, writeGcodeCallback=writeGcodeCallback, generateStlCallback=generateStlCallback, speculativeRenderCallback=speculativeRenderCallback, qmlFilename=self._qmlFilename, criticalPropertiesTable=self._criticalPropertiesTable, dataModel=dataModel, pluginName=pluginName)
 
 
 
@@ -100,6 +100,15 @@ class TempTowerController(ControllerBase):
     def _generateCustomTempTower(self)->None:
         ''' Generate a custom tower '''
 
+        # Send the filename and parameters to the model callback
+        (towerName, openScadFilename, openScadParameters) = self._customTowerDescription()
+        self._generateStlCallback(self, towerName, openScadFilename, openScadParameters, self.postProcess)
+
+
+
+    def _customTowerDescription(self)->tuple:
+        ''' Returns the name, OpenSCAD file name, and OpenSCAD parameters of the custom tower configured in the dialog '''
+
         # Collect data from the data model
         openScadFilename = self._openScadFilename
         startTemp = self._dataModel.startTemp
@@ -123,5 +132,4 @@ class TempTowerController(ControllerBase):
         # Determine the tower name
         towerName = f'Custom Temp Tower - {startTemp}-{endTemp}x{tempChange}'
 
-        # Send the filename and parameters to the model callback
-        self._generateStlCallback(self, towerName, self._openScadFilename, openScadParameters, self.postProcess)
+        return (towerName, self._openScadFilename, openScadParameters)
@@ -0,0 +1,247 @@
+# Generates gcode for a single layer of toolpaths without slicing a model
+#
+# A bed level pattern is only one layer of simple lines, so the gcode CuraEngine would generate
+# for it can be written directly from the pattern's toolpaths in a fraction of the time
+#
+# The gcode is laid out like the gcode generated by Cura, as a list of clumps:
+#   - The header, describing the print
+#   - The start gcode, including the machine's start gcode
+#   - The single layer
+#   - The end gcode, including the machine's end gcode
+# This allows it to be written by Cura's gcode writer exactly like sliced gcode
+#
+# The machine's start and end gcode, temperatures, speeds, and retraction settings are read from
+# the current profile, using the initial layer values where there are any
+
+import datetime
+import math
+import re
+
+import numpy
+
+
+
+# The flavors of gcode that can be generated, mapped to the name used in the gcode header
+# The Griffin, Makerbot, and BFB flavors need headers or post-processing that CuraEngine generates specially, so they are not supported
+_supportedFlavors = {
+    'RepRap (Marlin/Sprinter)': 'Marlin',
+    'RepRap (Volumetric)': 'Marlin(Volumetric)',
+    'RepRap (RepRap)': 'RepRap',
+    'UltiGCode': 'UltiGCode',
+    'MACH3': 'MACH3',
+    'Repetier': 'Repetier',
+}
+
+# Flavors that measure extrusion in cubic millimeters rather than millimeters of filament
+_volumetricFlavors = ('RepRap (Volumetric)', 'UltiGCode')
+
+# The regex used to find setting tokens (such as "{material_print_temperature}" or "{material_print_temperature, 0}") in the start and end gcode
+_settingTokenRegex = re.compile(r'\{\s*(\w+)\s*(?:,\s*-?\d+\s*)?\}')
+
+# The regex used to find any token in the start and end gcode, including conditions (such as "{if ...}") and expressions, which only Cura can evaluate
+_tokenRegex = re.compile(r'\{[^{}\n]*\}')
+
+
+
+def GenerateGcode(toolpaths, lineWidth, layerHeight, globalStack, extruderStack, description='') -> list:
+    ''' Generates gcode printing a single layer of toolpaths centered on the build plate
+        The toolpaths are arrays of (x, y) points, in the order they should be printed
+        Returns the gcode as a list of clumps, like the gcode generated by Cura
+        A ValueError is raised if gcode can't be generated for the machine - if its gcode flavor isn't supported, if it has more
+        than one extruder, or if its start or end gcode has tokens other than simple setting values '''
+
+    def setting(key):
+        # Extruder settings take priority over the global settings, as in CuraEngine
+        value = extruderStack.getProperty(key, 'value')
+        return value if not value is None else globalStack.getProperty(key, 'value')
+
+    flavor = setting('machine_gcode_flavor')
+    if not flavor in _supportedFlavors:
+        raise ValueError(f'Gcode cannot be generated directly for the "{flavor}" gcode flavor')
+
+    # The settings are read from the active extruder, so the machine's other extruders (and any tool changes) would be ignored
+    if setting('machine_extruder_count') > 1:
+        raise ValueError('Gcode cannot be generated directly for machines with more than one extruder')
+
+    volumetric = flavor in _volumetricFlavors
+    relativeExtrusion = setting('relative_extrusion')
+    firmwareRetraction = setting('machine_firmware_retract')
+    retractionEnabled = setting('retraction_enable')
+    retractionAmount = setting('retraction_amount')
+    retractionMinimumTravel = setting('retraction_min_travel')
+    printTemperature = setting('material_print_temperature_layer_0')
+    bedTemperature = setting('material_bed_temperature_layer_0')
+
+    # Speeds in mm/min
+    printFeedrate = setting('speed_print_layer_0') * 60
+    travelFeedrate = setting('speed_travel_layer_0') * 60
+    retractFeedrate = setting('retraction_retract_speed') * 60
+    primeFeedrate = setting('retraction_prime_speed') * 60
+
+    # The amount of extrusion for each millimeter of line printed
+    lineArea = lineWidth * layerHeight * setting('material_flow_layer_0') / 100
+    filamentArea = math.pi * (setting('material_diameter') / 2)**2
+    extrusionPerMm = lineArea if volumetric else lineArea / filamentArea
+    if volumetric:
+        retractionAmount *= filamentArea
+
+    # Center the toolpaths on the build plate
+    if setting('machine_center_is_zero'):
+        offset = numpy.array([0, 0])
+    else:
+        offset = numpy.array([setting('machine_width') / 2, setting('machine_depth') / 2])
+    toolpaths = [toolpath + offset for toolpath in toolpaths]
+
+    # Generate the layer
+    layerLines = [';LAYER:0', 'M107', ';TYPE:SKIN']
+    extruded = 0.0
+    printTime = 0.0
+    position = None
+    feedrate = None
+    for toolpath in toolpaths:
+        (x, y) = toolpath[0]
+
+        # Travel to the start of the path, retracting if it is far away
+        travelDistance = math.inf if position is None else math.hypot(x - position[0], y - position[1])
+        retract = retractionEnabled and not position is None and travelDistance >= retractionMinimumTravel
+        if retract:
+            layerLines.append(_retractCommand(firmwareRetraction, relativeExtrusion, -retractionAmount, extruded - retractionAmount, retractFeedrate))
+        if position is None:
+            layerLines.append(f'G0 F{travelFeedrate:.0f} X{x:.3f} Y{y:.3f} Z{layerHeight:.3f}')
+            feedrate = travelFeedrate
+        elif travelDistance > 0.001:
+            layerLines.append(f'G0 F{travelFeedrate:.0f} X{x:.3f} Y{y:.3f}')
+            printTime += travelDistance / travelFeedrate * 60
+            feedrate = travelFeedrate
+        if retract:
+            layerLines.append(_retractCommand(firmwareRetraction, relativeExtrusion, retractionAmount, extruded, primeFeedrate, unretract=True))
+            feedrate = primeFeedrate if not firmwareRetraction else feedrate
+
+        # Print the path
+        segmentLengths = numpy.hypot(*numpy.diff(toolpath, axis=0).T)
+        segmentExtrusions = segmentLengths * extrusionPerMm
+        extrusionValues = segmentExtrusions if relativeExtrusion else extruded + numpy.cumsum(segmentExtrusions)
+        for ((x, y), e) in zip(toolpath[1:], extrusionValues):
+            if feedrate != printFeedrate:
+                layerLines.append(f'G1 F{printFeedrate:.0f} X{x:.3f} Y{y:.3f} E{e:.5f}')
+                feedrate = printFeedrate
+            else:
+                layerLines.append(f'G1 X{x:.3f} Y{y:.3f} E{e:.5f}')
+        extruded += segmentExtrusions.sum()
+        printTime += segmentLengths.sum() / printFeedrate * 60
+        position = toolpath[-1]
+
+    layerLines.append(f';TIME_ELAPSED:{printTime:.6f}')
+
+    # Measure the pattern for the header
+    allPoints = numpy.concatenate(toolpaths) if len(toolpaths) > 0 else numpy.zeros((1, 2))
+    (minX, minY) = allPoints.min(axis=0)
+    (maxX, maxY) = allPoints.max(axis=0)
+    filamentUsed = extruded / filamentArea if volumetric else extruded
+
+    headerLines = [
+        f';FLAVOR:{_supportedFlavors[flavor]}',
+        f';TIME:{math.ceil(printTime)}',
+        f';Filament used: {filamentUsed / 1000:.5f}m',
+        f';Layer height: {layerHeight}',
+        f';MINX:{minX:.3f}',
+        f';MINY:{minY:.3f}',
+        f';MINZ:{layerHeight:.3f}',
+        f';MAXX:{maxX:.3f}',
+        f';MAXY:{maxY:.3f}',
+        f';MAXZ:{layerHeight:.3f}',
+    ]
+    if flavor == 'UltiGCode':
+        headerLines.append(f';MATERIAL:{extruded:.0f}')
+        headerLines.append(f';NOZZLE_DIAMETER:{setting("machine_nozzle_size")}')
+    if description != '':
+        headerLines.append(f';{description}')
+
+    # Heat up before the machine's start gcode, unless the start gcode already does
+    # UltiGCode printers handle heating themselves
+    startGcode = setting('machine_start_gcode')
+    startLines = []
+    if flavor != 'UltiGCode':
+        bedHeated = setting('machine_heated_bed') and not _startGcodeSetsTemperature(startGcode, ('M140', 'M190'), 'material_bed_temperature')
+        nozzleHeated = not _startGcodeSetsTemperature(startGcode, ('M104', 'M109'), 'material_print_temperature')
+        if bedHeated:
+            startLines.append(f'M140 S{bedTemperature:g}')
+            startLines.append('M105')
+            startLines.append(f'M190 S{bedTemperature:g}')
+        if nozzleHeated:
+            startLines.append(f'M104 S{printTemperature:g}')
+            startLines.append('M105')
+            startLines.append(f'M109 S{printTemperature:g}')
+    startLines.append('M83 ;relative extrusion mode' if relativeExtrusion else 'M82 ;absolute extrusion mode')
+    startLines.append(_expandSettingTokens(startGcode, setting))
+    startLines.append('G92 E0')
+    startLines.append(';LAYER_COUNT:1')
+
+    # Retract before the machine's end gcode
+    endLines = []
+    if retractionEnabled and len(toolpaths) > 0:
+        endLines.append(_retractCommand(firmwareRetraction, relativeExtrusion, -retractionAmount, extruded - retractionAmount, retractFeedrate))
+    if flavor != 'UltiGCode':
+        endLines.append('M140 S0')
+    endLines.append('M107')
+    endLines.append(_expandSettingTokens(setting('machine_end_gcode'), setting))
+    if relativeExtrusion:
+        endLines.append('M82 ;absolute extrusion mode')
+    endLines.append(';End of Gcode')
+
+    return ['\n'.join(lines) + '\n' for lines in (headerLines, startLines, layerLines, endLines)]
+
+
+
+def _retractCommand(firmwareRetraction, relativeExtrusion, relativeE, absoluteE, feedrate, unretract=False)->str:
+    ''' Returns the command that retracts (or unretracts) the filament '''
+
+    if firmwareRetraction:
+        return 'G11' if unretract else 'G10'
+
+    e = relativeE if relativeExtrusion else absoluteE
+    return f'G1 F{feedrate:.0f} E{e:.5f}'
+
+
+
+def _startGcodeSetsTemperature(startGcode, commands, settingKey)->bool:
+    ''' Determines if the machine's start gcode sets a temperature itself, as CuraEngine does '''
+
+    if settingKey in startGcode:
+        return True
+
+    return any(line.split(';', 1)[0].strip().startswith(commands) for line in startGcode.split('\n'))
+
+
+
+def _expandSettingTokens(gcode, setting)->str:
+    ''' Replaces the setting tokens in the start or end gcode with the current setting values
+        The tokens added by Cura itself (such as the print time) are supported as well
+        A ValueError is raised for conditions and expressions, which would otherwise be sent to the printer unevaluated '''
+
+    for match in _tokenRegex.finditer(gcode):
+        settingMatch = _settingTokenRegex.fullmatch(match.group(0))
+        if settingMatch is None or settingMatch.group(1) in ('if', 'elif', 'else', 'endif'):
+            raise ValueError(f'The start or end gcode token "{match.group(0)}" can only be evaluated when slicing')
+
+    now = datetime.datetime.now()
+    specialTokens = {
+        'print_temperature': lambda: setting('material_print_temperature'),
+        'print_bed_temperature': lambda: setting('material_bed_temperature'),
+        'travel_speed': lambda: setting('speed_travel'),
+        'initial_extruder_nr': lambda: 0,
+        'date': lambda: now.strftime('%d-%m-%Y'),
+        'time': lambda: now.strftime('%H:%M:%S'),
+        'day': lambda: now.strftime('%a'),
+    }
+
+    def replaceToken(match):
+        key = match.group(1)
+        value = specialTokens[key]() if key in specialTokens else setting(key)
+
+        # Unknown tokens are left as they are, as in Cura
+        if value is None:
+            return match.group(0)
+        return str(value)
+
+    return _settingTokenRegex.sub(replaceToken, gcode)
@@ -0,0 +1,381 @@
+import json
+import math
+import re
+
+import numpy
+
+
+
+class GlyphAtlas():
+    ''' The outlines and advances of the glyphs of a font, rendered once by OpenSCAD (using glyphatlas.scad)
+        so text can be carved into generated towers without rendering each label with OpenSCAD
+
+        Each label is laid out a glyph at a time, so kerning is ignored, but otherwise labels are
+        aligned the same way OpenSCAD aligns centered text '''
+
+    # The size the glyphs are rendered at in the atlas
+    referenceSize = 10
+
+    # The character codes rendered by default in glyphatlas.scad (the printable ASCII characters)
+    characterCodes = range(32, 127)
+
+    # The distance between the glyphs in the atlas, and the distance of the glyphs from the edge of their slot
+    # These must match the values calculated in glyphatlas.scad
+    _slotSize = referenceSize*4
+    _slotMargin = referenceSize
+
+    # The distance the band of cells glyphs are carved into extends beyond the tallest glyphs
+    _bandMargin = referenceSize*0.05
+
+    # The regex used to find the coordinate pairs in an SVG path
+    _svgCoordinateRegex = re.compile(r'(-?[\d.]+(?:[eE][-+]?\d+)?),(-?[\d.]+(?:[eE][-+]?\d+)?)')
+
+
+
+    def __init__(self, glyphs:dict):
+        ''' The glyphs are a dictionary of characters to tuples of the glyph's advance and a list of its outlines
+            Each outline is an (n, 2) array of points at the reference size, relative to the glyph origin on the baseline '''
+
+        self._glyphs = glyphs
+
+        # Every glyph is carved into a cell spanning the same band, so neighboring cells line up
+        allPoints = [outline for (advance, outlines) in glyphs.values() for outline in outlines]
+        if len(allPoints) > 0:
+            allPoints = numpy.concatenate(allPoints)
+            self._bandBottom = allPoints[:, 1].min() - self._bandMargin
+            self._bandTop = allPoints[:, 1].max() + self._bandMargin
+        else:
+            (self._bandBottom, self._bandTop) = (0, 0)
+
+        # The carved geometry of each glyph is only calculated when it's first needed
+        self._glyphGeometryCache = {}
+
+
+
+    @classmethod
+    def FromSvgData(cls, svgData:str, characterCodes):
+        ''' Creates an atlas from the SVG data generated by glyphatlas.scad for the given character codes '''
+
+        # Each outline in the SVG is a subpath starting with "M" and ending with "z"
+        # OpenSCAD flips the Y axis when exporting to SVG, so it is flipped back here
+        pathData = ' '.join(re.findall(r'\sd="([^"]*)"', svgData))
+        slotOutlines = {}
+        for subpath in pathData.split('M')[1:]:
+            outline = numpy.array([(float(x), -float(y)) for (x, y) in cls._svgCoordinateRegex.findall(subpath)])
+            outline = _removeDuplicatePoints(outline)
+            if len(outline) < 3:
+                continue
+
+            # Determine which slot the outline was rendered in from its center
+            (centerX, centerY) = (outline.min(axis=0) + outline.max(axis=0)) / 2
+            slot = (int(math.floor(centerX / cls._slotSize)), int(round(centerY / cls._slotSize)))
+            slotOutlines.setdefault(slot, []).append(outline)
+
+        def measuredAdvance(column):
+            # The difference between the left edges of "H" followed by the glyph, when left- and right-aligned, is their advance
+            leftAligned = slotOutlines.get((column, 1))
+            rightAligned = slotOutlines.get((column, 2))
+            if leftAligned is None or rightAligned is None:
+                return None
+            leftOffset = numpy.concatenate(leftAligned)[:, 0].min() - (column*cls._slotSize + cls._slotMargin)
+            rightOffset = numpy.concatenate(rightAligned)[:, 0].min() - ((column + 1)*cls._slotSize - cls._slotMargin/4)
+            return leftOffset - rightOffset
+
+        # The advance of "H" is measured in an extra column after the characters
+        hAdvance = measuredAdvance(len(characterCodes))
+        if hAdvance is None:
+            return cls({})
+
+        glyphs = {}
+        for (column, characterCode) in enumerate(characterCodes):
+            advance = measuredAdvance(column)
+
+            # Glyphs missing from the font can't be carved
+            if advance is None:
+                continue
+
+            origin = numpy.array([column*cls._slotSize + cls._slotMargin, 0])
+            outlines = [outline - origin for outline in slotOutlines.get((column, 0), [])]
+            glyphs[chr(characterCode)] = (advance - hAdvance, outlines)
+
+        return cls(glyphs)
+
+
+
+    @classmethod
+    def Load(cls, filePath):
+        ''' Loads an atlas previously saved with Save '''
+
+        with open(filePath, 'r') as atlasFile:
+            glyphs = json.load(atlasFile)
+        return cls({character: (advance, [numpy.array(outline) for outline in outlines]) for (character, (advance, outlines)) in glyphs.items()})
+
+
+
+    def Save(self, filePath)->None:
+        ''' Saves the atlas so it doesn't need to be rendered again '''
+
+        glyphs = {character: (advance, [outline.tolist() for outline in outlines]) for (character, (advance, outlines)) in self._glyphs.items()}
+        with open(filePath, 'w') as atlasFile:
+            json.dump(glyphs, atlasFile)
+
+
+
+    @property
+    def GlyphCount(self)->int:
+        return len(self._glyphs)
+
+
+
+    def LabelGeometry(self, label:str, size:float) -> tuple:
+        ''' Lays out a label centered on the origin, as OpenSCAD does with halign="center" and valign="center"
+            Returns a tuple of:
+              - The left and right edges of the cells the glyphs are carved into, as an array of n+1 X coordinates
+              - The bottom and top of the cells
+              - The triangles of the surface left between the glyphs within the rectangle, as an (n, 3, 2) array
+              - The triangles of the carved areas, as an (n, 3, 2) array
+              - The edges of the carved areas, oriented with the carved areas on their left, as an (n, 2, 2) array
+            None is returned if the label contains a character that can't be carved '''
+
+        scale = size / self.referenceSize
+
+        glyphGeometries = []
+        for character in label:
+            glyphGeometry = self._glyphGeometry(character)
+            if glyphGeometry is None:
+                return None
+            glyphGeometries.append(glyphGeometry)
+
+        # As in OpenSCAD, the label is centered horizontally on its advance and vertically on the extents of its glyphs
+        advances = numpy.array([glyphGeometry[0] for glyphGeometry in glyphGeometries])
+        origins = numpy.concatenate(([0], numpy.cumsum(advances)[:-1])) - advances.sum()/2
+        extents = [glyphGeometry[4] for glyphGeometry in glyphGeometries if not glyphGeometry[4] is None]
+        ascent = max([0] + [top for (bottom, top) in extents])
+        descent = min([0] + [bottom for (bottom, top) in extents])
+        verticalOffset = -(ascent + descent)/2
+
+        surfaceTriangles = []
+        carvedTriangles = []
+        edges = []
+        for (origin, (advance, surface, carved, carvedEdges, extent)) in zip(origins, glyphGeometries):
+            offset = numpy.array([origin, verticalOffset])
+            surfaceTriangles.append((surface + offset) * scale)
+            carvedTriangles.append((carved + offset) * scale)
+            edges.append((carvedEdges + offset) * scale)
+
+        cellEdges = numpy.append(origins, advances.sum()/2) * scale
+        return (cellEdges, (self._bandBottom + verticalOffset) * scale, (self._bandTop + verticalOffset) * scale, numpy.concatenate(surfaceTriangles), numpy.concatenate(carvedTriangles), numpy.concatenate(edges))
+
+
+
+    def _glyphGeometry(self, character:str) -> tuple:
+        ''' Returns the advance, surface triangles, carved triangles, carved edges, and vertical extent of a glyph at the reference size
+            None is returned if the glyph isn't in the atlas or extends beyond its cell '''
+
+        if character in self._glyphGeometryCache:
+            return self._glyphGeometryCache[character]
+
+        glyphGeometry = None
+        if character in self._glyphs:
+            (advance, outlines) = self._glyphs[character]
+            cell = numpy.array([(0, self._bandBottom), (advance, self._bandBottom), (advance, self._bandTop), (0, self._bandTop)])
+
+            if len(outlines) == 0:
+                # Glyphs without outlines (such as spaces) simply leave their cell uncarved
+                glyphGeometry = (advance, _triangulate(cell, []), numpy.zeros((0, 3, 2)), numpy.zeros((0, 2, 2)), None)
+
+            else:
+                allPoints = numpy.concatenate(outlines)
+                (left, bottom) = allPoints.min(axis=0)
+                (right, top) = allPoints.max(axis=0)
+
+                # Glyphs that extend beyond their advance would overlap the neighboring cells
+                if left > 0 and right < advance:
+                    (filledRegions, emptyRegions) = _regionsFromOutlines(outlines)
+
+                    # The cell surface is everything outside the glyph, including any islands inside its holes
+                    surface = [_triangulate(cell, [_oriented(outer, False) for (outer, holes, depth) in filledRegions if depth == 0])]
+                    surface += [_triangulate(outer, holes) for (outer, holes, depth) in emptyRegions]
+                    carved = [_triangulate(outer, holes) for (outer, holes, depth) in filledRegions]
+
+                    # The outlines of the filled regions are oriented with the carved area on their left
+                    edges = []
+                    for (outer, holes, depth) in filledRegions:
+                        for outline in [outer] + holes:
+                            edges.append(numpy.stack((outline, numpy.roll(outline, -1, axis=0)), axis=1))
+
+                    glyphGeometry = (advance, numpy.concatenate(surface), numpy.concatenate(carved), numpy.concatenate(edges), (bottom, top))
+
+        self._glyphGeometryCache[character] = glyphGeometry
+        return glyphGeometry
+
+
+
+def _removeDuplicatePoints(outline:numpy.ndarray) -> numpy.ndarray:
+    ''' Removes repeated points from an outline, including a final point repeating the first '''
+
+    distinct = numpy.any(numpy.abs(outline - numpy.roll(outline, 1, axis=0)) > 1e-9, axis=1)
+    return outline[distinct]
+
+
+
+def _signedArea(outline:numpy.ndarray) -> float:
+    ''' Returns the area of an outline, which is positive if the outline is counter-clockwise '''
+
+    (x, y) = outline.T
+    return (numpy.dot(x, numpy.roll(y, -1)) - numpy.dot(y, numpy.roll(x, -1))) / 2
+
+
+
+def _oriented(outline:numpy.ndarray, counterClockwise:bool) -> numpy.ndarray:
+    ''' Returns an outline in the given direction '''
+
+    return outline if (_signedArea(outline) > 0) == counterClockwise else outline[::-1]
+
+
+
+def _pointInOutline(point, outline:numpy.ndarray) -> bool:
+    ''' Determines if a point is inside an outline, using the even-odd rule '''
+
+    (x, y) = point
+    (x1, y1) = outline.T
+    (x2, y2) = numpy.roll(outline, -1, axis=0).T
+    crossing = (y1 > y) != (y2 > y)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        intersectionX = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    return numpy.count_nonzero(crossing & (intersectionX > x)) % 2 == 1
+
+
+
+def _nestingDepth(outline:numpy.ndarray, outlines:list) -> int:
+    ''' Returns the number of other outlines an outline is inside '''
+
+    return sum(1 for other in outlines if not other is outline and _pointInOutline(outline[0], other))
+
+
+
+def _regionsFromOutlines(outlines:list) -> tuple:
+    ''' Sorts the outlines of a glyph into the filled and empty regions they bound
+        Each region is a counter-clockwise outer outline, a list of clockwise holes, and the nesting depth of the outer outline
+        The outlines are nested alternately, so outlines inside an even number of others bound filled regions '''
+
+    depths = [_nestingDepth(outline, outlines) for outline in outlines]
+    filledRegions = []
+    emptyRegions = []
+    for (outline, depth) in zip(outlines, depths):
+        holes = [_oriented(other, False) for (other, otherDepth) in zip(outlines, depths) if otherDepth == depth + 1 and _pointInOutline(other[0], outline)]
+        region = (_oriented(outline, True), holes, depth)
+        (filledRegions if depth % 2 == 0 else emptyRegions).append(region)
+
+    return (filledRegions, emptyRegions)
+
+
+
+def _triangulate(outer:numpy.ndarray, holes:list) -> numpy.ndarray:
+    ''' Triangulates a polygon by ear clipping, without adding any points to it
+        The outer outline must be counter-clockwise and the holes clockwise
+        Returns the counter-clockwise triangles as an (n, 3, 2) array '''
+
+    points = [tuple(point) for point in outer]
+
+    # Join each hole to the outline with a pair of coincident edges, starting with the rightmost hole
+    for hole in sorted(holes, key=lambda hole: -hole[:, 0].max()):
+        points = _bridgeHole(points, [tuple(point) for point in hole])
+
+    points = numpy.array(points, dtype=numpy.float64)
+    remaining = list(range(len(points)))
+    triangles = []
+    index = 0
+    failures = 0
+    while len(remaining) > 3:
+        count = len(remaining)
+        (previous, current, following) = (remaining[(index - 1) % count], remaining[index % count], remaining[(index + 1) % count])
+        (a, b, c) = (points[previous], points[current], points[following])
+
+        # An ear is a convex corner with no other points inside it
+        # If no ear can be found (which only happens with degenerate corners) the flattest corner is clipped
+        isEar = _cross(a, b, c) > 1e-12 and not _anyPointInTriangle(points[remaining], a, b, c)
+        if isEar or failures > count:
+            if not isEar:
+                crosses = [abs(_cross(points[remaining[i - 1]], points[remaining[i]], points[remaining[(i + 1) % count]])) for i in range(count)]
+                index = int(numpy.argmin(crosses))
+                (previous, current, following) = (remaining[index - 1], remaining[index], remaining[(index + 1) % count])
+            triangles.append((points[previous], points[current], points[following]))
+            del remaining[index % count]
+            failures = 0
+        else:
+            index += 1
+            failures += 1
+
+    triangles.append(tuple(points[remaining]))
+    return numpy.array(triangles)
+
+
+
+def _cross(a, b, c) -> float:
+    ''' Returns the cross product of the edges a-b and b-c, which is positive if they turn counter-clockwise '''
+
+    return (b[0] - a[0]) * (c[1] - b[1]) - (b[1] - a[1]) * (c[0] - b[0])
+
+
+
+def _anyPointInTriangle(points:numpy.ndarray, a, b, c) -> bool:
+    ''' Determines if any of the points are inside (or on the edge of) a counter-clockwise triangle, ignoring points at its corners '''
+
+    corners = (numpy.all(points == a, axis=1) | numpy.all(points == b, axis=1) | numpy.all(points == c, axis=1))
+    inside = numpy.ones(len(points), dtype=bool)
+    for (start, end) in ((a, b), (b, c), (c, a)):
+        inside &= (end[0] - start[0]) * (points[:, 1] - start[1]) - (end[1] - start[1]) * (points[:, 0] - start[0]) >= -1e-12
+    return bool(numpy.any(inside & ~corners))
+
+
+
+def _bridgeHole(points:list, hole:list) -> list:
+    ''' Joins a hole to an outline by a pair of edges from the hole's rightmost point to a visible point on the outline '''
+
+    holeIndex = max(range(len(hole)), key=lambda index: hole[index][0])
+    (holeX, holeY) = hole[holeIndex]
+
+    # Find the nearest edge to the right of the hole's rightmost point
+    nearestX = math.inf
+    bridgeIndex = None
+    for index in range(len(points)):
+        ((x1, y1), (x2, y2)) = (points[index], points[(index + 1) % len(points)])
+        if (y1 <= holeY <= y2 or y2 <= holeY <= y1) and y1 != y2:
+            x = x1 + (holeY - y1) * (x2 - x1) / (y2 - y1)
+            if holeX <= x < nearestX:
+                nearestX = x
+                bridgeIndex = index if x1 > x2 else (index + 1) % len(points)
+
+    # If there are any corners of the outline inside the triangle between the hole, the edge, and the chosen point,
+    # the one closest in angle to the edge is visible instead
+    (bridgeX, bridgeY) = points[bridgeIndex]
+    bestAngle = math.inf
+    for (index, (x, y)) in enumerate(points):
+        if (x, y) == (bridgeX, bridgeY) or x < holeX:
+            continue
+        if _pointInOutline((x, y), numpy.array([(holeX, holeY), (nearestX, holeY), (bridgeX, bridgeY)])):
+            angle = abs(math.atan2(y - holeY, x - holeX))
+            if angle < bestAngle:
+                bestAngle = angle
+                bridgeIndex = index
+
+    # Earlier holes may have been joined to the same point, which then appears more than once in the outline
+    # The hole is joined to the copy whose corner it lies within, so the joining edges don't cross
+    bridge = points[bridgeIndex]
+    for (index, point) in enumerate(points):
+        if point == bridge and _cornerContains(points[index - 1], point, points[(index + 1) % len(points)], (holeX, holeY)):
+            bridgeIndex = index
+            break
+
+    return points[:bridgeIndex + 1] + hole[holeIndex:] + hole[:holeIndex + 1] + [bridge] + points[bridgeIndex + 1:]
+
+
+
+def _cornerContains(previous, corner, following, point) -> bool:
+    ''' Determines if the direction to a point lies within the interior angle at a corner of a counter-clockwise outline '''
+
+    start = math.atan2(following[1] - corner[1], following[0] - corner[0])
+    end = math.atan2(previous[1] - corner[1], previous[0] - corner[0])
+    direction = math.atan2(point[1] - corner[1], point[0] - corner[0])
+    return 0 < (direction - start) % (2*math.pi) < (end - start) % (2*math.pi)
@@ -0,0 +1,31 @@
+from UM.Job import Job
+
+from .GlyphAtlas import GlyphAtlas
+
+
+
+class GlyphAtlasJob(Job):
+    '''A simple class used to render the glyph atlas for a font using OpenSCAD
+
+    Since rendering every glyph of a font can take a while, Uranium's Job
+    class is used to render the atlas in the background
+
+    The parsed atlas is left in glyphAtlas (empty if it could not be rendered)
+    and the output of the OpenSCAD command is left in commandResult'''
+
+    def __init__(self, openScadInterface, atlasFilePath, atlasParameters, atlasHash):
+        super().__init__()
+        self._openScadInterface = openScadInterface
+        self._atlasFilePath = atlasFilePath
+        self._atlasParameters = atlasParameters
+        self.atlasHash = atlasHash
+        self.glyphAtlas = None
+        self.commandResult = ''
+
+
+
+    def run(self) -> None:
+        '''Render and parse the glyph atlas'''
+
+        (svgData, self.commandResult) = self._openScadInterface.GenerateSvgData(self._atlasFilePath, self._atlasParameters)
+        self.glyphAtlas = GlyphAtlas.FromSvgData(svgData, GlyphAtlas.characterCodes)
@@ -1,6 +1,7 @@
 import math
+import os
+
 import numpy
-import trimesh
 
 from cura.CuraApplication import CuraApplication
 from cura.Scene.BuildPlateDecorator import BuildPlateDecorator
@@ -10,17 +11,25 @@ from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
 from UM.Mesh.MeshData import MeshData, calculateNormalsFromIndexedVertices
 from UM.Operations.AddSceneNodeOperation import AddSceneNodeOperation
 
+from . import StlFile
+
 # This code was shamelessly stolen and refactored from the CalibrationShapes plugin
 # by 5@xes (https://github.com/5axes/Calibration-Shapes)
 # I don't pretend to have any idea how it works
 
+def ImportMesh(meshFilePath, ext_pos = 0, name='') -> tuple:
+    # Read in the mesh
+    mesh_data = ReadMeshData(meshFilePath)
+
+    return ImportMeshData(mesh_data, ext_pos, name)
+
+
+
 # The following comments are part of the original code:
 # Initial Source code from  fieldOfView
 # https://github.com/fieldOfView/Cura-SimpleShapes/blob/bac9133a2ddfbf1ca6a3c27aca1cfdd26e847221/SimpleShapes.py#L70
-def ImportMesh(meshFilePath, ext_pos = 0, name='') -> tuple:
-    # Read in the mesh
-    mesh = trimesh.load(meshFilePath)
-    mesh_data = _toMeshData(mesh)
+def ImportMeshData(mesh_data, ext_pos = 0, name='') -> tuple:
+    ''' Adds mesh data that has already been read to the scene as a new node '''
 
     application = CuraApplication.getInstance()
     global_stack = application.getGlobalContainerStack()
@@ -59,31 +68,85 @@ def ImportMesh(meshFilePath, ext_pos = 0, name='') -> tuple:
 
 
 
-def _toMeshData(tri_node: trimesh.base.Trimesh) -> MeshData:
+def ReadMeshData(meshFilePath) -> MeshData:
+    ''' Reads a mesh file into mesh data oriented the same way as ImportMesh, without adding it to the scene '''
+
+    return _toMeshData(_readMesh(meshFilePath))
+
+
+
+def ReadStlData(stlData:bytes) -> MeshData:
+    ''' Parses STL data held in memory into mesh data oriented the same way as ImportMesh '''
+
+    return _toMeshData(StlFile.ParseStl(stlData))
+
+
+
+def MeshDataFromVertices(vertices:numpy.ndarray) -> MeshData:
+    ''' Converts an (n*3, 3) array of triangle vertices, in the same orientation as an STL file, into mesh data oriented the same way as ImportMesh '''
+
+    return _toMeshData(vertices)
+
+
+
+def _readMesh(meshFilePath) -> numpy.ndarray:
+    ''' Reads a mesh file and returns the vertices of each of its triangles as an (n*3, 3) array '''
+
+    # STL files are read directly, since they are all the plugin generates or ships
+    if os.path.splitext(meshFilePath)[1].lower() == '.stl':
+        with open(meshFilePath, 'rb') as meshFile:
+            return StlFile.ParseStl(meshFile.read())
+
+    # Other formats fall back to trimesh, which is slow to import and so is only loaded when it's actually needed
+    import trimesh
+    tri_node = trimesh.load(meshFilePath)
+    return numpy.asarray(tri_node.vertices[tri_node.faces].reshape(-1, 3), dtype=numpy.float32)
+
+
+
+def _rotationMatrix(angle:float, axis:list) -> numpy.ndarray:
+    ''' Returns the 3x3 matrix for a rotation of angle radians around the given axis '''
+
+    axis = numpy.asarray(axis, dtype=numpy.float64)
+    axis /= numpy.linalg.norm(axis)
+    cross = numpy.array([
+        [0, -axis[2], axis[1]],
+        [axis[2], 0, -axis[0]],
+        [-axis[1], axis[0], 0],
+    ])
+    return numpy.cos(angle) * numpy.eye(3) + numpy.sin(angle) * cross + (1 - numpy.cos(angle)) * numpy.outer(axis, axis)
+
+
+
+def _rotate(vertices:numpy.ndarray, angle:float, axis:list) -> numpy.ndarray:
+    ''' Rotates an (n, 3) vertex array by angle radians around the given axis '''
+
+    matrix = _rotationMatrix(angle, axis)
+
+    # A rotation by a multiple of 90 degrees around a principal axis just swaps and negates coordinates
+    # Applying it as a column permutation is faster than a matrix multiply and exact, since no rounding is involved
+    axisAlignedMatrix = numpy.rint(matrix)
+    if numpy.allclose(matrix, axisAlignedMatrix, rtol=0, atol=1e-9):
+        sourceColumns = numpy.argmax(numpy.abs(axisAlignedMatrix), axis=1)
+        signs = axisAlignedMatrix[numpy.arange(3), sourceColumns].astype(vertices.dtype)
+        vertices = vertices[:, sourceColumns]
+        vertices *= signs
+        return vertices
+
+    return (vertices @ matrix.T).astype(vertices.dtype)
+
+
+
+def _toMeshData(vertices: numpy.ndarray) -> MeshData:
     # Rotate the part to laydown on the build plate
     # Modification from 5@xes
-    tri_node.apply_transform(trimesh.transformations.rotation_matrix(math.radians(90), [-1, 0, 0]))
-    tri_faces = tri_node.faces
-    tri_vertices = tri_node.vertices
+    vertices = _rotate(vertices, math.radians(90), [-1, 0, 0])
 
-    # Following Source code from fieldOfView
+    # Each triangle has its own three vertices, so the indices simply count up through the vertex array
+    # (This is the same unshared layout fieldOfView's original code built one face at a time)
     # https://github.com/fieldOfView/Cura-SimpleShapes/blob/bac9133a2ddfbf1ca6a3c27aca1cfdd26e847221/SimpleShapes.py#L45
-    indices = []
-    vertices = []
-
-    index_count = 0
-    face_count = 0
-    for tri_face in tri_faces:
-        face = []
-        for tri_index in tri_face:
-            vertices.append(tri_vertices[tri_index])
-            face.append(index_count)
-            index_count += 1
-        indices.append(face)
-        face_count += 1
-
-    vertices = numpy.asarray(vertices, dtype=numpy.float32)
-    indices = numpy.asarray(indices, dtype=numpy.int32)
+    face_count = len(vertices) // 3
+    indices = numpy.arange(face_count * 3, dtype=numpy.int32).reshape(-1, 3)
     normals = calculateNormalsFromIndexedVertices(vertices, indices, face_count)
 
     mesh_data = MeshData(vertices=vertices, indices=indices, normals=normals)
@@ -20,11 +20,12 @@ catalog = i18nCatalog("autotowers")
 class BedLevelPatternModel(ModelBase):
 
     # The available bed level presets
+    # These are spiral squares patterns, which are generated rather than loaded from STL files
     _presetsTable = [
-        {'name': catalog.i18nc("@model", "Bed Size 220x220") , 'filename': 'Bed Level Pattern - Spiral Squares 220x220.stl', 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
-        {'name': catalog.i18nc("@model", "Bed Size 200x200") , 'filename': 'Bed Level Pattern - Spiral Squares 200x200.stl', 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
-        {'name': catalog.i18nc("@model", "Bed Size 180x180") , 'filename': 'Bed Level Pattern - Spiral Squares 180x180.stl', 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
-        {'name': catalog.i18nc("@model", "Bed Size 150x150") , 'filename': 'Bed Level Pattern - Spiral Squares 150x150.stl', 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
+        {'name': catalog.i18nc("@model", "Bed Size 220x220") , 'print area': (220, 220), 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
+        {'name': catalog.i18nc("@model", "Bed Size 200x200") , 'print area': (200, 200), 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
+        {'name': catalog.i18nc("@model", "Bed Size 180x180") , 'print area': (180, 180), 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
+        {'name': catalog.i18nc("@model", "Bed Size 150x150") , 'print area': (150, 150), 'icon': 'bedlevelpattern_spiral_squares_icon.png'},
     ]
 
     # The available bed level patterns
@@ -80,13 +81,9 @@ class BedLevelPatternModel(ModelBase):
     def presetName(self)->str:
         return self._presetsTable[self.presetIndex]['name']
     
-    @pyqtProperty(str, notify=presetIndexChanged, fset=setPresetIndex)
-    def presetFileName(self)->str:
-        return self._presetsTable[self.presetIndex]['filename']
-    
-    @pyqtProperty(str, notify=presetIndexChanged, fset=setPresetIndex)
-    def presetFilePath(self)->str:
-        return self._buildStlFilePath(self.presetFileName)
+    @property
+    def presetPrintArea(self)->tuple:
+        return self._presetsTable[self.presetIndex]['print area']
         
     @pyqtProperty(str, notify=presetIndexChanged)
     def presetIcon(self)->str:
@@ -204,5 +201,20 @@ class BedLevelPatternModel(ModelBase):
     
 
 
+    # Determine if the pattern is written directly as gcode instead of being sliced
+    _directGcode = False
+
+    directGcodeChanged = pyqtSignal()
+
+    def setDirectGcode(self, value)->None:
+        self._directGcode = value
+        self.directGcodeChanged.emit()
+
+    @pyqtProperty(bool, notify=directGcodeChanged, fset=setDirectGcode)
+    def directGcode(self)->bool:
+        return self._directGcode
+
+
+
     def __init__(self, stlDir):
         super().__init__(stlDir=stlDir)
@@ -1,11 +1,12 @@
+from collections import OrderedDict
 import os
 import math
 
 # Import the correct version of PyQt
 try:
-    from PyQt6.QtCore import QObject
+    from PyQt6.QtCore import QObject, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject
+    from PyQt5.QtCore import QObject, pyqtSignal
 
 from cura.CuraApplication import CuraApplication
 from cura.Settings.ExtruderManager import ExtruderManager
@@ -13,6 +14,8 @@ from cura.Settings.ExtruderManager import ExtruderManager
 from UM.Application import Application
 from UM.Logger import Logger
 
+from .. import PrintArea
+
 class ModelBase(QObject):
 
     # The initial values used for the base and section heights of the tower
@@ -74,25 +77,45 @@ class ModelBase(QObject):
 
 
 
+    @property
+    def firmwareRetraction(self)->bool:
+        ''' Returns whether the printer performs retractions itself using G10/G11 (True or False) '''
+        return bool(Application.getInstance().getGlobalContainerStack().getProperty('machine_firmware_retract', 'value'))
+
+
+
+    # The usable bed area calculated for the most recently used sets of disallowed areas and bed sizes
+    _usableAreaCache = OrderedDict()
+    _usableAreaCacheSize = 8
+
+
+
     @property
     def printArea(self)->tuple:
         containerStack = Application.getInstance().getGlobalContainerStack()
 
         # Determine the maximum print area
         disallowedAreas = containerStack.getProperty('machine_disallowed_areas', 'value')
+        machineWidth = containerStack.getProperty('machine_width', 'value')
+        machineDepth = containerStack.getProperty('machine_depth', 'value')
         if len(disallowedAreas) > 0:
             # Calculate the print area based on the disallowed areas
-            flattenedList = [coord for section in disallowedAreas for coord in section]
-            minX = max([coord[0] for coord in flattenedList if coord[0] < 0])
-            maxX = min([coord[0] for coord in flattenedList if coord[0] >= 0])
-            minY = max([coord[1] for coord in flattenedList if coord[1] < 0])
-            maxY = min([coord[1] for coord in flattenedList if coord[1] >= 0])
-            printAreaWidth = maxX - minX
-            printAreaDepth = maxY - minY
+            # This can be relatively expensive, so the result is cached
+            # The disallowed areas themselves are part of the key, since they can change without the machine changing
+            # Only a few results are kept, since the disallowed areas change with settings such as the brim width
+            cacheKey = (str(disallowedAreas), machineWidth, machineDepth)
+            try:
+                (printAreaWidth, printAreaDepth) = ModelBase._usableAreaCache[cacheKey]
+                ModelBase._usableAreaCache.move_to_end(cacheKey)
+            except KeyError:
+                (printAreaWidth, printAreaDepth) = PrintArea.CalculateUsableArea(disallowedAreas, machineWidth, machineDepth)
+                ModelBase._usableAreaCache[cacheKey] = (printAreaWidth, printAreaDepth)
+                if len(ModelBase._usableAreaCache) > ModelBase._usableAreaCacheSize:
+                    ModelBase._usableAreaCache.popitem(last=False)
         else:
             # Calculate the print area based on the bed size
-            printAreaWidth = containerStack.getProperty('machine_width', 'value')
-            printAreaDepth = containerStack.getProperty('machine_depth', 'value')
+            printAreaWidth = machineWidth
+            printAreaDepth = machineDepth
 
         # Query the current line width
         lineWidth = containerStack.getProperty('line_width', 'value')
@@ -130,6 +153,40 @@ class ModelBase(QObject):
 
 
 
+    def getState(self)->dict:
+        ''' Returns the values selected in the data model so they can be restored later
+            The state consists of the simple values (strings, numbers, and flags) declared by the model classes '''
+
+        return {name: getattr(self, name) for name in self._stateAttributeNames()}
+
+
+
+    def restoreState(self, state:dict)->None:
+        ''' Restores values previously returned by getState '''
+
+        stateAttributeNames = self._stateAttributeNames()
+        for name, value in state.items():
+            if name in stateAttributeNames:
+                setattr(self, name, value)
+
+        # Let any dialog showing the model know that its values have changed
+        for name in dir(type(self)):
+            if isinstance(getattr(type(self), name), pyqtSignal):
+                getattr(self, name).emit()
+
+
+
+    def _stateAttributeNames(self)->set:
+        ''' Returns the names of the attributes that make up the state of the model '''
+
+        names = set()
+        for cls in type(self).__mro__:
+            if issubclass(cls, ModelBase):
+                names.update(name for name, value in vars(cls).items() if name.startswith('_') and not name.startswith('__') and isinstance(value, (str, int, float, bool)))
+        return names
+
+
+
     def _correctChangeValueSign(self, changeValue, startValue, endValue)->float:
         ''' Ensure the sign of a change value is appropriate for the start and end values '''
 
@@ -1,7 +1,10 @@
 import os
 import platform
+import re
 import shutil
+import signal
 import subprocess
+import tempfile
 
 from UM.Logger import Logger
 from UM.Message import Message
@@ -11,6 +14,12 @@ from UM.Message import Message
 class OpenScadInterface:
     _openscad_version_id = 'OpenSCAD version '
 
+    # The first version of OpenSCAD that can export to stdout (with "-o -" and "--export-format")
+    _stdoutExportVersion = (2021, 1)
+
+    # Parts of the messages given by older versions of OpenSCAD when they are asked to export to stdout
+    _stdoutExportErrors = ('export-format', 'Unknown suffix', 'unknown suffix')
+
 
 
     def __init__(self, pluginName, tempDir):
@@ -20,6 +29,12 @@ class OpenScadInterface:
         self._openscad_version = ''
         self._tempDir = tempDir
 
+        # The OpenSCAD command that was last found to be valid, so it doesn't need to be checked again
+        self._validatedCommand = None
+
+        # Whether the validated version of OpenSCAD can export to stdout, or None if it hasn't been determined yet
+        self._stdoutExportSupported = None
+
 
 
     def SetOpenScadPath(self, openScadPath):
@@ -50,8 +65,14 @@ class OpenScadInterface:
     def OpenScadPathValid(self)->bool:
         ''' Return true if the OpenScad path is valid '''
 
+        # The path only needs to be checked again if it has changed since it was found to be valid
+        # Invalid paths are always checked again, in case OpenSCAD has been installed since
+        openScadCommand = self._OpenScadCommand
+        if openScadCommand == self._validatedCommand:
+            return True
+
         # Attempt to verify the OpenScad executable is valid by querying the OpenScad version number
-        command = f'{self._OpenScadCommand} -v'
+        command = f'{openScadCommand} -v'
         response = subprocess.run(command, capture_output=True, text=True, shell=True).stderr.strip()
         Logger.log('d', f'Checking for OpenSCAD returned the following response: "{response}"')
 
@@ -59,9 +80,13 @@ class OpenScadInterface:
         valid = self._openscad_version_id in response
         if valid:
             self._openscad_version = response.replace(self._openscad_version_id, '')
+            self._validatedCommand = openScadCommand
+            self._stdoutExportSupported = self._VersionSupportsStdoutExport(self._openscad_version)
             Logger.log('d', 'The OpenSCAD path is valid')
         else:
             self._openscad_version = ''
+            self._validatedCommand = None
+            self._stdoutExportSupported = None
             Logger.log('d', 'The OpenSCAD path is not valid')
 
         return valid
@@ -73,6 +98,14 @@ class OpenScadInterface:
         ''' Converts the OpenScad path into a form that can be executed
             Currently, this is only needed for Linux '''
 
+        return self._BuildOpenScadCommand(lowPriority=False)
+
+
+
+    def _BuildOpenScadCommand(self, lowPriority)->str:
+        ''' Converts the OpenScad path into a form that can be executed
+            If lowPriority is True, OpenScad is started with nice on Linux and macOS, so it runs at a lower priority than Cura '''
+
         command = ''
 
         # This only makes sense if the OpenScad path has been determined or set
@@ -87,6 +120,10 @@ class OpenScadInterface:
                 # Prefix the OpenScad call with a command to unset LD_LIBRARY_PATH
                 command += 'unset LD_LIBRARY_PATH; '
 
+            # Windows processes are given a lower priority class when they are started instead
+            if lowPriority and system != 'windows':
+                command += 'nice -n 19 '
+
             path = self.OpenScadPath
 
             # Add the executable to the command
@@ -97,37 +134,154 @@ class OpenScadInterface:
 
 
 
-    def GenerateStl(self, inputFilePath, parameters, outputFilePath):
-        '''Execute an OpenSCAD file with the given parameters to generate a model'''
+    def GenerateStlData(self, inputFilePath, parameters)->tuple:
+        ''' Execute an OpenSCAD file with the given parameters and return the generated binary STL data and the output of the OpenSCAD command
+            The model is exported straight to stdout, so it never has to be written to and read back from disk
+            Empty data is returned if the model could not be generated '''
+
+        return self._GenerateData(inputFilePath, parameters, 'binstl', '.stl')
+
 
-        # If the OpenScad path is valid
-        if self.OpenScadPathValid:
+
+    def GenerateSvgData(self, inputFilePath, parameters, lowPriority=False)->tuple:
+        ''' Execute a 2D OpenSCAD file with the given parameters and return the generated SVG data and the output of the OpenSCAD command
+            If lowPriority is True, OpenSCAD is run at a lower priority so it doesn't compete with Cura
+            An empty string is returned if the SVG could not be generated '''
+
+        (svgData, commandResult) = self._GenerateData(inputFilePath, parameters, 'svg', '.svg', lowPriority)
+        return (svgData.decode(errors='replace'), commandResult)
+
+
+
+    def _GenerateData(self, inputFilePath, parameters, exportFormat, fileSuffix, lowPriority=False)->tuple:
+        ''' Execute an OpenSCAD file with the given parameters and return the data it exports in the given format and the output of the OpenSCAD command
+            The command output is returned rather than stored, since OpenSCAD may be run from several threads at once
+            The file suffix is used if the data has to be exported to a file instead of stdout
+            Empty data is returned if nothing could be generated '''
+
+        priorityArguments = self._LowPriorityArguments() if lowPriority else {}
+
+        # If the OpenScad path is invalid
+        if not self.OpenScadPathValid:
+            Message(f'The OpenSCAD path is invalid', title=self._pluginName, message_type=Message.MessageType.ERROR).show()
+            return (b'', '')
+
+        if self._stdoutExportSupported != False:
             # Build the OpenSCAD command
-            command = self._GenerateOpenScadCommand(inputFilePath, parameters, outputFilePath)
+            command = self._GenerateOpenScadCommand(inputFilePath, parameters, '-', exportFormat, lowPriority)
             Logger.log('d', f'Executing OpenSCAD command: {command}')
 
-            # Execute the OpenSCAD command and capture the error output
-            # Output in stderr does not necessarily indicate an error - OpenSCAD seems to routinely output to stderr
+            # Execute the OpenSCAD command, capturing the output from stdout and the messages from stderr
             try:
-                self.commandResult = subprocess.run(command, capture_output=True, text=True, shell=True).stderr.strip()
-
+                result = subprocess.run(command, capture_output=True, shell=True, **priorityArguments)
             except FileNotFoundError:
                 Message(f'OpenSCAD was not found at path "{self._openScadPath}"', title=self._pluginName, message_type=Message.MessageType.ERROR).show()
+                return (b'', '')
+            commandResult = result.stderr.decode(errors='replace').strip()
 
-        # If the OpenScad path is invalid
-        else:
-            Message(f'The OpenSCAD path is invalid', title=self._pluginName, message_type=Message.MessageType.ERROR).show()
+            if result.returncode == 0 and len(result.stdout) > 0:
+                self._stdoutExportSupported = True
+                return (result.stdout, commandResult)
+
+            # A model that failed to render would only fail again if it was exported to a file, so that is only done 
+            # if the version couldn't be determined and OpenSCAD reported that it can't export to stdout
+            if self._stdoutExportSupported == True or not any(error in commandResult for error in self._stdoutExportErrors):
+                return (b'', commandResult)
+            self._stdoutExportSupported = False
+
+        # Older versions of OpenSCAD can't export to stdout, so fall back to exporting to a uniquely-named temporary file
+        Logger.log('d', 'This version of OpenSCAD cannot export to stdout - exporting to a file instead')
+        (fileDescriptor, outputFilePath) = tempfile.mkstemp(suffix=fileSuffix, dir=self._tempDir)
+        os.close(fileDescriptor)
+        try:
+            command = self._GenerateOpenScadCommand(inputFilePath, parameters, outputFilePath, lowPriority=lowPriority)
+            commandResult = subprocess.run(command, capture_output=True, text=True, shell=True, **priorityArguments).stderr.strip()
+            with open(outputFilePath, 'rb') as outputFile:
+                return (outputFile.read(), commandResult)
+        finally:
+            os.remove(outputFilePath)
+
+
+
+    def StartStlGeneration(self, inputFilePath, parameters, outputFilePath):
+        ''' Start executing an OpenSCAD file in the background without waiting for it to finish
+            The running process is returned so it can be polled or stopped with StopStlGeneration, or None if OpenSCAD could not be started '''
+
+        # This only makes sense if the OpenScad path has been determined or set
+        if self._OpenScadCommand == '':
+            return None
+
+        command = self._GenerateOpenScadCommand(inputFilePath, parameters, outputFilePath)
+        Logger.log('d', f'Starting OpenSCAD command in the background: {command}')
+
+        # OpenSCAD is run through a shell, so it is started in its own process group
+        # This allows both the shell and OpenSCAD to be stopped together
+        try:
+            if platform.system().lower() == 'windows':
+                return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+            else:
+                return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True, start_new_session=True)
+        except OSError as e:
+            Logger.log('w', f'Unable to start OpenSCAD in the background: {e}')
+            return None
+
+
+
+    def StopStlGeneration(self, process)->None:
+        ''' Stop an OpenSCAD process started by StartStlGeneration if it is still running '''
+
+        if not process.poll() is None:
+            return
+
+        Logger.log('d', f'Stopping background OpenSCAD process {process.pid}')
+        try:
+            if platform.system().lower() == 'windows':
+                subprocess.run(f'taskkill /F /T /PID {process.pid}', capture_output=True, shell=True)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError as e:
+            # The process may have finished on its own in the meantime
+            Logger.log('d', f'Unable to stop OpenSCAD process {process.pid}: {e}')
+
+        process.wait()
+
+
+
+    def _VersionSupportsStdoutExport(self, version)->bool:
+        ''' Returns true if a version of OpenSCAD can export to stdout, or None if the version number can't be understood
+            Versions are numbered by year and month (for example, "2021.01" or the development snapshot "2024.03.18") '''
+
+        match = re.match(r'\s*(\d+)\.(\d+)', version)
+        if match is None:
+            return None
+
+        return (int(match.group(1)), int(match.group(2))) >= self._stdoutExportVersion
+
+
+
+    @staticmethod
+    def _LowPriorityArguments()->dict:
+        ''' Returns the subprocess arguments that run OpenSCAD at a lower priority than Cura
+            This is only needed for Windows - on other systems, the command itself is prefixed with nice '''
+
+        if platform.system().lower() == 'windows':
+            return {'creationflags': subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+
+        return {}
 
 
 
-    def _GenerateOpenScadCommand(self, inputFilePath, parameters, outputFilePath):
-        '''Generate an OpenSCAD command from an input file path, parameters, and output file path'''
+    def _GenerateOpenScadCommand(self, inputFilePath, parameters, outputFilePath, exportFormat=None, lowPriority=False):
+        '''Generate an OpenSCAD command from an input file path, parameters, and output file path
+           The export format must be given if the output file path is "-" (stdout), since it can't be determined from the file extension'''
 
         # Start the command line
-        command_line = self._OpenScadCommand
+        command_line = self._BuildOpenScadCommand(lowPriority)
 
         # Tell OpenSCAD to automatically generate an STL file
         command_line += f' -o "{outputFilePath}"'
+        if not exportFormat is None:
+            command_line += f' --export-format {exportFormat}'
 
         # Add each variable setting parameter
         for parameter in parameters:
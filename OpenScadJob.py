@@ -3,21 +3,25 @@ from UM.Job import Job
 
 
 class OpenScadJob(Job):
-    '''A simple class used to generate an STL file using OpenSCAD
+    '''A simple class used to generate an STL model using OpenSCAD
     
     Since this can be a lengthy process, Uranium's Job class is used
-    to perform the work in the background'''
+    to perform the work in the background
+    
+    The generated binary STL data is left in stlData (empty if the model could not be generated)
+    and the output of the OpenSCAD command is left in commandResult'''
 
-    def __init__(self, openScadInterface, openScadFilePath, openScadParameters, stlFilePath):
+    def __init__(self, openScadInterface, openScadFilePath, openScadParameters):
         super().__init__()
         self._openScadInterface = openScadInterface
         self._openScadFilePath = openScadFilePath
         self._openScadParameters = openScadParameters
-        self._stlFilePath = stlFilePath
+        self.stlData = b''
+        self.commandResult = ''
 
 
 
     def run(self) -> None:
-        '''Generate an STL from an OpenSCAD file'''
+        '''Generate an STL model from an OpenSCAD file'''
 
-        self._openScadInterface.GenerateStl(self._openScadFilePath, self._openScadParameters, self._stlFilePath)
+        (self.stlData, self.commandResult) = self._openScadInterface.GenerateStlData(self._openScadFilePath, self._openScadParameters)
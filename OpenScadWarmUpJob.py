@@ -0,0 +1,30 @@
+from UM.Job import Job
+from UM.Logger import Logger
+
+
+
+class OpenScadWarmUpJob(Job):
+    '''A simple class used to warm up OpenSCAD when the plugin is loaded
+
+    The first time OpenSCAD renders text, it has to initialize its font
+    cache, which noticeably slows down the first custom tower
+    This job validates the OpenSCAD path (which caches its version) and
+    then renders a tiny model with the tower font at a low priority, so
+    the first real tower is generated at full speed'''
+
+    def __init__(self, openScadInterface, openScadFilePath, openScadParameters):
+        super().__init__()
+        self._openScadInterface = openScadInterface
+        self._openScadFilePath = openScadFilePath
+        self._openScadParameters = openScadParameters
+
+
+
+    def run(self) -> None:
+        '''Render the warm-up model if OpenSCAD is available'''
+
+        if not self._openScadInterface.OpenScadPathValid:
+            return
+
+        self._openScadInterface.GenerateSvgData(self._openScadFilePath, self._openScadParameters, lowPriority=True)
+        Logger.log('d', f'Warmed up OpenSCAD version {self._openScadInterface.OpenScadVersion}')
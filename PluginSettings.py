@@ -1,20 +1,39 @@
 import json
+import os
+import tempfile
+import threading
+
+from UM.Logger import Logger
 
 
 
 class PluginSettings():
 
+    # The number of seconds to wait after a setting changes before writing the settings file
+    # This allows a burst of changes (such as accepting the settings dialog) to be written all at once
+    _saveDelay = 1.0
+
+
+
     def __init__(self, filepath=''):
         PluginSettings.__instance = self
         self._settingsDictionary = {}
-        
+        self._filepath = filepath
+        self._lock = threading.Lock()
+        self._saveLock = threading.Lock()
+        self._saveTimer = None
+
         if filepath != '':
             self.LoadFromFile(filepath)
 
 
 
     def SetValue(self, setting, value)->None:
-        self._settingsDictionary[setting] = value
+        with self._lock:
+            self._settingsDictionary[setting] = value
+
+        # Persist the change shortly, rather than waiting for Cura to close
+        self._ScheduleSave()
 
 
 
@@ -25,10 +44,26 @@ class PluginSettings():
             return default
 
 
-    
+
     def SaveToFile(self, filepath)->None:
-        with open(filepath, 'w') as settingsFile:
-            json.dump(self._settingsDictionary, settingsFile)
+        ''' Writes the settings to a temporary file and then swaps it into place
+            This ensures the settings file is never left partially written
+            Saves are made one at a time, and each uses its own temporary file, so overlapping saves can't mix their writes '''
+
+        with self._saveLock:
+            with self._lock:
+                contents = json.dumps(self._settingsDictionary)
+
+            (fileDescriptor, tempFilePath) = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(filepath)))
+            try:
+                with os.fdopen(fileDescriptor, 'w') as settingsFile:
+                    settingsFile.write(contents)
+                    settingsFile.flush()
+                    os.fsync(settingsFile.fileno())
+                os.replace(tempFilePath, filepath)
+            except OSError:
+                os.remove(tempFilePath)
+                raise
 
 
 
@@ -40,3 +75,31 @@ class PluginSettings():
 
         except FileNotFoundError:
             pass
+
+
+
+    def _ScheduleSave(self)->None:
+        ''' Starts (or restarts) the timer that saves the settings in the background '''
+
+        # There's nowhere to save the settings if no file was specified
+        if self._filepath == '':
+            return
+
+        with self._lock:
+            if not self._saveTimer is None:
+                self._saveTimer.cancel()
+
+            # The timer thread is deliberately not a daemon thread, so a pending save
+            # is still completed if Cura exits before the timer fires
+            self._saveTimer = threading.Timer(self._saveDelay, self._SaveInBackground)
+            self._saveTimer.start()
+
+
+
+    def _SaveInBackground(self)->None:
+        ''' Called by the save timer to write the settings file '''
+
+        try:
+            self.SaveToFile(self._filepath)
+        except OSError as e:
+            Logger.log('e', f'Unable to save the plugin settings to "{self._filepath}": {e}')
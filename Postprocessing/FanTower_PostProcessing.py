@@ -18,7 +18,11 @@
 #   This is more accurate if the section height cannot be evenly divided by the printing layer height
 # Version 3.1 - 28 Aug 2023:
 #   Add the option enable_advanced_gcode_comments to reduce the Gcode size
-__version__ = '3.1'
+# Version 3.2 - 19 Oct 2026:
+#   Parameters are now documented using the shared ParameterHeader in PostProcessingCommon.py
+# Version 3.3 - 19 Oct 2026:
+#   Only the bridge markers and fan commands are visited, rather than every line in the gcode
+__version__ = '3.3'
 
 from UM.Logger import Logger
 
@@ -26,32 +30,28 @@ from . import PostProcessingCommon as Common
 
 
 
+# The parameters documented in the log and at the top of the gcode
+parameter_header = Common.ParameterHeader('Fan Tower', __version__, [
+    Common.ParameterDescriptor('base_height', 'Base height', ' mm'),
+    Common.ParameterDescriptor('section_height', 'Section height', ' mm'),
+    Common.ParameterDescriptor('initial_layer_height', 'Initial printed layer height', ' mm'),
+    Common.ParameterDescriptor('layer_height', 'Printed layer height', ' mm'),
+    Common.ParameterDescriptor('start_fan_percent', 'Starting fan speed', '%'),
+    Common.ParameterDescriptor('fan_percent_change', 'Fan speed change', '%'),
+    Common.ParameterDescriptor('maintain_bridge_value', 'Maintain bridge value'),
+    Common.ParameterDescriptor('enable_lcd_messages', 'Enable LCD messages'),
+    Common.ParameterDescriptor('enable_advanced_gcode_comments', 'Advanced Gcode comments'),
+])
+
+# The lines this script is interested in (fan commands and bridge markers)
+fan_command_prefixes = ('M106 S', 'M107', ';BRIDGE')
+
+
+
 def execute(gcode, base_height:float, section_height:float, initial_layer_height: float, layer_height:float, start_fan_percent:float, fan_percent_change:float, maintain_bridge_value:bool, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool):
     
-    # Log the post-processing settings
-    Logger.log('d', f'Beginning Fan Tower post-processing script version {__version__}')
-    Logger.log('d', f'Script version {__version__}')
-    Logger.log('d', f'Base height = {base_height} mm')
-    Logger.log('d', f'Section height = {section_height} mm')
-    Logger.log('d', f'Initial printed layer height = {initial_layer_height}')
-    Logger.log('d', f'Printed layer height = {layer_height} mm')
-    Logger.log('d', f'Starting fan speed = {start_fan_percent}%')
-    Logger.log('d', f'Fan speed change = {fan_percent_change}%')
-    Logger.log('d', f'Maintain bridge value = {maintain_bridge_value}')
-    Logger.log('d', f'Enable LCD messages = {enable_lcd_messages}')
-    Logger.log('d', f'Advanced Gcode Comments = {enable_advanced_gcode_comments}')
-
-    # Document the settings in the g-code
-    gcode[0] += f'{Common.comment_prefix} Fan Tower post-processing script version {__version__}\n'
-    gcode[0] += f'{Common.comment_prefix} Base height = {base_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Section height = {section_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Initial printed layer height = {initial_layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Printed layer height = {layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Starting fan speed = {start_fan_percent}%\n'
-    gcode[0] += f'{Common.comment_prefix} Fan speed change = {fan_percent_change}%\n'
-    gcode[0] += f'{Common.comment_prefix} Maintain bridge value = {maintain_bridge_value}\n'
-    gcode[0] += f'{Common.comment_prefix} Enable LCD messages = {enable_lcd_messages}\n'
-    gcode[0] += f'{Common.comment_prefix} Advanced Gcode comments = {enable_advanced_gcode_comments}\n'
+    # Document the post-processing settings
+    parameter_header.Document(gcode, locals())
 
     # Start at the requested starting fan speed %
     current_fan_percent = start_fan_percent - fan_percent_change # The current fan percent will be corrected when the first section is encountered
@@ -62,8 +62,8 @@ def execute(gcode, base_height:float, section_height:float, initial_layer_height
     # Keep track of whether a bridge has been completed
     after_bridge = False
 
-    # Iterate over each line in the g-code
-    for line_index, line, lines, start_of_new_section in Common.LayerEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
+    # Iterate over the fan commands and bridge markers in the g-code
+    for line_index, line, lines, start_of_new_section in Common.CommandEnumerate(gcode, fan_command_prefixes, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
 
         # Handle each new tower section
         if start_of_new_section:
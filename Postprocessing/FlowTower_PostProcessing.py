@@ -17,60 +17,84 @@
 #   changing the extrusion distance
 # Version 3.1 - 28 Aug 2023:
 #   Add the option enable_advanced_gcode_comments to reduce the Gcode size
-__version__ = '3.1'
+# Version 3.2 - 19 Oct 2026:
+#   Parameters are now documented using the shared ParameterHeader in PostProcessingCommon.py
+# Version 3.3 - 19 Oct 2026:
+#   Extrusion values are located once and spliced into the line rather than replaced by string search
+#   The absolute extrusion adjustment is tracked as a single offset from the original positions
+#   Fixed relative moves with no positive extrusion being overwritten with the previously modified line
+# Version 3.4 - 19 Oct 2026:
+#   Extrusion values are rescaled a layer at a time using numpy, rather than one line at a time
+#   Layers that change the extrusion mode or reset the extruder position are still processed line by line
+__version__ = '3.4'
 
 import re
 
+import numpy
+
 from UM.Logger import Logger
 
 from . import PostProcessingCommon as Common
 
 
 
+# The parameters documented in the log and at the top of the gcode
+parameter_header = Common.ParameterHeader('Flow Tower', __version__, [
+    Common.ParameterDescriptor('base_height', 'Base height', ' mm'),
+    Common.ParameterDescriptor('section_height', 'Section height', ' mm'),
+    Common.ParameterDescriptor('initial_layer_height', 'Initial printed layer height', ' mm'),
+    Common.ParameterDescriptor('layer_height', 'Printed layer height', ' mm'),
+    Common.ParameterDescriptor('relative_extrusion', 'Relative extrusion'),
+    Common.ParameterDescriptor('start_flow_rate', 'Starting flow rate', '%'),
+    Common.ParameterDescriptor('flow_rate_change', 'Flow rate change', '%'),
+    Common.ParameterDescriptor('reference_flow_rate', 'Reference flow rate', '%'),
+    Common.ParameterDescriptor('enable_lcd_messages', 'Enable LCD messages'),
+    Common.ParameterDescriptor('enable_advanced_gcode_comments', 'Advanced Gcode comments'),
+])
+
+# The regex used to find commands that change how extrusion values are interpreted
+# Layers containing these commands are processed line by line
+_extrusion_mode_regex = re.compile(r'\n[ \t]*(?:G9[012]|M8[23])')
+
+# The regex used to split a segment of gcode around the extrusion values of G1 commands
+# Each match captures the start of the line, the extrusion value, and the remainder of the line
+_extrusion_value_regex = re.compile(r'(\nG1 [^\n;E]*E)([-+]?\d*\.?\d+)([^\n]*)')
+
+# Splitting with this regex produces the text before each match followed by the three captured groups
+_extrusion_value_group_count = 4
+
+
+
 def execute(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, relative_extrusion:bool, start_flow_rate:float, flow_rate_change:float, reference_flow_rate:float, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool):
 
-    # Log the post-processing settings
-    Logger.log('d', f'Beginning Flow Tower post-processing script version {__version__}')
-    Logger.log('d', f'Base height = {base_height} mm')
-    Logger.log('d', f'Section height = {section_height} mm')
-    Logger.log('d', f'Initial printed layer height = {initial_layer_height}')
-    Logger.log('d', f'Printed layer height = {layer_height} mm')
-    Logger.log('d', f'Relative extrusion = {relative_extrusion}')
-    Logger.log('d', f'Starting flow rate = {start_flow_rate}%')
-    Logger.log('d', f'Flow rate change = {flow_rate_change}%')
-    Logger.log('d', f'Reference flow rate = {reference_flow_rate}%')
-    Logger.log('d', f'Enable LCD messages = {enable_lcd_messages}')
-    Logger.log('d', f'Advanced Gcode Comments = {enable_advanced_gcode_comments}')
-
-    # Document the settings in the g-code
-    gcode[0] += f'{Common.comment_prefix} Flow Tower post-processing script version {__version__}\n'
-    gcode[0] += f'{Common.comment_prefix} Base height = {base_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Section height = {section_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Initial printed layer height = {initial_layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Printed layer height = {layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Relative extrusion = {relative_extrusion}\n'
-    gcode[0] += f'{Common.comment_prefix} Starting flow rate = {start_flow_rate}%\n'
-    gcode[0] += f'{Common.comment_prefix} Flow rate change = {flow_rate_change}%\n'
-    gcode[0] += f'{Common.comment_prefix} Reference flow rate = {reference_flow_rate}%\n'
-    gcode[0] += f'{Common.comment_prefix} Enable LCD messages = {enable_lcd_messages}\n'
-    gcode[0] += f'{Common.comment_prefix} Advanced Gcode comments = {enable_advanced_gcode_comments}\n'
+    # Document the post-processing settings
+    parameter_header.Document(gcode, locals())
 
     # Start at the requested starting flow value
     current_flow_rate = start_flow_rate - flow_rate_change # The current flow value will be corrected when the first section is encountered
 
-    # Keep track of values throughout the script
-    reference_extrusion_position = None
-    updated_extrusion_position = None
+    # Keep track of the extrusion state between layers
+    rescaler = _ExtrusionRescaler(relative_extrusion, reference_flow_rate, enable_advanced_gcode_comments)
 
-    # Iterate over each line in the g-code
-    for line_index, line, lines, start_of_new_section in Common.LayerEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
+    # Iterate over each layer in the g-code
+    for segments, segment_index, start_of_new_section in Common.SegmentEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
 
-        # Handle each new tower section
+        # Update the flow value for each new tower section
         if start_of_new_section:
-
-            # Update the flow value for the new tower section
             current_flow_rate += flow_rate_change
 
+        # Rescale the extrusion values in this layer to achieve the current flow rate
+        # Extrusion commands are by far the most common lines, so the layer is processed as a whole whenever possible
+        segment = segments[segment_index]
+        if _extrusion_mode_regex.search('\n' + segment):
+            segment = rescaler.RescaleLines(segment, current_flow_rate)
+        else:
+            segment = rescaler.RescaleSegment(segment, current_flow_rate)
+
+        # Handle each new tower section
+        if start_of_new_section:
+            lines = segment.split('\n', Common.section_head_line_count)
+
             # Document the new flow rate in the gcode
             if enable_advanced_gcode_comments :
                 lines.insert(2, f'{Common.comment_prefix} Using flow rate {current_flow_rate}% for this tower section')
@@ -83,116 +107,202 @@ def execute(gcode, base_height:float, section_height:float, initial_layer_height
                 # Display the new flow rate on the printer's LCD
                 if enable_lcd_messages:
                     lines.insert(2, f'M117 FLOW {current_flow_rate:.1f}%')
-                    
-        # Record if relative extrusion is now being used
-        if Common.IsRelativeInstructionLine(line):
-            relative_extrusion = True
 
-        # Record if absolute extrusion is now being used
-        elif Common.IsAbsoluteInstructionLine(line):
-            relative_extrusion = False
+            segment = '\n'.join(lines)
+
+        segments[segment_index] = segment
+
+    Logger.log('d', 'AutoTowersGenerator completing FlowTower post-processing')
+    
+    return gcode
+
+
 
-            # The absolute extrusion position data will need to be redetermined
-            reference_extrusion_position = None
-            updated_extrusion_position = None
+class _ExtrusionRescaler():
+    ''' Rescales the extrusion values in the gcode to achieve a given flow rate, keeping track of the extrusion state as it goes '''
 
-        # Handle resetting the extruder position
-        elif Common.IsResetExtruderLine(line) and relative_extrusion == False:
+    def __init__(self, relative_extrusion:bool, reference_flow_rate:float, enable_advanced_gcode_comments:bool):
+        self._relative_extrusion = relative_extrusion
+        self._reference_flow_rate = reference_flow_rate
+        self._enable_advanced_gcode_comments = enable_advanced_gcode_comments
 
-            # Reset the recorded extrusion positions to 0
-            reference_extrusion_position = 0
-            updated_extrusion_position = 0
+        # Keep track of the original absolute extrusion position and how far the modified positions have drifted from it
+        self._original_extrusion_position = None
+        self._extrusion_offset = 0.0
 
-        # Handle extrusion or retraction lines that need to be processed
+
+
+    def RescaleSegment(self, segment:str, current_flow_rate:float)->str:
+        ''' Rescales all of the extrusion values in a segment of gcode at once
+            The segment must not change the extrusion mode or reset the extruder position '''
+
+        # Split the segment around the extrusion values
+        # A newline is added so a command on the first line of the segment is matched like any other
+        parts = _extrusion_value_regex.split('\n' + segment)
+        line_starts = parts[1::_extrusion_value_group_count]
+        value_strings = parts[2::_extrusion_value_group_count]
+        line_endings = parts[3::_extrusion_value_group_count]
+
+        # Classify the commands the same way IsExtrusionLine and IsRetractLine do
         # All extrusion commands will need to be modified to achieve the requested flow rate
         # Absolute retraction commands will need to modified to account for flow rate extrusion changes
         # Relative retraction commands can be left unchanged 
-        elif (Common.IsExtrusionLine(line) or (Common.IsRetractLine(line) and not relative_extrusion)):
+        lines = [line_start + line_ending for (line_start, line_ending) in zip(line_starts, line_endings)]
+        is_extrusion = numpy.array(['X' in line and 'Y' in line for line in lines], dtype=bool)
+        if self._relative_extrusion:
+            is_processed = is_extrusion
+        else:
+            is_processed = is_extrusion | numpy.array(['F' in line and not 'X' in line and not 'Y' in line and not 'Z' in line for line in lines], dtype=bool)
+
+        processed_indexes = numpy.flatnonzero(is_processed)
+        if len(processed_indexes) == 0:
+            return segment
+        is_extrusion = is_extrusion[processed_indexes]
+        values = numpy.array([value_strings[index] for index in processed_indexes], dtype=float)
+
+        # Handle relative extrusion commands
+        if self._relative_extrusion:
+
+            # With relative extrusion, the "extrusion value" is simply the distance of filament being extruded
+            # Only positive extrusion (filament being pushed out) needs to be modified
+            is_modified = values > 0
+            original_extruded_distances = values
+            updated_extruded_distances = values / (self._reference_flow_rate / 100) * (current_flow_rate / 100)
+            updated_values = updated_extruded_distances
+
+        # Handle absolute extrusion and retraction commands
+        else:
+
+            # If the original absolute extrusion position hasn't been read yet, read it from the first command and leave that command unchanged
+            is_modified = numpy.ones(len(values), dtype=bool)
+            if self._original_extrusion_position is None:
+                self._original_extrusion_position = values[0]
+                is_modified[0] = False
+
+            # Determine how far the filament is originally being extruded or retracted by each command
+            original_extruded_distances = values - numpy.concatenate(([self._original_extrusion_position], values[:-1]))
+
+            # Retractions are left unchanged, apart from the offset
+            # Extrusions are scaled to achieve the current flow rate
+            # The offsets are accumulated in order, starting from the current offset, exactly as they would be line by line
+            updated_extruded_distances = original_extruded_distances / (self._reference_flow_rate / 100) * (current_flow_rate / 100)
+            offset_changes = numpy.where(is_extrusion & is_modified, updated_extruded_distances - original_extruded_distances, 0.0)
+            offsets = numpy.cumsum(numpy.concatenate(([self._extrusion_offset], offset_changes)))[1:]
+            updated_values = values + offsets
+
+            self._original_extrusion_position = values[-1]
+            self._extrusion_offset = offsets[-1]
+
+        # Format the updated values all at once and splice them in place of the original values
+        modified_positions = numpy.flatnonzero(is_modified)
+        modified_indexes = processed_indexes[modified_positions]
+        formatted_values = (('%.5f\n' * len(modified_positions)) % tuple(updated_values[modified_positions].tolist())).split('\n')[:-1]
+        value_array = numpy.array(value_strings, dtype=object)
+        value_array[modified_indexes] = formatted_values
+        parts[2::_extrusion_value_group_count] = value_array.tolist()
+
+        # Document the changes
+        if self._enable_advanced_gcode_comments:
+            comments = [self._Comment(is_extrusion_line, original_extruded_distance, updated_extruded_distance, current_flow_rate) for (is_extrusion_line, original_extruded_distance, updated_extruded_distance) in zip(is_extrusion[modified_positions].tolist(), original_extruded_distances[modified_positions].tolist(), updated_extruded_distances[modified_positions].tolist())]
+            ending_array = numpy.array(line_endings, dtype=object)
+            ending_array[modified_indexes] += comments
+            parts[3::_extrusion_value_group_count] = ending_array.tolist()
+
+        return ''.join(parts)[1:]
+
+
+
+    def RescaleLines(self, segment:str, current_flow_rate:float)->str:
+        ''' Rescales the extrusion values in a segment of gcode one line at a time, following any extrusion mode changes '''
+
+        lines = segment.split('\n')
+        for line_index, line in enumerate(lines):
+
+            # Handle extrusion or retraction lines that need to be processed
+            # All extrusion commands will need to be modified to achieve the requested flow rate
+            # Absolute retraction commands will need to modified to account for flow rate extrusion changes
+            # Relative retraction commands can be left unchanged 
+            # These are by far the most common lines, so they are checked first
+            is_extrusion_line = Common.IsExtrusionLine(line)
+            if is_extrusion_line or (not self._relative_extrusion and Common.IsRetractLine(line)):
+
+                # Locate the extrusion value in the line
+                value_span = Common.FindParameterValueSpan(line, 'E')
+                if value_span is None:
+                    continue
+                (value_start, value_end) = value_span
+                extrusion_value = float(line[value_start:value_end])
+
+                # Handle relative extrusion commands
+                # Relative extrusion is pretty simple
+                if self._relative_extrusion:
+
+                    # With relative extrusion, the "extrusion value" is simply the distance of filament being extruded
+                    # Only positive extrusion (filament being pushed out) needs to be modified
+                    original_extruded_distance = extrusion_value
+                    if original_extruded_distance <= 0:
+                        continue
+
+                    # Update the extruded distance to reflect the current flow rate
+                    updated_extruded_distance = original_extruded_distance / (self._reference_flow_rate / 100) * (current_flow_rate / 100)
+                    updated_extrusion_value = updated_extruded_distance
+
+                # If the original absolute extrusion position hasn't been read yet, read it from this command and move to the next line
+                elif self._original_extrusion_position is None:
+                    self._original_extrusion_position = extrusion_value
+                    continue
 
-            # Determine the new extrusion position
-            position_search_results = re.search(r'E([-+]?\d*\.?\d+)', line.split(';')[0])
-            if position_search_results:
-                original_extrusion_position_string = position_search_results.group(1)
-                original_extrusion_position = float(original_extrusion_position_string)
+                # Handle absolute extrusion and retraction commands
+                # These are shifted by the total adjustment made to the earlier extrusions
+                else:
 
-                # If the absolute filament reference extrusion position hasn't been read yet, read it from this command and move to the next line
-                if reference_extrusion_position is None and relative_extrusion == False:
+                    # Determine how far the filament is originally being extruded or retracted
+                    original_extruded_distance = extrusion_value - self._original_extrusion_position
+                    self._original_extrusion_position = extrusion_value
 
-                    # Record the original extrusion position as the reference position for future updates
-                    reference_extrusion_position = original_extrusion_position
-                    updated_extrusion_position = original_extrusion_position
-                    continue
+                    # Retractions are left unchanged, apart from the offset
+                    # Extrusions are scaled to achieve the current flow rate
+                    updated_extruded_distance = original_extruded_distance / (self._reference_flow_rate / 100) * (current_flow_rate / 100)
+                    if is_extrusion_line:
+                        self._extrusion_offset += updated_extruded_distance - original_extruded_distance
 
-                # Handle absolute retraction commands
-                elif Common.IsRetractLine(line):
-
-                    # Only absolute extrusions need to be tracked and modified
-                    if not relative_extrusion:
-
-                        # Determine how far the filament is being extruded or retracted
-                        original_extruded_distance = original_extrusion_position - reference_extrusion_position
-                        
-                        # Update the referenced extrusion positions
-                        reference_extrusion_position = original_extrusion_position
-                        updated_extrusion_position += original_extruded_distance
-
-                        # Update the gcode line
-                        new_line = line.replace(f'E{original_extrusion_position_string}', f'E{updated_extrusion_position:.5f}')
-                        if enable_advanced_gcode_comments :
-                            if original_extruded_distance < 0:
-                                new_line += f' {Common.comment_prefix} Retracting {-original_extruded_distance:.5f} mm of filament'
-                            else:
-                                new_line += f' {Common.comment_prefix} Extruding {original_extruded_distance:.5f} mm of filament to reverse the last retraction'
-
-                # Handle extrusion commands
-                elif Common.IsExtrusionLine(line):
-
-                        # Handle relative extrusion commands
-                        # Relative extrusion is pretty simple
-                        if relative_extrusion:
-
-                            # With relative extrusion, the "extrusion position" is simply the distance of filament being extruded
-                            original_extruded_distance = original_extrusion_position
-
-                            # Modify positive extrusion (filament being pushed out) to achieve the requested flow rate
-                            if original_extruded_distance > 0:
-                                
-                                # Update the extruded distance to reflect the current flow rate
-                                nominal_extruded_distance = original_extruded_distance / (reference_flow_rate / 100) # Correct for the reference flow rate
-                                updated_extruded_distance = nominal_extruded_distance * (current_flow_rate / 100) # Convert to the current flow rate
-
-                                # Update the gcode line
-                                new_line = line.replace(f'E{original_extrusion_position_string}', f'E{updated_extruded_distance:.5f}')
-                                if enable_advanced_gcode_comments :
-                                    new_line += f' {Common.comment_prefix} Extruding {updated_extruded_distance:.5f} mm of filament to achieve a {current_flow_rate}% flow rate (originally {original_extruded_distance:.5f} mm at {reference_flow_rate}% flow rate)'
-
-                        # Handle absolute extrusion commands
-                        # This is more complicated than relative extrusion since we need to keep track of how much 
-                        # filament the script originally extruded and how much our modifications are extruding
-                        else:
-
-                            # Calculate how much filament is being extruded by the script
-                            original_extruded_distance = original_extrusion_position - reference_extrusion_position
-                            
-                            # Update the referenced extrusion position
-                            reference_extrusion_position = original_extrusion_position
-
-                            # Update the extruded distance to reflect the current flow rate
-                            nominal_extruded_distance = original_extruded_distance / (reference_flow_rate / 100) # Correct for the reference flow rate
-                            updated_extruded_distance = nominal_extruded_distance * (current_flow_rate / 100) # Convert to the current flow rate
-                            updated_extrusion_position += updated_extruded_distance
-
-                            # Update the gcode line
-                            new_line = line.replace(f'E{original_extrusion_position_string}', f'E{updated_extrusion_position:.5f}')
-                            if enable_advanced_gcode_comments :
-                                new_line += f' {Common.comment_prefix} Extruding {updated_extruded_distance:.5f} mm of filament to achieve a {current_flow_rate}% flow rate (originally {original_extruded_distance:.5f} mm at {reference_flow_rate}% flow rate)'
-                    
-                # Replace the original line with the post-processing modifications
+                    updated_extrusion_value = extrusion_value + self._extrusion_offset
+
+                # Splice the updated value into the line in place of the original value
+                new_line = f'{line[:value_start]}{updated_extrusion_value:.5f}{line[value_end:]}'
+                if self._enable_advanced_gcode_comments:
+                    new_line += self._Comment(is_extrusion_line, original_extruded_distance, updated_extruded_distance, current_flow_rate)
                 lines[line_index] = new_line
 
-                # Leave the original line commented out in the gcode for reference
-                #lines.insert(line_index, f';{line} {Common.comment_prefix} This is the original line before it was modified')
+            # Record if relative extrusion is now being used
+            elif Common.IsRelativeInstructionLine(line):
+                self._relative_extrusion = True
 
-    Logger.log('d', 'AutoTowersGenerator completing FlowTower post-processing')
-    
-    return gcode
\ No newline at end of file
+            # Record if absolute extrusion is now being used
+            elif Common.IsAbsoluteInstructionLine(line):
+                self._relative_extrusion = False
+
+                # The absolute extrusion position will need to be redetermined
+                self._original_extrusion_position = None
+                self._extrusion_offset = 0.0
+
+            # Handle resetting the extruder position
+            elif Common.IsResetExtruderLine(line) and self._relative_extrusion == False:
+
+                # Reset the original and modified extrusion positions to 0
+                self._original_extrusion_position = 0
+                self._extrusion_offset = 0.0
+
+        return '\n'.join(lines)
+
+
+
+    def _Comment(self, is_extrusion_line:bool, original_extruded_distance:float, updated_extruded_distance:float, current_flow_rate:float)->str:
+        ''' Returns the comment documenting a modified extrusion or retraction command '''
+
+        if is_extrusion_line:
+            return f' {Common.comment_prefix} Extruding {updated_extruded_distance:.5f} mm of filament to achieve a {current_flow_rate}% flow rate (originally {original_extruded_distance:.5f} mm at {self._reference_flow_rate}% flow rate)'
+        elif original_extruded_distance < 0:
+            return f' {Common.comment_prefix} Retracting {-original_extruded_distance:.5f} mm of filament'
+        else:
+            return f' {Common.comment_prefix} Extruding {original_extruded_distance:.5f} mm of filament to reverse the last retraction'
@@ -0,0 +1,144 @@
+# This script reduces the size of post-processed gcode
+#
+# Printers that receive gcode over a serial connection or from an SD card
+# spend time transferring every byte, so this script removes content that
+# does not affect the print:
+#   - Comments, except for the markers that Cura, printers, gcode previewers,
+#     and the tower post-processing scripts rely on (such as ";LAYER:" and ";TYPE:")
+#   - Feedrates that repeat the feedrate already in effect
+#   - Trailing zeros in the numeric parameters of movement commands
+#
+# The header generated by Cura (the first clump) is left unchanged.
+#
+# Version 1.0 - 19 Oct 2026:
+#   Initial version
+# Version 1.1 - 19 Oct 2026:
+#   The ";TYPE:" and ";MESH:" markers are kept, since gcode previewers and other post-processing scripts rely on them
+__version__ = '1.1'
+
+import re
+
+from UM.Logger import Logger
+
+from . import PostProcessingCommon as Common
+
+
+
+# Comment lines starting with these prefixes are kept
+essential_comment_prefixes = (
+    ';LAYER:',
+    ';LAYER_COUNT:',
+    ';TYPE:',
+    ';MESH:',
+    ';TIME_ELAPSED:',
+    ';TIME:',
+    ';FLAVOR:',
+    ';Filament used:',
+    ';End of Gcode',
+)
+
+# The commands that use the current feedrate
+movement_commands = ('G0', 'G1', 'G2', 'G3')
+
+# Commands after which the feedrate in effect can't be relied on
+feedrate_reset_commands = ('G10', 'G11', 'G28', 'G29')
+
+# The commands whose numeric parameters can have trailing zeros trimmed
+trimmable_commands = movement_commands + ('G92',)
+
+# The regex used to find decimal numbers following a parameter letter
+_decimal_parameter_regex = re.compile(r'(?<=[A-Z])[-+]?\d*\.\d+')
+
+
+
+def execute(gcode):
+
+    Logger.log('d', f'Beginning Gcode Compaction post-processing script version {__version__}')
+
+    original_size = sum(len(clump) for clump in gcode)
+
+    # The feedrate in effect is tracked both as a single value shared by all movement commands (as in Marlin)
+    # and separately for each movement command (as in some other firmwares)
+    # A feedrate is only removed if it is redundant under both models
+    shared_feedrate = None
+    command_feedrates = {}
+
+    # Leave the header generated by Cura unchanged
+    for clump_index in range(1, len(gcode)):
+        clump = gcode[clump_index]
+
+        compacted_lines = []
+        for line in clump.split('\n'):
+
+            # Keep only the essential comment lines
+            if line.startswith(';'):
+                if line.startswith(essential_comment_prefixes):
+                    compacted_lines.append(line)
+                continue
+
+            # Remove comments from the end of command lines
+            comment_start = line.find(';')
+            if comment_start >= 0:
+                line = line[:comment_start]
+            line = line.strip()
+
+            # Remove empty lines
+            if line == '':
+                continue
+
+            command = line.split(' ', 1)[0]
+
+            # Forget the feedrate in effect after commands that may change it
+            if command in feedrate_reset_commands or command.startswith('T'):
+                shared_feedrate = None
+                command_feedrates = {}
+
+            elif command in movement_commands:
+                value_span = Common.FindParameterValueSpan(line, 'F')
+                if not value_span is None:
+                    (value_start, value_end) = value_span
+                    feedrate = float(line[value_start:value_end])
+
+                    # Remove the feedrate if it is already in effect
+                    if feedrate == shared_feedrate and feedrate == command_feedrates.get(command):
+                        line = (line[:value_start - 1].rstrip() + line[value_end:]).strip()
+
+                        # A move with only a redundant feedrate does nothing
+                        if line == command:
+                            continue
+
+                    shared_feedrate = feedrate
+                    command_feedrates[command] = feedrate
+
+            # Trim trailing zeros from numeric parameters
+            if command in trimmable_commands and '.' in line:
+                line = _decimal_parameter_regex.sub(_TrimTrailingZeros, line)
+
+            compacted_lines.append(line)
+
+        compacted_clump = '\n'.join(compacted_lines)
+        if clump.endswith('\n') and compacted_lines:
+            compacted_clump += '\n'
+        gcode[clump_index] = compacted_clump
+
+    # Document the compaction in the gcode
+    gcode[0] += f'{Common.comment_prefix} Gcode Compaction post-processing script version {__version__}\n'
+
+    compacted_size = sum(len(clump) for clump in gcode)
+    saved_bytes = original_size - compacted_size
+    saved_percentage = saved_bytes / original_size * 100 if original_size > 0 else 0
+    Logger.log('i', f'Gcode compaction reduced the gcode from {original_size} to {compacted_size} bytes (saving {saved_bytes} bytes, {saved_percentage:.1f}%)')
+
+    Logger.log('d', 'AutoTowersGenerator completing Gcode Compaction post-processing')
+
+    return gcode
+
+
+
+def _TrimTrailingZeros(match)->str:
+    ''' Removes unneeded trailing zeros (and decimal points) from a matched number '''
+
+    number = match.group(0).rstrip('0').rstrip('.')
+    if number in ('', '-', '+'):
+        number = '0'
+    return number
@@ -3,6 +3,8 @@
 from decimal import Decimal # Used to prevent floating-point inaccuracies from creeping into calculations
 import re
 
+from UM.Logger import Logger
+
 
 # A string to use when commenting added or modified lines
 comment_prefix = ';AutoTowersGenerator:'
@@ -18,86 +20,213 @@ trailing_inserted_layer_count = 2
 
 
 
+class ParameterDescriptor():
+    ''' Describes a post-processing parameter that is documented in the log and the gcode header '''
+
+    def __init__(self, name:str, label:str, units:str=''):
+        self.name = name
+        self.label = label
+        self.units = units
+
+
+
+class ParameterHeader():
+    ''' Documents the parameters passed to a post-processing script
+        The descriptors are compiled into a single format template when the script is loaded, 
+        so each execution renders all of the parameters with one format call and adds them 
+        to the gcode with one concatenation '''
+
+    def __init__(self, title:str, version:str, descriptors:list):
+        self._version = version
+
+        # The title may refer to parameter values (e.g. "Speed Tower ({tower_type})")
+        self._title = title
+
+        # Compile the descriptors into a template with one parameter per line
+        self._template = '\n'.join(f'{descriptor.label} = {{{descriptor.name}}}{descriptor.units}' for descriptor in descriptors)
+
+
+
+    def Document(self, gcode, parameter_values:dict)->None:
+        ''' Logs the parameter values and documents them at the top of the gcode '''
+
+        title = self._title.format_map(parameter_values)
+        parameter_lines = self._template.format_map(parameter_values).split('\n')
+
+        # Log the post-processing settings
+        Logger.log('d', f'Beginning {title} post-processing script version {self._version}')
+        for parameter_line in parameter_lines:
+            Logger.log('d', parameter_line)
+
+        # Document the settings in the g-code
+        header_lines = [f'{title} post-processing script version {self._version}'] + parameter_lines
+        gcode[0] += ''.join(f'{comment_prefix} {header_line}\n' for header_line in header_lines)
+
+
+
+# The regex used to build the layer index
+# It matches both layer start markers and the end of processable gcode markers in a single pass
+# The pattern starts with a literal so the search is fast, but matches must be checked to be at the start of a line
+_layer_index_regex = re.compile(r';(?:LAYER:(\d+)|TIME_ELAPSED:)')
+
+def BuildLayerIndex(gcode)->list:
+    ''' Locates the layer start markers (";LAYER:n") and the end of processable gcode markers (";TIME_ELAPSED:") in the gcode
+        Each clump is scanned once, without splitting it into lines
+        Returns a list of (clump index, offset, layer number, is end) tuples in gcode order
+        The layer number is None for end markers '''
+
+    layer_index = []
+    for clump_index, clump in enumerate(gcode):
+        layer_index.extend(_IndexClump(clump_index, clump))
+    return layer_index
+
+
+
+def _IndexClump(clump_index:int, clump:str, start_offset:int=0)->list:
+    ''' Returns the layer index entries for a single clump, starting from an offset in the clump '''
+
+    entries = []
+    for match in _layer_index_regex.finditer(clump, start_offset):
+        layer_number = match.group(1)
+        offset = match.start()
+        if layer_number is None:
+            # End markers may be indented, just like IsEndOfGcodeLine allows
+            if _IsAtLineStart(clump, offset, allow_indentation=True):
+                entries.append((clump_index, offset, None, True))
+        elif _IsAtLineStart(clump, offset):
+            entries.append((clump_index, offset, int(layer_number), False))
+    return entries
+
+
+
+def _IsAtLineStart(text:str, offset:int, allow_indentation:bool=False)->bool:
+    ''' Check if an offset in a block of text is at the start of a line (optionally ignoring indentation) '''
+
+    line_start = text.rfind('\n', 0, offset) + 1
+    return line_start == offset or (allow_indentation and text[line_start:offset].strip() == '')
+
+
+
+def _GroupLayerIndexByClump(layer_index:list)->dict:
+    ''' Returns the layer index entries for each clump, keyed by clump index '''
+
+    entries_by_clump = {}
+    for entry in layer_index:
+        entries_by_clump.setdefault(entry[0], []).append(entry)
+    return entries_by_clump
+
+
+
+class _SectionTracker():
+    ''' Tracks the print height, layer by layer, to determine where each tower section starts '''
+
+    def __init__(self, base_height:float, section_height:float, initial_layer_height:float, layer_height:float):
+        # Convert the heights to decimal numbers for better mathematical accuracy
+        self._base_height = Decimal(str(base_height))
+        self._section_height = Decimal(str(section_height))
+        self._initial_layer_height = Decimal(str(initial_layer_height))
+        self._layer_height = Decimal(str(layer_height))
+
+        # Keep track of the current print height
+        self._current_print_height = Decimal('0')
+
+        # Keep track of where the next section should start
+        self._next_section_start_height = self._base_height
+
+        # Keep track of the tower section number
+        self.tower_section_number = 0
+
+
+
+    @property
+    def in_base(self)->bool:
+        ''' Whether the current layer is part of the tower base '''
+        return self._current_print_height <= self._base_height
+
+
+
+    def AdvanceLayer(self)->bool:
+        ''' Moves up to the next layer and returns whether it starts a new tower section '''
+
+        # Increment the print height
+        if self._current_print_height == 0:
+            self._current_print_height += self._initial_layer_height
+        else:
+            self._current_print_height += self._layer_height
+
+        # Don't start sections until after the base has been printed
+        if self.in_base or self._current_print_height <= self._next_section_start_height:
+            return False
+
+        # Update the starting height of the next tower section
+        self._next_section_start_height += self._section_height
+
+        # Increment the tower section number
+        self.tower_section_number += 1
+
+        return True
+
+
+
+def _SectionStartComment(tower_section_number:int, layer_number:int)->str:
+    ''' Returns the comment documenting the start of a tower section '''
+
+    cura_layer_number = layer_number + 1
+    return f'{comment_prefix} Starting tower section number {tower_section_number} at Cura layer number {cura_layer_number} (which is labeled as layer {layer_number} in this gcode file)'
+
+
+
 def LayerEnumerate(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, enable_advanced_gcode_comments:bool):
     ''' Iterates over the lines in the gcode that is passed in 
         skipping Cura's comment layer and the user-specified start gcode 
         and ignoring post-printing layers '''
 
-    # Convert the heights to decimal numbers for better mathematical accuracy
-    base_height = Decimal(str(base_height))
-    section_height = Decimal(str(section_height))
-    initial_layer_height = Decimal(str(initial_layer_height))
-    layer_height = Decimal(str(layer_height))
+    # Locate the layer starts and end markers up front, so individual lines don't need to be tested
+    entries_by_clump = _GroupLayerIndexByClump(BuildLayerIndex(gcode))
+
+    # Keep track of the tower sections
+    section_tracker = _SectionTracker(base_height, section_height, initial_layer_height, layer_height)
 
     # Keep track of whether a line marks the start of a new layer
     start_of_new_section = False
     
-    # Keep track of the current print height
-    current_print_height = Decimal('0')
-
-    # Keep track of where the next section should start
-    next_section_start_height = base_height
-
-    # Keep track of the current gcode layer number
-    layer_number = 0
-
-    # The regex to use when searching for new layers
-    layer_regex = re.compile(r';LAYER:(\d+)\s*')
-
-    # Keep track of the tower section number
-    tower_section_number = 0
-
     # Iterate over each "clump" of gcode
     for clump_index, clump in enumerate(gcode):
 
         # Split the layer into lines
         lines = clump.split('\n')
 
+        # Find the lines containing the markers in this clump
+        # The line objects themselves are used to recognize the markers, since scripts may insert lines as they go
+        markers = []
+        for (_, offset, layer_number, is_end) in entries_by_clump.get(clump_index, []):
+            markers.append((lines[clump.count('\n', 0, offset)], layer_number, is_end))
+        markers.reverse()
+        (marker_line, layer_number, is_end) = markers.pop() if markers else (None, None, False)
+
         # Iterate over each line in the layer
         for line_index, line in enumerate(lines):
 
-            # Check if this line marks the end of the gcode that needs to be processed
-            if IsEndOfGcodeLine(line):
-                gcode[clump_index] = f'{comment_prefix} post-processing complete\n' + clump
-                break
+            if line is marker_line:
+                marker_is_end = is_end
+                marker_layer_number = layer_number
+                (marker_line, layer_number, is_end) = markers.pop() if markers else (None, None, False)
 
-            # Check if this line really does mark the start of a new layer in the gcode
-            match = re.match(layer_regex, line)
-            if match:
-                # Extract the layer number
-                layer_number = int(match.group(1))
+                # Check if this line marks the end of the gcode that needs to be processed
+                if marker_is_end:
+                    gcode[clump_index] = f'{comment_prefix} post-processing complete\n' + clump
+                    break
 
-                # Increment the print height
-                if current_print_height == 0:
-                    current_print_height += initial_layer_height
-                else:
-                    current_print_height += layer_height
+                # Determine if this is the start of a new tower section
+                start_of_new_section = section_tracker.AdvanceLayer()
 
                 # Don't process layers until after the base has been printed
-                if current_print_height <= base_height:
+                if section_tracker.in_base:
                     continue
 
-                # Determine if this is the start of a new tower section
-                if current_print_height > next_section_start_height:
-                    
-                    # Indicate this is the start of a new tower section
-                    start_of_new_section = True
-
-                    # Update the starting height of the next tower section
-                    next_section_start_height += section_height
-
-                    # Increment the tower section number
-                    tower_section_number += 1
-                    
-                    # Comment the start of the tower section in the gcode
-                    cura_layer_number = layer_number + 1
-                    if enable_advanced_gcode_comments :
-                        lines[line_index] = line + f'\n{comment_prefix} Starting tower section number {tower_section_number} at Cura layer number {cura_layer_number} (which is labeled as layer {layer_number} in this gcode file)'
-                    
-                # If this is not the start of a new tower section
-                else:
-                    # Indicate this is NOT the start of a new tower section
-                    start_of_new_section = False
+                # Comment the start of the tower section in the gcode
+                if start_of_new_section and enable_advanced_gcode_comments:
+                    lines[line_index] = line + '\n' + _SectionStartComment(section_tracker.tower_section_number, marker_layer_number)
 
             # Yield the values for this line
             yield line_index, line, lines, start_of_new_section
@@ -110,6 +239,343 @@ def LayerEnumerate(gcode, base_height:float, section_height:float, initial_layer
 
 
 
+# The number of lines split from the start of a clump by SectionEnumerate
+# Scripts insert their section commands within these first few lines
+section_head_line_count = 4
+
+def SectionEnumerate(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, enable_advanced_gcode_comments:bool):
+    ''' Iterates over the start of each tower section in the gcode
+        This is for scripts that only insert commands at the start of each section
+        Sections are located using the layer index, so only the first few lines of the 
+        clumps that start a new section are ever split into lines
+        The yielded list of lines can be modified (such as by inserting commands) just like 
+        the lines yielded by LayerEnumerate '''
+
+    # Keep track of the tower sections
+    section_tracker = _SectionTracker(base_height, section_height, initial_layer_height, layer_height)
+
+    # Iterate over the clumps containing layer starts or end markers
+    for clump_index, entries in _GroupLayerIndexByClump(BuildLayerIndex(gcode)).items():
+        entry_position = 0
+        while entry_position < len(entries):
+            (_, offset, layer_number, is_end) = entries[entry_position]
+            entry_position += 1
+
+            # Ignore the rest of the clump after the end of the gcode that needs to be processed
+            if is_end:
+                break
+
+            # Ignore layers that don't start a new tower section
+            if not section_tracker.AdvanceLayer():
+                continue
+
+            # Split only the start of the clump into lines
+            clump = gcode[clump_index]
+            layer_line_index = clump.count('\n', 0, offset)
+            lines = clump.split('\n', max(section_head_line_count, layer_line_index + 1))
+
+            # Comment the start of the tower section in the gcode
+            if enable_advanced_gcode_comments:
+                lines[layer_line_index] += '\n' + _SectionStartComment(section_tracker.tower_section_number, layer_number)
+
+            # Yield the lines at the start of the section
+            yield lines
+
+            # Reassemble the clump
+            clump = '\n'.join(lines)
+            gcode[clump_index] = clump
+
+            # The clump has been modified, so reindex the remainder of it (after the layer line)
+            entries = _IndexClump(clump_index, clump, len('\n'.join(lines[:layer_line_index + 1])))
+            entry_position = 0
+
+
+
+def SegmentEnumerate(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, enable_advanced_gcode_comments:bool):
+    ''' Iterates over the gcode a layer at a time, rather than a line at a time
+        This is for scripts that modify so many lines that visiting them one at a time is too slow
+        Each clump is divided into segments that start at its layer markers (the first segment holds anything before the first marker)
+        Yields (segments, segment_index, start_of_new_section) for the segments that need to be processed
+        The segment can be replaced in the list with a modified copy
+        At the start of a new tower section, lines can be inserted after the first line of the segment '''
+
+    # Locate the layer starts and end markers up front
+    entries_by_clump = _GroupLayerIndexByClump(BuildLayerIndex(gcode))
+
+    # Keep track of the tower sections
+    section_tracker = _SectionTracker(base_height, section_height, initial_layer_height, layer_height)
+
+    # Iterate over each "clump" of gcode
+    for clump_index, clump in enumerate(gcode):
+        entries = entries_by_clump.get(clump_index, [])
+
+        # Divide the clump at the markers
+        boundaries = [0] + [offset for (_, offset, _, _) in entries] + [len(clump)]
+        segments = [clump[boundaries[position]:boundaries[position + 1]] for position in range(len(boundaries) - 1)]
+
+        for segment_index in range(len(segments)):
+            start_of_new_section = False
+            if segment_index > 0:
+                (_, _, layer_number, is_end) = entries[segment_index - 1]
+
+                # Ignore the rest of the clump after the end of the gcode that needs to be processed
+                if is_end:
+                    break
+
+                # Determine if this is the start of a new tower section
+                start_of_new_section = section_tracker.AdvanceLayer()
+
+            # There is nothing before the marker in most clumps
+            if segments[segment_index] == '':
+                continue
+
+            # Yield the values for this segment
+            yield segments, segment_index, start_of_new_section
+
+            # Comment the start of the tower section in the gcode
+            if start_of_new_section and enable_advanced_gcode_comments:
+                (marker_line, newline, remainder) = segments[segment_index].partition('\n')
+                segments[segment_index] = marker_line + '\n' + _SectionStartComment(section_tracker.tower_section_number, layer_number) + newline + remainder
+
+        # Reassemble the clump
+        gcode[clump_index] = ''.join(segments)
+
+
+
+def CommandEnumerate(gcode, command_prefixes:tuple, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, enable_advanced_gcode_comments:bool):
+    ''' Iterates over the lines in the gcode that start with one of the given prefixes (such as "M106 S")
+        along with the lines that start each new tower section
+        This is for scripts that only modify a few kinds of commands
+        The matching lines are located by searching each clump, so the lines that don't match are never visited
+        The yielded values are the same as those yielded by LayerEnumerate '''
+
+    # Keep track of the tower sections
+    section_tracker = _SectionTracker(base_height, section_height, initial_layer_height, layer_height)
+
+    # Iterate over each "clump" of gcode
+    for clump_index, clump in enumerate(gcode):
+
+        # Locate the layer markers and matching lines in this clump
+        targets = _LocateCommandLines(clump, command_prefixes)
+        if not targets:
+            continue
+
+        # Split the layer into lines
+        lines = clump.split('\n')
+
+        target_position = 0
+        while target_position < len(targets):
+            (line_index, layer_number, is_end) = targets[target_position]
+            target_position += 1
+            line = lines[line_index]
+
+            start_of_new_section = False
+            if is_end:
+                # This line marks the end of the gcode that needs to be processed
+                break
+
+            elif not layer_number is None:
+                # Determine if this is the start of a new tower section
+                # Only the lines starting new tower sections are yielded
+                start_of_new_section = section_tracker.AdvanceLayer()
+                if section_tracker.in_base or not start_of_new_section:
+                    continue
+
+                # Comment the start of the tower section in the gcode
+                if enable_advanced_gcode_comments:
+                    lines[line_index] = line + '\n' + _SectionStartComment(section_tracker.tower_section_number, layer_number)
+
+            # Yield the values for this line
+            line_count = len(lines)
+            yield line_index, line, lines, start_of_new_section
+
+            # If lines were inserted, locate the matching lines again in the remainder of the clump (after this line)
+            if len(lines) != line_count:
+                resume_offset = len('\n'.join(lines[:line_index + 1]))
+                clump = '\n'.join(lines)
+                lines = clump.split('\n')
+                targets = _LocateCommandLines(clump, command_prefixes, resume_offset)
+                target_position = 0
+
+        # Reassemble the clump
+        gcode[clump_index] = '\n'.join(lines)
+
+
+
+def _LocateCommandLines(clump:str, command_prefixes:tuple, start_offset:int=0)->list:
+    ''' Returns the lines in a clump that are layer markers or start with one of the given prefixes
+        Returns a list of (line index, layer number, is end) tuples in gcode order 
+        The layer number is None for end markers and matching commands '''
+
+    found = [(offset, layer_number, is_end) for (_, offset, layer_number, is_end) in _IndexClump(0, clump, start_offset)]
+    # Searching for each prefix separately is much faster than searching for a regex that matches any of them
+    for prefix in command_prefixes:
+        offset = clump.find(prefix, start_offset)
+        while offset >= 0:
+            # Commands may be indented, just like the Is...Line functions allow
+            if _IsAtLineStart(clump, offset, allow_indentation=True):
+                found.append((offset, None, False))
+            offset = clump.find(prefix, offset + len(prefix))
+    found.sort(key=lambda entry: entry[0])
+
+    # Convert the offsets into line indexes
+    targets = []
+    line_index = 0
+    line_offset = 0
+    for (offset, layer_number, is_end) in found:
+        line_index += clump.count('\n', line_offset, offset)
+        line_offset = offset
+        targets.append((line_index, layer_number, is_end))
+    return targets
+
+
+
+# The regex used to match a numeric parameter value in a gcode command
+_parameter_value_regex = re.compile(r'[-+]?\d*\.?\d+')
+
+def FindParameterValueSpan(line:str, parameter:str):
+    ''' Returns the start and end offsets of the value of a parameter (such as "E") in a gcode line
+        Only the command portion of the line is searched, so values in comments are ignored
+        Returns None if the parameter is not present '''
+
+    command_end = line.find(';')
+    if command_end < 0:
+        command_end = len(line)
+
+    # Search backwards, since the parameters most often modified (E and F) tend to be at the end of the command
+    parameter_index = line.rfind(parameter, 0, command_end)
+    while parameter_index >= 0:
+        # Make sure this is a parameter and not part of a longer word
+        if parameter_index == 0 or not line[parameter_index - 1].isalpha():
+            match = _parameter_value_regex.match(line, parameter_index + 1, command_end)
+            if match:
+                return match.span()
+        parameter_index = line.rfind(parameter, 0, parameter_index)
+
+    return None
+
+
+
+class ExtruderState():
+    ''' Follows the extruder through the gcode, one line at a time, so each line that moves the filament can be classified
+        Absolute and relative extrusion, extruder position resets, and firmware retraction (G10/G11) are all tracked
+        As with IsRetractLine, only lines that move the filament without moving the nozzle (so not z-hops) are retractions '''
+
+    # The ways a line can move the filament
+    NO_EXTRUSION = 0 # The line doesn't move the filament (or the movement can't be determined yet)
+    EXTRUSION = 1 # Any other movement of the filament, including retractions combined with a nozzle move
+    RETRACTION = 2
+    UNRETRACTION = 3
+    FIRMWARE_RETRACTION = 4
+    FIRMWARE_UNRETRACTION = 5
+
+
+
+    def __init__(self, relative_extrusion:bool=False):
+        self.relative_extrusion = relative_extrusion
+
+        # The absolute extruder position, which is unknown until the gcode sets or reveals it
+        self.position = None
+
+        # Whether the filament is currently retracted
+        self.retracted = False
+
+        # The span of the E value in the last line that moved the filament and the distance it was moved
+        self.value_span = None
+        self.distance = 0.0
+
+
+
+    def Classify(self, line:str)->int:
+        ''' Updates the state from a gcode line and returns how the line moves the filament
+            For lines that move the filament, value_span and distance describe the movement '''
+
+        # Movement commands are by far the most common lines, so they are checked first
+        if line.lstrip().startswith(('G1 ', 'G0 ')):
+            value_span = FindParameterValueSpan(line, 'E')
+            if value_span is None:
+                return self.NO_EXTRUSION
+            value = float(line[value_span[0]:value_span[1]])
+
+            # Determine how far the filament is being moved
+            if self.relative_extrusion:
+                distance = value
+            elif self.position is None:
+                # The first absolute position only reveals where the extruder is
+                self.position = value
+                return self.NO_EXTRUSION
+            else:
+                distance = value - self.position
+                self.position = value
+
+            self.value_span = value_span
+            self.distance = distance
+
+            # Retractions and the extrusions that reverse them don't move the nozzle
+            command = line.split(';', 1)[0]
+            nozzle_moved = 'X' in command or 'Y' in command or 'Z' in command
+
+            if distance < 0:
+                self.retracted = True
+                return self.EXTRUSION if nozzle_moved else self.RETRACTION
+
+            if distance > 0:
+                # Filament pushed back out without moving the nozzle reverses the last retraction
+                was_retracted = self.retracted
+                self.retracted = False
+                if was_retracted and not nozzle_moved:
+                    return self.UNRETRACTION
+                return self.EXTRUSION
+
+            return self.NO_EXTRUSION
+
+        # Ignore comments and empty lines
+        if line == '' or line[0] == ';':
+            return self.NO_EXTRUSION
+
+        command = line.split(';', 1)[0].split()
+        if not command:
+            return self.NO_EXTRUSION
+
+        # Handle firmware retraction
+        # G10 is also used to set tool offsets, which always include parameters other than S
+        if command[0] == 'G10':
+            if all(parameter.startswith('S') for parameter in command[1:]):
+                self.retracted = True
+                return self.FIRMWARE_RETRACTION
+        elif command[0] == 'G11':
+            self.retracted = False
+            return self.FIRMWARE_UNRETRACTION
+
+        # Handle resetting the extruder position
+        elif command[0] == 'G92':
+            value_span = FindParameterValueSpan(line, 'E')
+            if not value_span is None:
+                self.position = float(line[value_span[0]:value_span[1]])
+
+            # Without any parameters, all axes are reset to 0
+            elif len(command) == 1:
+                self.position = 0.0
+
+        # Handle switching to relative extrusion
+        elif command[0] in ('G91', 'M83'):
+            self.relative_extrusion = True
+
+        # Handle switching to absolute extrusion
+        # If the extruder was in relative mode, its absolute position will need to be redetermined
+        elif command[0] in ('G90', 'M82'):
+            if self.relative_extrusion:
+                self.position = None
+            self.relative_extrusion = False
+
+        # A tool change switches to an extruder with its own position
+        elif command[0].startswith('T'):
+            self.position = None
+
+        return self.NO_EXTRUSION
+
+
+
 def CalculateCuraLayerNumber(layer_index):
     ''' Converts a gcode layer index to the layer number that is shown in the Cura preview '''
     return layer_index - 1
@@ -30,7 +30,11 @@
 #   Unfortunately, this is still not a completely accurate demonstration of the different print speeds
 # Version 2.2 - 28 Aug 2023:
 #   Add the option enable_advanced_gcode_comments to reduce the Gcode size
-__version__ = '2.2'
+# Version 2.3 - 19 Oct 2026:
+#   Parameters are now documented using the shared ParameterHeader in PostProcessingCommon.py
+# Version 2.4 - 19 Oct 2026:
+#   Only the start of each tower section is visited rather than every line
+__version__ = '2.4'
 
 from UM.Logger import Logger
 
@@ -40,35 +44,29 @@ from . import PostProcessingCommon as Common
 
 
 
+# The parameters documented in the log and at the top of the gcode
+parameter_header = Common.ParameterHeader('Speed Tower (print speed)', __version__, [
+    Common.ParameterDescriptor('base_height', 'Base height', ' mm'),
+    Common.ParameterDescriptor('section_height', 'Section height', ' mm'),
+    Common.ParameterDescriptor('initial_layer_height', 'Initial printed layer height', ' mm'),
+    Common.ParameterDescriptor('layer_height', 'Printed layer height', ' mm'),
+    Common.ParameterDescriptor('start_speed', 'Starting speed', ' mm/s'),
+    Common.ParameterDescriptor('speed_change', 'Speed change', ' mm/s'),
+    Common.ParameterDescriptor('reference_speed', 'Reference speed', ' mm/s'),
+    Common.ParameterDescriptor('enable_lcd_messages', 'Enable LCD messages'),
+    Common.ParameterDescriptor('enable_advanced_gcode_comments', 'Advanced Gcode comments'),
+])
+
+
+
 def execute(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, start_speed:float, speed_change:float, reference_speed:float, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool):
     ''' Post-process gcode sliced by Cura
         Note that reference_speed is the print speed selection when the gcode was generated 
             This value is used to determine how print speed settings in the
             gcode are modified for each level '''
     
-    # Log the post-processing settings
-    Logger.log('d', f'Beginning Speed Tower (print speed) post-processing script version {__version__}')
-    Logger.log('d', f'Base height = {base_height} mm')
-    Logger.log('d', f'Section height = {section_height} mm')
-    Logger.log('d', f'Initial printed layer height = {initial_layer_height}')
-    Logger.log('d', f'Printed layer height = {layer_height} mm')
-    Logger.log('d', f'Starting speed = {start_speed} mm/s')
-    Logger.log('d', f'Speed change = {speed_change} mm/s')
-    Logger.log('d', f'Reference speed = {reference_speed} mm/s')
-    Logger.log('d', f'Enable LCD messages = {enable_lcd_messages}')
-    Logger.log('d', f'Advanced Gcode Comments = {enable_advanced_gcode_comments}')
-
-    # Document the settings in the g-code
-    gcode[0] += f'{Common.comment_prefix} Speed Tower (print speed) post-processing script version {__version__}\n'
-    gcode[0] += f'{Common.comment_prefix} Base height = {base_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Section height = {section_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Initial printed layer height = {initial_layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Printed layer height = {layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Starting speed = {start_speed} mm/s\n'
-    gcode[0] += f'{Common.comment_prefix} Speed change = {speed_change} mm/s\n'
-    gcode[0] += f'{Common.comment_prefix} Reference speed = {reference_speed} mm/s\n'
-    gcode[0] += f'{Common.comment_prefix} Enable LCD messages = {enable_lcd_messages}\n'
-    gcode[0] += f'{Common.comment_prefix} Advanced Gcode comments = {enable_advanced_gcode_comments}\n'
+    # Document the post-processing settings
+    parameter_header.Document(gcode, locals())
 
     # Start at the requested print speed
     current_speed = start_speed - speed_change # The current speed will be corrected when the first section is encountered
@@ -76,49 +74,46 @@ def execute(gcode, base_height:float, section_height:float, initial_layer_height
     # Keep track of when the first section is encountered
     first_section = True
 
-    # Iterate over each line in the g-code
-    for line_index, line, lines, start_of_new_section in Common.LayerEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
+    # Iterate over the start of each tower section in the g-code
+    for lines in Common.SectionEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
+
+        # Increment the speed for the new tower section
+        current_speed += speed_change
+
+        # Calculate the new feedrate percentage
+        feedrate_percentage = current_speed / reference_speed * 100
 
-        # Handle each new section
-        if start_of_new_section:
+        if enable_advanced_gcode_comments :
+            # Document the new speed in the gcode
+            lines.insert(2, f'{Common.comment_prefix} Print speed for this tower section is {current_speed:.1f} mm/s')
 
-            # Increment the speed for the new tower section
-            current_speed += speed_change
+            # Command the new feedrate percentage in the gcode
+            lines.insert(3, f'M220 S{feedrate_percentage:.2f} {Common.comment_prefix} Setting the feedrate percentage to {feedrate_percentage:.2f}% to mimic a print speed setting change from {reference_speed}mm/s to {current_speed} mm/s')
 
-            # Calculate the new feedrate percentage
-            feedrate_percentage = current_speed / reference_speed * 100
+            # Display the new print speed on the printer's LCD
+            if enable_lcd_messages:
+                lines.insert(4, f'M117 SPD {current_speed:.1f} mm/s')
+                lines.insert(4, f'{Common.comment_prefix} Displaying "SPD {current_speed:.1f}" on the LCD')
+        else:
 
+            # Command the new feedrate percentage in the gcode
+            lines.insert(2, f'M220 S{feedrate_percentage:.2f}')
+
+            # Display the new print speed on the printer's LCD
+            if enable_lcd_messages:
+                lines.insert(3, f'M117 SPD {current_speed:.1f} mm/s')
+
+                
+        # Handle the first tower section
+        if first_section:
+            first_section = False
+
+            # Backup the feedrate percentage
             if enable_advanced_gcode_comments :
-                # Document the new speed in the gcode
-                lines.insert(2, f'{Common.comment_prefix} Print speed for this tower section is {current_speed:.1f} mm/s')
-
-                # Command the new feedrate percentage in the gcode
-                lines.insert(3, f'M220 S{feedrate_percentage:.2f} {Common.comment_prefix} Setting the feedrate percentage to {feedrate_percentage:.2f}% to mimic a print speed setting change from {reference_speed}mm/s to {current_speed} mm/s')
-
-                # Display the new print speed on the printer's LCD
-                if enable_lcd_messages:
-                    lines.insert(4, f'M117 SPD {current_speed:.1f} mm/s')
-                    lines.insert(4, f'{Common.comment_prefix} Displaying "SPD {current_speed:.1f}" on the LCD')
-            else:
-
-                # Command the new feedrate percentage in the gcode
-                lines.insert(2, f'M220 S{feedrate_percentage:.2f}')
-
-                # Display the new print speed on the printer's LCD
-                if enable_lcd_messages:
-                    lines.insert(3, f'M117 SPD {current_speed:.1f} mm/s')
-
-                    
-            # Handle the first tower section
-            if first_section:
-                first_section = False
-
-                # Backup the feedrate percentage
-                if enable_advanced_gcode_comments :
-                    lines.insert(1, f'M220 B {Common.comment_prefix} Backing up the current feedrate percentage')
-                else :
-                    lines.insert(1, f'M220 B')
-    
+                lines.insert(1, f'M220 B {Common.comment_prefix} Backing up the current feedrate percentage')
+            else :
+                lines.insert(1, f'M220 B')
+
     # Restore the backed-up feedrate percentage
     last_layer_index = len(gcode) - Common.trailing_inserted_layer_count - 1
     if enable_advanced_gcode_comments :
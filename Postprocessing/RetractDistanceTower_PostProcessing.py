@@ -24,9 +24,19 @@
 #   This script has been simplified to focus solely on retraction distance
 # Version 4.1 - 28 Aug 2023:
 #   Add the option enable_advanced_gcode_comments to reduce the Gcode size
-__version__ = '4.1'
-
-import re 
+# Version 4.2 - 19 Oct 2026:
+#   Parameters are now documented using the shared ParameterHeader in PostProcessingCommon.py
+# Version 4.3 - 19 Oct 2026:
+#   Retractions are identified using the shared ExtruderState in PostProcessingCommon.py
+#   rather than by matching the form of each line
+#   Firmware retraction (G10/G11) and extruder position resets to values other than 0 are now recognized
+# Version 4.4 - 19 Oct 2026:
+#   Added the option firmware_retraction, which configures the retraction distance with M207 at the start of
+#   each tower section rather than modifying each retraction
+# Version 4.5 - 19 Oct 2026:
+#   As before version 4.3, retractions combined with a nozzle move (such as a z-hop) are left unchanged
+#   and indented retraction lines are recognized
+__version__ = '4.5'
 
 from UM.Logger import Logger
 from UM.Application import Application
@@ -35,37 +45,45 @@ from . import PostProcessingCommon as Common
 
 
 
-def execute(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, relative_extrusion:bool, start_retract_distance:float, retract_distance_change:float, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool):
-
-    # Log the post-processing settings
-    Logger.log('d', f'Beginning Retract Tower (distance) post-processing script version {__version__}')
-    Logger.log('d', f'Base height = {base_height} mm')
-    Logger.log('d', f'Section height = {section_height} mm')
-    Logger.log('d', f'Initial printed layer height = {initial_layer_height}')
-    Logger.log('d', f'Printed layer height = {layer_height} mm')
-    Logger.log('d', f'Relative extrusion = {relative_extrusion}')
-    Logger.log('d', f'Starting retraction distance = {start_retract_distance}')
-    Logger.log('d', f'Retraction distance change = {retract_distance_change}')
-    Logger.log('d', f'Enable LCD messages = {enable_lcd_messages}')
-    Logger.log('d', f'Advanced Gcode Comments = {enable_advanced_gcode_comments}')
-
-    # Document the settings in the g-code
-    gcode[0] += f'{Common.comment_prefix} Retract Tower (distance) post-processing script version {__version__}\n'
-    gcode[0] += f'{Common.comment_prefix} Base height = {base_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Section height = {section_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Initial printed layer height = {initial_layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Printed layer height = {layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Relative extrusion = {relative_extrusion}\n'
-    gcode[0] += f'{Common.comment_prefix} Starting retraction distance = {start_retract_distance}\n'
-    gcode[0] += f'{Common.comment_prefix} Retraction distance change = {retract_distance_change}\n'
-    gcode[0] += f'{Common.comment_prefix} Enable LCD messages = {enable_lcd_messages}\n'
-    gcode[0] += f'{Common.comment_prefix} Advanced Gcode comments = {enable_advanced_gcode_comments}\n'
+# The parameters documented in the log and at the top of the gcode
+parameter_header = Common.ParameterHeader('Retract Tower (distance)', __version__, [
+    Common.ParameterDescriptor('base_height', 'Base height', ' mm'),
+    Common.ParameterDescriptor('section_height', 'Section height', ' mm'),
+    Common.ParameterDescriptor('initial_layer_height', 'Initial printed layer height', ' mm'),
+    Common.ParameterDescriptor('layer_height', 'Printed layer height', ' mm'),
+    Common.ParameterDescriptor('relative_extrusion', 'Relative extrusion'),
+    Common.ParameterDescriptor('firmware_retraction', 'Firmware retraction'),
+    Common.ParameterDescriptor('start_retract_distance', 'Starting retraction distance'),
+    Common.ParameterDescriptor('retract_distance_change', 'Retraction distance change'),
+    Common.ParameterDescriptor('enable_lcd_messages', 'Enable LCD messages'),
+    Common.ParameterDescriptor('enable_advanced_gcode_comments', 'Advanced Gcode comments'),
+])
+
+
+
+def execute(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, relative_extrusion:bool, firmware_retraction:bool, start_retract_distance:float, retract_distance_change:float, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool):
+
+    # Document the post-processing settings
+    parameter_header.Document(gcode, locals())
 
     # Start at the requested starting retraction value
     current_retract_distance = start_retract_distance - retract_distance_change # The current retract value will be corrected when the first section is encountered
     
-    # Keep track of the absolute retraction position throughout the script
-    reference_extrusion_position = None
+    # With firmware retraction, the printer performs the retractions (G10/G11), so the retraction distance only needs
+    # to be configured at the start of each tower section
+    if firmware_retraction:
+        for lines in Common.SectionEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
+
+            # Update the retraction value for the new tower section
+            current_retract_distance += retract_distance_change
+            _StartSection(lines, current_retract_distance, firmware_retraction, enable_lcd_messages, enable_advanced_gcode_comments)
+
+        Logger.log('d', f'AutoTowersGenerator completing RetractTower (distance) post-processing')
+
+        return gcode
+
+    # Follow the extruder through the gcode to identify retractions
+    extruder_state = Common.ExtruderState(relative_extrusion)
 
     # Iterate over each line in the g-code
     for line_index, line, lines, start_of_new_section in Common.LayerEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
@@ -75,103 +93,68 @@ def execute(gcode, base_height:float, section_height:float, initial_layer_height
 
             # Update the retraction value for the new tower section
             current_retract_distance += retract_distance_change
-
-            # Document the new retraction value in the gcode
-            lines.insert(2, f'{Common.comment_prefix} Using a retraction distance of {current_retract_distance} mm for this tower section')
-
-            # Display the new retraction value on the printer's LCD
-            if enable_lcd_messages:
-                lines.insert(3, f'M117 DST {current_retract_distance:.1f} mm')
+            _StartSection(lines, current_retract_distance, firmware_retraction, enable_lcd_messages, enable_advanced_gcode_comments)
+
+        # Determine how this line moves the filament
+        filament_movement = extruder_state.Classify(line)
+
+        # Retraction commands need to be processed to achieve the requested retraction distance
+        if filament_movement == Common.ExtruderState.RETRACTION:
+            (value_start, value_end) = extruder_state.value_span
+
+            # Relative retraction is fairly simple since the filament position doesn't need to be tracked
+            if extruder_state.relative_extrusion:
+                updated_extrusion_value = -current_retract_distance
+                comment = f'Retracting {-current_retract_distance:.5f} mm of filament using relative positioning'
+
+            # Absolute retraction needs to take into account the filament position before the retraction
+            else:
+                updated_extrusion_value = extruder_state.position - extruder_state.distance - current_retract_distance
+                comment = f'Retracting {current_retract_distance:.5f} mm of filament using absolute positioning'
+
+            # Replace the original line with the post-processed line
+            new_line = f'{line[:value_start]}{updated_extrusion_value:.5f}{line[value_end:]}'
+            if enable_advanced_gcode_comments :
+                new_line += f' {Common.comment_prefix} {comment}'
+            lines[line_index] = new_line
+
+        # Filament extrusion reversing the previous retraction also needs to be processed
+        elif filament_movement == Common.ExtruderState.UNRETRACTION:
+
+            # With relative positioning, the filament is extruded by the new retraction distance
+            if extruder_state.relative_extrusion:
+                (value_start, value_end) = extruder_state.value_span
+                new_line = f'{line[:value_start]}{current_retract_distance:.5f}{line[value_end:]}'
                 if enable_advanced_gcode_comments :
-                    lines.insert(3, f'{Common.comment_prefix} Displaying "DST {current_retract_distance:.1f}" on the LCD')
-
-        # Record if relative extrusion is now being used
-        if Common.IsRelativeInstructionLine(line):
-            relative_extrusion = True
-
-        # Record if absolute extrusion is now being used
-        elif Common.IsAbsoluteInstructionLine(line):
-            relative_extrusion = False
-
-            # The absolute extrusion position data is irrelevant in this mode
-            reference_extrusion_position = None
+                    new_line += f' {Common.comment_prefix} Extruding {current_retract_distance:.5f} mm of filament using relative positioning to reverse the previous retraction'
+                lines[line_index] = new_line
 
-        # Handle resetting the extruder position
-        elif Common.IsResetExtruderLine(line):
+            # With absolute positioning, the extrusion just returns the filament to the previous position, so the original line will work unchanged
+            # Just comment the line for informational purposes
+            elif enable_advanced_gcode_comments :
+                lines[line_index] = line + f' {Common.comment_prefix} Extruding {current_retract_distance:.5f} mm of filament using absolute positioning to reverse the previous retraction'
 
-            # Reset the recorded extrusion position to 0
-            reference_extrusion_position = 0
-
-        # Handle extrusion and retraction lines
-        elif Common.IsExtrusionLine(line) or Common.IsRetractLine(line):
-
-            # Determine the current extrusion position
-            position_search_results = re.search(r'E([-+]?\d*\.?\d+)', line.split(';')[0])
-            if position_search_results:
-                original_extrusion_position_string = position_search_results.group(1)
-                original_extrusion_position = float(original_extrusion_position_string)
-
-                # Record the first reference position
-                if reference_extrusion_position is None and not relative_extrusion:
-                    reference_extrusion_position = original_extrusion_position
-
-                # For extrusion commands, the absolute extrusion position just needs to be updated
-                elif Common.IsExtrusionLine(line) and not relative_extrusion:
-                    reference_extrusion_position = original_extrusion_position
-
-                # Retraction commands need to be processed to achieve the requested retraction distance
-                elif Common.IsRetractLine(line):
-
-                    # Relative retraction is fairly simple since the filament position doesn't need to be tracked
-                    if relative_extrusion:
-
-                        # The original retraction distance is just the "extrusion position" in this case
-                        original_retraction_distance = original_extrusion_position
-
-                        # Update actual retraction lines (filament being pulled in)
-                        if original_retraction_distance < 0:
-
-                            # Update the line with the new retraction distance
-                            new_line = line.replace(f'E{original_extrusion_position_string}', f'E{-current_retract_distance:.5f}')
-                            if enable_advanced_gcode_comments :
-                                new_line += f' {Common.comment_prefix} Retracting {-current_retract_distance:.5f} mm of filament using relative positioning'
-
-                        # Update filament extrusion (reversing the previous retraction)
-                        else:
-
-                            # Update the line with the new retraction distance
-                            new_line = line.replace(f'E{original_extrusion_position_string}', f'E{current_retract_distance:.5f}')
-                            if enable_advanced_gcode_comments :
-                                new_line += f' {Common.comment_prefix} Extruding {current_retract_distance:.5f} mm of filament using relative positioning to reverse the previous retraction'
-
-                    # Absolute retraction needs to take into account the current absolute filament position
-                    else:
+    Logger.log('d', f'AutoTowersGenerator completing RetractTower (distance) post-processing')
 
-                        # Update actual retraction lines (filament being pulled in)
-                        if original_extrusion_position < reference_extrusion_position:
+    return gcode
 
-                            # Determine the new position given the desired retraction distance for this section
-                            updated_extrusion_position = reference_extrusion_position - current_retract_distance
-                            new_line = line.replace(f'E{original_extrusion_position_string}', f'E{updated_extrusion_position:.5f}')
-                            if enable_advanced_gcode_comments :
-                                new_line += f' {Common.comment_prefix} Retracting {current_retract_distance:.5f} mm of filament using absolute positioning'
 
-                        # Update filament extrusion (reversing the previous retraction)
-                        # Since the extrusion is just returning the filament to the previous position, the original line will work unchanged
-                        else:
 
-                            # Just comment the line for informational purposes
-                            if enable_advanced_gcode_comments :
-                                new_line = line + f' {Common.comment_prefix} Extruding {current_retract_distance:.5f} mm of filament using absolute positioning to reverse the previous retraction'
-                            else :
-                                new_line = line
-                                
-                    # Replace the original line with the post-processed line
-                    lines[line_index] = new_line
+def _StartSection(lines, current_retract_distance:float, firmware_retraction:bool, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool)->None:
+    ''' Documents and configures the retraction distance at the start of a tower section '''
 
-                    # Leave the original line commented out in the gcode for reference
-                    #lines.insert(line_index, f';{line} {Common.comment_prefix} This is the original line before it was modified')
+    # Document the new retraction value in the gcode
+    lines.insert(2, f'{Common.comment_prefix} Using a retraction distance of {current_retract_distance} mm for this tower section')
 
-    Logger.log('d', f'AutoTowersGenerator completing RetractTower (distance) post-processing')
+    # Display the new retraction value on the printer's LCD
+    if enable_lcd_messages:
+        lines.insert(3, f'M117 DST {current_retract_distance:.1f} mm')
+        if enable_advanced_gcode_comments :
+            lines.insert(3, f'{Common.comment_prefix} Displaying "DST {current_retract_distance:.1f}" on the LCD')
 
-    return gcode
+    # Configure the printer's firmware retraction distance
+    if firmware_retraction:
+        if enable_advanced_gcode_comments :
+            lines.insert(3, f'M207 S{current_retract_distance:.5f} {Common.comment_prefix} Setting the firmware retraction distance')
+        else :
+            lines.insert(3, f'M207 S{current_retract_distance:.5f}')
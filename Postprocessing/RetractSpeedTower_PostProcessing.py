@@ -24,9 +24,18 @@
 #   This script has been simplified to focus solely on retraction speed
 # Version 4.1 - 28 Aug 2023:
 #   Add the option enable_advanced_gcode_comments to reduce the Gcode size
-__version__ = '4.1'
-
-import re 
+# Version 4.2 - 19 Oct 2026:
+#   Parameters are now documented using the shared ParameterHeader in PostProcessingCommon.py
+# Version 4.3 - 19 Oct 2026:
+#   Retractions are identified using the shared ExtruderState in PostProcessingCommon.py
+#   rather than by matching the form of each line
+# Version 4.4 - 19 Oct 2026:
+#   Added the option firmware_retraction, which configures the retraction speeds with M207 and M208 at the start of
+#   each tower section rather than modifying each retraction
+# Version 4.5 - 19 Oct 2026:
+#   As before version 4.3, retractions combined with a nozzle move (such as a z-hop) are left unchanged
+#   and indented retraction lines are recognized
+__version__ = '4.5'
 
 from UM.Logger import Logger
 from UM.Application import Application
@@ -35,33 +44,46 @@ from . import PostProcessingCommon as Common
 
 
 
-def execute(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, start_retract_speed:float, retract_speed_change:float, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool):
+# The parameters documented in the log and at the top of the gcode
+parameter_header = Common.ParameterHeader('Retract Tower (speed)', __version__, [
+    Common.ParameterDescriptor('base_height', 'Base height', ' mm'),
+    Common.ParameterDescriptor('section_height', 'Section height', ' mm'),
+    Common.ParameterDescriptor('initial_layer_height', 'Initial printed layer height', ' mm'),
+    Common.ParameterDescriptor('layer_height', 'Printed layer height', ' mm'),
+    Common.ParameterDescriptor('relative_extrusion', 'Relative extrusion'),
+    Common.ParameterDescriptor('firmware_retraction', 'Firmware retraction'),
+    Common.ParameterDescriptor('start_retract_speed', 'Starting retraction speed'),
+    Common.ParameterDescriptor('retract_speed_change', 'Retraction speed change'),
+    Common.ParameterDescriptor('enable_lcd_messages', 'Enable LCD messages'),
+    Common.ParameterDescriptor('enable_advanced_gcode_comments', 'Advanced Gcode comments'),
+])
+
+
+
+def execute(gcode, base_height:float, section_height:float, initial_layer_height:float, layer_height:float, relative_extrusion:bool, firmware_retraction:bool, start_retract_speed:float, retract_speed_change:float, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool):
     
-    # Log the post-processing settings
-    Logger.log('d', f'Beginning Retract Tower (speed) post-processing script version {__version__}')
-    Logger.log('d', f'Base height = {base_height} mm')
-    Logger.log('d', f'Section height = {section_height} mm')
-    Logger.log('d', f'Initial printed layer height = {initial_layer_height}')
-    Logger.log('d', f'Printed layer height = {layer_height} mm')
-    Logger.log('d', f'Starting retraction speed = {start_retract_speed}')
-    Logger.log('d', f'Retraction speed change = {retract_speed_change}')
-    Logger.log('d', f'Enable LCD messages = {enable_lcd_messages}')
-    Logger.log('d', f'Advanced Gcode Comments = {enable_advanced_gcode_comments}')
-
-    # Document the settings in the g-code
-    gcode[0] += f'{Common.comment_prefix} Retract Tower (speed) post-processing script version {__version__}\n'
-    gcode[0] += f'{Common.comment_prefix} Base height = {base_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Section height = {section_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Initial printed layer height = {initial_layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Printed layer height = {layer_height} mm\n'
-    gcode[0] += f'{Common.comment_prefix} Starting retraction speed = {start_retract_speed}\n'
-    gcode[0] += f'{Common.comment_prefix} Retraction speed change = {retract_speed_change}\n'
-    gcode[0] += f'{Common.comment_prefix} Enable LCD messages = {enable_lcd_messages}\n'
-    gcode[0] += f'{Common.comment_prefix} Advanced Gcode comments = {enable_advanced_gcode_comments}\n'
+    # Document the post-processing settings
+    parameter_header.Document(gcode, locals())
 
     # Start at the requested starting retraction value
     current_retract_speed = start_retract_speed - retract_speed_change # The current retract value will be corrected when the first section is encountered
 
+    # With firmware retraction, the printer performs the retractions (G10/G11), so the retraction speeds only need
+    # to be configured at the start of each tower section
+    if firmware_retraction:
+        for lines in Common.SectionEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
+
+            # Update the retraction value for the new tower section
+            current_retract_speed += retract_speed_change
+            _StartSection(lines, current_retract_speed, firmware_retraction, enable_lcd_messages, enable_advanced_gcode_comments)
+
+        Logger.log('d', f'AutoTowersGenerator completing Retract Tower (speed) post-processing')
+
+        return gcode
+
+    # Follow the extruder through the gcode to identify retractions
+    extruder_state = Common.ExtruderState(relative_extrusion)
+
     # Iterate over each line in the g-code
     for line_index, line, lines, start_of_new_section in Common.LayerEnumerate(gcode, base_height, section_height, initial_layer_height, layer_height, enable_advanced_gcode_comments):
 
@@ -70,36 +92,49 @@ def execute(gcode, base_height:float, section_height:float, initial_layer_height
 
             # Update the retraction value for the new tower section
             current_retract_speed += retract_speed_change
-
-            # Document the new retraction speed in the gcode
-            lines.insert(2, f'{Common.comment_prefix} Using a retraction speed of {current_retract_speed} mm/s for this tower section')
-
-            # Display the new retraction value on the printer's LCD
-            if enable_lcd_messages:
-                lines.insert(3, f'M117 SPD {current_retract_speed:.1f} mm/s')
-                if enable_advanced_gcode_comments :
-                    lines.insert(3, f'{Common.comment_prefix} Displaying "SPD {current_retract_speed:.1f}" on the LCD')
+            _StartSection(lines, current_retract_speed, firmware_retraction, enable_lcd_messages, enable_advanced_gcode_comments)
 
         # Handle retraction commands
-        # Retraction commands need to be modified to match the requested speed
-        elif Common.IsRetractLine(line):
+        # Retraction commands (and the extrusions that reverse them) need to be modified to match the requested speed
+        filament_movement = extruder_state.Classify(line)
+        if filament_movement == Common.ExtruderState.RETRACTION or filament_movement == Common.ExtruderState.UNRETRACTION:
 
-            # Determine the current retraction speed
-            speed_search_results = re.search(r'F([-+]?\d*\.?\d+)', line.split(';')[0])
-            if speed_search_results:
-                original_speed_string = speed_search_results.group(1)
+            # Locate the current retraction speed
+            value_span = Common.FindParameterValueSpan(line, 'F')
+            if not value_span is None:
+                (value_start, value_end) = value_span
 
                 # Update the line with the new retraction speed
-                new_line = line.replace(f'F{original_speed_string}', f'F{int(current_retract_speed * 60)}')
+                new_line = f'{line[:value_start]}{int(current_retract_speed * 60)}{line[value_end:]}'
                 if enable_advanced_gcode_comments :
                     new_line += f' {Common.comment_prefix} Changed retraction speed to {current_retract_speed} mm/s ({current_retract_speed * 60} mm/min)' # Speed value must be specified as mm/min for the gcode'
 
                 # Replace the original line with the post-processed line
                 lines[line_index] = new_line
 
-                # Leave the original line commented out in the gcode for reference
-                #lines.insert(line_index, f';{line} {Common.comment_prefix} This is the original line before it was modified')
-
     Logger.log('d', f'AutoTowersGenerator completing Retract Tower (speed) post-processing')
 
     return gcode
+
+
+
+def _StartSection(lines, current_retract_speed:float, firmware_retraction:bool, enable_lcd_messages:bool, enable_advanced_gcode_comments:bool)->None:
+    ''' Documents and configures the retraction speed at the start of a tower section '''
+
+    # Document the new retraction speed in the gcode
+    lines.insert(2, f'{Common.comment_prefix} Using a retraction speed of {current_retract_speed} mm/s for this tower section')
+
+    # Display the new retraction value on the printer's LCD
+    if enable_lcd_messages:
+        lines.insert(3, f'M117 SPD {current_retract_speed:.1f} mm/s')
+        if enable_advanced_gcode_comments :
+            lines.insert(3, f'{Common.comment_prefix} Displaying "SPD {current_retract_speed:.1f}" on the LCD')
+
+    # Configure the printer's firmware retraction and recovery speeds (specified in mm/min)
+    if firmware_retraction:
+        if enable_advanced_gcode_comments :
+            lines.insert(3, f'M208 F{int(current_retract_speed * 60)} {Common.comment_prefix} Setting the firmware retraction recovery speed')
+            lines.insert(3, f'M207 F{int(current_retract_speed * 60)} {Common.comment_prefix} Setting the firmware retraction speed')
+        else :
+            lines.insert(3, f'M208 F{int(current_retract_speed * 60)}')
+            lines.insert(3, f'M207 F{int(current_retract_speed * 60)}')
@@ -0,0 +1,120 @@
+# Calculates the usable area of the build plate from the machine's disallowed areas
+#
+# The usable area is the largest rectangle, centered on the build plate, that doesn't overlap any of
+# the disallowed polygons (such as bed clips), so patterns and towers sized to it can be placed in the middle
+#
+# This has no dependencies on Cura, so it can be benchmarked on its own (see Tests/benchmark_print_area.py)
+
+import numpy
+
+
+
+def CalculateUsableArea(disallowedAreas, machineWidth, machineDepth) -> tuple:
+    ''' Calculates the largest rectangle, centered on the bed, that doesn't overlap any of the disallowed areas
+        Each candidate half-width limits the half-depth to the nearest point (in y) of any disallowed 
+        polygon that lies within the strip of the bed covered by the rectangle '''
+
+    disallowedAreas = [area for area in disallowedAreas if len(area) > 2]
+    if len(disallowedAreas) == 0:
+        return (machineWidth, machineDepth)
+
+    # Most disallowed areas (such as bed clips) are rectangles, which can be handled much more quickly
+    if all(_isAxisAlignedRectangle(area) for area in disallowedAreas):
+        return _calculateUsableAreaOfRectangles(disallowedAreas, machineWidth, machineDepth)
+
+    # Collect the edges of every polygon into flat arrays
+    polygons = [numpy.array(area, dtype=float).reshape(-1, 2) for area in disallowedAreas]
+    startPoints = numpy.concatenate(polygons)
+    endPoints = numpy.concatenate([numpy.roll(polygon, -1, axis=0) for polygon in polygons])
+    polygonStarts = numpy.cumsum([0] + [len(polygon) for polygon in polygons[:-1]])
+    (x0, y0) = startPoints.T
+    (x1, y1) = endPoints.T
+
+    # The candidate half-widths are the polygon vertices, the full bed width, and evenly-spaced 
+    # values in between (to catch maxima along sloped edges)
+    sampleCount = 256
+    maxHalfWidth = machineWidth / 2
+    maxHalfDepth = machineDepth / 2
+    halfWidths = numpy.concatenate((numpy.abs(x0), [maxHalfWidth], numpy.linspace(0, maxHalfWidth, sampleCount)))
+    halfWidths = numpy.unique(halfWidths[(halfWidths > 0) & (halfWidths <= maxHalfWidth)])[:, numpy.newaxis]
+
+    # Clip each edge to the open strip -a < x < a, using the parametric form of the edge
+    dx = x1 - x0
+    dy = y1 - y0
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        tLeft = (-halfWidths - x0) / dx
+        tRight = (halfWidths - x0) / dx
+    tStart = numpy.clip(numpy.minimum(tLeft, tRight), 0, 1)
+    tEnd = numpy.clip(numpy.maximum(tLeft, tRight), 0, 1)
+    vertical = dx == 0
+    insideStrip = numpy.where(vertical, numpy.abs(x0) < halfWidths, tEnd > tStart)
+    tStart = numpy.where(vertical, 0, tStart)
+    tEnd = numpy.where(vertical, 1, tEnd)
+
+    # The nearest point of a clipped edge is one of its ends, unless it crosses the x axis
+    yStart = y0 + tStart * dy
+    yEnd = y0 + tEnd * dy
+    edgeDistance = numpy.where(yStart * yEnd <= 0, 0, numpy.minimum(numpy.abs(yStart), numpy.abs(yEnd)))
+    edgeDistance = numpy.where(insideStrip, edgeDistance, numpy.inf)
+    halfDepths = numpy.minimum(edgeDistance.min(axis=1), maxHalfDepth)
+
+    # A polygon with no edge crossing the x axis inside the strip may still cover the x axis at the 
+    # sides of the strip, which is tested by casting a ray from just inside (-a, 0) and (a, 0)
+    # (The rectangle is allowed to touch a polygon, so the test points are nudged off the boundary)
+    crossesAxis = (y0 > 0) != (y1 > 0)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        axisCrossing = numpy.where(crossesAxis, x0 - y0 * dx / dy, numpy.nan)
+    sideOffset = halfWidths - 1e-6
+    for side in (-sideOffset, sideOffset):
+        crossings = numpy.add.reduceat((axisCrossing > side).astype(int), polygonStarts, axis=1)
+        halfDepths = numpy.where((crossings % 2 == 1).any(axis=1), 0, halfDepths)
+
+    # Choose the candidate with the largest area
+    halfWidths = halfWidths[:, 0]
+    areas = halfWidths * halfDepths
+    best = numpy.argmax(areas)
+    if areas[best] <= 0:
+        return (0.0, 0.0)
+    return (float(halfWidths[best] * 2), float(halfDepths[best] * 2))
+
+
+
+def _isAxisAlignedRectangle(polygon) -> bool:
+    ''' Determines if a polygon is a rectangle with its sides parallel to the axes '''
+
+    if len(polygon) != 4 or len({x for (x, y) in polygon}) != 2 or len({y for (x, y) in polygon}) != 2:
+        return False
+
+    # Each side must be either horizontal or vertical (rather than a diagonal of the rectangle)
+    return all(start[0] == end[0] or start[1] == end[1] for (start, end) in zip(polygon, list(polygon[1:]) + list(polygon[:1])))
+
+
+
+def _calculateUsableAreaOfRectangles(rectangles, machineWidth, machineDepth) -> tuple:
+    ''' Calculates the largest rectangle, centered on the bed, that doesn't overlap any of the given axis-aligned rectangles
+        This gives the same result as CalculateUsableArea, but only has to consider the sides of the rectangles '''
+
+    maxHalfWidth = machineWidth / 2
+    maxHalfDepth = machineDepth / 2
+    bounds = []
+    for rectangle in rectangles:
+        xs = [x for (x, y) in rectangle]
+        ys = [y for (x, y) in rectangle]
+        bounds.append((min(xs), max(xs), min(ys), max(ys)))
+
+    # The best half-width is always the bed's or one that just touches the side of a rectangle
+    bestArea = (0.0, 0.0)
+    for halfWidth in {maxHalfWidth} | {abs(x) for (minX, maxX, minY, maxY) in bounds for x in (minX, maxX)}:
+        if halfWidth <= 0 or halfWidth > maxHalfWidth:
+            continue
+
+        # Each rectangle within the strip covered by the centered rectangle limits its depth
+        halfDepth = maxHalfDepth
+        for (minX, maxX, minY, maxY) in bounds:
+            if minX < halfWidth and maxX > -halfWidth:
+                halfDepth = min(halfDepth, 0 if minY < 0 < maxY else min(abs(minY), abs(maxY)))
+
+        if halfWidth * halfDepth > bestArea[0] * bestArea[1] / 4:
+            bestArea = (float(halfWidth * 2), float(halfDepth * 2))
+
+    return bestArea
@@ -168,6 +168,17 @@ UM.Dialog
                     if (dataModel.padSizeStr != text) dataModel.padSizeStr = text
                 }
             }
+
+            Label
+            {
+                text: 'Write G-code Directly'
+            }
+            CheckBox
+            {
+                id: directGcode
+                checked: dataModel.directGcode
+                onClicked: dataModel.directGcode = directGcode.checked
+            }
         }
     }
 
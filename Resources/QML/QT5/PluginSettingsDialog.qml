@@ -128,6 +128,37 @@ UM.Dialog
                 id: enableDescriptiveFileNames
                 checked: manager.enableDescriptiveFileNamesSetting
             }
+
+			Label 
+            { 
+                text: "Draft Rendering" 
+            }
+            CheckBox
+            {
+                id: draftRendering
+                checked: manager.draftRenderingSetting
+            }
+
+			Label 
+            { 
+                text: "Warm Up OpenSCAD" 
+            }
+            CheckBox
+            {
+                id: warmUpOpenScad
+                checked: manager.warmUpOpenScadSetting
+            }
+
+			Label 
+            { 
+                text: "Compact GCode" 
+            }
+            CheckBox
+            {
+                id: compactGcode
+                checked: manager.compactGcodeSetting
+            }
+
         }
     }
 
@@ -149,6 +180,9 @@ UM.Dialog
         manager.enableLcdMessagesSetting = enableLcdMessages.checked
 		manager.enableAdvancedGcodeCommentsSetting = enableAdvancedGcodeComments.checked
         manager.enableDescriptiveFileNamesSetting = enableDescriptiveFileNames.checked
+        manager.draftRenderingSetting = draftRendering.checked
+        manager.warmUpOpenScadSetting = warmUpOpenScad.checked
+        manager.compactGcodeSetting = compactGcode.checked
         manager.correctPrintSettings = correctPrintSettings.checked
     }
 }
@@ -232,6 +232,29 @@ UM.Dialog
                 text: catalog.i18nc("@tooltip", "The size of each of the pads in the pattern.")
                 visible: pad_size_mouse_area.containsMouse
             }
+
+            // Write the pattern directly as gcode
+            UM.Label
+            {
+                text: catalog.i18nc("@label", "Write G-code Directly")
+                MouseArea 
+                {
+                    id: direct_gcode_mouse_area
+                    anchors.fill: parent
+                    hoverEnabled: true
+                }
+            }
+            UM.CheckBox
+            {
+                id: directGcodeCheckBox
+                checked: dataModel.directGcode
+                onClicked: dataModel.directGcode = checked
+            }
+            UM.ToolTip
+            {
+                text: catalog.i18nc("@tooltip", "Writes the pattern straight to the selected output device as gcode, without slicing it in Cura.<p>The machine's start and end gcode and the current initial layer temperatures and speeds are used.")
+                visible: direct_gcode_mouse_area.containsMouse
+            }
         }
     }
 
@@ -191,6 +191,70 @@ UM.Dialog
                 text: catalog.i18nc("@tooltip", "If enabled, gcode will be created with descriptive file names.<p>These file names may be too long for some printers to handle and can be deselected if needed.")
                 visible: enable_descriptive_file_names_mouse_area.containsMouse
             }
+
+			UM.Label 
+            { 
+                text: catalog.i18nc("@label", "Draft Rendering")
+                MouseArea 
+                {
+                    id: draft_rendering_mouse_area
+                    anchors.fill: parent
+                    hoverEnabled: true
+                }
+            }
+            UM.CheckBox
+            {
+                id: draftRendering
+                checked: manager.draftRenderingSetting
+            }
+            UM.ToolTip
+            {
+                text: catalog.i18nc("@tooltip", "If enabled, custom towers are first generated quickly with low-detail curves and text so they can be sliced right away.<p>The full-quality model replaces the draft once it has been generated in the background.")
+                visible: draft_rendering_mouse_area.containsMouse
+            }
+
+			UM.Label 
+            { 
+                text: catalog.i18nc("@label", "Warm Up OpenSCAD")
+                MouseArea 
+                {
+                    id: warm_up_openscad_mouse_area
+                    anchors.fill: parent
+                    hoverEnabled: true
+                }
+            }
+            UM.CheckBox
+            {
+                id: warmUpOpenScad
+                checked: manager.warmUpOpenScadSetting
+            }
+            UM.ToolTip
+            {
+                text: catalog.i18nc("@tooltip", "If enabled, OpenSCAD renders a tiny model in the background when Cura starts, so its fonts are ready and the first custom tower is generated at full speed.")
+                visible: warm_up_openscad_mouse_area.containsMouse
+            }
+
+			UM.Label 
+            { 
+                text: catalog.i18nc("@label", "Compact GCode")
+                MouseArea 
+                {
+                    id: compact_gcode_mouse_area
+                    anchors.fill: parent
+                    hoverEnabled: true
+                }
+            }
+            UM.CheckBox
+            {
+                id: compactGcode
+                checked: manager.compactGcodeSetting
+            }
+            UM.ToolTip
+            {
+                text: catalog.i18nc("@tooltip", "If enabled, non-essential comments, repeated feedrates, and trailing zeros are removed from the post-processed GCode.<p>This reduces the size of the final code, which can speed up printing over a serial connection.")
+                visible: compact_gcode_mouse_area.containsMouse
+            }
+
         }
     }
 
@@ -214,6 +278,9 @@ UM.Dialog
         manager.enableLcdMessagesSetting = enableLcdMessages.checked
         manager.enableAdvancedGcodeCommentsSetting = enableAdvancedGcodeComments.checked
         manager.enableDescriptiveFileNamesSetting = enableDescriptiveFileNames.checked
+        manager.draftRenderingSetting = draftRendering.checked
+        manager.warmUpOpenScadSetting = warmUpOpenScad.checked
+        manager.compactGcodeSetting = compactGcode.checked
 		manager.correctPrintSettings = correctPrintSettings.checked
     }
 
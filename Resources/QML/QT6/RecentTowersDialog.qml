@@ -0,0 +1,102 @@
+import QtQuick 6.0
+import QtQuick.Controls 6.0
+import QtQuick.Layouts 6.0
+
+import UM 1.6 as UM
+import Cura 1.7 as Cura
+
+UM.Dialog
+{
+    id: dialog
+	
+	property variant catalog: UM.I18nCatalog { name: "autotowers" }
+	
+    title: catalog.i18nc("@title", "Recent Towers")
+
+    buttonSpacing: UM.Theme.getSize("default_margin").width
+    minimumWidth: screenScaleFactor * 445
+    minimumHeight: (screenScaleFactor * contents.childrenRect.height) + (2 * UM.Theme.getSize("default_margin").height) + UM.Theme.getSize("button").height
+    maximumHeight: minimumHeight
+    width: minimumWidth
+    height: minimumHeight
+
+    backgroundColor: UM.Theme.getColor("main_background")
+
+    RowLayout
+    {
+        id: contents
+        width: dialog.width - 2 * UM.Theme.getSize("default_margin").width
+        spacing: UM.Theme.getSize("default_margin").width
+
+        Rectangle
+        {
+            Layout.preferredWidth: icon.width
+            Layout.preferredHeight: icon.height
+            Layout.fillHeight: true
+            color: UM.Theme.getColor("primary_button")
+
+            Image
+            {
+                id: icon
+                source: Qt.resolvedUrl("../../Images/autotowersgenerator_icon.png")
+                anchors.verticalCenter: parent.verticalCenter
+                anchors.horizontalCenter: parent.horizontalCenter
+            }
+        }
+
+        GridLayout
+        {
+            columns: 2
+            rowSpacing: UM.Theme.getSize("default_lining").height
+            columnSpacing: UM.Theme.getSize("default_margin").width
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            Layout.alignment: Qt.AlignTop
+
+            // Recent tower selection
+            UM.Label
+            {
+                text: catalog.i18nc("@label", "Recent Tower")
+                MouseArea
+                {
+                    id: recent_tower_mouse_area
+                    anchors.fill: parent
+                    hoverEnabled: true
+                }
+            }
+            Cura.ComboBox
+            {
+                id: recentTower
+                Layout.fillWidth: true
+                model: manager.recentTowersModel
+                textRole: "name"
+                currentIndex: 0
+            }
+            UM.ToolTip
+            {
+                text: catalog.i18nc("@tooltip", "A previously generated tower to add back to the build plate.<p>The tower is reopened with the same settings and post-processing it was generated with, without running OpenSCAD again.")
+                visible: recent_tower_mouse_area.containsMouse
+            }
+        }
+    }
+
+    rightButtons: 
+    [
+        Cura.SecondaryButton
+        {
+            text: catalog.i18nc("@button", "Cancel")
+            onClicked: dialog.reject()
+        },
+        Cura.PrimaryButton
+        {
+            text: catalog.i18nc("@button", "OK")
+            onClicked: dialog.accept()
+        }
+    ]
+
+    onAccepted:
+    {
+        manager.reopenRecentTower(recentTower.currentIndex)
+    }
+
+}
@@ -0,0 +1,43 @@
+# Reads and writes the contents of STL files
+#
+# Binary files are mapped directly onto numpy arrays and ASCII files are parsed in a single vectorized pass,
+# rather than one triangle at a time
+#
+# This has no dependencies on Cura, so it can be tested on its own (see Tests/test_stl_file.py)
+
+import numpy
+
+
+
+# Binary STL files are an 80-byte header and a 32-bit triangle count followed by one 50-byte record per triangle
+_binaryStlHeaderSize = 84
+_binaryStlDtype = numpy.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attributes', '<u2')])
+
+
+
+def ParseStl(stlData:bytes) -> numpy.ndarray:
+    ''' Parses the contents of a binary or ASCII STL file into an (n*3, 3) array of triangle vertices '''
+
+    # ASCII STL files are supposed to start with "solid", but some binary files do too
+    # The only reliable test for a binary file is whether its size matches the triangle count in its header
+    if len(stlData) >= _binaryStlHeaderSize:
+        triangleCount = int(numpy.frombuffer(stlData, dtype='<u4', count=1, offset=80)[0])
+        if len(stlData) == _binaryStlHeaderSize + triangleCount * _binaryStlDtype.itemsize:
+            triangles = numpy.frombuffer(stlData, dtype=_binaryStlDtype, count=triangleCount, offset=_binaryStlHeaderSize)
+            return triangles['vertices'].reshape(-1, 3).astype(numpy.float32)
+
+    # For ASCII files, the three values following each "vertex" keyword are the vertex coordinates
+    tokens = numpy.array(stlData.split())
+    vertexTokenIndices = numpy.flatnonzero(tokens == b'vertex')
+    coordinateTokens = tokens[vertexTokenIndices[:, numpy.newaxis] + numpy.arange(1, 4)]
+    return coordinateTokens.astype(numpy.float32)
+
+
+
+def StlDataFromVertices(vertices:numpy.ndarray) -> bytes:
+    ''' Converts an (n*3, 3) array of triangle vertices into the contents of a binary STL file '''
+
+    triangles = numpy.zeros(len(vertices) // 3, dtype=_binaryStlDtype)
+    triangles['vertices'] = vertices.reshape(-1, 3, 3)
+    header = bytes(80) + numpy.uint32(len(triangles)).tobytes()
+    return header + triangles.tobytes()
@@ -0,0 +1,74 @@
+# Compares the time taken to calculate the usable print area with the approximation printArea used before
+# Run with "python Tests/benchmark_print_area.py" from the plugin directory
+#
+# The approximation took the nearest disallowed vertex on each side of the origin, ignoring the shapes
+# of the polygons, so it is only timed here - its results can be wrong
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import PrintArea
+
+
+
+def ApproximateUsableArea(disallowedAreas):
+    ''' The calculation printArea used before PrintArea.py '''
+
+    flattenedList = [coord for section in disallowedAreas for coord in section]
+    minX = max([coord[0] for coord in flattenedList if coord[0] < 0])
+    maxX = min([coord[0] for coord in flattenedList if coord[0] >= 0])
+    minY = max([coord[1] for coord in flattenedList if coord[1] < 0])
+    maxY = min([coord[1] for coord in flattenedList if coord[1] >= 0])
+    return (maxX - minX, maxY - minY)
+
+
+
+def CornerClips(machineWidth, machineDepth, clipSize):
+    ''' Returns a square clip in each corner of the bed '''
+
+    clips = []
+    for (xSign, ySign) in ((-1, 1), (1, 1), (-1, -1), (1, -1)):
+        (x1, y1) = (xSign * machineWidth/2, ySign * machineDepth/2)
+        (x2, y2) = (x1 - xSign * clipSize, y1 - ySign * clipSize)
+        clips.append([[x1, y1], [x2, y1], [x2, y2], [x1, y2]])
+    return clips
+
+
+
+def SensorZones(machineWidth, machineDepth, zoneCount):
+    ''' Returns triangular zones scattered around the edges of the bed, so the polygon calculation is used '''
+
+    random.seed(1)
+    zones = []
+    for zoneNumber in range(zoneCount):
+        (xSign, ySign) = ((-1) ** zoneNumber, (-1) ** (zoneNumber // 2))
+        x = xSign * random.uniform(machineWidth/4, machineWidth/2)
+        y = ySign * random.uniform(machineDepth/4, machineDepth/2)
+        zones.append([[x, y], [x + xSign * 10, y], [x, y + ySign * 10]])
+    return zones
+
+
+
+def Benchmark(name, disallowedAreas, machineWidth, machineDepth):
+    ''' Prints the time taken by each calculation and the area it found '''
+
+    print(name)
+    for (label, calculation) in (
+        ('approximation', lambda: ApproximateUsableArea(disallowedAreas)),
+        ('PrintArea', lambda: PrintArea.CalculateUsableArea(disallowedAreas, machineWidth, machineDepth)),
+    ):
+        (count, total) = timeit.Timer(calculation).autorange()
+        (width, depth) = calculation()
+        print(f'  {label:15s} {total / count * 1e6:10.1f} us   {width:.2f} x {depth:.2f} mm')
+
+
+
+if __name__ == '__main__':
+    Benchmark('Four corner clips on a 220 x 220 mm bed', CornerClips(220, 220, 10), 220, 220)
+    Benchmark('Four corner clips on a 300 x 300 mm bed', CornerClips(300, 300, 25), 300, 300)
+    Benchmark('Forty clips on a 300 x 300 mm bed', CornerClips(300, 300, 25) * 10, 300, 300)
+    Benchmark('Twelve triangular sensor zones on a 300 x 300 mm bed', SensorZones(300, 300, 12), 300, 300)
+    Benchmark('Fifty triangular sensor zones on a 300 x 300 mm bed', SensorZones(300, 300, 50), 300, 300)
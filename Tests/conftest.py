@@ -0,0 +1,5 @@
+# The modules tested here don't depend on Cura, so they are imported directly from the plugin directory
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
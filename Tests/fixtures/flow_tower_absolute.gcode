@@ -0,0 +1,458 @@
+;FLAVOR:Marlin
+;TIME:1234
+;Filament used: 1.2345m
+;Layer height: 0.2
+;MINX:-10
+;MINY:-10
+;MINZ:0.2
+;MAXX:10
+;MAXY:10
+;MAXZ:3.2
+;Generated with Cura_SteamEngine 5.4.0
+M140 S60
+M105
+M190 S60
+M104 S200
+M105
+M109 S200
+M82 ;absolute extrusion mode
+G28 ;Home
+G1 Z15.0 F6000 ;Move the platform down 15mm
+G92 E0
+G1 F200 E3
+G92 E0
+;LAYER_COUNT:16
+;LAYER:0
+G0 F3000 X-3.523 Y-6.983 Z0.2
+;TYPE:WALL-OUTER
+G1 F1200 X-8.551 Y0.718 E0.30588
+G1 X-2.686 Y-8.840 E0.67885
+G1 X0.149 Y-9.250 E0.77412
+G1 X-1.327 Y-8.603 E0.82772
+G1 F2700 E-4.17228
+G0 F6000 X-8.186 Y-1.510
+G1 F2700 E0.82772
+;TYPE:SKIN
+G1 F1200 X8.949 Y2.613 E1.41388
+G1 X1.660 Y-8.763 E1.86323
+G1 X1.711 Y-9.008 E1.87157
+G1 X-5.578 Y1.133 E2.28697
+G1 F2700 E-2.71303
+G0 F6000 X-7.337 Y-1.617
+G1 F2700 E2.28697
+G1 F2700 E-2.71303
+;MESH:NONMESH
+G0 F6000 X-7.337 Y-1.617 Z0.4
+;TIME_ELAPSED:7.162744
+;LAYER:1
+M106 S255
+G0 F6000 X1.418 Y1.205 Z0.4
+G1 F2700 E2.28697
+;TYPE:WALL-OUTER
+G1 F1200 X-7.939 Y1.424 E2.59827
+G1 X-6.243 Y-8.051 E2.91843
+G1 X4.242 Y1.287 E3.38543
+G1 X2.380 Y-0.072 E3.46210
+G1 X0.634 Y5.545 E3.65772
+G1 F2700 E-1.34228
+G0 F6000 X-0.688 Y8.469
+G1 F2700 E3.65772
+;TYPE:SKIN
+G1 F1200 X-4.005 Y5.888 E3.79750
+G1 X3.980 Y-5.118 E4.24974
+G1 X1.488 Y0.504 E4.45426
+G1 X7.503 Y4.589 E4.69608
+G1 X-4.241 Y9.603 E5.12080
+G1 X-7.639 Y-1.638 E5.51138
+G1 F2700 E0.51138
+G0 F6000 X5.143 Y-6.960
+G1 F2700 E5.51138
+G1 F2700 E0.51138
+;MESH:NONMESH
+G0 F6000 X5.143 Y-6.960 Z0.6
+;TIME_ELAPSED:14.118596
+;LAYER:2
+G0 F6000 X-9.216 Y3.364 Z0.6
+G1 F2700 E5.51138
+;TYPE:WALL-OUTER
+G1 F1200 X-3.198 Y-2.996 E5.80263
+G1 X-0.067 Y5.938 E6.11750
+G1 X-8.625 Y-8.128 E6.66512
+G1 X-4.601 Y3.941 E7.08825
+G1 X-8.700 Y4.623 E7.22646
+G1 X-3.808 Y1.559 E7.41845
+G1 F2700 E2.41845
+G0 F6000 X3.625 Y-1.087
+G1 F2700 E7.41845
+;TYPE:SKIN
+G1 F1200 X7.741 Y-3.060 E7.57026
+G1 X8.813 Y-2.891 E7.60636
+G1 X2.218 Y-0.126 E7.84419
+G1 X-5.636 Y-4.251 E8.13927
+G1 X4.767 Y-2.042 E8.49299
+G1 X8.336 Y-0.070 E8.62861
+G1 X-6.673 Y-1.967 E9.13179
+G1 F2700 E4.13179
+G0 F6000 X-4.443 Y-7.261
+G1 F2700 E9.13179
+G1 F2700 E4.13179
+;MESH:NONMESH
+G0 F6000 X-4.443 Y-7.261 Z0.8
+;TIME_ELAPSED:20.840683
+;LAYER:3
+G0 F6000 X1.004 Y4.128 Z0.8
+G1 F2700 E9.13179
+;TYPE:WALL-OUTER
+G1 F1200 X3.654 Y-2.391 E9.36584
+G1 X-5.385 Y-8.340 E9.72576
+G1 X-6.974 Y3.170 E10.11224
+G1 X-9.759 Y6.622 E10.25974
+G1 X-6.353 Y-4.361 E10.64220
+G1 X-7.086 Y0.692 E10.81203
+G1 F2700 E5.81203
+G0 F6000 X2.196 Y-3.628
+G1 F2700 E10.81203
+;TYPE:SKIN
+G1 F1200 X3.810 Y0.310 E10.95357
+G1 X2.352 Y3.524 E11.07095
+G1 X-8.920 Y7.991 E11.47422
+G1 X5.599 Y7.490 E11.95743
+G1 X5.957 Y-2.152 E12.27837
+G1 F2700 E7.27837
+G0 F6000 X-2.020 Y-7.929
+G1 F2700 E12.27837
+G1 F2700 E7.27837
+;MESH:NONMESH
+G0 F6000 X-2.020 Y-7.929 Z1.0
+;TIME_ELAPSED:28.377841
+;LAYER:4
+G0 F6000 X-8.755 Y-8.653 Z1.0
+G1 F2700 E12.27837
+;TYPE:WALL-OUTER
+G1 F1200 X-1.187 Y-7.801 E12.53165
+G1 X2.015 Y-7.952 E12.63827
+G1 X1.336 Y0.732 E12.92801
+G1 X8.979 Y2.275 E13.18735
+G1 X-8.594 Y-5.841 E13.83113
+G1 F2700 E8.83113
+G0 F6000 X-2.475 Y2.688
+G1 F2700 E13.83113
+;TYPE:SKIN
+G1 F1200 X2.046 Y-0.517 E14.01546
+G1 X-7.693 Y-0.239 E14.33949
+G1 X9.556 Y-0.392 E14.91323
+G1 X-3.763 Y-7.118 E15.40951
+G1 X4.993 Y4.807 E15.90157
+G1 X-0.428 Y3.841 E16.08471
+G1 F2700 E11.08471
+G0 F6000 X0.327 Y-5.896
+G1 F2700 E16.08471
+G1 F2700 E11.08471
+;MESH:NONMESH
+G0 F6000 X0.327 Y-5.896 Z1.2
+;TIME_ELAPSED:37.185925
+;LAYER:5
+G0 F6000 X-2.765 Y3.801 Z1.2
+G1 F2700 E16.08471
+;TYPE:WALL-OUTER
+G1 F1200 X5.163 Y-4.038 E16.45554
+G1 X2.858 Y-8.180 E16.61318
+G1 X6.909 Y0.368 E16.92778
+G1 X8.165 Y-2.886 E17.04379
+G1 F2700 E12.04379
+G0 F6000 X-5.544 Y0.831
+G1 F2700 E17.04379
+;TYPE:SKIN
+G1 F1200 X2.729 Y2.265 E17.32305
+G1 X5.768 Y5.166 E17.46281
+G1 X-6.097 Y-5.212 E17.98712
+G1 X-1.986 Y6.067 E18.38639
+G1 X-6.002 Y-0.144 E18.63237
+G1 X4.620 Y9.792 E19.11613
+G1 F2700 E14.11613
+G0 F6000 X5.802 Y-0.555
+G1 F2700 E19.11613
+G1 F2700 E14.11613
+;MESH:NONMESH
+G0 F6000 X5.802 Y-0.555 Z1.4
+;TIME_ELAPSED:42.960504
+;LAYER:6
+G0 F6000 X2.103 Y-3.114 Z1.4
+G1 F2700 E19.11613
+;TYPE:WALL-OUTER
+G1 F1200 X9.100 Y-2.707 E19.34926
+G1 X-5.591 Y-5.463 E19.84639
+G1 X-6.066 Y-5.913 E19.86815
+G1 X2.481 Y8.006 E20.41140
+G1 X6.809 Y-0.411 E20.72617
+G1 X3.060 Y5.993 E20.97297
+G1 F2700 E15.97297
+G0 F6000 X-8.304 Y3.212
+G1 F2700 E20.97297
+;TYPE:SKIN
+G1 F1200 X5.646 Y5.003 E21.44077
+G1 X-0.439 Y-6.430 E21.87153
+G1 X5.783 Y-3.350 E22.10244
+G1 X6.016 Y9.433 E22.52766
+G1 X-2.083 Y-1.972 E22.99293
+G1 X8.936 Y4.496 E23.41791
+G1 X-6.600 Y-7.459 E24.06991
+G1 F2700 E19.06991
+G0 F6000 X-6.977 Y8.097
+G1 F2700 E24.06991
+G1 F2700 E19.06991
+;MESH:NONMESH
+G0 F6000 X-6.977 Y8.097 Z1.6
+;TIME_ELAPSED:51.186512
+;LAYER:7
+G0 F6000 X-7.077 Y6.530 Z1.6
+G1 F2700 E24.06991
+;TYPE:WALL-OUTER
+G1 F1200 X3.145 Y-2.992 E24.53455
+G1 X0.973 Y-7.380 E24.69741
+G1 X-9.715 Y9.418 E25.35963
+G1 X2.993 Y0.532 E25.87540
+G1 X8.672 Y-1.324 E26.07411
+G1 X7.435 Y6.523 E26.33832
+G1 X-5.779 Y-4.963 E26.92065
+G1 F2700 E21.92065
+G0 F6000 X-4.141 Y-5.189
+G1 F2700 E26.92065
+;TYPE:SKIN
+G1 F1200 X-4.813 Y-1.620 E27.04146
+G1 X-7.379 Y8.200 E27.37904
+G1 X-2.924 Y-0.837 E27.71414
+G1 X1.667 Y8.086 E28.04790
+G1 X-1.587 Y8.354 E28.15650
+G1 X0.033 Y0.636 E28.41880
+G1 F2700 E23.41880
+G0 F6000 X0.470 Y-9.626
+G1 F2700 E28.41880
+G1 F2700 E23.41880
+;MESH:NONMESH
+G0 F6000 X0.470 Y-9.626 Z1.8
+;TIME_ELAPSED:57.947012
+;LAYER:8
+G0 F6000 X-6.338 Y-9.921 Z1.8
+G1 F2700 E28.41880
+;TYPE:WALL-OUTER
+G1 F1200 X-6.553 Y-0.530 E28.73123
+G1 X4.504 Y1.130 E29.10311
+G1 X-3.480 Y0.367 E29.36987
+G1 X1.109 Y5.685 E29.60351
+G1 X-7.878 Y1.206 E29.93748
+G1 F2700 E24.93748
+G0 F6000 X-5.030 Y-4.462
+G1 F2700 E29.93748
+;TYPE:SKIN
+G1 F1200 X0.154 Y1.235 E30.19366
+G1 X5.200 Y8.250 E30.48107
+G1 X-1.135 Y2.251 E30.77125
+G1 X0.111 Y0.243 E30.84984
+G1 F2700 E25.84984
+G0 F6000 X3.855 Y-0.953
+G1 F2700 E30.84984
+G1 F2700 E25.84984
+;MESH:NONMESH
+G0 F6000 X3.855 Y-0.953 Z2.0
+;TIME_ELAPSED:65.080154
+;LAYER:9
+G0 F6000 X-0.439 Y8.830 Z2.0
+G1 F2700 E30.84984
+;TYPE:WALL-OUTER
+G1 F1200 X8.456 Y7.855 E31.14745
+G1 X-5.948 Y-1.049 E31.71068
+G1 X-1.667 Y-2.153 E31.85772
+G1 X-3.680 Y3.423 E32.05489
+G1 X-1.433 Y-5.746 E32.36888
+G1 X-3.944 Y-7.553 E32.47178
+G1 F2700 E27.47178
+G0 F6000 X5.539 Y8.790
+G1 F2700 E32.47178
+;TYPE:SKIN
+G1 F1200 X-7.140 Y7.657 E32.89517
+G1 X9.351 Y-5.608 E33.59909
+G1 X9.050 Y-2.035 E33.71836
+G1 X-0.255 Y9.797 E34.21901
+G1 X6.649 Y-6.771 E34.81599
+G1 X-1.370 Y0.312 E35.17183
+G1 F2700 E30.17183
+G0 F6000 X-3.218 Y-6.085
+G1 F2700 E35.17183
+G92 E0
+G1 X-3.629 Y4.443 E0.35043
+G1 X-9.610 Y1.081 E0.57863
+G1 X-1.191 Y-9.638 E1.03198
+G1 F2700 E-3.96802
+;MESH:NONMESH
+G0 F6000 X-1.191 Y-9.638 Z2.2
+;TIME_ELAPSED:71.406145
+;LAYER:10
+G0 F6000 X2.479 Y0.245 Z2.2
+G1 F2700 E1.03198
+;TYPE:WALL-OUTER
+G1 F1200 X-7.743 Y8.371 E1.46629
+G1 X-5.429 Y7.528 E1.54820
+G1 X-8.319 Y-4.562 E1.96163
+G1 X8.118 Y-6.369 E2.51161
+G1 F2700 E-2.48839
+G0 F6000 X5.116 Y6.396
+G1 F2700 E2.51161
+;TYPE:SKIN
+G1 F1200 X-1.881 Y0.732 E2.81100
+G1 X0.296 Y-0.108 E2.88860
+G1 X-3.459 Y-4.419 E3.07874
+G1 X5.992 Y-6.333 E3.39946
+G1 X7.906 Y-4.622 E3.48486
+G1 X-9.663 Y-8.229 E4.08139
+G1 F2700 E-0.91861
+G0 F6000 X-4.789 Y2.164
+G1 F2700 E4.08139
+G1 F2700 E-0.91861
+;MESH:NONMESH
+G0 F6000 X-4.789 Y2.164 Z2.4
+;TIME_ELAPSED:77.295777
+;LAYER:11
+G0 F6000 X-4.711 Y-7.566 Z2.4
+G1 F2700 E4.08139
+;TYPE:WALL-OUTER
+G1 F1200 X-3.217 Y1.061 E4.37262
+G1 X8.533 Y-4.643 E4.80705
+G1 X-7.416 Y0.538 E5.36480
+G1 X-5.231 Y-7.811 E5.65184
+G1 F2700 E0.65184
+G0 F6000 X-6.771 Y-8.992
+G1 F2700 E5.65184
+;TYPE:SKIN
+G1 F1200 X8.645 Y2.573 E6.29284
+G1 X0.622 Y-5.883 E6.68054
+G1 X-1.086 Y3.443 E6.99587
+G1 X-4.590 Y6.074 E7.14158
+G1 X9.890 Y-9.261 E7.84304
+G1 F2700 E2.84304
+G0 F6000 X-9.631 Y0.113
+G1 F2700 E7.84304
+G1 F2700 E2.84304
+;MESH:NONMESH
+G0 F6000 X-9.631 Y0.113 Z2.6
+;TIME_ELAPSED:86.207984
+;LAYER:12
+G0 F6000 X0.285 Y-5.086 Z2.6
+G1 F2700 E7.84304
+;TYPE:WALL-OUTER
+G1 F1200 X-7.874 Y6.378 E8.31107
+G1 X-1.356 Y-0.100 E8.61672
+G1 X6.692 Y-2.138 E8.89287
+G1 X0.134 Y3.755 E9.18613
+G1 X9.649 Y-3.146 E9.57707
+G1 X6.646 Y4.135 E9.83901
+G1 X2.720 Y-1.906 E10.07863
+G1 F2700 E5.07863
+G0 F6000 X-3.049 Y-8.912
+G1 F2700 E10.07863
+;TYPE:SKIN
+G1 F1200 X-9.715 Y2.509 E10.51847
+G1 X7.597 Y-1.385 E11.10865
+G1 X-8.892 Y3.305 E11.67883
+G1 X-2.382 Y0.119 E11.91987
+G1 X9.419 Y1.976 E12.31720
+G1 F2700 E7.31720
+G0 F6000 X3.854 Y-9.095
+G1 F2700 E12.31720
+G1 F2700 E7.31720
+;MESH:NONMESH
+G0 F6000 X3.854 Y-9.095 Z2.8
+;TIME_ELAPSED:91.949392
+;LAYER:13
+G0 F6000 X-4.619 Y-9.928 Z2.8
+G1 F2700 E12.31720
+;TYPE:WALL-OUTER
+G1 F1200 X9.236 Y9.452 E13.10956
+G1 X0.941 Y-5.111 E13.66699
+G1 X9.313 Y-3.809 E13.94879
+G1 X-2.868 Y-9.979 E14.40295
+G1 X-2.367 Y-0.507 E14.71841
+G1 X0.055 Y-5.980 E14.91749
+G1 F2700 E9.91749
+G0 F6000 X0.095 Y-9.901
+G1 F2700 E14.91749
+;TYPE:SKIN
+G1 F1200 X6.341 Y-7.123 E15.14486
+G1 X1.736 Y-2.120 E15.37100
+G1 X-4.007 Y2.593 E15.61812
+G1 X-8.310 Y9.153 E15.87904
+G1 X7.065 Y-6.895 E16.61823
+G1 X7.856 Y5.681 E17.03732
+G1 F2700 E12.03732
+G0 F6000 X1.931 Y5.286
+G1 F2700 E17.03732
+G1 F2700 E12.03732
+;MESH:NONMESH
+G0 F6000 X1.931 Y5.286 Z3.0
+;TIME_ELAPSED:99.832101
+;LAYER:14
+G0 F6000 X-0.116 Y-4.316 Z3.0
+G1 F2700 E17.03732
+;TYPE:WALL-OUTER
+G1 F1200 X-9.124 Y6.706 E17.51078
+G1 X7.839 Y2.547 E18.09168
+G1 X4.677 Y6.244 E18.25350
+G1 X-7.214 Y0.475 E18.69308
+G1 X0.087 Y6.699 E19.01217
+G1 F2700 E14.01217
+G0 F6000 X6.094 Y6.528
+G1 F2700 E19.01217
+;TYPE:SKIN
+G1 F1200 X-8.298 Y-9.163 E19.72033
+G1 X2.742 Y9.190 E20.43269
+G1 X-2.468 Y-0.972 E20.81253
+G1 X-8.984 Y-9.623 E21.17276
+G1 X0.629 Y-5.109 E21.52600
+G1 F2700 E16.52600
+G0 F6000 X-4.724 Y-0.861
+G1 F2700 E21.52600
+G1 F2700 E16.52600
+;MESH:NONMESH
+G0 F6000 X-4.724 Y-0.861 Z3.2
+;TIME_ELAPSED:105.112547
+;LAYER:15
+G0 F6000 X8.650 Y7.957 Z3.2
+G1 F2700 E21.52600
+;TYPE:WALL-OUTER
+G1 F1200 X3.186 Y-8.679 E22.10840
+G1 X4.736 Y-4.956 E22.24252
+G1 X-8.511 Y-4.689 E22.68320
+G1 X4.587 Y-5.896 E23.12067
+G1 F2700 E18.12067
+G0 F6000 X4.797 Y9.515
+G1 F2700 E23.12067
+;TYPE:SKIN
+G1 F1200 X6.911 Y-8.465 E23.72280
+G1 X8.209 Y-4.254 E23.86939
+G1 X-9.065 Y2.656 E24.48819
+G1 X-6.034 Y1.994 E24.59137
+G1 X-3.365 Y3.031 E24.68662
+G1 X3.858 Y2.423 E24.92769
+G1 X-7.331 Y-0.352 E25.31110
+G1 F2700 E20.31110
+G0 F6000 X-0.284 Y9.450
+G1 F2700 E25.31110
+G1 F2700 E20.31110
+;MESH:NONMESH
+G0 F6000 X-0.284 Y9.450 Z3.4
+;TIME_ELAPSED:110.510623
+M140 S0
+M107
+G91 ;Relative positioning
+G1 E-2 F2700 ;Retract a bit
+G1 E-2 Z0.2 F2400 ;Retract and raise Z
+G1 X5 Y5 F3000 ;Wipe out
+G1 Z10 ;Raise Z more
+G90 ;Absolute positioning
+G1 X0 Y235 ;Present print
+M106 S0 ;Turn-off fan
+M104 S0 ;Turn-off hotend
+M140 S0 ;Turn-off bed
+M84 X Y E ;Disable all steppers but Z
+M104 S0
+;End of Gcode
@@ -0,0 +1,460 @@
+;Generated with Cura_SteamEngine 5.4.0
+M140 S60
+M105
+M190 S60
+M104 S200
+M105
+M109 S200
+M82 ;absolute extrusion mode
+G28 ;Home
+G1 Z15.0 F6000 ;Move the platform down 15mm
+G92 E0
+G1 F200 E3.00000 ;AutoTowersGenerator: Extruding 3.00000 mm of filament to reverse the last retraction
+G92 E0
+;LAYER_COUNT:16
+;LAYER:0
+G0 F3000 X-3.523 Y-6.983 Z0.2
+;TYPE:WALL-OUTER
+G1 F1200 X-8.551 Y0.718 E0.35176 ;AutoTowersGenerator: Extruding 0.35176 mm of filament to achieve a 115% flow rate (originally 0.30588 mm at 100% flow rate)
+G1 X-2.686 Y-8.840 E0.78068 ;AutoTowersGenerator: Extruding 0.42892 mm of filament to achieve a 115% flow rate (originally 0.37297 mm at 100% flow rate)
+G1 X0.149 Y-9.250 E0.89024 ;AutoTowersGenerator: Extruding 0.10956 mm of filament to achieve a 115% flow rate (originally 0.09527 mm at 100% flow rate)
+G1 X-1.327 Y-8.603 E0.95188 ;AutoTowersGenerator: Extruding 0.06164 mm of filament to achieve a 115% flow rate (originally 0.05360 mm at 100% flow rate)
+G1 F2700 E-4.04812 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-8.186 Y-1.510
+G1 F2700 E0.95188 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X8.949 Y2.613 E1.62596 ;AutoTowersGenerator: Extruding 0.67408 mm of filament to achieve a 115% flow rate (originally 0.58616 mm at 100% flow rate)
+G1 X1.660 Y-8.763 E2.14271 ;AutoTowersGenerator: Extruding 0.51675 mm of filament to achieve a 115% flow rate (originally 0.44935 mm at 100% flow rate)
+G1 X1.711 Y-9.008 E2.15231 ;AutoTowersGenerator: Extruding 0.00959 mm of filament to achieve a 115% flow rate (originally 0.00834 mm at 100% flow rate)
+G1 X-5.578 Y1.133 E2.63002 ;AutoTowersGenerator: Extruding 0.47771 mm of filament to achieve a 115% flow rate (originally 0.41540 mm at 100% flow rate)
+G1 F2700 E-2.36998 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-7.337 Y-1.617
+G1 F2700 E2.63002 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E-2.36998 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-7.337 Y-1.617 Z0.4
+;TIME_ELAPSED:7.162744
+;LAYER:1
+M106 S255
+G0 F6000 X1.418 Y1.205 Z0.4
+G1 F2700 E2.63002 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-7.939 Y1.424 E2.98801 ;AutoTowersGenerator: Extruding 0.35799 mm of filament to achieve a 115% flow rate (originally 0.31130 mm at 100% flow rate)
+G1 X-6.243 Y-8.051 E3.35619 ;AutoTowersGenerator: Extruding 0.36818 mm of filament to achieve a 115% flow rate (originally 0.32016 mm at 100% flow rate)
+G1 X4.242 Y1.287 E3.89324 ;AutoTowersGenerator: Extruding 0.53705 mm of filament to achieve a 115% flow rate (originally 0.46700 mm at 100% flow rate)
+G1 X2.380 Y-0.072 E3.98141 ;AutoTowersGenerator: Extruding 0.08817 mm of filament to achieve a 115% flow rate (originally 0.07667 mm at 100% flow rate)
+G1 X0.634 Y5.545 E4.20638 ;AutoTowersGenerator: Extruding 0.22496 mm of filament to achieve a 115% flow rate (originally 0.19562 mm at 100% flow rate)
+G1 F2700 E-0.79362 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-0.688 Y8.469
+G1 F2700 E4.20638 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X-4.005 Y5.888 E4.36712 ;AutoTowersGenerator: Extruding 0.16075 mm of filament to achieve a 115% flow rate (originally 0.13978 mm at 100% flow rate)
+G1 X3.980 Y-5.118 E4.88720 ;AutoTowersGenerator: Extruding 0.52008 mm of filament to achieve a 115% flow rate (originally 0.45224 mm at 100% flow rate)
+G1 X1.488 Y0.504 E5.12240 ;AutoTowersGenerator: Extruding 0.23520 mm of filament to achieve a 115% flow rate (originally 0.20452 mm at 100% flow rate)
+G1 X7.503 Y4.589 E5.40049 ;AutoTowersGenerator: Extruding 0.27809 mm of filament to achieve a 115% flow rate (originally 0.24182 mm at 100% flow rate)
+G1 X-4.241 Y9.603 E5.88892 ;AutoTowersGenerator: Extruding 0.48843 mm of filament to achieve a 115% flow rate (originally 0.42472 mm at 100% flow rate)
+G1 X-7.639 Y-1.638 E6.33809 ;AutoTowersGenerator: Extruding 0.44917 mm of filament to achieve a 115% flow rate (originally 0.39058 mm at 100% flow rate)
+G1 F2700 E1.33809 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X5.143 Y-6.960
+G1 F2700 E6.33809 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E1.33809 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X5.143 Y-6.960 Z0.6
+;TIME_ELAPSED:14.118596
+;LAYER:2
+;AutoTowersGenerator: Starting tower section number 1 at Cura layer number 3 (which is labeled as layer 2 in this gcode file)
+G0 F6000 X-9.216 Y3.364 Z0.6
+;AutoTowersGenerator: Using flow rate 110% for this tower section
+;AutoTowersGenerator: Displaying "FLOW 110.0% on the LCD
+M117 FLOW 110.0%
+G1 F2700 E6.33809 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-3.198 Y-2.996 E6.65846 ;AutoTowersGenerator: Extruding 0.32037 mm of filament to achieve a 110% flow rate (originally 0.29125 mm at 100% flow rate)
+G1 X-0.067 Y5.938 E7.00482 ;AutoTowersGenerator: Extruding 0.34636 mm of filament to achieve a 110% flow rate (originally 0.31487 mm at 100% flow rate)
+G1 X-8.625 Y-8.128 E7.60720 ;AutoTowersGenerator: Extruding 0.60238 mm of filament to achieve a 110% flow rate (originally 0.54762 mm at 100% flow rate)
+G1 X-4.601 Y3.941 E8.07264 ;AutoTowersGenerator: Extruding 0.46544 mm of filament to achieve a 110% flow rate (originally 0.42313 mm at 100% flow rate)
+G1 X-8.700 Y4.623 E8.22468 ;AutoTowersGenerator: Extruding 0.15203 mm of filament to achieve a 110% flow rate (originally 0.13821 mm at 100% flow rate)
+G1 X-3.808 Y1.559 E8.43586 ;AutoTowersGenerator: Extruding 0.21119 mm of filament to achieve a 110% flow rate (originally 0.19199 mm at 100% flow rate)
+G1 F2700 E3.43586 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X3.625 Y-1.087
+G1 F2700 E8.43586 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X7.741 Y-3.060 E8.60285 ;AutoTowersGenerator: Extruding 0.16699 mm of filament to achieve a 110% flow rate (originally 0.15181 mm at 100% flow rate)
+G1 X8.813 Y-2.891 E8.64256 ;AutoTowersGenerator: Extruding 0.03971 mm of filament to achieve a 110% flow rate (originally 0.03610 mm at 100% flow rate)
+G1 X2.218 Y-0.126 E8.90418 ;AutoTowersGenerator: Extruding 0.26161 mm of filament to achieve a 110% flow rate (originally 0.23783 mm at 100% flow rate)
+G1 X-5.636 Y-4.251 E9.22877 ;AutoTowersGenerator: Extruding 0.32459 mm of filament to achieve a 110% flow rate (originally 0.29508 mm at 100% flow rate)
+G1 X4.767 Y-2.042 E9.61786 ;AutoTowersGenerator: Extruding 0.38909 mm of filament to achieve a 110% flow rate (originally 0.35372 mm at 100% flow rate)
+G1 X8.336 Y-0.070 E9.76704 ;AutoTowersGenerator: Extruding 0.14918 mm of filament to achieve a 110% flow rate (originally 0.13562 mm at 100% flow rate)
+G1 X-6.673 Y-1.967 E10.32054 ;AutoTowersGenerator: Extruding 0.55350 mm of filament to achieve a 110% flow rate (originally 0.50318 mm at 100% flow rate)
+G1 F2700 E5.32054 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-4.443 Y-7.261
+G1 F2700 E10.32054 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E5.32054 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-4.443 Y-7.261 Z0.8
+;TIME_ELAPSED:20.840683
+;LAYER:3
+G0 F6000 X1.004 Y4.128 Z0.8
+G1 F2700 E10.32054 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X3.654 Y-2.391 E10.57799 ;AutoTowersGenerator: Extruding 0.25745 mm of filament to achieve a 110% flow rate (originally 0.23405 mm at 100% flow rate)
+G1 X-5.385 Y-8.340 E10.97391 ;AutoTowersGenerator: Extruding 0.39591 mm of filament to achieve a 110% flow rate (originally 0.35992 mm at 100% flow rate)
+G1 X-6.974 Y3.170 E11.39903 ;AutoTowersGenerator: Extruding 0.42513 mm of filament to achieve a 110% flow rate (originally 0.38648 mm at 100% flow rate)
+G1 X-9.759 Y6.622 E11.56128 ;AutoTowersGenerator: Extruding 0.16225 mm of filament to achieve a 110% flow rate (originally 0.14750 mm at 100% flow rate)
+G1 X-6.353 Y-4.361 E11.98199 ;AutoTowersGenerator: Extruding 0.42071 mm of filament to achieve a 110% flow rate (originally 0.38246 mm at 100% flow rate)
+G1 X-7.086 Y0.692 E12.16880 ;AutoTowersGenerator: Extruding 0.18681 mm of filament to achieve a 110% flow rate (originally 0.16983 mm at 100% flow rate)
+G1 F2700 E7.16880 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X2.196 Y-3.628
+G1 F2700 E12.16880 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X3.810 Y0.310 E12.32450 ;AutoTowersGenerator: Extruding 0.15569 mm of filament to achieve a 110% flow rate (originally 0.14154 mm at 100% flow rate)
+G1 X2.352 Y3.524 E12.45361 ;AutoTowersGenerator: Extruding 0.12912 mm of filament to achieve a 110% flow rate (originally 0.11738 mm at 100% flow rate)
+G1 X-8.920 Y7.991 E12.89721 ;AutoTowersGenerator: Extruding 0.44360 mm of filament to achieve a 110% flow rate (originally 0.40327 mm at 100% flow rate)
+G1 X5.599 Y7.490 E13.42874 ;AutoTowersGenerator: Extruding 0.53153 mm of filament to achieve a 110% flow rate (originally 0.48321 mm at 100% flow rate)
+G1 X5.957 Y-2.152 E13.78178 ;AutoTowersGenerator: Extruding 0.35303 mm of filament to achieve a 110% flow rate (originally 0.32094 mm at 100% flow rate)
+G1 F2700 E8.78178 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-2.020 Y-7.929
+G1 F2700 E13.78178 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E8.78178 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-2.020 Y-7.929 Z1.0
+;TIME_ELAPSED:28.377841
+;LAYER:4
+G0 F6000 X-8.755 Y-8.653 Z1.0
+G1 F2700 E13.78178 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-1.187 Y-7.801 E14.06038 ;AutoTowersGenerator: Extruding 0.27861 mm of filament to achieve a 110% flow rate (originally 0.25328 mm at 100% flow rate)
+G1 X2.015 Y-7.952 E14.17767 ;AutoTowersGenerator: Extruding 0.11728 mm of filament to achieve a 110% flow rate (originally 0.10662 mm at 100% flow rate)
+G1 X1.336 Y0.732 E14.49638 ;AutoTowersGenerator: Extruding 0.31871 mm of filament to achieve a 110% flow rate (originally 0.28974 mm at 100% flow rate)
+G1 X8.979 Y2.275 E14.78165 ;AutoTowersGenerator: Extruding 0.28527 mm of filament to achieve a 110% flow rate (originally 0.25934 mm at 100% flow rate)
+G1 X-8.594 Y-5.841 E15.48981 ;AutoTowersGenerator: Extruding 0.70816 mm of filament to achieve a 110% flow rate (originally 0.64378 mm at 100% flow rate)
+G1 F2700 E10.48981 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-2.475 Y2.688
+G1 F2700 E15.48981 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X2.046 Y-0.517 E15.69257 ;AutoTowersGenerator: Extruding 0.20276 mm of filament to achieve a 110% flow rate (originally 0.18433 mm at 100% flow rate)
+G1 X-7.693 Y-0.239 E16.04901 ;AutoTowersGenerator: Extruding 0.35643 mm of filament to achieve a 110% flow rate (originally 0.32403 mm at 100% flow rate)
+G1 X9.556 Y-0.392 E16.68012 ;AutoTowersGenerator: Extruding 0.63111 mm of filament to achieve a 110% flow rate (originally 0.57374 mm at 100% flow rate)
+G1 X-3.763 Y-7.118 E17.22603 ;AutoTowersGenerator: Extruding 0.54591 mm of filament to achieve a 110% flow rate (originally 0.49628 mm at 100% flow rate)
+G1 X4.993 Y4.807 E17.76730 ;AutoTowersGenerator: Extruding 0.54127 mm of filament to achieve a 110% flow rate (originally 0.49206 mm at 100% flow rate)
+G1 X-0.428 Y3.841 E17.96875 ;AutoTowersGenerator: Extruding 0.20145 mm of filament to achieve a 110% flow rate (originally 0.18314 mm at 100% flow rate)
+G1 F2700 E12.96875 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X0.327 Y-5.896
+G1 F2700 E17.96875 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E12.96875 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X0.327 Y-5.896 Z1.2
+;TIME_ELAPSED:37.185925
+;LAYER:5
+G0 F6000 X-2.765 Y3.801 Z1.2
+G1 F2700 E17.96875 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X5.163 Y-4.038 E18.37666 ;AutoTowersGenerator: Extruding 0.40791 mm of filament to achieve a 110% flow rate (originally 0.37083 mm at 100% flow rate)
+G1 X2.858 Y-8.180 E18.55007 ;AutoTowersGenerator: Extruding 0.17340 mm of filament to achieve a 110% flow rate (originally 0.15764 mm at 100% flow rate)
+G1 X6.909 Y0.368 E18.89613 ;AutoTowersGenerator: Extruding 0.34606 mm of filament to achieve a 110% flow rate (originally 0.31460 mm at 100% flow rate)
+G1 X8.165 Y-2.886 E19.02374 ;AutoTowersGenerator: Extruding 0.12761 mm of filament to achieve a 110% flow rate (originally 0.11601 mm at 100% flow rate)
+G1 F2700 E14.02374 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-5.544 Y0.831
+G1 F2700 E19.02374 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X2.729 Y2.265 E19.33092 ;AutoTowersGenerator: Extruding 0.30719 mm of filament to achieve a 110% flow rate (originally 0.27926 mm at 100% flow rate)
+G1 X5.768 Y5.166 E19.48466 ;AutoTowersGenerator: Extruding 0.15374 mm of filament to achieve a 110% flow rate (originally 0.13976 mm at 100% flow rate)
+G1 X-6.097 Y-5.212 E20.06140 ;AutoTowersGenerator: Extruding 0.57674 mm of filament to achieve a 110% flow rate (originally 0.52431 mm at 100% flow rate)
+G1 X-1.986 Y6.067 E20.50060 ;AutoTowersGenerator: Extruding 0.43920 mm of filament to achieve a 110% flow rate (originally 0.39927 mm at 100% flow rate)
+G1 X-6.002 Y-0.144 E20.77118 ;AutoTowersGenerator: Extruding 0.27058 mm of filament to achieve a 110% flow rate (originally 0.24598 mm at 100% flow rate)
+G1 X4.620 Y9.792 E21.30331 ;AutoTowersGenerator: Extruding 0.53214 mm of filament to achieve a 110% flow rate (originally 0.48376 mm at 100% flow rate)
+G1 F2700 E16.30331 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X5.802 Y-0.555
+G1 F2700 E21.30331 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E16.30331 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X5.802 Y-0.555 Z1.4
+;TIME_ELAPSED:42.960504
+;LAYER:6
+G0 F6000 X2.103 Y-3.114 Z1.4
+G1 F2700 E21.30331 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X9.100 Y-2.707 E21.55975 ;AutoTowersGenerator: Extruding 0.25644 mm of filament to achieve a 110% flow rate (originally 0.23313 mm at 100% flow rate)
+G1 X-5.591 Y-5.463 E22.10660 ;AutoTowersGenerator: Extruding 0.54684 mm of filament to achieve a 110% flow rate (originally 0.49713 mm at 100% flow rate)
+G1 X-6.066 Y-5.913 E22.13053 ;AutoTowersGenerator: Extruding 0.02394 mm of filament to achieve a 110% flow rate (originally 0.02176 mm at 100% flow rate)
+G1 X2.481 Y8.006 E22.72811 ;AutoTowersGenerator: Extruding 0.59758 mm of filament to achieve a 110% flow rate (originally 0.54325 mm at 100% flow rate)
+G1 X6.809 Y-0.411 E23.07436 ;AutoTowersGenerator: Extruding 0.34625 mm of filament to achieve a 110% flow rate (originally 0.31477 mm at 100% flow rate)
+G1 X3.060 Y5.993 E23.34584 ;AutoTowersGenerator: Extruding 0.27148 mm of filament to achieve a 110% flow rate (originally 0.24680 mm at 100% flow rate)
+G1 F2700 E18.34584 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-8.304 Y3.212
+G1 F2700 E23.34584 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X5.646 Y5.003 E23.86042 ;AutoTowersGenerator: Extruding 0.51458 mm of filament to achieve a 110% flow rate (originally 0.46780 mm at 100% flow rate)
+G1 X-0.439 Y-6.430 E24.33425 ;AutoTowersGenerator: Extruding 0.47384 mm of filament to achieve a 110% flow rate (originally 0.43076 mm at 100% flow rate)
+G1 X5.783 Y-3.350 E24.58825 ;AutoTowersGenerator: Extruding 0.25400 mm of filament to achieve a 110% flow rate (originally 0.23091 mm at 100% flow rate)
+G1 X6.016 Y9.433 E25.05599 ;AutoTowersGenerator: Extruding 0.46774 mm of filament to achieve a 110% flow rate (originally 0.42522 mm at 100% flow rate)
+G1 X-2.083 Y-1.972 E25.56779 ;AutoTowersGenerator: Extruding 0.51180 mm of filament to achieve a 110% flow rate (originally 0.46527 mm at 100% flow rate)
+G1 X8.936 Y4.496 E26.03527 ;AutoTowersGenerator: Extruding 0.46748 mm of filament to achieve a 110% flow rate (originally 0.42498 mm at 100% flow rate)
+G1 X-6.600 Y-7.459 E26.75247 ;AutoTowersGenerator: Extruding 0.71720 mm of filament to achieve a 110% flow rate (originally 0.65200 mm at 100% flow rate)
+G1 F2700 E21.75247 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-6.977 Y8.097
+G1 F2700 E26.75247 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E21.75247 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-6.977 Y8.097 Z1.6
+;TIME_ELAPSED:51.186512
+;LAYER:7
+;AutoTowersGenerator: Starting tower section number 2 at Cura layer number 8 (which is labeled as layer 7 in this gcode file)
+G0 F6000 X-7.077 Y6.530 Z1.6
+;AutoTowersGenerator: Using flow rate 105% for this tower section
+;AutoTowersGenerator: Displaying "FLOW 105.0% on the LCD
+M117 FLOW 105.0%
+G1 F2700 E26.75247 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X3.145 Y-2.992 E27.24034 ;AutoTowersGenerator: Extruding 0.48787 mm of filament to achieve a 105% flow rate (originally 0.46464 mm at 100% flow rate)
+G1 X0.973 Y-7.380 E27.41134 ;AutoTowersGenerator: Extruding 0.17100 mm of filament to achieve a 105% flow rate (originally 0.16286 mm at 100% flow rate)
+G1 X-9.715 Y9.418 E28.10668 ;AutoTowersGenerator: Extruding 0.69533 mm of filament to achieve a 105% flow rate (originally 0.66222 mm at 100% flow rate)
+G1 X2.993 Y0.532 E28.64823 ;AutoTowersGenerator: Extruding 0.54156 mm of filament to achieve a 105% flow rate (originally 0.51577 mm at 100% flow rate)
+G1 X8.672 Y-1.324 E28.85688 ;AutoTowersGenerator: Extruding 0.20865 mm of filament to achieve a 105% flow rate (originally 0.19871 mm at 100% flow rate)
+G1 X7.435 Y6.523 E29.13430 ;AutoTowersGenerator: Extruding 0.27742 mm of filament to achieve a 105% flow rate (originally 0.26421 mm at 100% flow rate)
+G1 X-5.779 Y-4.963 E29.74575 ;AutoTowersGenerator: Extruding 0.61145 mm of filament to achieve a 105% flow rate (originally 0.58233 mm at 100% flow rate)
+G1 F2700 E24.74575 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-4.141 Y-5.189
+G1 F2700 E29.74575 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X-4.813 Y-1.620 E29.87260 ;AutoTowersGenerator: Extruding 0.12685 mm of filament to achieve a 105% flow rate (originally 0.12081 mm at 100% flow rate)
+G1 X-7.379 Y8.200 E30.22706 ;AutoTowersGenerator: Extruding 0.35446 mm of filament to achieve a 105% flow rate (originally 0.33758 mm at 100% flow rate)
+G1 X-2.924 Y-0.837 E30.57891 ;AutoTowersGenerator: Extruding 0.35186 mm of filament to achieve a 105% flow rate (originally 0.33510 mm at 100% flow rate)
+G1 X1.667 Y8.086 E30.92936 ;AutoTowersGenerator: Extruding 0.35045 mm of filament to achieve a 105% flow rate (originally 0.33376 mm at 100% flow rate)
+G1 X-1.587 Y8.354 E31.04339 ;AutoTowersGenerator: Extruding 0.11403 mm of filament to achieve a 105% flow rate (originally 0.10860 mm at 100% flow rate)
+G1 X0.033 Y0.636 E31.31880 ;AutoTowersGenerator: Extruding 0.27541 mm of filament to achieve a 105% flow rate (originally 0.26230 mm at 100% flow rate)
+G1 F2700 E26.31880 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X0.470 Y-9.626
+G1 F2700 E31.31880 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E26.31880 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X0.470 Y-9.626 Z1.8
+;TIME_ELAPSED:57.947012
+;LAYER:8
+G0 F6000 X-6.338 Y-9.921 Z1.8
+G1 F2700 E31.31880 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-6.553 Y-0.530 E31.64686 ;AutoTowersGenerator: Extruding 0.32805 mm of filament to achieve a 105% flow rate (originally 0.31243 mm at 100% flow rate)
+G1 X4.504 Y1.130 E32.03733 ;AutoTowersGenerator: Extruding 0.39047 mm of filament to achieve a 105% flow rate (originally 0.37188 mm at 100% flow rate)
+G1 X-3.480 Y0.367 E32.31743 ;AutoTowersGenerator: Extruding 0.28010 mm of filament to achieve a 105% flow rate (originally 0.26676 mm at 100% flow rate)
+G1 X1.109 Y5.685 E32.56275 ;AutoTowersGenerator: Extruding 0.24532 mm of filament to achieve a 105% flow rate (originally 0.23364 mm at 100% flow rate)
+G1 X-7.878 Y1.206 E32.91342 ;AutoTowersGenerator: Extruding 0.35067 mm of filament to achieve a 105% flow rate (originally 0.33397 mm at 100% flow rate)
+G1 F2700 E27.91342 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-5.030 Y-4.462
+G1 F2700 E32.91342 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X0.154 Y1.235 E33.18241 ;AutoTowersGenerator: Extruding 0.26899 mm of filament to achieve a 105% flow rate (originally 0.25618 mm at 100% flow rate)
+G1 X5.200 Y8.250 E33.48419 ;AutoTowersGenerator: Extruding 0.30178 mm of filament to achieve a 105% flow rate (originally 0.28741 mm at 100% flow rate)
+G1 X-1.135 Y2.251 E33.78888 ;AutoTowersGenerator: Extruding 0.30469 mm of filament to achieve a 105% flow rate (originally 0.29018 mm at 100% flow rate)
+G1 X0.111 Y0.243 E33.87140 ;AutoTowersGenerator: Extruding 0.08252 mm of filament to achieve a 105% flow rate (originally 0.07859 mm at 100% flow rate)
+G1 F2700 E28.87140 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X3.855 Y-0.953
+G1 F2700 E33.87140 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E28.87140 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X3.855 Y-0.953 Z2.0
+;TIME_ELAPSED:65.080154
+;LAYER:9
+G0 F6000 X-0.439 Y8.830 Z2.0
+G1 F2700 E33.87140 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X8.456 Y7.855 E34.18389 ;AutoTowersGenerator: Extruding 0.31249 mm of filament to achieve a 105% flow rate (originally 0.29761 mm at 100% flow rate)
+G1 X-5.948 Y-1.049 E34.77528 ;AutoTowersGenerator: Extruding 0.59139 mm of filament to achieve a 105% flow rate (originally 0.56323 mm at 100% flow rate)
+G1 X-1.667 Y-2.153 E34.92967 ;AutoTowersGenerator: Extruding 0.15439 mm of filament to achieve a 105% flow rate (originally 0.14704 mm at 100% flow rate)
+G1 X-3.680 Y3.423 E35.13670 ;AutoTowersGenerator: Extruding 0.20703 mm of filament to achieve a 105% flow rate (originally 0.19717 mm at 100% flow rate)
+G1 X-1.433 Y-5.746 E35.46639 ;AutoTowersGenerator: Extruding 0.32969 mm of filament to achieve a 105% flow rate (originally 0.31399 mm at 100% flow rate)
+G1 X-3.944 Y-7.553 E35.57443 ;AutoTowersGenerator: Extruding 0.10805 mm of filament to achieve a 105% flow rate (originally 0.10290 mm at 100% flow rate)
+G1 F2700 E30.57443 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X5.539 Y8.790
+G1 F2700 E35.57443 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X-7.140 Y7.657 E36.01899 ;AutoTowersGenerator: Extruding 0.44456 mm of filament to achieve a 105% flow rate (originally 0.42339 mm at 100% flow rate)
+G1 X9.351 Y-5.608 E36.75811 ;AutoTowersGenerator: Extruding 0.73912 mm of filament to achieve a 105% flow rate (originally 0.70392 mm at 100% flow rate)
+G1 X9.050 Y-2.035 E36.88334 ;AutoTowersGenerator: Extruding 0.12523 mm of filament to achieve a 105% flow rate (originally 0.11927 mm at 100% flow rate)
+G1 X-0.255 Y9.797 E37.40902 ;AutoTowersGenerator: Extruding 0.52568 mm of filament to achieve a 105% flow rate (originally 0.50065 mm at 100% flow rate)
+G1 X6.649 Y-6.771 E38.03585 ;AutoTowersGenerator: Extruding 0.62683 mm of filament to achieve a 105% flow rate (originally 0.59698 mm at 100% flow rate)
+G1 X-1.370 Y0.312 E38.40949 ;AutoTowersGenerator: Extruding 0.37363 mm of filament to achieve a 105% flow rate (originally 0.35584 mm at 100% flow rate)
+G1 F2700 E33.40949 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-3.218 Y-6.085
+G1 F2700 E38.40949 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G92 E0
+G1 X-3.629 Y4.443 E0.36795 ;AutoTowersGenerator: Extruding 0.36795 mm of filament to achieve a 105% flow rate (originally 0.35043 mm at 100% flow rate)
+G1 X-9.610 Y1.081 E0.60756 ;AutoTowersGenerator: Extruding 0.23961 mm of filament to achieve a 105% flow rate (originally 0.22820 mm at 100% flow rate)
+G1 X-1.191 Y-9.638 E1.08358 ;AutoTowersGenerator: Extruding 0.47602 mm of filament to achieve a 105% flow rate (originally 0.45335 mm at 100% flow rate)
+G1 F2700 E-3.91642 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-1.191 Y-9.638 Z2.2
+;TIME_ELAPSED:71.406145
+;LAYER:10
+G0 F6000 X2.479 Y0.245 Z2.2
+G1 F2700 E1.08358 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-7.743 Y8.371 E1.53960 ;AutoTowersGenerator: Extruding 0.45603 mm of filament to achieve a 105% flow rate (originally 0.43431 mm at 100% flow rate)
+G1 X-5.429 Y7.528 E1.62561 ;AutoTowersGenerator: Extruding 0.08601 mm of filament to achieve a 105% flow rate (originally 0.08191 mm at 100% flow rate)
+G1 X-8.319 Y-4.562 E2.05971 ;AutoTowersGenerator: Extruding 0.43410 mm of filament to achieve a 105% flow rate (originally 0.41343 mm at 100% flow rate)
+G1 X8.118 Y-6.369 E2.63719 ;AutoTowersGenerator: Extruding 0.57748 mm of filament to achieve a 105% flow rate (originally 0.54998 mm at 100% flow rate)
+G1 F2700 E-2.36281 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X5.116 Y6.396
+G1 F2700 E2.63719 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X-1.881 Y0.732 E2.95155 ;AutoTowersGenerator: Extruding 0.31436 mm of filament to achieve a 105% flow rate (originally 0.29939 mm at 100% flow rate)
+G1 X0.296 Y-0.108 E3.03303 ;AutoTowersGenerator: Extruding 0.08148 mm of filament to achieve a 105% flow rate (originally 0.07760 mm at 100% flow rate)
+G1 X-3.459 Y-4.419 E3.23268 ;AutoTowersGenerator: Extruding 0.19965 mm of filament to achieve a 105% flow rate (originally 0.19014 mm at 100% flow rate)
+G1 X5.992 Y-6.333 E3.56943 ;AutoTowersGenerator: Extruding 0.33676 mm of filament to achieve a 105% flow rate (originally 0.32072 mm at 100% flow rate)
+G1 X7.906 Y-4.622 E3.65910 ;AutoTowersGenerator: Extruding 0.08967 mm of filament to achieve a 105% flow rate (originally 0.08540 mm at 100% flow rate)
+G1 X-9.663 Y-8.229 E4.28546 ;AutoTowersGenerator: Extruding 0.62636 mm of filament to achieve a 105% flow rate (originally 0.59653 mm at 100% flow rate)
+G1 F2700 E-0.71454 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-4.789 Y2.164
+G1 F2700 E4.28546 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E-0.71454 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-4.789 Y2.164 Z2.4
+;TIME_ELAPSED:77.295777
+;LAYER:11
+G0 F6000 X-4.711 Y-7.566 Z2.4
+G1 F2700 E4.28546 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-3.217 Y1.061 E4.59125 ;AutoTowersGenerator: Extruding 0.30579 mm of filament to achieve a 105% flow rate (originally 0.29123 mm at 100% flow rate)
+G1 X8.533 Y-4.643 E5.04740 ;AutoTowersGenerator: Extruding 0.45615 mm of filament to achieve a 105% flow rate (originally 0.43443 mm at 100% flow rate)
+G1 X-7.416 Y0.538 E5.63304 ;AutoTowersGenerator: Extruding 0.58564 mm of filament to achieve a 105% flow rate (originally 0.55775 mm at 100% flow rate)
+G1 X-5.231 Y-7.811 E5.93443 ;AutoTowersGenerator: Extruding 0.30139 mm of filament to achieve a 105% flow rate (originally 0.28704 mm at 100% flow rate)
+G1 F2700 E0.93443 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-6.771 Y-8.992
+G1 F2700 E5.93443 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X8.645 Y2.573 E6.60748 ;AutoTowersGenerator: Extruding 0.67305 mm of filament to achieve a 105% flow rate (originally 0.64100 mm at 100% flow rate)
+G1 X0.622 Y-5.883 E7.01457 ;AutoTowersGenerator: Extruding 0.40708 mm of filament to achieve a 105% flow rate (originally 0.38770 mm at 100% flow rate)
+G1 X-1.086 Y3.443 E7.34566 ;AutoTowersGenerator: Extruding 0.33110 mm of filament to achieve a 105% flow rate (originally 0.31533 mm at 100% flow rate)
+G1 X-4.590 Y6.074 E7.49866 ;AutoTowersGenerator: Extruding 0.15300 mm of filament to achieve a 105% flow rate (originally 0.14571 mm at 100% flow rate)
+G1 X9.890 Y-9.261 E8.23519 ;AutoTowersGenerator: Extruding 0.73653 mm of filament to achieve a 105% flow rate (originally 0.70146 mm at 100% flow rate)
+G1 F2700 E3.23519 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-9.631 Y0.113
+G1 F2700 E8.23519 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E3.23519 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-9.631 Y0.113 Z2.6
+;TIME_ELAPSED:86.207984
+;LAYER:12
+;AutoTowersGenerator: Starting tower section number 3 at Cura layer number 13 (which is labeled as layer 12 in this gcode file)
+G0 F6000 X0.285 Y-5.086 Z2.6
+;AutoTowersGenerator: Using flow rate 100% for this tower section
+;AutoTowersGenerator: Displaying "FLOW 100.0% on the LCD
+M117 FLOW 100.0%
+G1 F2700 E8.23519 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-7.874 Y6.378 E8.70322 ;AutoTowersGenerator: Extruding 0.46803 mm of filament to achieve a 100% flow rate (originally 0.46803 mm at 100% flow rate)
+G1 X-1.356 Y-0.100 E9.00887 ;AutoTowersGenerator: Extruding 0.30565 mm of filament to achieve a 100% flow rate (originally 0.30565 mm at 100% flow rate)
+G1 X6.692 Y-2.138 E9.28502 ;AutoTowersGenerator: Extruding 0.27615 mm of filament to achieve a 100% flow rate (originally 0.27615 mm at 100% flow rate)
+G1 X0.134 Y3.755 E9.57828 ;AutoTowersGenerator: Extruding 0.29326 mm of filament to achieve a 100% flow rate (originally 0.29326 mm at 100% flow rate)
+G1 X9.649 Y-3.146 E9.96922 ;AutoTowersGenerator: Extruding 0.39094 mm of filament to achieve a 100% flow rate (originally 0.39094 mm at 100% flow rate)
+G1 X6.646 Y4.135 E10.23116 ;AutoTowersGenerator: Extruding 0.26194 mm of filament to achieve a 100% flow rate (originally 0.26194 mm at 100% flow rate)
+G1 X2.720 Y-1.906 E10.47078 ;AutoTowersGenerator: Extruding 0.23962 mm of filament to achieve a 100% flow rate (originally 0.23962 mm at 100% flow rate)
+G1 F2700 E5.47078 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-3.049 Y-8.912
+G1 F2700 E10.47078 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X-9.715 Y2.509 E10.91062 ;AutoTowersGenerator: Extruding 0.43984 mm of filament to achieve a 100% flow rate (originally 0.43984 mm at 100% flow rate)
+G1 X7.597 Y-1.385 E11.50080 ;AutoTowersGenerator: Extruding 0.59018 mm of filament to achieve a 100% flow rate (originally 0.59018 mm at 100% flow rate)
+G1 X-8.892 Y3.305 E12.07098 ;AutoTowersGenerator: Extruding 0.57018 mm of filament to achieve a 100% flow rate (originally 0.57018 mm at 100% flow rate)
+G1 X-2.382 Y0.119 E12.31202 ;AutoTowersGenerator: Extruding 0.24104 mm of filament to achieve a 100% flow rate (originally 0.24104 mm at 100% flow rate)
+G1 X9.419 Y1.976 E12.70935 ;AutoTowersGenerator: Extruding 0.39733 mm of filament to achieve a 100% flow rate (originally 0.39733 mm at 100% flow rate)
+G1 F2700 E7.70935 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X3.854 Y-9.095
+G1 F2700 E12.70935 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E7.70935 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X3.854 Y-9.095 Z2.8
+;TIME_ELAPSED:91.949392
+;LAYER:13
+G0 F6000 X-4.619 Y-9.928 Z2.8
+G1 F2700 E12.70935 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X9.236 Y9.452 E13.50171 ;AutoTowersGenerator: Extruding 0.79236 mm of filament to achieve a 100% flow rate (originally 0.79236 mm at 100% flow rate)
+G1 X0.941 Y-5.111 E14.05914 ;AutoTowersGenerator: Extruding 0.55743 mm of filament to achieve a 100% flow rate (originally 0.55743 mm at 100% flow rate)
+G1 X9.313 Y-3.809 E14.34094 ;AutoTowersGenerator: Extruding 0.28180 mm of filament to achieve a 100% flow rate (originally 0.28180 mm at 100% flow rate)
+G1 X-2.868 Y-9.979 E14.79510 ;AutoTowersGenerator: Extruding 0.45416 mm of filament to achieve a 100% flow rate (originally 0.45416 mm at 100% flow rate)
+G1 X-2.367 Y-0.507 E15.11056 ;AutoTowersGenerator: Extruding 0.31546 mm of filament to achieve a 100% flow rate (originally 0.31546 mm at 100% flow rate)
+G1 X0.055 Y-5.980 E15.30964 ;AutoTowersGenerator: Extruding 0.19908 mm of filament to achieve a 100% flow rate (originally 0.19908 mm at 100% flow rate)
+G1 F2700 E10.30964 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X0.095 Y-9.901
+G1 F2700 E15.30964 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X6.341 Y-7.123 E15.53701 ;AutoTowersGenerator: Extruding 0.22737 mm of filament to achieve a 100% flow rate (originally 0.22737 mm at 100% flow rate)
+G1 X1.736 Y-2.120 E15.76315 ;AutoTowersGenerator: Extruding 0.22614 mm of filament to achieve a 100% flow rate (originally 0.22614 mm at 100% flow rate)
+G1 X-4.007 Y2.593 E16.01027 ;AutoTowersGenerator: Extruding 0.24712 mm of filament to achieve a 100% flow rate (originally 0.24712 mm at 100% flow rate)
+G1 X-8.310 Y9.153 E16.27119 ;AutoTowersGenerator: Extruding 0.26092 mm of filament to achieve a 100% flow rate (originally 0.26092 mm at 100% flow rate)
+G1 X7.065 Y-6.895 E17.01038 ;AutoTowersGenerator: Extruding 0.73919 mm of filament to achieve a 100% flow rate (originally 0.73919 mm at 100% flow rate)
+G1 X7.856 Y5.681 E17.42947 ;AutoTowersGenerator: Extruding 0.41909 mm of filament to achieve a 100% flow rate (originally 0.41909 mm at 100% flow rate)
+G1 F2700 E12.42947 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X1.931 Y5.286
+G1 F2700 E17.42947 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E12.42947 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X1.931 Y5.286 Z3.0
+;TIME_ELAPSED:99.832101
+;LAYER:14
+G0 F6000 X-0.116 Y-4.316 Z3.0
+G1 F2700 E17.42947 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X-9.124 Y6.706 E17.90293 ;AutoTowersGenerator: Extruding 0.47346 mm of filament to achieve a 100% flow rate (originally 0.47346 mm at 100% flow rate)
+G1 X7.839 Y2.547 E18.48383 ;AutoTowersGenerator: Extruding 0.58090 mm of filament to achieve a 100% flow rate (originally 0.58090 mm at 100% flow rate)
+G1 X4.677 Y6.244 E18.64565 ;AutoTowersGenerator: Extruding 0.16182 mm of filament to achieve a 100% flow rate (originally 0.16182 mm at 100% flow rate)
+G1 X-7.214 Y0.475 E19.08523 ;AutoTowersGenerator: Extruding 0.43958 mm of filament to achieve a 100% flow rate (originally 0.43958 mm at 100% flow rate)
+G1 X0.087 Y6.699 E19.40432 ;AutoTowersGenerator: Extruding 0.31909 mm of filament to achieve a 100% flow rate (originally 0.31909 mm at 100% flow rate)
+G1 F2700 E14.40432 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X6.094 Y6.528
+G1 F2700 E19.40432 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X-8.298 Y-9.163 E20.11248 ;AutoTowersGenerator: Extruding 0.70816 mm of filament to achieve a 100% flow rate (originally 0.70816 mm at 100% flow rate)
+G1 X2.742 Y9.190 E20.82484 ;AutoTowersGenerator: Extruding 0.71236 mm of filament to achieve a 100% flow rate (originally 0.71236 mm at 100% flow rate)
+G1 X-2.468 Y-0.972 E21.20468 ;AutoTowersGenerator: Extruding 0.37984 mm of filament to achieve a 100% flow rate (originally 0.37984 mm at 100% flow rate)
+G1 X-8.984 Y-9.623 E21.56491 ;AutoTowersGenerator: Extruding 0.36023 mm of filament to achieve a 100% flow rate (originally 0.36023 mm at 100% flow rate)
+G1 X0.629 Y-5.109 E21.91815 ;AutoTowersGenerator: Extruding 0.35324 mm of filament to achieve a 100% flow rate (originally 0.35324 mm at 100% flow rate)
+G1 F2700 E16.91815 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-4.724 Y-0.861
+G1 F2700 E21.91815 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E16.91815 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-4.724 Y-0.861 Z3.2
+;TIME_ELAPSED:105.112547
+;LAYER:15
+G0 F6000 X8.650 Y7.957 Z3.2
+G1 F2700 E21.91815 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:WALL-OUTER
+G1 F1200 X3.186 Y-8.679 E22.50055 ;AutoTowersGenerator: Extruding 0.58240 mm of filament to achieve a 100% flow rate (originally 0.58240 mm at 100% flow rate)
+G1 X4.736 Y-4.956 E22.63467 ;AutoTowersGenerator: Extruding 0.13412 mm of filament to achieve a 100% flow rate (originally 0.13412 mm at 100% flow rate)
+G1 X-8.511 Y-4.689 E23.07535 ;AutoTowersGenerator: Extruding 0.44068 mm of filament to achieve a 100% flow rate (originally 0.44068 mm at 100% flow rate)
+G1 X4.587 Y-5.896 E23.51282 ;AutoTowersGenerator: Extruding 0.43747 mm of filament to achieve a 100% flow rate (originally 0.43747 mm at 100% flow rate)
+G1 F2700 E18.51282 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X4.797 Y9.515
+G1 F2700 E23.51282 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+;TYPE:SKIN
+G1 F1200 X6.911 Y-8.465 E24.11495 ;AutoTowersGenerator: Extruding 0.60213 mm of filament to achieve a 100% flow rate (originally 0.60213 mm at 100% flow rate)
+G1 X8.209 Y-4.254 E24.26154 ;AutoTowersGenerator: Extruding 0.14659 mm of filament to achieve a 100% flow rate (originally 0.14659 mm at 100% flow rate)
+G1 X-9.065 Y2.656 E24.88034 ;AutoTowersGenerator: Extruding 0.61880 mm of filament to achieve a 100% flow rate (originally 0.61880 mm at 100% flow rate)
+G1 X-6.034 Y1.994 E24.98352 ;AutoTowersGenerator: Extruding 0.10318 mm of filament to achieve a 100% flow rate (originally 0.10318 mm at 100% flow rate)
+G1 X-3.365 Y3.031 E25.07877 ;AutoTowersGenerator: Extruding 0.09525 mm of filament to achieve a 100% flow rate (originally 0.09525 mm at 100% flow rate)
+G1 X3.858 Y2.423 E25.31984 ;AutoTowersGenerator: Extruding 0.24107 mm of filament to achieve a 100% flow rate (originally 0.24107 mm at 100% flow rate)
+G1 X-7.331 Y-0.352 E25.70325 ;AutoTowersGenerator: Extruding 0.38341 mm of filament to achieve a 100% flow rate (originally 0.38341 mm at 100% flow rate)
+G1 F2700 E20.70325 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+G0 F6000 X-0.284 Y9.450
+G1 F2700 E25.70325 ;AutoTowersGenerator: Extruding 5.00000 mm of filament to reverse the last retraction
+G1 F2700 E20.70325 ;AutoTowersGenerator: Retracting 5.00000 mm of filament
+;MESH:NONMESH
+G0 F6000 X-0.284 Y9.450 Z3.4
+;TIME_ELAPSED:110.510623
+M140 S0
+M107
+G91 ;Relative positioning
+G1 E-2 F2700 ;Retract a bit
+G1 E-2 Z0.2 F2400 ;Retract and raise Z
+G1 X5 Y5 F3000 ;Wipe out
+G1 Z10 ;Raise Z more
+G90 ;Absolute positioning
+G1 X0 Y235 ;Present print
+M106 S0 ;Turn-off fan
+M104 S0 ;Turn-off hotend
+M140 S0 ;Turn-off bed
+M84 X Y E ;Disable all steppers but Z
+M104 S0
+;End of Gcode
@@ -0,0 +1,448 @@
+;Generated with Cura_SteamEngine 5.4.0
+M140 S60
+M105
+M190 S60
+M104 S200
+M105
+M109 S200
+M82 ;absolute extrusion mode
+G28 ;Home
+G1 Z15.0 F6000 ;Move the platform down 15mm
+G92 E0
+G1 F200 E3.00000
+G92 E0
+;LAYER_COUNT:16
+;LAYER:0
+G0 F3000 X-3.523 Y-6.983 Z0.2
+;TYPE:WALL-OUTER
+G1 F1200 X-8.551 Y0.718 E0.35176
+G1 X-2.686 Y-8.840 E0.78068
+G1 X0.149 Y-9.250 E0.89024
+G1 X-1.327 Y-8.603 E0.95188
+G1 F2700 E-4.04812
+G0 F6000 X-8.186 Y-1.510
+G1 F2700 E0.95188
+;TYPE:SKIN
+G1 F1200 X8.949 Y2.613 E1.62596
+G1 X1.660 Y-8.763 E2.14271
+G1 X1.711 Y-9.008 E2.15231
+G1 X-5.578 Y1.133 E2.63002
+G1 F2700 E-2.36998
+G0 F6000 X-7.337 Y-1.617
+G1 F2700 E2.63002
+G1 F2700 E-2.36998
+;MESH:NONMESH
+G0 F6000 X-7.337 Y-1.617 Z0.4
+;TIME_ELAPSED:7.162744
+;LAYER:1
+M106 S255
+G0 F6000 X1.418 Y1.205 Z0.4
+G1 F2700 E2.63002
+;TYPE:WALL-OUTER
+G1 F1200 X-7.939 Y1.424 E2.98801
+G1 X-6.243 Y-8.051 E3.35619
+G1 X4.242 Y1.287 E3.89324
+G1 X2.380 Y-0.072 E3.98141
+G1 X0.634 Y5.545 E4.20638
+G1 F2700 E-0.79362
+G0 F6000 X-0.688 Y8.469
+G1 F2700 E4.20638
+;TYPE:SKIN
+G1 F1200 X-4.005 Y5.888 E4.36712
+G1 X3.980 Y-5.118 E4.88720
+G1 X1.488 Y0.504 E5.12240
+G1 X7.503 Y4.589 E5.40049
+G1 X-4.241 Y9.603 E5.88892
+G1 X-7.639 Y-1.638 E6.33809
+G1 F2700 E1.33809
+G0 F6000 X5.143 Y-6.960
+G1 F2700 E6.33809
+G1 F2700 E1.33809
+;MESH:NONMESH
+G0 F6000 X5.143 Y-6.960 Z0.6
+;TIME_ELAPSED:14.118596
+;LAYER:2
+G0 F6000 X-9.216 Y3.364 Z0.6
+G1 F2700 E6.33809
+;TYPE:WALL-OUTER
+G1 F1200 X-3.198 Y-2.996 E6.65846
+G1 X-0.067 Y5.938 E7.00482
+G1 X-8.625 Y-8.128 E7.60720
+G1 X-4.601 Y3.941 E8.07264
+G1 X-8.700 Y4.623 E8.22467
+G1 X-3.808 Y1.559 E8.43586
+G1 F2700 E3.43586
+G0 F6000 X3.625 Y-1.087
+G1 F2700 E8.43586
+;TYPE:SKIN
+G1 F1200 X7.741 Y-3.060 E8.60285
+G1 X8.813 Y-2.891 E8.64256
+G1 X2.218 Y-0.126 E8.90418
+G1 X-5.636 Y-4.251 E9.22877
+G1 X4.767 Y-2.042 E9.61786
+G1 X8.336 Y-0.070 E9.76704
+G1 X-6.673 Y-1.967 E10.32054
+G1 F2700 E5.32054
+G0 F6000 X-4.443 Y-7.261
+G1 F2700 E10.32054
+G1 F2700 E5.32054
+;MESH:NONMESH
+G0 F6000 X-4.443 Y-7.261 Z0.8
+;TIME_ELAPSED:20.840683
+;LAYER:3
+G0 F6000 X1.004 Y4.128 Z0.8
+G1 F2700 E10.32054
+;TYPE:WALL-OUTER
+G1 F1200 X3.654 Y-2.391 E10.57799
+G1 X-5.385 Y-8.340 E10.97390
+G1 X-6.974 Y3.170 E11.39903
+G1 X-9.759 Y6.622 E11.56128
+G1 X-6.353 Y-4.361 E11.98199
+G1 X-7.086 Y0.692 E12.16880
+G1 F2700 E7.16880
+G0 F6000 X2.196 Y-3.628
+G1 F2700 E12.16880
+;TYPE:SKIN
+G1 F1200 X3.810 Y0.310 E12.32450
+G1 X2.352 Y3.524 E12.45361
+G1 X-8.920 Y7.991 E12.89721
+G1 X5.599 Y7.490 E13.42874
+G1 X5.957 Y-2.152 E13.78178
+G1 F2700 E8.78178
+G0 F6000 X-2.020 Y-7.929
+G1 F2700 E13.78178
+G1 F2700 E8.78178
+;MESH:NONMESH
+G0 F6000 X-2.020 Y-7.929 Z1.0
+;TIME_ELAPSED:28.377841
+;LAYER:4
+G0 F6000 X-8.755 Y-8.653 Z1.0
+G1 F2700 E13.78178
+;TYPE:WALL-OUTER
+G1 F1200 X-1.187 Y-7.801 E14.06038
+G1 X2.015 Y-7.952 E14.17767
+G1 X1.336 Y0.732 E14.49638
+G1 X8.979 Y2.275 E14.78165
+G1 X-8.594 Y-5.841 E15.48981
+G1 F2700 E10.48981
+G0 F6000 X-2.475 Y2.688
+G1 F2700 E15.48981
+;TYPE:SKIN
+G1 F1200 X2.046 Y-0.517 E15.69257
+G1 X-7.693 Y-0.239 E16.04901
+G1 X9.556 Y-0.392 E16.68012
+G1 X-3.763 Y-7.118 E17.22603
+G1 X4.993 Y4.807 E17.76730
+G1 X-0.428 Y3.841 E17.96875
+G1 F2700 E12.96875
+G0 F6000 X0.327 Y-5.896
+G1 F2700 E17.96875
+G1 F2700 E12.96875
+;MESH:NONMESH
+G0 F6000 X0.327 Y-5.896 Z1.2
+;TIME_ELAPSED:37.185925
+;LAYER:5
+G0 F6000 X-2.765 Y3.801 Z1.2
+G1 F2700 E17.96875
+;TYPE:WALL-OUTER
+G1 F1200 X5.163 Y-4.038 E18.37666
+G1 X2.858 Y-8.180 E18.55007
+G1 X6.909 Y0.368 E18.89613
+G1 X8.165 Y-2.886 E19.02374
+G1 F2700 E14.02374
+G0 F6000 X-5.544 Y0.831
+G1 F2700 E19.02374
+;TYPE:SKIN
+G1 F1200 X2.729 Y2.265 E19.33092
+G1 X5.768 Y5.166 E19.48466
+G1 X-6.097 Y-5.212 E20.06140
+G1 X-1.986 Y6.067 E20.50060
+G1 X-6.002 Y-0.144 E20.77118
+G1 X4.620 Y9.792 E21.30331
+G1 F2700 E16.30331
+G0 F6000 X5.802 Y-0.555
+G1 F2700 E21.30331
+G1 F2700 E16.30331
+;MESH:NONMESH
+G0 F6000 X5.802 Y-0.555 Z1.4
+;TIME_ELAPSED:42.960504
+;LAYER:6
+G0 F6000 X2.103 Y-3.114 Z1.4
+G1 F2700 E21.30331
+;TYPE:WALL-OUTER
+G1 F1200 X9.100 Y-2.707 E21.55976
+G1 X-5.591 Y-5.463 E22.10660
+G1 X-6.066 Y-5.913 E22.13053
+G1 X2.481 Y8.006 E22.72811
+G1 X6.809 Y-0.411 E23.07436
+G1 X3.060 Y5.993 E23.34584
+G1 F2700 E18.34584
+G0 F6000 X-8.304 Y3.212
+G1 F2700 E23.34584
+;TYPE:SKIN
+G1 F1200 X5.646 Y5.003 E23.86042
+G1 X-0.439 Y-6.430 E24.33425
+G1 X5.783 Y-3.350 E24.58825
+G1 X6.016 Y9.433 E25.05600
+G1 X-2.083 Y-1.972 E25.56779
+G1 X8.936 Y4.496 E26.03527
+G1 X-6.600 Y-7.459 E26.75247
+G1 F2700 E21.75247
+G0 F6000 X-6.977 Y8.097
+G1 F2700 E26.75247
+G1 F2700 E21.75247
+;MESH:NONMESH
+G0 F6000 X-6.977 Y8.097 Z1.6
+;TIME_ELAPSED:51.186512
+;LAYER:7
+G0 F6000 X-7.077 Y6.530 Z1.6
+G1 F2700 E26.75247
+;TYPE:WALL-OUTER
+G1 F1200 X3.145 Y-2.992 E27.24034
+G1 X0.973 Y-7.380 E27.41135
+G1 X-9.715 Y9.418 E28.10668
+G1 X2.993 Y0.532 E28.64823
+G1 X8.672 Y-1.324 E28.85688
+G1 X7.435 Y6.523 E29.13430
+G1 X-5.779 Y-4.963 E29.74575
+G1 F2700 E24.74575
+G0 F6000 X-4.141 Y-5.189
+G1 F2700 E29.74575
+;TYPE:SKIN
+G1 F1200 X-4.813 Y-1.620 E29.87260
+G1 X-7.379 Y8.200 E30.22706
+G1 X-2.924 Y-0.837 E30.57891
+G1 X1.667 Y8.086 E30.92936
+G1 X-1.587 Y8.354 E31.04339
+G1 X0.033 Y0.636 E31.31880
+G1 F2700 E26.31880
+G0 F6000 X0.470 Y-9.626
+G1 F2700 E31.31880
+G1 F2700 E26.31880
+;MESH:NONMESH
+G0 F6000 X0.470 Y-9.626 Z1.8
+;TIME_ELAPSED:57.947012
+;LAYER:8
+G0 F6000 X-6.338 Y-9.921 Z1.8
+G1 F2700 E31.31880
+;TYPE:WALL-OUTER
+G1 F1200 X-6.553 Y-0.530 E31.64686
+G1 X4.504 Y1.130 E32.03733
+G1 X-3.480 Y0.367 E32.31743
+G1 X1.109 Y5.685 E32.56275
+G1 X-7.878 Y1.206 E32.91342
+G1 F2700 E27.91342
+G0 F6000 X-5.030 Y-4.462
+G1 F2700 E32.91342
+;TYPE:SKIN
+G1 F1200 X0.154 Y1.235 E33.18241
+G1 X5.200 Y8.250 E33.48419
+G1 X-1.135 Y2.251 E33.78888
+G1 X0.111 Y0.243 E33.87140
+G1 F2700 E28.87140
+G0 F6000 X3.855 Y-0.953
+G1 F2700 E33.87140
+G1 F2700 E28.87140
+;MESH:NONMESH
+G0 F6000 X3.855 Y-0.953 Z2.0
+;TIME_ELAPSED:65.080154
+;LAYER:9
+G0 F6000 X-0.439 Y8.830 Z2.0
+G1 F2700 E33.87140
+;TYPE:WALL-OUTER
+G1 F1200 X8.456 Y7.855 E34.18389
+G1 X-5.948 Y-1.049 E34.77528
+G1 X-1.667 Y-2.153 E34.92967
+G1 X-3.680 Y3.423 E35.13670
+G1 X-1.433 Y-5.746 E35.46639
+G1 X-3.944 Y-7.553 E35.57443
+G1 F2700 E30.57443
+G0 F6000 X5.539 Y8.790
+G1 F2700 E35.57443
+;TYPE:SKIN
+G1 F1200 X-7.140 Y7.657 E36.01899
+G1 X9.351 Y-5.608 E36.75811
+G1 X9.050 Y-2.035 E36.88334
+G1 X-0.255 Y9.797 E37.40902
+G1 X6.649 Y-6.771 E38.03585
+G1 X-1.370 Y0.312 E38.40949
+G1 F2700 E33.40949
+G0 F6000 X-3.218 Y-6.085
+G1 F2700 E38.40949
+G92 E0
+G1 X-3.629 Y4.443 E0.36795
+G1 X-9.610 Y1.081 E0.60756
+G1 X-1.191 Y-9.638 E1.08358
+G1 F2700 E-3.91642
+;MESH:NONMESH
+G0 F6000 X-1.191 Y-9.638 Z2.2
+;TIME_ELAPSED:71.406145
+;LAYER:10
+G0 F6000 X2.479 Y0.245 Z2.2
+G1 F2700 E1.08358
+;TYPE:WALL-OUTER
+G1 F1200 X-7.743 Y8.371 E1.53960
+G1 X-5.429 Y7.528 E1.62561
+G1 X-8.319 Y-4.562 E2.05971
+G1 X8.118 Y-6.369 E2.63719
+G1 F2700 E-2.36281
+G0 F6000 X5.116 Y6.396
+G1 F2700 E2.63719
+;TYPE:SKIN
+G1 F1200 X-1.881 Y0.732 E2.95155
+G1 X0.296 Y-0.108 E3.03303
+G1 X-3.459 Y-4.419 E3.23268
+G1 X5.992 Y-6.333 E3.56943
+G1 X7.906 Y-4.622 E3.65910
+G1 X-9.663 Y-8.229 E4.28546
+G1 F2700 E-0.71454
+G0 F6000 X-4.789 Y2.164
+G1 F2700 E4.28546
+G1 F2700 E-0.71454
+;MESH:NONMESH
+G0 F6000 X-4.789 Y2.164 Z2.4
+;TIME_ELAPSED:77.295777
+;LAYER:11
+G0 F6000 X-4.711 Y-7.566 Z2.4
+G1 F2700 E4.28546
+;TYPE:WALL-OUTER
+G1 F1200 X-3.217 Y1.061 E4.59125
+G1 X8.533 Y-4.643 E5.04740
+G1 X-7.416 Y0.538 E5.63304
+G1 X-5.231 Y-7.811 E5.93443
+G1 F2700 E0.93443
+G0 F6000 X-6.771 Y-8.992
+G1 F2700 E5.93443
+;TYPE:SKIN
+G1 F1200 X8.645 Y2.573 E6.60748
+G1 X0.622 Y-5.883 E7.01457
+G1 X-1.086 Y3.443 E7.34566
+G1 X-4.590 Y6.074 E7.49866
+G1 X9.890 Y-9.261 E8.23519
+G1 F2700 E3.23519
+G0 F6000 X-9.631 Y0.113
+G1 F2700 E8.23519
+G1 F2700 E3.23519
+;MESH:NONMESH
+G0 F6000 X-9.631 Y0.113 Z2.6
+;TIME_ELAPSED:86.207984
+;LAYER:12
+G0 F6000 X0.285 Y-5.086 Z2.6
+G1 F2700 E8.23519
+;TYPE:WALL-OUTER
+G1 F1200 X-7.874 Y6.378 E8.70322
+G1 X-1.356 Y-0.100 E9.00887
+G1 X6.692 Y-2.138 E9.28502
+G1 X0.134 Y3.755 E9.57828
+G1 X9.649 Y-3.146 E9.96922
+G1 X6.646 Y4.135 E10.23116
+G1 X2.720 Y-1.906 E10.47078
+G1 F2700 E5.47078
+G0 F6000 X-3.049 Y-8.912
+G1 F2700 E10.47078
+;TYPE:SKIN
+G1 F1200 X-9.715 Y2.509 E10.91062
+G1 X7.597 Y-1.385 E11.50080
+G1 X-8.892 Y3.305 E12.07098
+G1 X-2.382 Y0.119 E12.31202
+G1 X9.419 Y1.976 E12.70935
+G1 F2700 E7.70935
+G0 F6000 X3.854 Y-9.095
+G1 F2700 E12.70935
+G1 F2700 E7.70935
+;MESH:NONMESH
+G0 F6000 X3.854 Y-9.095 Z2.8
+;TIME_ELAPSED:91.949392
+;LAYER:13
+G0 F6000 X-4.619 Y-9.928 Z2.8
+G1 F2700 E12.70935
+;TYPE:WALL-OUTER
+G1 F1200 X9.236 Y9.452 E13.50171
+G1 X0.941 Y-5.111 E14.05914
+G1 X9.313 Y-3.809 E14.34094
+G1 X-2.868 Y-9.979 E14.79510
+G1 X-2.367 Y-0.507 E15.11056
+G1 X0.055 Y-5.980 E15.30964
+G1 F2700 E10.30964
+G0 F6000 X0.095 Y-9.901
+G1 F2700 E15.30964
+;TYPE:SKIN
+G1 F1200 X6.341 Y-7.123 E15.53701
+G1 X1.736 Y-2.120 E15.76315
+G1 X-4.007 Y2.593 E16.01027
+G1 X-8.310 Y9.153 E16.27119
+G1 X7.065 Y-6.895 E17.01038
+G1 X7.856 Y5.681 E17.42947
+G1 F2700 E12.42947
+G0 F6000 X1.931 Y5.286
+G1 F2700 E17.42947
+G1 F2700 E12.42947
+;MESH:NONMESH
+G0 F6000 X1.931 Y5.286 Z3.0
+;TIME_ELAPSED:99.832101
+;LAYER:14
+G0 F6000 X-0.116 Y-4.316 Z3.0
+G1 F2700 E17.42947
+;TYPE:WALL-OUTER
+G1 F1200 X-9.124 Y6.706 E17.90293
+G1 X7.839 Y2.547 E18.48383
+G1 X4.677 Y6.244 E18.64565
+G1 X-7.214 Y0.475 E19.08523
+G1 X0.087 Y6.699 E19.40432
+G1 F2700 E14.40432
+G0 F6000 X6.094 Y6.528
+G1 F2700 E19.40432
+;TYPE:SKIN
+G1 F1200 X-8.298 Y-9.163 E20.11248
+G1 X2.742 Y9.190 E20.82484
+G1 X-2.468 Y-0.972 E21.20468
+G1 X-8.984 Y-9.623 E21.56491
+G1 X0.629 Y-5.109 E21.91815
+G1 F2700 E16.91815
+G0 F6000 X-4.724 Y-0.861
+G1 F2700 E21.91815
+G1 F2700 E16.91815
+;MESH:NONMESH
+G0 F6000 X-4.724 Y-0.861 Z3.2
+;TIME_ELAPSED:105.112547
+;LAYER:15
+G0 F6000 X8.650 Y7.957 Z3.2
+G1 F2700 E21.91815
+;TYPE:WALL-OUTER
+G1 F1200 X3.186 Y-8.679 E22.50055
+G1 X4.736 Y-4.956 E22.63467
+G1 X-8.511 Y-4.689 E23.07535
+G1 X4.587 Y-5.896 E23.51282
+G1 F2700 E18.51282
+G0 F6000 X4.797 Y9.515
+G1 F2700 E23.51282
+;TYPE:SKIN
+G1 F1200 X6.911 Y-8.465 E24.11495
+G1 X8.209 Y-4.254 E24.26154
+G1 X-9.065 Y2.656 E24.88034
+G1 X-6.034 Y1.994 E24.98352
+G1 X-3.365 Y3.031 E25.07877
+G1 X3.858 Y2.423 E25.31984
+G1 X-7.331 Y-0.352 E25.70325
+G1 F2700 E20.70325
+G0 F6000 X-0.284 Y9.450
+G1 F2700 E25.70325
+G1 F2700 E20.70325
+;MESH:NONMESH
+G0 F6000 X-0.284 Y9.450 Z3.4
+;TIME_ELAPSED:110.510623
+M140 S0
+M107
+G91 ;Relative positioning
+G1 E-2 F2700 ;Retract a bit
+G1 E-2 Z0.2 F2400 ;Retract and raise Z
+G1 X5 Y5 F3000 ;Wipe out
+G1 Z10 ;Raise Z more
+G90 ;Absolute positioning
+G1 X0 Y235 ;Present print
+M106 S0 ;Turn-off fan
+M104 S0 ;Turn-off hotend
+M140 S0 ;Turn-off bed
+M84 X Y E ;Disable all steppers but Z
+M104 S0
+;End of Gcode
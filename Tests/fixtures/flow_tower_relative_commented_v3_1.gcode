@@ -0,0 +1,460 @@
+;Generated with Cura_SteamEngine 5.4.0
+M140 S60
+M105
+M190 S60
+M104 S200
+M105
+M109 S200
+M83 ;relative extrusion mode
+G28 ;Home
+G1 Z15.0 F6000 ;Move the platform down 15mm
+G92 E0
+G1 F200 E3
+G92 E0
+;LAYER_COUNT:16
+;LAYER:0
+G0 F3000 X-3.523 Y-6.983 Z0.2
+;TYPE:WALL-OUTER
+G1 F1200 X-8.551 Y0.718 E0.35176 ;AutoTowersGenerator: Extruding 0.35176 mm of filament to achieve a 115% flow rate (originally 0.30588 mm at 100% flow rate)
+G1 X-2.686 Y-8.840 E0.42892 ;AutoTowersGenerator: Extruding 0.42892 mm of filament to achieve a 115% flow rate (originally 0.37297 mm at 100% flow rate)
+G1 X0.149 Y-9.250 E0.10956 ;AutoTowersGenerator: Extruding 0.10956 mm of filament to achieve a 115% flow rate (originally 0.09527 mm at 100% flow rate)
+G1 X-1.327 Y-8.603 E0.06164 ;AutoTowersGenerator: Extruding 0.06164 mm of filament to achieve a 115% flow rate (originally 0.05360 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-8.186 Y-1.510
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X8.949 Y2.613 E0.67408 ;AutoTowersGenerator: Extruding 0.67408 mm of filament to achieve a 115% flow rate (originally 0.58616 mm at 100% flow rate)
+G1 X1.660 Y-8.763 E0.51675 ;AutoTowersGenerator: Extruding 0.51675 mm of filament to achieve a 115% flow rate (originally 0.44935 mm at 100% flow rate)
+G1 X1.711 Y-9.008 E0.00959 ;AutoTowersGenerator: Extruding 0.00959 mm of filament to achieve a 115% flow rate (originally 0.00834 mm at 100% flow rate)
+G1 X-5.578 Y1.133 E0.47770 ;AutoTowersGenerator: Extruding 0.47770 mm of filament to achieve a 115% flow rate (originally 0.41539 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-7.337 Y-1.617
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-7.337 Y-1.617 Z0.4
+;TIME_ELAPSED:7.162744
+;LAYER:1
+M106 S255
+G0 F6000 X1.418 Y1.205 Z0.4
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-7.939 Y1.424 E0.35800 ;AutoTowersGenerator: Extruding 0.35800 mm of filament to achieve a 115% flow rate (originally 0.31130 mm at 100% flow rate)
+G1 X-6.243 Y-8.051 E0.36818 ;AutoTowersGenerator: Extruding 0.36818 mm of filament to achieve a 115% flow rate (originally 0.32016 mm at 100% flow rate)
+G1 X4.242 Y1.287 E0.53705 ;AutoTowersGenerator: Extruding 0.53705 mm of filament to achieve a 115% flow rate (originally 0.46700 mm at 100% flow rate)
+G1 X2.380 Y-0.072 E0.08817 ;AutoTowersGenerator: Extruding 0.08817 mm of filament to achieve a 115% flow rate (originally 0.07667 mm at 100% flow rate)
+G1 X0.634 Y5.545 E0.22495 ;AutoTowersGenerator: Extruding 0.22495 mm of filament to achieve a 115% flow rate (originally 0.19561 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-0.688 Y8.469
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-4.005 Y5.888 E0.16075 ;AutoTowersGenerator: Extruding 0.16075 mm of filament to achieve a 115% flow rate (originally 0.13978 mm at 100% flow rate)
+G1 X3.980 Y-5.118 E0.52008 ;AutoTowersGenerator: Extruding 0.52008 mm of filament to achieve a 115% flow rate (originally 0.45224 mm at 100% flow rate)
+G1 X1.488 Y0.504 E0.23521 ;AutoTowersGenerator: Extruding 0.23521 mm of filament to achieve a 115% flow rate (originally 0.20453 mm at 100% flow rate)
+G1 X7.503 Y4.589 E0.27808 ;AutoTowersGenerator: Extruding 0.27808 mm of filament to achieve a 115% flow rate (originally 0.24181 mm at 100% flow rate)
+G1 X-4.241 Y9.603 E0.48843 ;AutoTowersGenerator: Extruding 0.48843 mm of filament to achieve a 115% flow rate (originally 0.42472 mm at 100% flow rate)
+G1 X-7.639 Y-1.638 E0.44917 ;AutoTowersGenerator: Extruding 0.44917 mm of filament to achieve a 115% flow rate (originally 0.39058 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X5.143 Y-6.960
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X5.143 Y-6.960 Z0.6
+;TIME_ELAPSED:14.118596
+;LAYER:2
+;AutoTowersGenerator: Starting tower section number 1 at Cura layer number 3 (which is labeled as layer 2 in this gcode file)
+G0 F6000 X-9.216 Y3.364 Z0.6
+;AutoTowersGenerator: Using flow rate 110% for this tower section
+;AutoTowersGenerator: Displaying "FLOW 110.0% on the LCD
+M117 FLOW 110.0%
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-3.198 Y-2.996 E0.32038 ;AutoTowersGenerator: Extruding 0.32038 mm of filament to achieve a 110% flow rate (originally 0.29125 mm at 100% flow rate)
+G1 X-0.067 Y5.938 E0.34636 ;AutoTowersGenerator: Extruding 0.34636 mm of filament to achieve a 110% flow rate (originally 0.31487 mm at 100% flow rate)
+G1 X-8.625 Y-8.128 E0.60238 ;AutoTowersGenerator: Extruding 0.60238 mm of filament to achieve a 110% flow rate (originally 0.54762 mm at 100% flow rate)
+G1 X-4.601 Y3.941 E0.46544 ;AutoTowersGenerator: Extruding 0.46544 mm of filament to achieve a 110% flow rate (originally 0.42313 mm at 100% flow rate)
+G1 X-8.700 Y4.623 E0.15202 ;AutoTowersGenerator: Extruding 0.15202 mm of filament to achieve a 110% flow rate (originally 0.13820 mm at 100% flow rate)
+G1 X-3.808 Y1.559 E0.21120 ;AutoTowersGenerator: Extruding 0.21120 mm of filament to achieve a 110% flow rate (originally 0.19200 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X3.625 Y-1.087
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X7.741 Y-3.060 E0.16699 ;AutoTowersGenerator: Extruding 0.16699 mm of filament to achieve a 110% flow rate (originally 0.15181 mm at 100% flow rate)
+G1 X8.813 Y-2.891 E0.03971 ;AutoTowersGenerator: Extruding 0.03971 mm of filament to achieve a 110% flow rate (originally 0.03610 mm at 100% flow rate)
+G1 X2.218 Y-0.126 E0.26161 ;AutoTowersGenerator: Extruding 0.26161 mm of filament to achieve a 110% flow rate (originally 0.23783 mm at 100% flow rate)
+G1 X-5.636 Y-4.251 E0.32458 ;AutoTowersGenerator: Extruding 0.32458 mm of filament to achieve a 110% flow rate (originally 0.29507 mm at 100% flow rate)
+G1 X4.767 Y-2.042 E0.38909 ;AutoTowersGenerator: Extruding 0.38909 mm of filament to achieve a 110% flow rate (originally 0.35372 mm at 100% flow rate)
+G1 X8.336 Y-0.070 E0.14918 ;AutoTowersGenerator: Extruding 0.14918 mm of filament to achieve a 110% flow rate (originally 0.13562 mm at 100% flow rate)
+G1 X-6.673 Y-1.967 E0.55349 ;AutoTowersGenerator: Extruding 0.55349 mm of filament to achieve a 110% flow rate (originally 0.50317 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-4.443 Y-7.261
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-4.443 Y-7.261 Z0.8
+;TIME_ELAPSED:20.840683
+;LAYER:3
+G0 F6000 X1.004 Y4.128 Z0.8
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X3.654 Y-2.391 E0.25747 ;AutoTowersGenerator: Extruding 0.25747 mm of filament to achieve a 110% flow rate (originally 0.23406 mm at 100% flow rate)
+G1 X-5.385 Y-8.340 E0.39591 ;AutoTowersGenerator: Extruding 0.39591 mm of filament to achieve a 110% flow rate (originally 0.35992 mm at 100% flow rate)
+G1 X-6.974 Y3.170 E0.42512 ;AutoTowersGenerator: Extruding 0.42512 mm of filament to achieve a 110% flow rate (originally 0.38647 mm at 100% flow rate)
+G1 X-9.759 Y6.622 E0.16225 ;AutoTowersGenerator: Extruding 0.16225 mm of filament to achieve a 110% flow rate (originally 0.14750 mm at 100% flow rate)
+G1 X-6.353 Y-4.361 E0.42071 ;AutoTowersGenerator: Extruding 0.42071 mm of filament to achieve a 110% flow rate (originally 0.38246 mm at 100% flow rate)
+G1 X-7.086 Y0.692 E0.18681 ;AutoTowersGenerator: Extruding 0.18681 mm of filament to achieve a 110% flow rate (originally 0.16983 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X2.196 Y-3.628
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X3.810 Y0.310 E0.15568 ;AutoTowersGenerator: Extruding 0.15568 mm of filament to achieve a 110% flow rate (originally 0.14153 mm at 100% flow rate)
+G1 X2.352 Y3.524 E0.12913 ;AutoTowersGenerator: Extruding 0.12913 mm of filament to achieve a 110% flow rate (originally 0.11739 mm at 100% flow rate)
+G1 X-8.920 Y7.991 E0.44360 ;AutoTowersGenerator: Extruding 0.44360 mm of filament to achieve a 110% flow rate (originally 0.40327 mm at 100% flow rate)
+G1 X5.599 Y7.490 E0.53153 ;AutoTowersGenerator: Extruding 0.53153 mm of filament to achieve a 110% flow rate (originally 0.48321 mm at 100% flow rate)
+G1 X5.957 Y-2.152 E0.35303 ;AutoTowersGenerator: Extruding 0.35303 mm of filament to achieve a 110% flow rate (originally 0.32094 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-2.020 Y-7.929
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-2.020 Y-7.929 Z1.0
+;TIME_ELAPSED:28.377841
+;LAYER:4
+G0 F6000 X-8.755 Y-8.653 Z1.0
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-1.187 Y-7.801 E0.27862 ;AutoTowersGenerator: Extruding 0.27862 mm of filament to achieve a 110% flow rate (originally 0.25329 mm at 100% flow rate)
+G1 X2.015 Y-7.952 E0.11728 ;AutoTowersGenerator: Extruding 0.11728 mm of filament to achieve a 110% flow rate (originally 0.10662 mm at 100% flow rate)
+G1 X1.336 Y0.732 E0.31871 ;AutoTowersGenerator: Extruding 0.31871 mm of filament to achieve a 110% flow rate (originally 0.28974 mm at 100% flow rate)
+G1 X8.979 Y2.275 E0.28527 ;AutoTowersGenerator: Extruding 0.28527 mm of filament to achieve a 110% flow rate (originally 0.25934 mm at 100% flow rate)
+G1 X-8.594 Y-5.841 E0.70817 ;AutoTowersGenerator: Extruding 0.70817 mm of filament to achieve a 110% flow rate (originally 0.64379 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-2.475 Y2.688
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X2.046 Y-0.517 E0.20275 ;AutoTowersGenerator: Extruding 0.20275 mm of filament to achieve a 110% flow rate (originally 0.18432 mm at 100% flow rate)
+G1 X-7.693 Y-0.239 E0.35644 ;AutoTowersGenerator: Extruding 0.35644 mm of filament to achieve a 110% flow rate (originally 0.32404 mm at 100% flow rate)
+G1 X9.556 Y-0.392 E0.63111 ;AutoTowersGenerator: Extruding 0.63111 mm of filament to achieve a 110% flow rate (originally 0.57374 mm at 100% flow rate)
+G1 X-3.763 Y-7.118 E0.54591 ;AutoTowersGenerator: Extruding 0.54591 mm of filament to achieve a 110% flow rate (originally 0.49628 mm at 100% flow rate)
+G1 X4.993 Y4.807 E0.54127 ;AutoTowersGenerator: Extruding 0.54127 mm of filament to achieve a 110% flow rate (originally 0.49206 mm at 100% flow rate)
+G1 X-0.428 Y3.841 E0.20145 ;AutoTowersGenerator: Extruding 0.20145 mm of filament to achieve a 110% flow rate (originally 0.18314 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X0.327 Y-5.896
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X0.327 Y-5.896 Z1.2
+;TIME_ELAPSED:37.185925
+;LAYER:5
+G0 F6000 X-2.765 Y3.801 Z1.2
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X5.163 Y-4.038 E0.40791 ;AutoTowersGenerator: Extruding 0.40791 mm of filament to achieve a 110% flow rate (originally 0.37083 mm at 100% flow rate)
+G1 X2.858 Y-8.180 E0.17340 ;AutoTowersGenerator: Extruding 0.17340 mm of filament to achieve a 110% flow rate (originally 0.15764 mm at 100% flow rate)
+G1 X6.909 Y0.368 E0.34606 ;AutoTowersGenerator: Extruding 0.34606 mm of filament to achieve a 110% flow rate (originally 0.31460 mm at 100% flow rate)
+G1 X8.165 Y-2.886 E0.12761 ;AutoTowersGenerator: Extruding 0.12761 mm of filament to achieve a 110% flow rate (originally 0.11601 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-5.544 Y0.831
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X2.729 Y2.265 E0.30719 ;AutoTowersGenerator: Extruding 0.30719 mm of filament to achieve a 110% flow rate (originally 0.27926 mm at 100% flow rate)
+G1 X5.768 Y5.166 E0.15374 ;AutoTowersGenerator: Extruding 0.15374 mm of filament to achieve a 110% flow rate (originally 0.13976 mm at 100% flow rate)
+G1 X-6.097 Y-5.212 E0.57673 ;AutoTowersGenerator: Extruding 0.57673 mm of filament to achieve a 110% flow rate (originally 0.52430 mm at 100% flow rate)
+G1 X-1.986 Y6.067 E0.43920 ;AutoTowersGenerator: Extruding 0.43920 mm of filament to achieve a 110% flow rate (originally 0.39927 mm at 100% flow rate)
+G1 X-6.002 Y-0.144 E0.27058 ;AutoTowersGenerator: Extruding 0.27058 mm of filament to achieve a 110% flow rate (originally 0.24598 mm at 100% flow rate)
+G1 X4.620 Y9.792 E0.53214 ;AutoTowersGenerator: Extruding 0.53214 mm of filament to achieve a 110% flow rate (originally 0.48376 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X5.802 Y-0.555
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X5.802 Y-0.555 Z1.4
+;TIME_ELAPSED:42.960504
+;LAYER:6
+G0 F6000 X2.103 Y-3.114 Z1.4
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X9.100 Y-2.707 E0.25643 ;AutoTowersGenerator: Extruding 0.25643 mm of filament to achieve a 110% flow rate (originally 0.23312 mm at 100% flow rate)
+G1 X-5.591 Y-5.463 E0.54685 ;AutoTowersGenerator: Extruding 0.54685 mm of filament to achieve a 110% flow rate (originally 0.49714 mm at 100% flow rate)
+G1 X-6.066 Y-5.913 E0.02393 ;AutoTowersGenerator: Extruding 0.02393 mm of filament to achieve a 110% flow rate (originally 0.02175 mm at 100% flow rate)
+G1 X2.481 Y8.006 E0.59758 ;AutoTowersGenerator: Extruding 0.59758 mm of filament to achieve a 110% flow rate (originally 0.54325 mm at 100% flow rate)
+G1 X6.809 Y-0.411 E0.34625 ;AutoTowersGenerator: Extruding 0.34625 mm of filament to achieve a 110% flow rate (originally 0.31477 mm at 100% flow rate)
+G1 X3.060 Y5.993 E0.27148 ;AutoTowersGenerator: Extruding 0.27148 mm of filament to achieve a 110% flow rate (originally 0.24680 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-8.304 Y3.212
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X5.646 Y5.003 E0.51458 ;AutoTowersGenerator: Extruding 0.51458 mm of filament to achieve a 110% flow rate (originally 0.46780 mm at 100% flow rate)
+G1 X-0.439 Y-6.430 E0.47383 ;AutoTowersGenerator: Extruding 0.47383 mm of filament to achieve a 110% flow rate (originally 0.43075 mm at 100% flow rate)
+G1 X5.783 Y-3.350 E0.25400 ;AutoTowersGenerator: Extruding 0.25400 mm of filament to achieve a 110% flow rate (originally 0.23091 mm at 100% flow rate)
+G1 X6.016 Y9.433 E0.46775 ;AutoTowersGenerator: Extruding 0.46775 mm of filament to achieve a 110% flow rate (originally 0.42523 mm at 100% flow rate)
+G1 X-2.083 Y-1.972 E0.51180 ;AutoTowersGenerator: Extruding 0.51180 mm of filament to achieve a 110% flow rate (originally 0.46527 mm at 100% flow rate)
+G1 X8.936 Y4.496 E0.46747 ;AutoTowersGenerator: Extruding 0.46747 mm of filament to achieve a 110% flow rate (originally 0.42497 mm at 100% flow rate)
+G1 X-6.600 Y-7.459 E0.71721 ;AutoTowersGenerator: Extruding 0.71721 mm of filament to achieve a 110% flow rate (originally 0.65201 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-6.977 Y8.097
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-6.977 Y8.097 Z1.6
+;TIME_ELAPSED:51.186512
+;LAYER:7
+;AutoTowersGenerator: Starting tower section number 2 at Cura layer number 8 (which is labeled as layer 7 in this gcode file)
+G0 F6000 X-7.077 Y6.530 Z1.6
+;AutoTowersGenerator: Using flow rate 105% for this tower section
+;AutoTowersGenerator: Displaying "FLOW 105.0% on the LCD
+M117 FLOW 105.0%
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X3.145 Y-2.992 E0.48787 ;AutoTowersGenerator: Extruding 0.48787 mm of filament to achieve a 105% flow rate (originally 0.46464 mm at 100% flow rate)
+G1 X0.973 Y-7.380 E0.17100 ;AutoTowersGenerator: Extruding 0.17100 mm of filament to achieve a 105% flow rate (originally 0.16286 mm at 100% flow rate)
+G1 X-9.715 Y9.418 E0.69532 ;AutoTowersGenerator: Extruding 0.69532 mm of filament to achieve a 105% flow rate (originally 0.66221 mm at 100% flow rate)
+G1 X2.993 Y0.532 E0.54156 ;AutoTowersGenerator: Extruding 0.54156 mm of filament to achieve a 105% flow rate (originally 0.51577 mm at 100% flow rate)
+G1 X8.672 Y-1.324 E0.20865 ;AutoTowersGenerator: Extruding 0.20865 mm of filament to achieve a 105% flow rate (originally 0.19871 mm at 100% flow rate)
+G1 X7.435 Y6.523 E0.27742 ;AutoTowersGenerator: Extruding 0.27742 mm of filament to achieve a 105% flow rate (originally 0.26421 mm at 100% flow rate)
+G1 X-5.779 Y-4.963 E0.61145 ;AutoTowersGenerator: Extruding 0.61145 mm of filament to achieve a 105% flow rate (originally 0.58233 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-4.141 Y-5.189
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-4.813 Y-1.620 E0.12685 ;AutoTowersGenerator: Extruding 0.12685 mm of filament to achieve a 105% flow rate (originally 0.12081 mm at 100% flow rate)
+G1 X-7.379 Y8.200 E0.35446 ;AutoTowersGenerator: Extruding 0.35446 mm of filament to achieve a 105% flow rate (originally 0.33758 mm at 100% flow rate)
+G1 X-2.924 Y-0.837 E0.35186 ;AutoTowersGenerator: Extruding 0.35186 mm of filament to achieve a 105% flow rate (originally 0.33510 mm at 100% flow rate)
+G1 X1.667 Y8.086 E0.35044 ;AutoTowersGenerator: Extruding 0.35044 mm of filament to achieve a 105% flow rate (originally 0.33375 mm at 100% flow rate)
+G1 X-1.587 Y8.354 E0.11404 ;AutoTowersGenerator: Extruding 0.11404 mm of filament to achieve a 105% flow rate (originally 0.10861 mm at 100% flow rate)
+G1 X0.033 Y0.636 E0.27540 ;AutoTowersGenerator: Extruding 0.27540 mm of filament to achieve a 105% flow rate (originally 0.26229 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X0.470 Y-9.626
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X0.470 Y-9.626 Z1.8
+;TIME_ELAPSED:57.947012
+;LAYER:8
+G0 F6000 X-6.338 Y-9.921 Z1.8
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-6.553 Y-0.530 E0.32805 ;AutoTowersGenerator: Extruding 0.32805 mm of filament to achieve a 105% flow rate (originally 0.31243 mm at 100% flow rate)
+G1 X4.504 Y1.130 E0.39046 ;AutoTowersGenerator: Extruding 0.39046 mm of filament to achieve a 105% flow rate (originally 0.37187 mm at 100% flow rate)
+G1 X-3.480 Y0.367 E0.28010 ;AutoTowersGenerator: Extruding 0.28010 mm of filament to achieve a 105% flow rate (originally 0.26676 mm at 100% flow rate)
+G1 X1.109 Y5.685 E0.24532 ;AutoTowersGenerator: Extruding 0.24532 mm of filament to achieve a 105% flow rate (originally 0.23364 mm at 100% flow rate)
+G1 X-7.878 Y1.206 E0.35067 ;AutoTowersGenerator: Extruding 0.35067 mm of filament to achieve a 105% flow rate (originally 0.33397 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-5.030 Y-4.462
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X0.154 Y1.235 E0.26899 ;AutoTowersGenerator: Extruding 0.26899 mm of filament to achieve a 105% flow rate (originally 0.25618 mm at 100% flow rate)
+G1 X5.200 Y8.250 E0.30178 ;AutoTowersGenerator: Extruding 0.30178 mm of filament to achieve a 105% flow rate (originally 0.28741 mm at 100% flow rate)
+G1 X-1.135 Y2.251 E0.30470 ;AutoTowersGenerator: Extruding 0.30470 mm of filament to achieve a 105% flow rate (originally 0.29019 mm at 100% flow rate)
+G1 X0.111 Y0.243 E0.08251 ;AutoTowersGenerator: Extruding 0.08251 mm of filament to achieve a 105% flow rate (originally 0.07858 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X3.855 Y-0.953
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X3.855 Y-0.953 Z2.0
+;TIME_ELAPSED:65.080154
+;LAYER:9
+G0 F6000 X-0.439 Y8.830 Z2.0
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X8.456 Y7.855 E0.31250 ;AutoTowersGenerator: Extruding 0.31250 mm of filament to achieve a 105% flow rate (originally 0.29762 mm at 100% flow rate)
+G1 X-5.948 Y-1.049 E0.59139 ;AutoTowersGenerator: Extruding 0.59139 mm of filament to achieve a 105% flow rate (originally 0.56323 mm at 100% flow rate)
+G1 X-1.667 Y-2.153 E0.15439 ;AutoTowersGenerator: Extruding 0.15439 mm of filament to achieve a 105% flow rate (originally 0.14704 mm at 100% flow rate)
+G1 X-3.680 Y3.423 E0.20703 ;AutoTowersGenerator: Extruding 0.20703 mm of filament to achieve a 105% flow rate (originally 0.19717 mm at 100% flow rate)
+G1 X-1.433 Y-5.746 E0.32970 ;AutoTowersGenerator: Extruding 0.32970 mm of filament to achieve a 105% flow rate (originally 0.31400 mm at 100% flow rate)
+G1 X-3.944 Y-7.553 E0.10803 ;AutoTowersGenerator: Extruding 0.10803 mm of filament to achieve a 105% flow rate (originally 0.10289 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X5.539 Y8.790
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-7.140 Y7.657 E0.44456 ;AutoTowersGenerator: Extruding 0.44456 mm of filament to achieve a 105% flow rate (originally 0.42339 mm at 100% flow rate)
+G1 X9.351 Y-5.608 E0.73912 ;AutoTowersGenerator: Extruding 0.73912 mm of filament to achieve a 105% flow rate (originally 0.70392 mm at 100% flow rate)
+G1 X9.050 Y-2.035 E0.12523 ;AutoTowersGenerator: Extruding 0.12523 mm of filament to achieve a 105% flow rate (originally 0.11927 mm at 100% flow rate)
+G1 X-0.255 Y9.797 E0.52568 ;AutoTowersGenerator: Extruding 0.52568 mm of filament to achieve a 105% flow rate (originally 0.50065 mm at 100% flow rate)
+G1 X6.649 Y-6.771 E0.62683 ;AutoTowersGenerator: Extruding 0.62683 mm of filament to achieve a 105% flow rate (originally 0.59698 mm at 100% flow rate)
+G1 X-1.370 Y0.312 E0.37363 ;AutoTowersGenerator: Extruding 0.37363 mm of filament to achieve a 105% flow rate (originally 0.35584 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-3.218 Y-6.085
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-3.218 Y-6.085 Z2.2
+;TIME_ELAPSED:71.354256
+;LAYER:10
+G0 F6000 X4.443 Y-9.610 Z2.2
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-1.191 Y-9.638 E0.19675 ;AutoTowersGenerator: Extruding 0.19675 mm of filament to achieve a 105% flow rate (originally 0.18738 mm at 100% flow rate)
+G1 X-3.370 Y2.479 E0.42994 ;AutoTowersGenerator: Extruding 0.42994 mm of filament to achieve a 105% flow rate (originally 0.40947 mm at 100% flow rate)
+G1 X0.245 Y-8.714 E0.41077 ;AutoTowersGenerator: Extruding 0.41077 mm of filament to achieve a 105% flow rate (originally 0.39121 mm at 100% flow rate)
+G1 X9.702 Y5.767 E0.60401 ;AutoTowersGenerator: Extruding 0.60401 mm of filament to achieve a 105% flow rate (originally 0.57525 mm at 100% flow rate)
+G1 X9.434 Y-7.904 E0.47755 ;AutoTowersGenerator: Extruding 0.47755 mm of filament to achieve a 105% flow rate (originally 0.45481 mm at 100% flow rate)
+G1 X-4.689 Y-9.208 E0.49531 ;AutoTowersGenerator: Extruding 0.49531 mm of filament to achieve a 105% flow rate (originally 0.47172 mm at 100% flow rate)
+G1 X5.580 Y-4.591 E0.39319 ;AutoTowersGenerator: Extruding 0.39319 mm of filament to achieve a 105% flow rate (originally 0.37447 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-7.409 Y-1.555
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-1.881 Y0.732 E0.20892 ;AutoTowersGenerator: Extruding 0.20892 mm of filament to achieve a 105% flow rate (originally 0.19897 mm at 100% flow rate)
+G1 X0.296 Y-0.108 E0.08148 ;AutoTowersGenerator: Extruding 0.08148 mm of filament to achieve a 105% flow rate (originally 0.07760 mm at 100% flow rate)
+G1 X-3.459 Y-4.419 E0.19965 ;AutoTowersGenerator: Extruding 0.19965 mm of filament to achieve a 105% flow rate (originally 0.19014 mm at 100% flow rate)
+G1 X5.992 Y-6.333 E0.33676 ;AutoTowersGenerator: Extruding 0.33676 mm of filament to achieve a 105% flow rate (originally 0.32072 mm at 100% flow rate)
+G1 X7.906 Y-4.622 E0.08967 ;AutoTowersGenerator: Extruding 0.08967 mm of filament to achieve a 105% flow rate (originally 0.08540 mm at 100% flow rate)
+G1 X-9.663 Y-8.229 E0.62637 ;AutoTowersGenerator: Extruding 0.62637 mm of filament to achieve a 105% flow rate (originally 0.59654 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-4.789 Y2.164
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-4.789 Y2.164 Z2.4
+;TIME_ELAPSED:77.243888
+;LAYER:11
+G0 F6000 X-4.711 Y-7.566 Z2.4
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-3.217 Y1.061 E0.30579 ;AutoTowersGenerator: Extruding 0.30579 mm of filament to achieve a 105% flow rate (originally 0.29123 mm at 100% flow rate)
+G1 X8.533 Y-4.643 E0.45615 ;AutoTowersGenerator: Extruding 0.45615 mm of filament to achieve a 105% flow rate (originally 0.43443 mm at 100% flow rate)
+G1 X-7.416 Y0.538 E0.58564 ;AutoTowersGenerator: Extruding 0.58564 mm of filament to achieve a 105% flow rate (originally 0.55775 mm at 100% flow rate)
+G1 X-5.231 Y-7.811 E0.30139 ;AutoTowersGenerator: Extruding 0.30139 mm of filament to achieve a 105% flow rate (originally 0.28704 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-6.771 Y-8.992
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X8.645 Y2.573 E0.67305 ;AutoTowersGenerator: Extruding 0.67305 mm of filament to achieve a 105% flow rate (originally 0.64100 mm at 100% flow rate)
+G1 X0.622 Y-5.883 E0.40709 ;AutoTowersGenerator: Extruding 0.40709 mm of filament to achieve a 105% flow rate (originally 0.38770 mm at 100% flow rate)
+G1 X-1.086 Y3.443 E0.33110 ;AutoTowersGenerator: Extruding 0.33110 mm of filament to achieve a 105% flow rate (originally 0.31533 mm at 100% flow rate)
+G1 X-4.590 Y6.074 E0.15300 ;AutoTowersGenerator: Extruding 0.15300 mm of filament to achieve a 105% flow rate (originally 0.14571 mm at 100% flow rate)
+G1 X9.890 Y-9.261 E0.73654 ;AutoTowersGenerator: Extruding 0.73654 mm of filament to achieve a 105% flow rate (originally 0.70147 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-9.631 Y0.113
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-9.631 Y0.113 Z2.6
+;TIME_ELAPSED:86.156094
+;LAYER:12
+;AutoTowersGenerator: Starting tower section number 3 at Cura layer number 13 (which is labeled as layer 12 in this gcode file)
+G0 F6000 X0.285 Y-5.086 Z2.6
+;AutoTowersGenerator: Using flow rate 100% for this tower section
+;AutoTowersGenerator: Displaying "FLOW 100.0% on the LCD
+M117 FLOW 100.0%
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-7.874 Y6.378 E0.46802 ;AutoTowersGenerator: Extruding 0.46802 mm of filament to achieve a 100% flow rate (originally 0.46802 mm at 100% flow rate)
+G1 X-1.356 Y-0.100 E0.30565 ;AutoTowersGenerator: Extruding 0.30565 mm of filament to achieve a 100% flow rate (originally 0.30565 mm at 100% flow rate)
+G1 X6.692 Y-2.138 E0.27615 ;AutoTowersGenerator: Extruding 0.27615 mm of filament to achieve a 100% flow rate (originally 0.27615 mm at 100% flow rate)
+G1 X0.134 Y3.755 E0.29326 ;AutoTowersGenerator: Extruding 0.29326 mm of filament to achieve a 100% flow rate (originally 0.29326 mm at 100% flow rate)
+G1 X9.649 Y-3.146 E0.39094 ;AutoTowersGenerator: Extruding 0.39094 mm of filament to achieve a 100% flow rate (originally 0.39094 mm at 100% flow rate)
+G1 X6.646 Y4.135 E0.26194 ;AutoTowersGenerator: Extruding 0.26194 mm of filament to achieve a 100% flow rate (originally 0.26194 mm at 100% flow rate)
+G1 X2.720 Y-1.906 E0.23962 ;AutoTowersGenerator: Extruding 0.23962 mm of filament to achieve a 100% flow rate (originally 0.23962 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-3.049 Y-8.912
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-9.715 Y2.509 E0.43984 ;AutoTowersGenerator: Extruding 0.43984 mm of filament to achieve a 100% flow rate (originally 0.43984 mm at 100% flow rate)
+G1 X7.597 Y-1.385 E0.59018 ;AutoTowersGenerator: Extruding 0.59018 mm of filament to achieve a 100% flow rate (originally 0.59018 mm at 100% flow rate)
+G1 X-8.892 Y3.305 E0.57018 ;AutoTowersGenerator: Extruding 0.57018 mm of filament to achieve a 100% flow rate (originally 0.57018 mm at 100% flow rate)
+G1 X-2.382 Y0.119 E0.24105 ;AutoTowersGenerator: Extruding 0.24105 mm of filament to achieve a 100% flow rate (originally 0.24105 mm at 100% flow rate)
+G1 X9.419 Y1.976 E0.39733 ;AutoTowersGenerator: Extruding 0.39733 mm of filament to achieve a 100% flow rate (originally 0.39733 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X3.854 Y-9.095
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X3.854 Y-9.095 Z2.8
+;TIME_ELAPSED:91.897503
+;LAYER:13
+G0 F6000 X-4.619 Y-9.928 Z2.8
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X9.236 Y9.452 E0.79236 ;AutoTowersGenerator: Extruding 0.79236 mm of filament to achieve a 100% flow rate (originally 0.79236 mm at 100% flow rate)
+G1 X0.941 Y-5.111 E0.55743 ;AutoTowersGenerator: Extruding 0.55743 mm of filament to achieve a 100% flow rate (originally 0.55743 mm at 100% flow rate)
+G1 X9.313 Y-3.809 E0.28180 ;AutoTowersGenerator: Extruding 0.28180 mm of filament to achieve a 100% flow rate (originally 0.28180 mm at 100% flow rate)
+G1 X-2.868 Y-9.979 E0.45416 ;AutoTowersGenerator: Extruding 0.45416 mm of filament to achieve a 100% flow rate (originally 0.45416 mm at 100% flow rate)
+G1 X-2.367 Y-0.507 E0.31546 ;AutoTowersGenerator: Extruding 0.31546 mm of filament to achieve a 100% flow rate (originally 0.31546 mm at 100% flow rate)
+G1 X0.055 Y-5.980 E0.19908 ;AutoTowersGenerator: Extruding 0.19908 mm of filament to achieve a 100% flow rate (originally 0.19908 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X0.095 Y-9.901
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X6.341 Y-7.123 E0.22737 ;AutoTowersGenerator: Extruding 0.22737 mm of filament to achieve a 100% flow rate (originally 0.22737 mm at 100% flow rate)
+G1 X1.736 Y-2.120 E0.22614 ;AutoTowersGenerator: Extruding 0.22614 mm of filament to achieve a 100% flow rate (originally 0.22614 mm at 100% flow rate)
+G1 X-4.007 Y2.593 E0.24712 ;AutoTowersGenerator: Extruding 0.24712 mm of filament to achieve a 100% flow rate (originally 0.24712 mm at 100% flow rate)
+G1 X-8.310 Y9.153 E0.26092 ;AutoTowersGenerator: Extruding 0.26092 mm of filament to achieve a 100% flow rate (originally 0.26092 mm at 100% flow rate)
+G1 X7.065 Y-6.895 E0.73919 ;AutoTowersGenerator: Extruding 0.73919 mm of filament to achieve a 100% flow rate (originally 0.73919 mm at 100% flow rate)
+G1 X7.856 Y5.681 E0.41910 ;AutoTowersGenerator: Extruding 0.41910 mm of filament to achieve a 100% flow rate (originally 0.41910 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X1.931 Y5.286
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X1.931 Y5.286 Z3.0
+;TIME_ELAPSED:99.780212
+;LAYER:14
+G0 F6000 X-0.116 Y-4.316 Z3.0
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-9.124 Y6.706 E0.47346 ;AutoTowersGenerator: Extruding 0.47346 mm of filament to achieve a 100% flow rate (originally 0.47346 mm at 100% flow rate)
+G1 X7.839 Y2.547 E0.58090 ;AutoTowersGenerator: Extruding 0.58090 mm of filament to achieve a 100% flow rate (originally 0.58090 mm at 100% flow rate)
+G1 X4.677 Y6.244 E0.16182 ;AutoTowersGenerator: Extruding 0.16182 mm of filament to achieve a 100% flow rate (originally 0.16182 mm at 100% flow rate)
+G1 X-7.214 Y0.475 E0.43958 ;AutoTowersGenerator: Extruding 0.43958 mm of filament to achieve a 100% flow rate (originally 0.43958 mm at 100% flow rate)
+G1 X0.087 Y6.699 E0.31909 ;AutoTowersGenerator: Extruding 0.31909 mm of filament to achieve a 100% flow rate (originally 0.31909 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X6.094 Y6.528
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-8.298 Y-9.163 E0.70815 ;AutoTowersGenerator: Extruding 0.70815 mm of filament to achieve a 100% flow rate (originally 0.70815 mm at 100% flow rate)
+G1 X2.742 Y9.190 E0.71236 ;AutoTowersGenerator: Extruding 0.71236 mm of filament to achieve a 100% flow rate (originally 0.71236 mm at 100% flow rate)
+G1 X-2.468 Y-0.972 E0.37984 ;AutoTowersGenerator: Extruding 0.37984 mm of filament to achieve a 100% flow rate (originally 0.37984 mm at 100% flow rate)
+G1 X-8.984 Y-9.623 E0.36023 ;AutoTowersGenerator: Extruding 0.36023 mm of filament to achieve a 100% flow rate (originally 0.36023 mm at 100% flow rate)
+G1 X0.629 Y-5.109 E0.35324 ;AutoTowersGenerator: Extruding 0.35324 mm of filament to achieve a 100% flow rate (originally 0.35324 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-4.724 Y-0.861
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-4.724 Y-0.861 Z3.2
+;TIME_ELAPSED:105.060658
+;LAYER:15
+G0 F6000 X8.650 Y7.957 Z3.2
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X3.186 Y-8.679 E0.58240 ;AutoTowersGenerator: Extruding 0.58240 mm of filament to achieve a 100% flow rate (originally 0.58240 mm at 100% flow rate)
+G1 X4.736 Y-4.956 E0.13412 ;AutoTowersGenerator: Extruding 0.13412 mm of filament to achieve a 100% flow rate (originally 0.13412 mm at 100% flow rate)
+G1 X-8.511 Y-4.689 E0.44068 ;AutoTowersGenerator: Extruding 0.44068 mm of filament to achieve a 100% flow rate (originally 0.44068 mm at 100% flow rate)
+G1 X4.587 Y-5.896 E0.43747 ;AutoTowersGenerator: Extruding 0.43747 mm of filament to achieve a 100% flow rate (originally 0.43747 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X4.797 Y9.515
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X6.911 Y-8.465 E0.60213 ;AutoTowersGenerator: Extruding 0.60213 mm of filament to achieve a 100% flow rate (originally 0.60213 mm at 100% flow rate)
+G1 X8.209 Y-4.254 E0.14659 ;AutoTowersGenerator: Extruding 0.14659 mm of filament to achieve a 100% flow rate (originally 0.14659 mm at 100% flow rate)
+G1 X-9.065 Y2.656 E0.61880 ;AutoTowersGenerator: Extruding 0.61880 mm of filament to achieve a 100% flow rate (originally 0.61880 mm at 100% flow rate)
+G1 X-6.034 Y1.994 E0.10318 ;AutoTowersGenerator: Extruding 0.10318 mm of filament to achieve a 100% flow rate (originally 0.10318 mm at 100% flow rate)
+G1 X-3.365 Y3.031 E0.09525 ;AutoTowersGenerator: Extruding 0.09525 mm of filament to achieve a 100% flow rate (originally 0.09525 mm at 100% flow rate)
+G1 X3.858 Y2.423 E0.24106 ;AutoTowersGenerator: Extruding 0.24106 mm of filament to achieve a 100% flow rate (originally 0.24106 mm at 100% flow rate)
+G1 X-7.331 Y-0.352 E0.38341 ;AutoTowersGenerator: Extruding 0.38341 mm of filament to achieve a 100% flow rate (originally 0.38341 mm at 100% flow rate)
+G1 F2700 E-5
+G0 F6000 X-0.284 Y9.450
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-0.284 Y9.450 Z3.4
+;TIME_ELAPSED:110.458734
+M140 S0
+M107
+G91 ;Relative positioning
+G1 E-2 F2700 ;Retract a bit
+G1 E-2 Z0.2 F2400 ;Retract and raise Z
+G1 X5 Y5 F3000 ;Wipe out
+G1 Z10 ;Raise Z more
+G90 ;Absolute positioning
+G1 X0 Y235 ;Present print
+M106 S0 ;Turn-off fan
+M104 S0 ;Turn-off hotend
+M140 S0 ;Turn-off bed
+M84 X Y E ;Disable all steppers but Z
+M82 ;absolute extrusion mode
+M104 S0
+;End of Gcode
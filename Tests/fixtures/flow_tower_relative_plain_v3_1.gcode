@@ -0,0 +1,448 @@
+;Generated with Cura_SteamEngine 5.4.0
+M140 S60
+M105
+M190 S60
+M104 S200
+M105
+M109 S200
+M83 ;relative extrusion mode
+G28 ;Home
+G1 Z15.0 F6000 ;Move the platform down 15mm
+G92 E0
+G1 F200 E3
+G92 E0
+;LAYER_COUNT:16
+;LAYER:0
+G0 F3000 X-3.523 Y-6.983 Z0.2
+;TYPE:WALL-OUTER
+G1 F1200 X-8.551 Y0.718 E0.35176
+G1 X-2.686 Y-8.840 E0.42892
+G1 X0.149 Y-9.250 E0.10956
+G1 X-1.327 Y-8.603 E0.06164
+G1 F2700 E-5
+G0 F6000 X-8.186 Y-1.510
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X8.949 Y2.613 E0.67408
+G1 X1.660 Y-8.763 E0.51675
+G1 X1.711 Y-9.008 E0.00959
+G1 X-5.578 Y1.133 E0.47770
+G1 F2700 E-5
+G0 F6000 X-7.337 Y-1.617
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-7.337 Y-1.617 Z0.4
+;TIME_ELAPSED:7.162744
+;LAYER:1
+M106 S255
+G0 F6000 X1.418 Y1.205 Z0.4
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-7.939 Y1.424 E0.35800
+G1 X-6.243 Y-8.051 E0.36818
+G1 X4.242 Y1.287 E0.53705
+G1 X2.380 Y-0.072 E0.08817
+G1 X0.634 Y5.545 E0.22495
+G1 F2700 E-5
+G0 F6000 X-0.688 Y8.469
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-4.005 Y5.888 E0.16075
+G1 X3.980 Y-5.118 E0.52008
+G1 X1.488 Y0.504 E0.23521
+G1 X7.503 Y4.589 E0.27808
+G1 X-4.241 Y9.603 E0.48843
+G1 X-7.639 Y-1.638 E0.44917
+G1 F2700 E-5
+G0 F6000 X5.143 Y-6.960
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X5.143 Y-6.960 Z0.6
+;TIME_ELAPSED:14.118596
+;LAYER:2
+G0 F6000 X-9.216 Y3.364 Z0.6
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-3.198 Y-2.996 E0.32038
+G1 X-0.067 Y5.938 E0.34636
+G1 X-8.625 Y-8.128 E0.60238
+G1 X-4.601 Y3.941 E0.46544
+G1 X-8.700 Y4.623 E0.15202
+G1 X-3.808 Y1.559 E0.21120
+G1 F2700 E-5
+G0 F6000 X3.625 Y-1.087
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X7.741 Y-3.060 E0.16699
+G1 X8.813 Y-2.891 E0.03971
+G1 X2.218 Y-0.126 E0.26161
+G1 X-5.636 Y-4.251 E0.32458
+G1 X4.767 Y-2.042 E0.38909
+G1 X8.336 Y-0.070 E0.14918
+G1 X-6.673 Y-1.967 E0.55349
+G1 F2700 E-5
+G0 F6000 X-4.443 Y-7.261
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-4.443 Y-7.261 Z0.8
+;TIME_ELAPSED:20.840683
+;LAYER:3
+G0 F6000 X1.004 Y4.128 Z0.8
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X3.654 Y-2.391 E0.25747
+G1 X-5.385 Y-8.340 E0.39591
+G1 X-6.974 Y3.170 E0.42512
+G1 X-9.759 Y6.622 E0.16225
+G1 X-6.353 Y-4.361 E0.42071
+G1 X-7.086 Y0.692 E0.18681
+G1 F2700 E-5
+G0 F6000 X2.196 Y-3.628
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X3.810 Y0.310 E0.15568
+G1 X2.352 Y3.524 E0.12913
+G1 X-8.920 Y7.991 E0.44360
+G1 X5.599 Y7.490 E0.53153
+G1 X5.957 Y-2.152 E0.35303
+G1 F2700 E-5
+G0 F6000 X-2.020 Y-7.929
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-2.020 Y-7.929 Z1.0
+;TIME_ELAPSED:28.377841
+;LAYER:4
+G0 F6000 X-8.755 Y-8.653 Z1.0
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-1.187 Y-7.801 E0.27862
+G1 X2.015 Y-7.952 E0.11728
+G1 X1.336 Y0.732 E0.31871
+G1 X8.979 Y2.275 E0.28527
+G1 X-8.594 Y-5.841 E0.70817
+G1 F2700 E-5
+G0 F6000 X-2.475 Y2.688
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X2.046 Y-0.517 E0.20275
+G1 X-7.693 Y-0.239 E0.35644
+G1 X9.556 Y-0.392 E0.63111
+G1 X-3.763 Y-7.118 E0.54591
+G1 X4.993 Y4.807 E0.54127
+G1 X-0.428 Y3.841 E0.20145
+G1 F2700 E-5
+G0 F6000 X0.327 Y-5.896
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X0.327 Y-5.896 Z1.2
+;TIME_ELAPSED:37.185925
+;LAYER:5
+G0 F6000 X-2.765 Y3.801 Z1.2
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X5.163 Y-4.038 E0.40791
+G1 X2.858 Y-8.180 E0.17340
+G1 X6.909 Y0.368 E0.34606
+G1 X8.165 Y-2.886 E0.12761
+G1 F2700 E-5
+G0 F6000 X-5.544 Y0.831
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X2.729 Y2.265 E0.30719
+G1 X5.768 Y5.166 E0.15374
+G1 X-6.097 Y-5.212 E0.57673
+G1 X-1.986 Y6.067 E0.43920
+G1 X-6.002 Y-0.144 E0.27058
+G1 X4.620 Y9.792 E0.53214
+G1 F2700 E-5
+G0 F6000 X5.802 Y-0.555
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X5.802 Y-0.555 Z1.4
+;TIME_ELAPSED:42.960504
+;LAYER:6
+G0 F6000 X2.103 Y-3.114 Z1.4
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X9.100 Y-2.707 E0.25643
+G1 X-5.591 Y-5.463 E0.54685
+G1 X-6.066 Y-5.913 E0.02393
+G1 X2.481 Y8.006 E0.59758
+G1 X6.809 Y-0.411 E0.34625
+G1 X3.060 Y5.993 E0.27148
+G1 F2700 E-5
+G0 F6000 X-8.304 Y3.212
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X5.646 Y5.003 E0.51458
+G1 X-0.439 Y-6.430 E0.47383
+G1 X5.783 Y-3.350 E0.25400
+G1 X6.016 Y9.433 E0.46775
+G1 X-2.083 Y-1.972 E0.51180
+G1 X8.936 Y4.496 E0.46747
+G1 X-6.600 Y-7.459 E0.71721
+G1 F2700 E-5
+G0 F6000 X-6.977 Y8.097
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-6.977 Y8.097 Z1.6
+;TIME_ELAPSED:51.186512
+;LAYER:7
+G0 F6000 X-7.077 Y6.530 Z1.6
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X3.145 Y-2.992 E0.48787
+G1 X0.973 Y-7.380 E0.17100
+G1 X-9.715 Y9.418 E0.69532
+G1 X2.993 Y0.532 E0.54156
+G1 X8.672 Y-1.324 E0.20865
+G1 X7.435 Y6.523 E0.27742
+G1 X-5.779 Y-4.963 E0.61145
+G1 F2700 E-5
+G0 F6000 X-4.141 Y-5.189
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-4.813 Y-1.620 E0.12685
+G1 X-7.379 Y8.200 E0.35446
+G1 X-2.924 Y-0.837 E0.35186
+G1 X1.667 Y8.086 E0.35044
+G1 X-1.587 Y8.354 E0.11404
+G1 X0.033 Y0.636 E0.27540
+G1 F2700 E-5
+G0 F6000 X0.470 Y-9.626
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X0.470 Y-9.626 Z1.8
+;TIME_ELAPSED:57.947012
+;LAYER:8
+G0 F6000 X-6.338 Y-9.921 Z1.8
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-6.553 Y-0.530 E0.32805
+G1 X4.504 Y1.130 E0.39046
+G1 X-3.480 Y0.367 E0.28010
+G1 X1.109 Y5.685 E0.24532
+G1 X-7.878 Y1.206 E0.35067
+G1 F2700 E-5
+G0 F6000 X-5.030 Y-4.462
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X0.154 Y1.235 E0.26899
+G1 X5.200 Y8.250 E0.30178
+G1 X-1.135 Y2.251 E0.30470
+G1 X0.111 Y0.243 E0.08251
+G1 F2700 E-5
+G0 F6000 X3.855 Y-0.953
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X3.855 Y-0.953 Z2.0
+;TIME_ELAPSED:65.080154
+;LAYER:9
+G0 F6000 X-0.439 Y8.830 Z2.0
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X8.456 Y7.855 E0.31250
+G1 X-5.948 Y-1.049 E0.59139
+G1 X-1.667 Y-2.153 E0.15439
+G1 X-3.680 Y3.423 E0.20703
+G1 X-1.433 Y-5.746 E0.32970
+G1 X-3.944 Y-7.553 E0.10803
+G1 F2700 E-5
+G0 F6000 X5.539 Y8.790
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-7.140 Y7.657 E0.44456
+G1 X9.351 Y-5.608 E0.73912
+G1 X9.050 Y-2.035 E0.12523
+G1 X-0.255 Y9.797 E0.52568
+G1 X6.649 Y-6.771 E0.62683
+G1 X-1.370 Y0.312 E0.37363
+G1 F2700 E-5
+G0 F6000 X-3.218 Y-6.085
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-3.218 Y-6.085 Z2.2
+;TIME_ELAPSED:71.354256
+;LAYER:10
+G0 F6000 X4.443 Y-9.610 Z2.2
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-1.191 Y-9.638 E0.19675
+G1 X-3.370 Y2.479 E0.42994
+G1 X0.245 Y-8.714 E0.41077
+G1 X9.702 Y5.767 E0.60401
+G1 X9.434 Y-7.904 E0.47755
+G1 X-4.689 Y-9.208 E0.49531
+G1 X5.580 Y-4.591 E0.39319
+G1 F2700 E-5
+G0 F6000 X-7.409 Y-1.555
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-1.881 Y0.732 E0.20892
+G1 X0.296 Y-0.108 E0.08148
+G1 X-3.459 Y-4.419 E0.19965
+G1 X5.992 Y-6.333 E0.33676
+G1 X7.906 Y-4.622 E0.08967
+G1 X-9.663 Y-8.229 E0.62637
+G1 F2700 E-5
+G0 F6000 X-4.789 Y2.164
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-4.789 Y2.164 Z2.4
+;TIME_ELAPSED:77.243888
+;LAYER:11
+G0 F6000 X-4.711 Y-7.566 Z2.4
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-3.217 Y1.061 E0.30579
+G1 X8.533 Y-4.643 E0.45615
+G1 X-7.416 Y0.538 E0.58564
+G1 X-5.231 Y-7.811 E0.30139
+G1 F2700 E-5
+G0 F6000 X-6.771 Y-8.992
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X8.645 Y2.573 E0.67305
+G1 X0.622 Y-5.883 E0.40709
+G1 X-1.086 Y3.443 E0.33110
+G1 X-4.590 Y6.074 E0.15300
+G1 X9.890 Y-9.261 E0.73654
+G1 F2700 E-5
+G0 F6000 X-9.631 Y0.113
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-9.631 Y0.113 Z2.6
+;TIME_ELAPSED:86.156094
+;LAYER:12
+G0 F6000 X0.285 Y-5.086 Z2.6
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-7.874 Y6.378 E0.46802
+G1 X-1.356 Y-0.100 E0.30565
+G1 X6.692 Y-2.138 E0.27615
+G1 X0.134 Y3.755 E0.29326
+G1 X9.649 Y-3.146 E0.39094
+G1 X6.646 Y4.135 E0.26194
+G1 X2.720 Y-1.906 E0.23962
+G1 F2700 E-5
+G0 F6000 X-3.049 Y-8.912
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-9.715 Y2.509 E0.43984
+G1 X7.597 Y-1.385 E0.59018
+G1 X-8.892 Y3.305 E0.57018
+G1 X-2.382 Y0.119 E0.24105
+G1 X9.419 Y1.976 E0.39733
+G1 F2700 E-5
+G0 F6000 X3.854 Y-9.095
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X3.854 Y-9.095 Z2.8
+;TIME_ELAPSED:91.897503
+;LAYER:13
+G0 F6000 X-4.619 Y-9.928 Z2.8
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X9.236 Y9.452 E0.79236
+G1 X0.941 Y-5.111 E0.55743
+G1 X9.313 Y-3.809 E0.28180
+G1 X-2.868 Y-9.979 E0.45416
+G1 X-2.367 Y-0.507 E0.31546
+G1 X0.055 Y-5.980 E0.19908
+G1 F2700 E-5
+G0 F6000 X0.095 Y-9.901
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X6.341 Y-7.123 E0.22737
+G1 X1.736 Y-2.120 E0.22614
+G1 X-4.007 Y2.593 E0.24712
+G1 X-8.310 Y9.153 E0.26092
+G1 X7.065 Y-6.895 E0.73919
+G1 X7.856 Y5.681 E0.41910
+G1 F2700 E-5
+G0 F6000 X1.931 Y5.286
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X1.931 Y5.286 Z3.0
+;TIME_ELAPSED:99.780212
+;LAYER:14
+G0 F6000 X-0.116 Y-4.316 Z3.0
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X-9.124 Y6.706 E0.47346
+G1 X7.839 Y2.547 E0.58090
+G1 X4.677 Y6.244 E0.16182
+G1 X-7.214 Y0.475 E0.43958
+G1 X0.087 Y6.699 E0.31909
+G1 F2700 E-5
+G0 F6000 X6.094 Y6.528
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X-8.298 Y-9.163 E0.70815
+G1 X2.742 Y9.190 E0.71236
+G1 X-2.468 Y-0.972 E0.37984
+G1 X-8.984 Y-9.623 E0.36023
+G1 X0.629 Y-5.109 E0.35324
+G1 F2700 E-5
+G0 F6000 X-4.724 Y-0.861
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-4.724 Y-0.861 Z3.2
+;TIME_ELAPSED:105.060658
+;LAYER:15
+G0 F6000 X8.650 Y7.957 Z3.2
+G1 F2700 E5
+;TYPE:WALL-OUTER
+G1 F1200 X3.186 Y-8.679 E0.58240
+G1 X4.736 Y-4.956 E0.13412
+G1 X-8.511 Y-4.689 E0.44068
+G1 X4.587 Y-5.896 E0.43747
+G1 F2700 E-5
+G0 F6000 X4.797 Y9.515
+G1 F2700 E5
+;TYPE:SKIN
+G1 F1200 X6.911 Y-8.465 E0.60213
+G1 X8.209 Y-4.254 E0.14659
+G1 X-9.065 Y2.656 E0.61880
+G1 X-6.034 Y1.994 E0.10318
+G1 X-3.365 Y3.031 E0.09525
+G1 X3.858 Y2.423 E0.24106
+G1 X-7.331 Y-0.352 E0.38341
+G1 F2700 E-5
+G0 F6000 X-0.284 Y9.450
+G1 F2700 E5
+G1 F2700 E-5
+;MESH:NONMESH
+G0 F6000 X-0.284 Y9.450 Z3.4
+;TIME_ELAPSED:110.458734
+M140 S0
+M107
+G91 ;Relative positioning
+G1 E-2 F2700 ;Retract a bit
+G1 E-2 Z0.2 F2400 ;Retract and raise Z
+G1 X5 Y5 F3000 ;Wipe out
+G1 Z10 ;Raise Z more
+G90 ;Absolute positioning
+G1 X0 Y235 ;Present print
+M106 S0 ;Turn-off fan
+M104 S0 ;Turn-off hotend
+M140 S0 ;Turn-off bed
+M84 X Y E ;Disable all steppers but Z
+M82 ;absolute extrusion mode
+M104 S0
+;End of Gcode
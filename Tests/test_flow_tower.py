@@ -0,0 +1,103 @@
+import os
+import re
+
+import pytest
+
+# The post-processing scripts log through Uranium, so these tests can only be run where Cura's modules are available
+pytest.importorskip('UM.Logger')
+
+from Postprocessing import FlowTower_PostProcessing
+
+
+
+_fixturesDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# The tower settings used to generate the expected output fixtures
+_towerSettings = {
+    'base_height': 0.4,
+    'section_height': 1.0,
+    'initial_layer_height': 0.2,
+    'layer_height': 0.2,
+    'start_flow_rate': 110,
+    'flow_rate_change': -5,
+    'reference_flow_rate': 100,
+}
+
+_extrusionRegex = re.compile(r' E(-?[\d.]+)')
+
+
+
+def _readFixture(fileName):
+    with open(os.path.join(_fixturesDir, fileName), 'r', newline='') as file:
+        return file.read()
+
+
+
+def _sliceGcode(fileName):
+    ''' Splits a gcode fixture into the list of strings Cura hands to the post-processing scripts
+        The header, the start gcode, each layer and the end gcode are separate entries '''
+
+    gcode = re.split(r'(?m)^(?=;Generated with|;LAYER:\d)', _readFixture(fileName))
+    lastLayer = gcode.pop()
+    endOfLayer = lastLayer.index('\n', lastLayer.rindex(';TIME_ELAPSED:')) + 1
+    return gcode + [lastLayer[:endOfLayer], lastLayer[endOfLayer:]]
+
+
+
+def _postProcess(relative_extrusion, enable_options):
+    ''' Runs the flow tower script over the matching fixture and returns its output after the settings header '''
+
+    mode = 'relative' if relative_extrusion else 'absolute'
+    gcode = FlowTower_PostProcessing.execute(_sliceGcode(f'flow_tower_{mode}.gcode'), relative_extrusion=relative_extrusion, enable_lcd_messages=enable_options, enable_advanced_gcode_comments=enable_options, **_towerSettings)
+    return ''.join(gcode[1:])
+
+
+
+def _expectedFileName(relative_extrusion, enable_options, version):
+    mode = 'relative' if relative_extrusion else 'absolute'
+    options = 'commented' if enable_options else 'plain'
+    return f'flow_tower_{mode}_{options}_{version}.gcode'
+
+
+
+@pytest.mark.parametrize('relative_extrusion', [False, True])
+@pytest.mark.parametrize('enable_options', [False, True])
+def test_matches_original_script(relative_extrusion, enable_options):
+    ''' The output of version 3.1 of the script was saved before the extrusion values were rescaled incrementally
+        The new calculation can differ from it in the last printed digit, but in nothing else '''
+
+    expectedLines = _readFixture(_expectedFileName(relative_extrusion, enable_options, 'v3_1')).split('\n')
+    lines = _postProcess(relative_extrusion, enable_options).split('\n')
+
+    assert len(lines) == len(expectedLines)
+    for line, expectedLine in zip(lines, expectedLines):
+        assert _extrusionRegex.sub(' E', line) == _extrusionRegex.sub(' E', expectedLine)
+        for extrusion, expectedExtrusion in zip(_extrusionRegex.findall(line), _extrusionRegex.findall(expectedLine)):
+            assert float(extrusion) == pytest.approx(float(expectedExtrusion), abs=1e-5)
+
+
+
+def test_fixtures_cover_the_tower():
+    ''' Makes sure the fixtures exercise the parts of the script the expected output is meant to pin down '''
+
+    absoluteGcode = _sliceGcode('flow_tower_absolute.gcode')
+    relativeGcode = _sliceGcode('flow_tower_relative.gcode')
+
+    # An extruder reset in the middle of a layer
+    assert any('\nG92 E0\n' in layer for layer in absoluteGcode if layer.startswith(';LAYER:'))
+
+    # Retractions in both extrusion modes
+    assert any('\nG1 F2700 E-5\n' in layer for layer in relativeGcode)
+
+    # More than one flow rate section above the base
+    assert _postProcess(False, True).count('M117 FLOW') > 2
+
+
+
+@pytest.mark.parametrize('relative_extrusion', [False, True])
+@pytest.mark.parametrize('enable_options', [False, True])
+def test_matches_script_before_numpy(relative_extrusion, enable_options):
+    ''' The output of version 3.3 of the script was saved before the extrusion values were rescaled with numpy
+        Rescaling a layer at a time must not change a single byte of it '''
+
+    assert _postProcess(relative_extrusion, enable_options) == _readFixture(_expectedFileName(relative_extrusion, enable_options, 'v3_3'))
@@ -0,0 +1,38 @@
+import PrintArea
+
+from benchmark_print_area import CornerClips
+
+
+
+def test_no_disallowed_areas_uses_whole_bed():
+    assert PrintArea.CalculateUsableArea([], 220, 220) == (220, 220)
+
+
+
+def test_corner_clips():
+    # The widest rectangle passes between the clips, while the deepest one is as wide as the gap between them
+    assert PrintArea.CalculateUsableArea(CornerClips(220, 220, 10), 220, 220) == (200.0, 220.0)
+
+
+
+def test_areas_on_one_side_of_the_bed():
+    # A strip along the back of the bed, which has no vertices in front of the middle of the bed
+    backStrip = [[-110, 110], [110, 110], [110, 90], [-110, 90]]
+    assert PrintArea.CalculateUsableArea([backStrip], 220, 220) == (220.0, 180.0)
+
+
+
+def test_polygon_crossing_the_middle_of_the_bed():
+    # A triangle covering the middle of the bed leaves no room for a centered rectangle
+    triangle = [[-10, -10], [10, -10], [0, 10]]
+    assert PrintArea.CalculateUsableArea([triangle], 220, 220) == (0.0, 0.0)
+
+
+
+def test_rectangles_match_polygon_calculation():
+    # The same rectangles with an extra point on one side aren't recognized as rectangles, so the polygon calculation is used
+    clips = CornerClips(300, 300, 25)
+    clipPolygons = [clip[:1] + [[(clip[0][0] + clip[1][0]) / 2, clip[0][1]]] + clip[1:] for clip in clips]
+    (width, depth) = PrintArea.CalculateUsableArea(clips, 300, 300)
+    (polygonWidth, polygonDepth) = PrintArea.CalculateUsableArea(clipPolygons, 300, 300)
+    assert abs(width * depth - polygonWidth * polygonDepth) < 1e-6
@@ -0,0 +1,71 @@
+import glob
+import os
+import struct
+
+import numpy
+import pytest
+
+import StlFile
+
+
+
+_stlDir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Resources', 'STL')
+
+
+
+def _readAsciiStlLineByLine(stlData:bytes) -> numpy.ndarray:
+    ''' A reference parser that reads an ASCII STL file one line at a time '''
+
+    vertices = []
+    for line in stlData.decode('ascii').splitlines():
+        words = line.split()
+        if len(words) == 4 and words[0] == 'vertex':
+            vertices.append([float(word) for word in words[1:]])
+    return numpy.array(vertices, dtype=numpy.float32)
+
+
+
+def _writeBinaryStlOneTriangleAtATime(vertices:numpy.ndarray, header:bytes=bytes(80)) -> bytes:
+    ''' A reference writer that packs each triangle of a binary STL file separately '''
+
+    triangles = vertices.reshape(-1, 9)
+    data = header + struct.pack('<I', len(triangles))
+    for triangle in triangles:
+        data += struct.pack('<12fH', 0, 0, 0, *triangle, 0)
+    return data
+
+
+
+@pytest.mark.parametrize('stlFilePath', sorted(glob.glob(os.path.join(_stlDir, '*.stl'))), ids=os.path.basename)
+def test_shipped_ascii_stl_files(stlFilePath):
+    with open(stlFilePath, 'rb') as stlFile:
+        stlData = stlFile.read()
+
+    vertices = StlFile.ParseStl(stlData)
+    assert vertices.dtype == numpy.float32
+    assert len(vertices) == stlData.count(b'endfacet') * 3
+    assert numpy.array_equal(vertices, _readAsciiStlLineByLine(stlData))
+
+
+
+def test_binary_round_trip():
+    with open(os.path.join(_stlDir, 'Fan Tower - Fan 0-100.stl'), 'rb') as stlFile:
+        vertices = StlFile.ParseStl(stlFile.read())
+
+    stlData = StlFile.StlDataFromVertices(vertices)
+    assert stlData == _writeBinaryStlOneTriangleAtATime(vertices)
+    assert numpy.array_equal(StlFile.ParseStl(stlData), vertices)
+
+
+
+def test_binary_file_starting_with_solid():
+    # Binary files are recognized by their size, even if the header starts like an ASCII file
+    vertices = numpy.arange(18, dtype=numpy.float32).reshape(-1, 3)
+    stlData = _writeBinaryStlOneTriangleAtATime(vertices, b'solid binary'.ljust(80, b' '))
+    assert numpy.array_equal(StlFile.ParseStl(stlData), vertices)
+
+
+
+def test_empty_files():
+    assert len(StlFile.ParseStl(StlFile.StlDataFromVertices(numpy.zeros((0, 3), dtype=numpy.float32)))) == 0
+    assert len(StlFile.ParseStl(b'solid empty\nendsolid empty\n')) == 0
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+# The history logs through Uranium, so these tests can only be run where Cura's modules are available
+pytest.importorskip('UM.Logger')
+
+from TowerHistory import TowerHistory
+
+
+
+@pytest.fixture
+def scadFilePath(tmp_path):
+    scadFilePath = tmp_path / 'tower.scad'
+    scadFilePath.write_text('cube(Size);')
+    return str(scadFilePath)
+
+
+
+@pytest.fixture
+def history(tmp_path):
+    return TowerHistory(str(tmp_path / 'towerHistory.db'), str(tmp_path / 'cache'))
+
+
+
+def test_scad_hash_identifies_the_model(scadFilePath):
+    scadHash = TowerHistory.ScadHash(scadFilePath, {'Size': 10, 'Label': 'A'})
+
+    # The order of the parameters doesn't matter, but their values do
+    assert TowerHistory.ScadHash(scadFilePath, {'Label': 'A', 'Size': 10}) == scadHash
+    assert TowerHistory.ScadHash(scadFilePath, {'Size': 11, 'Label': 'A'}) != scadHash
+
+    # Assembled towers are cached separately from those rendered by OpenSCAD
+    assert TowerHistory.AssembledHash(scadHash) != scadHash
+
+
+
+def test_cached_stl_data(history):
+    assert history.CachedStlFilePath('missing') is None
+
+    cachedFilePath = history.CacheStlData(b'solid tower\nendsolid tower\n', 'tower')
+    assert history.CachedStlFilePath('tower') == cachedFilePath
+    with open(cachedFilePath, 'rb') as cachedFile:
+        assert cachedFile.read() == b'solid tower\nendsolid tower\n'
+
+
+
+def test_recent_towers_are_remembered(tmp_path, history):
+    stlFilePath = history.CacheStlData(b'solid tower\nendsolid tower\n', 'tower')
+    history.AddTower('TempTowerController', 'Temp Tower', stlFilePath, {'startValue': 220}, {'Starting_Value': 220}, 'tower')
+    history.AddTower('FanTowerController', 'Fan Tower', 'fan.stl', {'startValue': 0})
+
+    recentTowers = history.RecentTowers()
+    assert [tower['tower name'] for tower in recentTowers] == ['Fan Tower', 'Temp Tower']
+    assert recentTowers[1]['openscad parameters'] == {'Starting_Value': 220}
+    assert recentTowers[1]['post-processing parameters'] == {'startValue': 220}
+    assert recentTowers[1]['scad hash'] == 'tower'
+    assert recentTowers[1]['stl file path'] == stlFilePath
+
+    # The history is kept between sessions
+    reopenedHistory = TowerHistory(str(tmp_path / 'towerHistory.db'), str(tmp_path / 'cache'))
+    assert reopenedHistory.RecentTowers() == recentTowers
+
+
+
+def test_reopened_tower_moves_to_the_top(history):
+    history.AddTower('TempTowerController', 'Temp Tower', 'temp.stl', {'startValue': 220})
+    history.AddTower('FanTowerController', 'Fan Tower', 'fan.stl', {'startValue': 0})
+    history.AddTower('TempTowerController', 'Temp Tower', 'temp.stl', {'startValue': 220})
+
+    assert [tower['tower name'] for tower in history.RecentTowers()] == ['Temp Tower', 'Fan Tower']
+
+
+
+def test_oldest_towers_and_their_cached_files_are_forgotten(history):
+    for towerNumber in range(TowerHistory._maxEntryCount + 1):
+        stlFilePath = history.CacheStlData(b'solid tower\nendsolid tower\n', f'tower{towerNumber}')
+        history.AddTower('TempTowerController', f'Tower {towerNumber}', stlFilePath, {}, {}, f'tower{towerNumber}')
+
+    recentTowers = history.RecentTowers()
+    assert len(recentTowers) == TowerHistory._maxEntryCount
+    assert recentTowers[-1]['tower name'] == 'Tower 1'
+    assert history.CachedStlFilePath('tower0') is None
+    assert all(os.path.isfile(tower['stl file path']) for tower in recentTowers)
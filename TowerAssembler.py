@@ -0,0 +1,490 @@
+# Assembles towers directly from simple shapes, rather than rendering them with OpenSCAD
+#
+# Towers such as the temp tower are a stack of identical sections that differ only in the labels
+# carved into them, so they can be built with a few array operations once the glyphs of the label
+# font are known (see GlyphAtlas.py)
+#
+# The shapes making up a tower (columns, bridges, supports, and the base) are each closed meshes,
+# but they are not unioned together. They only touch or overlap, which Cura handles when the tower is sliced
+# with "Union Overlapping Volumes" enabled (Cura's default). If it is disabled, towers are rendered by OpenSCAD instead
+#
+# The returned vertices use the same coordinates as the STL files generated by OpenSCAD
+# (centered on the origin with Z up), so they are imported exactly the same way
+#
+# None is returned if a tower can't be assembled (for example, if a label uses a glyph that isn't
+# in the atlas), in which case the tower should be rendered by OpenSCAD instead
+
+import math
+
+import numpy
+
+
+
+# The default values of the parameters in temptower.scad
+_tempTowerDefaultParameters = {
+    'Tower_Label': '',
+    'Column_Label': '',
+    'Section_Label_Prefix': '',
+    'Section_Label_Suffix': '',
+    'Starting_Value': 220,
+    'Ending_Value': 180,
+    'Value_Change': -5,
+    'Base_Height': 0.801,
+    'Section_Height': 8.001,
+    'Font': 'Arial:style=Bold',
+    'Label_Sections': True,
+    'Section_Label_Height_Multiplier': 0.401,
+    'Tower_Label_Height_Multiplier': 0.601,
+    'Column_Label_Height_Multiplier': 0.301,
+    'Wall_Thickness': 0.601,
+    'Tower_Width_Multiplier': 5.001,
+    'Preview_Quality_Value': 24,
+    'Render_Quality_Value': 24,
+}
+
+# The smallest distance allowed between a label and the edge of the surface it is carved into
+_labelClearance = 0.001
+
+
+
+def CanAssemble(openScadFilename) -> bool:
+    ''' Determines if towers generated from an OpenSCAD file can be assembled directly '''
+
+    return openScadFilename in _assemblers
+
+
+
+def GlyphAtlasParameters(openScadFilename, openScadParameters) -> dict:
+    ''' Returns the parameters to render the glyph atlas (glyphatlas.scad) needed to assemble a tower '''
+
+    (assembler, defaultParameters) = _assemblers[openScadFilename]
+    parameters = {**defaultParameters, **openScadParameters}
+    return {name: parameters[name] for name in ('Font', 'Preview_Quality_Value', 'Render_Quality_Value')}
+
+
+
+def AssembleTower(openScadFilename, openScadParameters, glyphAtlas) -> numpy.ndarray:
+    ''' Assembles the tower that would be generated from an OpenSCAD file with the given parameters
+        Returns the vertices of each of its triangles as an (n*3, 3) array, or None if the tower can't be assembled '''
+
+    (assembler, defaultParameters) = _assemblers[openScadFilename]
+    triangles = assembler({**defaultParameters, **openScadParameters}, glyphAtlas)
+    if triangles is None:
+        return None
+
+    return numpy.concatenate(triangles).reshape(-1, 3).astype(numpy.float32)
+
+
+
+def _assembleTempTower(parameters, glyphAtlas) -> list:
+    ''' Assembles temptower.scad, which is used by the fan and temp towers '''
+
+    if parameters['Value_Change'] == 0:
+        return None
+
+    startingValue = parameters['Starting_Value']
+    endingValue = parameters['Ending_Value']
+    valueChange = abs(parameters['Value_Change']) if endingValue > startingValue else -abs(parameters['Value_Change'])
+    sectionCount = math.ceil(abs(endingValue - startingValue) / abs(valueChange) + 1)
+
+    # The dimensions calculated in temptower.scad
+    baseHeight = parameters['Base_Height']
+    wallThickness = parameters['Wall_Thickness']
+    cubeSize = parameters['Section_Height']
+    capSize = cubeSize - wallThickness
+    capHeight = wallThickness
+    bridgeThickness = wallThickness
+    supportSize = cubeSize/2
+    towerWidth = cubeSize * parameters['Tower_Width_Multiplier']
+    baseExtension = wallThickness*4
+    baseWidth = towerWidth + baseExtension*2
+    baseLength = cubeSize + baseExtension*2
+    hollowSize = cubeSize - wallThickness*3
+    labelDepth = wallThickness/2
+    segmentCount = parameters['Render_Quality_Value']
+
+    leftColumnX = -towerWidth/2 + cubeSize/2
+    rightColumnX = towerWidth/2 - cubeSize/2
+
+    # The tower label is carved up the left side of the tower, starting halfway up the first section
+    # As with the column label, it is not raised by the height of the base
+    # It is laid out along the height of the tower, then turned on its side so it reads from bottom to top
+    towerLabelSurface = None
+    if parameters['Tower_Label'] != '':
+        labelGeometry = glyphAtlas.LabelGeometry(parameters['Tower_Label'], parameters['Tower_Label_Height_Multiplier'] * cubeSize)
+        if labelGeometry is None:
+            return None
+
+        # The label must stay clear of the edges of the inset caps, which it crosses between sections
+        (cellEdges, cellBottom, cellTop) = labelGeometry[:3]
+        if cellBottom < -capSize/2 + _labelClearance or cellTop > capSize/2 - _labelClearance:
+            return None
+
+        labelStart = cubeSize/2
+        labelEnd = labelStart + cellEdges[-1] - cellEdges[0]
+        towerTop = baseHeight + sectionCount*cubeSize
+        sideStrip = (min(baseHeight, labelStart) - cubeSize, -cubeSize/2, max(towerTop, labelEnd) + cubeSize, cubeSize/2)
+        towerLabelSurface = [_turned(part) for part in _labelSurface(sideStrip, labelGeometry, (labelStart - cellEdges[0], 0))]
+
+    triangles = [_box(-baseWidth/2, -baseLength/2, 0, baseWidth/2, baseLength/2, baseHeight)]
+
+    for section in range(sectionCount):
+        sectionZ = baseHeight + section*cubeSize
+        bodyTop = sectionZ + cubeSize - capHeight
+        leftFrontWall = (leftColumnX - cubeSize/2, sectionZ, leftColumnX + cubeSize/2, bodyTop)
+        rightFrontWall = (rightColumnX - cubeSize/2, sectionZ, rightColumnX + cubeSize/2, bodyTop)
+
+        # The section label is carved into the front of the left column
+        leftFront = _labelSurface(leftFrontWall, None, None)
+        if parameters['Label_Sections']:
+            value = startingValue + valueChange*section
+            label = f'{parameters["Section_Label_Prefix"]}{value:g}{parameters["Section_Label_Suffix"]}'
+            labelGeometry = glyphAtlas.LabelGeometry(label, parameters['Section_Label_Height_Multiplier'] * cubeSize)
+            if labelGeometry is None:
+                return None
+            leftFront = _labelSurface(leftFrontWall, labelGeometry, (leftColumnX, sectionZ + cubeSize/2))
+
+        # The column label is carved into the front of the right column
+        # As in temptower.scad, the label is not raised by the height of the base
+        rightFront = _labelSurface(rightFrontWall, None, None)
+        if section == 0 and parameters['Column_Label'] != '':
+            labelGeometry = glyphAtlas.LabelGeometry(parameters['Column_Label'], parameters['Column_Label_Height_Multiplier'] * cubeSize)
+            if labelGeometry is None:
+                return None
+            rightFront = _labelSurface(rightFrontWall, labelGeometry, (rightColumnX, cubeSize/2))
+
+        # The part of the tower label crossing the left side of this section
+        leftSide = None
+        if not towerLabelSurface is None:
+            (surface, carved, edges) = towerLabelSurface
+            leftSide = (_clipTriangles(surface, sectionZ, bodyTop), _clipTriangles(carved, sectionZ, bodyTop), _clipEdges(edges, sectionZ, bodyTop))
+
+        for (columnX, front, side) in ((leftColumnX, leftFront, leftSide), (rightColumnX, rightFront, None)):
+            if front is None:
+                return None
+            column = _column(columnX, sectionZ, cubeSize, capSize, capHeight, hollowSize, labelDepth, front, side)
+            if column is None:
+                return None
+            triangles.append(column)
+
+        # The bridge connecting the columns at the top of the section
+        triangles.append(_box(-towerWidth/2 + cubeSize, -cubeSize/2, bodyTop - bridgeThickness, towerWidth/2 - cubeSize, cubeSize/2, bodyTop))
+
+        # The supports on either side of the bridge, angled on the left and curved on the right
+        supportZ = bodyTop - bridgeThickness - supportSize
+        leftSupportX = -towerWidth/2 + cubeSize
+        triangles.append(_prism([(leftSupportX, supportZ + supportSize), (leftSupportX, supportZ), (leftSupportX + supportSize, supportZ + supportSize)], -cubeSize/2, cubeSize/2))
+
+        # The curve follows the points of the cylinder OpenSCAD cuts the support with
+        rightSupportX = towerWidth/2 - cubeSize
+        angles = numpy.radians(numpy.arange(0, 360, 360/segmentCount))
+        angles = angles[angles <= math.pi/2 + 1e-9]
+        curve = [(rightSupportX - supportSize + supportSize*math.cos(angle), supportZ + supportSize*math.sin(angle)) for angle in angles]
+        if not numpy.isclose(angles[-1], math.pi/2):
+            curve.append((rightSupportX - supportSize, supportZ + supportSize))
+        triangles.append(_prism([(rightSupportX, supportZ + supportSize)] + curve[::-1], -cubeSize/2, cubeSize/2))
+
+    return triangles
+
+
+
+def _column(centerX, bottomZ, cubeSize, capSize, capHeight, hollowSize, labelDepth, front, leftSide=None) -> numpy.ndarray:
+    ''' A hollow column with an inset cap on top
+        The front wall is given as a carved surface (see _labelSurface), seen from the front
+        The left side can also be given as a carved surface, clipped to the height of the column below its cap and seen from the left
+        None is returned if the left side can't be joined to the rest of the column '''
+
+    bodyTop = bottomZ + cubeSize - capHeight
+    top = bottomZ + cubeSize
+    (outer, cap, hollow) = (cubeSize/2, capSize/2, hollowSize/2)
+
+    # The sides that are carved are built separately (see _squareWalls for how the sides are numbered)
+    carvedSides = (0, 3) if not leftSide is None else (0,)
+    capSides = carvedSides[1:]
+
+    # The bottom is split in line with the cap, so a carved left side can be joined to it
+    faces = [
+        _squareWalls(centerX, outer, bottomZ, bodyTop, omittedSides=carvedSides),
+        _squareRing(centerX, outer, cap, bodyTop, facingUp=True, omittedSides=capSides),
+        _squareWalls(centerX, cap, bodyTop, top, omittedSides=capSides),
+        _squareRing(centerX, cap, hollow, top, facingUp=True),
+        _squareWalls(centerX, hollow, bottomZ, top, facingOut=False),
+        _squareRing(centerX, outer, cap, bottomZ, facingUp=False, omittedSides=capSides),
+        _squareRing(centerX, cap, hollow, bottomZ, facingUp=False, omittedSides=capSides),
+    ]
+
+    toFront = lambda points, depth: numpy.stack((points[..., 0], numpy.full(points.shape[:-1], -outer + depth), points[..., 1]), axis=-1)
+    faces.append(_carvedFace(*front, labelDepth, toFront))
+
+    if not leftSide is None:
+        left = _carvedSide(centerX - outer, outer, cap, hollow, bottomZ, bodyTop, top, leftSide)
+        if left is None:
+            return None
+        faces.append(left)
+
+    return numpy.concatenate(faces)
+
+
+
+def _carvedSide(sideX, outer, cap, hollow, bottomZ, bodyTop, top, carvedSurface) -> numpy.ndarray:
+    ''' The left side of a column with a label carved into it, along with the parts of the cap and bottom it meets
+        The label is carved exactly as deep as the cap is inset, so where it crosses the top or bottom of the column
+        it opens into the gap beside the cap rather than being closed off
+        None is returned if the label only touches the top or bottom of the column, rather than crossing it '''
+
+    (surface, carved, edges) = carvedSurface
+    inset = outer - cap
+
+    # The surface is seen from the left, with its depth measured into the column
+    # The top and bottom of the column are seen from above, with their depth measured from the side of the column
+    toSide = lambda points, depth: numpy.stack((numpy.full(points.shape[:-1], sideX + depth), -points[..., 0], points[..., 1]), axis=-1)
+    toLevel = lambda points, z: numpy.stack((sideX + points[..., 1], -points[..., 0], numpy.full(points.shape[:-1], z)), axis=-1)
+    faces = [_carvedFace(surface, carved, edges, inset, toSide)]
+
+    topCrossing = _lineCrossing(surface, carved, edges, bodyTop)
+    bottomCrossing = _lineCrossing(surface, carved, edges, bottomZ)
+    if topCrossing is None or bottomCrossing is None:
+        return None
+
+    # The ledge beside the cap is slotted where the label opens into it, and the side of the cap meets the bottom of the carved areas
+    (surfacePoints, carvedPoints, slots) = topCrossing
+    ledge = _slottedTrapezoid((-outer, outer), 0, (-cap, cap), inset, slots, surfacePoints)
+    faces.append(toLevel(ledge, bodyTop))
+    capEdge = numpy.unique(numpy.concatenate(([-cap, cap], carvedPoints, slots.flatten())))
+    capSide = numpy.array([(-cap, top)] + [(x, bodyTop) for x in capEdge] + [(cap, top)])
+    faces.append(toSide(_fan(capSide), inset))
+
+    # The bottom is slotted the same way, with the rest of the bottom meeting the bottom of the carved areas
+    (surfacePoints, carvedPoints, slots) = bottomCrossing
+    strip = _slottedTrapezoid((-outer, outer), 0, (-cap, cap), inset, slots, surfacePoints)
+    stripEdge = numpy.unique(numpy.concatenate(([-cap, cap], carvedPoints, slots.flatten())))
+    rest = _slottedTrapezoid((-cap, cap), inset, (-hollow, hollow), outer - hollow, numpy.zeros((0, 2)), stripEdge)
+    faces.append(toLevel(numpy.concatenate((strip, rest))[:, ::-1], bottomZ))
+
+    return numpy.concatenate(faces)
+
+
+
+def _lineCrossing(surface, carved, edges, y) -> tuple:
+    ''' Finds where a clipped carved surface meets one of the lines it was clipped to
+        Returns the X coordinates of the points of the surface and of the carved areas along the line, and the
+        (start, end) ranges of the line that are carved, or None if the carved areas only touch the line '''
+
+    surfacePoints = numpy.unique(surface[..., 0][surface[..., 1] == y])
+    carvedPoints = numpy.unique(carved[..., 0][carved[..., 1] == y])
+    edgeEnds = numpy.sort(edges[..., 0][edges[..., 1] == y])
+    if len(edgeEnds) % 2 != 0:
+        return None
+
+    return (surfacePoints, carvedPoints, edgeEnds.reshape(-1, 2))
+
+
+
+def _slottedTrapezoid(outerEdge, outerY, innerEdge, innerY, slots, outerPoints) -> numpy.ndarray:
+    ''' Triangulates a trapezoid between an outer and inner edge, each a (start, end) range of X coordinates at a given Y,
+        with (start, end) slots cut across it from one edge to the other
+        Extra points can be added along the outer edge so it lines up with the triangles beside it
+        The triangles are counter-clockwise if the outer edge is below the inner edge '''
+
+    outerBoundaries = numpy.concatenate(([outerEdge[0]], slots.flatten(), [outerEdge[1]])).reshape(-1, 2)
+    innerBoundaries = numpy.concatenate(([innerEdge[0]], slots.flatten(), [innerEdge[1]])).reshape(-1, 2)
+
+    triangles = []
+    for ((outerStart, outerEnd), (innerStart, innerEnd)) in zip(outerBoundaries, innerBoundaries):
+        points = [x for x in outerPoints if outerStart < x < outerEnd]
+        piece = [(innerStart, innerY), (outerStart, outerY)] + [(x, outerY) for x in points] + [(outerEnd, outerY), (innerEnd, innerY)]
+        triangles.append(_fan(numpy.array(piece)))
+
+    return numpy.concatenate(triangles)
+
+
+
+def _labelSurface(rectangle, labelGeometry, center) -> tuple:
+    ''' Triangulates a flat rectangular surface with a label carved into it
+        The rectangle is (left, bottom, right, top) in the coordinates of the surface, as seen from outside
+        The label is given as its geometry (from GlyphAtlas.LabelGeometry) and the position of its center, or None for a plain surface
+        Returns the triangles of the surface, the triangles of the carved areas, and the edges of the carved areas,
+        or None if the label doesn't fit on the surface '''
+
+    (left, bottom, right, top) = rectangle
+    (a, b, c, d) = ((left, bottom), (right, bottom), (right, top), (left, top))
+
+    if labelGeometry is None:
+        return (numpy.array([(a, b, c), (a, c, d)], dtype=numpy.float64), numpy.zeros((0, 3, 2)), numpy.zeros((0, 2, 2)))
+
+    (cellEdges, cellBottom, cellTop, surfaceTriangles, carvedTriangles, carvedEdges) = labelGeometry
+    (centerX, centerY) = center
+    cellEdges = cellEdges + centerX
+    (cellBottom, cellTop) = (cellBottom + centerY, cellTop + centerY)
+    if cellEdges[0] < left + _labelClearance or cellEdges[-1] > right - _labelClearance or cellBottom < bottom + _labelClearance or cellTop > top - _labelClearance:
+        return None
+
+    # The surface around the label is split into four pieces, with the corners of the glyph cells
+    # along the top and bottom so they line up with the edges of the cells
+    pieces = [
+        [a, b] + [(x, cellBottom) for x in cellEdges[::-1]],
+        [c, d] + [(x, cellTop) for x in cellEdges],
+        [a, (cellEdges[0], cellBottom), (cellEdges[0], cellTop), d],
+        [b, c, (cellEdges[-1], cellTop), (cellEdges[-1], cellBottom)],
+    ]
+    surface = [_fan(numpy.array(piece)) for piece in pieces]
+
+    offset = numpy.array([centerX, centerY])
+    surface.append(surfaceTriangles + offset)
+    return (numpy.concatenate(surface), carvedTriangles + offset, carvedEdges + offset)
+
+
+
+def _carvedFace(surface, carved, edges, depth, toWorld) -> numpy.ndarray:
+    ''' Converts a carved surface (see _labelSurface) into world coordinates, with the carved areas recessed and walled in
+        toWorld converts points on the surface into world coordinates, given their depth below the surface '''
+
+    (start, end) = (edges[:, 0], edges[:, 1])
+    walls = numpy.concatenate((
+        numpy.stack((toWorld(start, 0), toWorld(end, 0), toWorld(end, depth)), axis=1),
+        numpy.stack((toWorld(start, 0), toWorld(end, depth), toWorld(start, depth)), axis=1),
+    ))
+
+    return numpy.concatenate((toWorld(surface, 0), toWorld(carved, depth), walls))
+
+
+
+def _turned(points:numpy.ndarray) -> numpy.ndarray:
+    ''' Turns points a quarter turn counter-clockwise around the origin '''
+
+    return numpy.stack((-points[..., 1], points[..., 0]), axis=-1)
+
+
+
+def _clipTriangles(triangles:numpy.ndarray, low, high) -> numpy.ndarray:
+    ''' Clips triangles to the band between two horizontal lines, triangulating the clipped pieces as fans '''
+
+    y = triangles[..., 1]
+    inside = (y.min(axis=1) >= low) & (y.max(axis=1) <= high)
+    crossing = ~inside & (y.max(axis=1) > low) & (y.min(axis=1) < high)
+
+    clipped = [triangles[inside]]
+    for triangle in triangles[crossing]:
+        polygon = _clipPolygon(_clipPolygon(list(triangle), low, 1), high, -1)
+        if len(polygon) >= 3:
+            clipped.append(_fan(numpy.array(polygon)))
+
+    return numpy.concatenate(clipped)
+
+
+
+def _clipPolygon(polygon:list, y, direction) -> list:
+    ''' Clips a convex polygon to the part above (direction 1) or below (direction -1) a horizontal line '''
+
+    clipped = []
+    for (index, point) in enumerate(polygon):
+        previous = polygon[index - 1]
+        pointInside = direction*(point[1] - y) >= 0
+        if pointInside != (direction*(previous[1] - y) >= 0):
+            clipped.append(_crossings(previous[None], point[None], y)[0])
+        if pointInside:
+            clipped.append(point)
+
+    return clipped
+
+
+
+def _clipEdges(edges:numpy.ndarray, low, high) -> numpy.ndarray:
+    ''' Clips edges to the band between two horizontal lines, keeping their direction '''
+
+    y = edges[..., 1]
+    edges = edges[(y.max(axis=1) > low) & (y.min(axis=1) < high)].copy()
+
+    for (limit, direction) in ((low, 1), (high, -1)):
+        for end in (0, 1):
+            outside = direction*(edges[:, end, 1] - limit) < 0
+            edges[outside, end] = _crossings(edges[outside, 0], edges[outside, 1], limit)
+
+    return edges
+
+
+
+def _crossings(a:numpy.ndarray, b:numpy.ndarray, y) -> numpy.ndarray:
+    ''' Returns the points where the segments between a and b cross a horizontal line
+        The points are calculated the same way whichever direction the segments run, so shared edges are clipped identically '''
+
+    swap = (a[:, 1] > b[:, 1])[:, None]
+    (lower, upper) = (numpy.where(swap, b, a), numpy.where(swap, a, b))
+    x = lower[:, 0] + (upper[:, 0] - lower[:, 0]) * (y - lower[:, 1]) / (upper[:, 1] - lower[:, 1])
+    return numpy.stack((x, numpy.full(len(x), y, dtype=numpy.float64)), axis=1)
+
+
+
+def _fan(polygon:numpy.ndarray) -> numpy.ndarray:
+    ''' Triangulates a polygon as a fan from its first point '''
+
+    return numpy.stack((numpy.repeat(polygon[:1], len(polygon) - 2, axis=0), polygon[1:-1], polygon[2:]), axis=1)
+
+
+
+def _box(x1, y1, z1, x2, y2, z2) -> numpy.ndarray:
+    ''' An axis-aligned box '''
+
+    return _prism([(x1, z1), (x2, z1), (x2, z2), (x1, z2)], y1, y2)
+
+
+
+def _prism(polygon, y1, y2) -> numpy.ndarray:
+    ''' A polygon in the XZ plane, counter-clockwise as seen from the front, extruded from front (y1) to back (y2)
+        Every point of the polygon must be visible from its first point, so it can be triangulated as a fan '''
+
+    polygon = numpy.array(polygon, dtype=numpy.float64)
+    front = numpy.insert(polygon, 1, y1, axis=1)
+    back = numpy.insert(polygon, 1, y2, axis=1)
+    following = numpy.roll(numpy.arange(len(polygon)), -1)
+
+    caps = numpy.concatenate((_fan(front), _fan(back[::-1])))
+    sides = _quads(front, back, back[following], front[following])
+    return numpy.concatenate((caps, sides))
+
+
+
+def _squareWalls(centerX, halfSize, z1, z2, facingOut=True, omittedSides=()) -> numpy.ndarray:
+    ''' The walls of a square centered on (centerX, 0), facing outwards or inwards
+        The sides are numbered counter-clockwise from the front (0 is the front, 1 the right, 2 the back, and 3 the left),
+        so any that are built separately can be left out '''
+
+    corners = numpy.array([(-1, -1), (1, -1), (1, 1), (-1, 1)]) * halfSize + (centerX, 0)
+    bottom = numpy.insert(corners, 2, z1, axis=1)
+    top = numpy.insert(corners, 2, z2, axis=1)
+
+    start = numpy.array([side for side in range(4) if not side in omittedSides])
+    end = (start + 1) % 4
+    if facingOut:
+        return _quads(bottom[start], bottom[end], top[end], top[start])
+    return _quads(bottom[start], top[start], top[end], bottom[end])
+
+
+
+def _squareRing(centerX, outerHalfSize, innerHalfSize, z, facingUp, omittedSides=()) -> numpy.ndarray:
+    ''' The flat ring between two squares centered on (centerX, 0), facing up or down
+        The sides are numbered the same way as in _squareWalls, so any can be left out '''
+
+    corners = numpy.array([(-1, -1), (1, -1), (1, 1), (-1, 1)])
+    outer = numpy.insert(corners * outerHalfSize + (centerX, 0), 2, z, axis=1)
+    inner = numpy.insert(corners * innerHalfSize + (centerX, 0), 2, z, axis=1)
+
+    start = numpy.array([side for side in range(4) if not side in omittedSides])
+    end = (start + 1) % 4
+    if facingUp:
+        return _quads(outer[start], outer[end], inner[end], inner[start])
+    return _quads(outer[start], inner[start], inner[end], outer[end])
+
+
+
+def _quads(a, b, c, d) -> numpy.ndarray:
+    ''' Splits quadrilaterals with corners a, b, c, d (counter-clockwise as seen from outside) into triangles '''
+
+    return numpy.concatenate((numpy.stack((a, b, c), axis=1), numpy.stack((a, c, d), axis=1)))
+
+
+
+# The towers that can be assembled, with the function that assembles them and the default values of their parameters
+_assemblers = {
+    'temptower.scad': (_assembleTempTower, _tempTowerDefaultParameters),
+}
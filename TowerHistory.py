@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+
+from UM.Logger import Logger
+
+
+
+class TowerHistory():
+    ''' Keeps a small database of the towers that have been generated so they can be reopened later
+
+        STL files generated by OpenSCAD are copied into a cache directory, named after a hash of
+        the OpenSCAD source file and the parameters used to generate them, so a tower can be
+        reopened (or regenerated with the same parameters) without running OpenSCAD again '''
+
+    # The maximum number of towers to remember
+    _maxEntryCount = 20
+
+
+
+    def __init__(self, databaseFilePath, cacheDir):
+        self._cacheDir = cacheDir
+
+        # Make sure the cache directory exists
+        if not os.path.exists(self._cacheDir):
+            os.makedirs(self._cacheDir)
+
+        self._connection = sqlite3.connect(databaseFilePath)
+        with self._connection:
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS towers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp REAL NOT NULL,
+                    controller TEXT NOT NULL,
+                    tower_name TEXT NOT NULL,
+                    openscad_parameters TEXT,
+                    scad_hash TEXT,
+                    stl_file_path TEXT NOT NULL,
+                    post_processing_parameters TEXT NOT NULL
+                )''')
+
+
+
+    @staticmethod
+    def ScadHash(openScadFilePath, openScadParameters)->str:
+        ''' Returns a hash identifying the model generated from an OpenSCAD file with the given parameters '''
+
+        hash = hashlib.sha256()
+        with open(openScadFilePath, 'rb') as openScadFile:
+            hash.update(openScadFile.read())
+        hash.update(json.dumps(openScadParameters, sort_keys=True).encode('utf-8'))
+        return hash.hexdigest()
+
+
+
+    @staticmethod
+    def AssembledHash(scadHash)->str:
+        ''' Returns a hash identifying a tower that was assembled directly rather than rendered from its OpenSCAD file
+            Assembled towers are cached separately, since they are only usable while Cura unions overlapping volumes '''
+
+        return hashlib.sha256(f'{scadHash} assembled'.encode('utf-8')).hexdigest()
+
+
+
+    @staticmethod
+    def StlHash(stlData)->str:
+        ''' Returns a hash identifying a model that was generated without OpenSCAD '''
+
+        return hashlib.sha256(stlData).hexdigest()
+
+
+
+    def CachedStlFilePath(self, scadHash)->str:
+        ''' Returns the path to the cached STL file for a scad hash, or None if it hasn't been cached '''
+
+        stlFilePath = self._CacheFilePath(scadHash)
+        return stlFilePath if os.path.isfile(stlFilePath) else None
+
+
+
+    def CacheStl(self, stlFilePath, scadHash)->str:
+        ''' Copies a generated STL file into the cache and returns the path to the cached copy '''
+
+        cachedFilePath = self._CacheFilePath(scadHash)
+        shutil.copyfile(stlFilePath, cachedFilePath)
+        return cachedFilePath
+
+
+
+    def CacheStlData(self, stlData, scadHash)->str:
+        ''' Writes generated STL data into the cache and returns the path to the cached file '''
+
+        cachedFilePath = self._CacheFilePath(scadHash)
+        with open(cachedFilePath, 'wb') as cachedFile:
+            cachedFile.write(stlData)
+        return cachedFilePath
+
+
+
+    def AddTower(self, controllerName, towerName, stlFilePath, postProcessingParameters, openScadParameters=None, scadHash=None)->None:
+        ''' Records a tower that has been added to the scene '''
+
+        encodedPostProcessingParameters = json.dumps(postProcessingParameters, sort_keys=True)
+
+        with self._connection:
+            # Reopening a tower moves it back to the top of the history rather than duplicating it
+            self._connection.execute('DELETE FROM towers WHERE controller = ? AND tower_name = ? AND stl_file_path = ? AND post_processing_parameters = ?',
+                (controllerName, towerName, stlFilePath, encodedPostProcessingParameters))
+
+            self._connection.execute('INSERT INTO towers (timestamp, controller, tower_name, openscad_parameters, scad_hash, stl_file_path, post_processing_parameters) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (time.time(), controllerName, towerName, None if openScadParameters is None else json.dumps(openScadParameters, sort_keys=True), scadHash, stlFilePath, encodedPostProcessingParameters))
+
+        self._PruneHistory()
+
+
+
+    def RecentTowers(self)->list:
+        ''' Returns the remembered towers, most recent first '''
+
+        rows = self._connection.execute('SELECT timestamp, controller, tower_name, openscad_parameters, scad_hash, stl_file_path, post_processing_parameters FROM towers ORDER BY timestamp DESC').fetchall()
+        return [{
+            'timestamp': timestamp,
+            'controller': controllerName,
+            'tower name': towerName,
+            'openscad parameters': None if openScadParameters is None else json.loads(openScadParameters),
+            'scad hash': scadHash,
+            'stl file path': stlFilePath,
+            'post-processing parameters': json.loads(postProcessingParameters),
+        } for (timestamp, controllerName, towerName, openScadParameters, scadHash, stlFilePath, postProcessingParameters) in rows]
+
+
+
+    def _CacheFilePath(self, scadHash)->str:
+        ''' Returns the path of the cached STL file for a scad hash '''
+
+        return os.path.join(self._cacheDir, f'{scadHash}.stl')
+
+
+
+    def _PruneHistory(self)->None:
+        ''' Forgets the oldest towers once the history is full and removes cached files that are no longer needed '''
+
+        with self._connection:
+            self._connection.execute('DELETE FROM towers WHERE id NOT IN (SELECT id FROM towers ORDER BY timestamp DESC LIMIT ?)', (self._maxEntryCount,))
+
+        # Remove any cached STL files that aren't referenced by the history
+        referencedHashes = {row[0] for row in self._connection.execute('SELECT scad_hash FROM towers WHERE scad_hash IS NOT NULL')}
+        for fileName in os.listdir(self._cacheDir):
+            (scadHash, extension) = os.path.splitext(fileName)
+            if extension == '.stl' and not scadHash in referencedHashes:
+                try:
+                    os.remove(os.path.join(self._cacheDir, fileName))
+                except OSError as e:
+                    Logger.log('w', f'Unable to remove the cached file "{fileName}": {e}')